@@ -1,10 +1,52 @@
 """Shared runtime-config primitives used by both qdrant-loader packages."""
 
 from .capabilities import CollectionVectorCapabilities, parse_collection_capabilities
+from .collection_profiles import (
+    BUILTIN_COLLECTION_PROFILES,
+    DEFAULT_COLLECTION_PROFILE,
+    CollectionProfile,
+    CollectionSearchParams,
+    available_collection_profiles,
+    describe_collection,
+    match_collection_profile,
+    resolve_collection_profile,
+)
+from .payload_layout import (
+    ANALYSIS_COLLECTION_SUFFIX,
+    DEFAULT_ANALYSIS_FIELDS,
+    PAYLOAD_SCHEMA_VERSION,
+    PAYLOAD_VERSION_KEY,
+    PROMOTED_PAYLOAD_FIELDS,
+    PayloadLayout,
+    analysis_collection_name,
+    build_payload,
+    merge_analysis,
+    migrate_payload,
+    payload_metadata,
+)
 from .sparse import SparseRuntimeConfig
 
 __all__ = [
+    "ANALYSIS_COLLECTION_SUFFIX",
+    "BUILTIN_COLLECTION_PROFILES",
+    "DEFAULT_ANALYSIS_FIELDS",
+    "DEFAULT_COLLECTION_PROFILE",
+    "PAYLOAD_SCHEMA_VERSION",
+    "PAYLOAD_VERSION_KEY",
+    "PROMOTED_PAYLOAD_FIELDS",
+    "CollectionProfile",
+    "CollectionSearchParams",
     "CollectionVectorCapabilities",
+    "PayloadLayout",
     "SparseRuntimeConfig",
+    "analysis_collection_name",
+    "available_collection_profiles",
+    "build_payload",
+    "describe_collection",
+    "match_collection_profile",
+    "merge_analysis",
+    "migrate_payload",
     "parse_collection_capabilities",
+    "payload_metadata",
+    "resolve_collection_profile",
 ]
@@ -0,0 +1,224 @@
+"""Qdrant collection performance profiles.
+
+A profile bundles the storage options a collection is created with —
+quantization, on-disk vectors and payload, the HNSW graph and optimizer
+thresholds — with the search parameters that suit them. The loader creates
+collections from a profile; the MCP server matches a live collection against
+the known profiles to pick its search parameters. Like the capability probe,
+nothing here talks to Qdrant or imports qdrant-client.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+QuantizationKind = Literal["none", "scalar", "binary", "product"]
+
+DEFAULT_COLLECTION_PROFILE = "default"
+
+# Qdrant's defaults for collections created without an HNSW config
+_DEFAULT_HNSW_M = 16
+_DEFAULT_HNSW_EF_CONSTRUCT = 100
+
+
+class CollectionSearchParams(BaseModel):
+    """Search parameters suited to the collections of a profile."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    hnsw_ef: int | None = Field(
+        default=None,
+        ge=1,
+        description="Minimum size of the HNSW candidate list at search time.",
+    )
+    rescore: bool = Field(
+        default=True,
+        description="Rescore quantized candidates with the original vectors.",
+    )
+    oversampling: float | None = Field(
+        default=None,
+        ge=1.0,
+        description="Candidates fetched from the quantized index per result.",
+    )
+
+
+class CollectionProfile(BaseModel):
+    """Storage and index options of a collection, and how to search it."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    quantization: QuantizationKind = "none"
+    quantization_always_ram: bool = Field(
+        default=True,
+        description="Keep the quantized vectors in RAM when the originals are on disk.",
+    )
+    scalar_quantile: float | None = Field(
+        default=None,
+        gt=0.5,
+        le=1.0,
+        description="Quantile of the values kept in range by scalar quantization.",
+    )
+    product_compression: Literal["x4", "x8", "x16", "x32", "x64"] = "x16"
+    vectors_on_disk: bool = False
+    payload_on_disk: bool = False
+    hnsw_m: int | None = Field(
+        default=None, ge=0, description="Edges per node of the HNSW graph."
+    )
+    hnsw_ef_construct: int | None = Field(
+        default=None, ge=4, description="Candidate list size while building the graph."
+    )
+    hnsw_on_disk: bool = False
+    indexing_threshold: int | None = Field(
+        default=None,
+        ge=0,
+        description="Segment size, in KB, above which vectors are indexed.",
+    )
+    memmap_threshold: int | None = Field(
+        default=None,
+        ge=0,
+        description="Segment size, in KB, above which segments are memory-mapped.",
+    )
+    search: CollectionSearchParams = Field(default_factory=CollectionSearchParams)
+
+    def matches(self, info: Any, dense_vector_name: str) -> bool:
+        """Whether a live collection was created with this profile.
+
+        Collections are told apart by their quantization, where their vectors
+        are stored and the shape of their HNSW graph.
+        """
+        layout = describe_collection(info, dense_vector_name)
+        if layout["quantization"] != self.quantization:
+            return False
+        if layout["vectors_on_disk"] != self.vectors_on_disk:
+            return False
+        expected = (
+            (layout["hnsw_m"], self.hnsw_m or _DEFAULT_HNSW_M),
+            (
+                layout["hnsw_ef_construct"],
+                self.hnsw_ef_construct or _DEFAULT_HNSW_EF_CONSTRUCT,
+            ),
+        )
+        # Values missing from the collection info are not compared
+        return all(actual is None or actual == value for actual, value in expected)
+
+
+BUILTIN_COLLECTION_PROFILES: dict[str, CollectionProfile] = {
+    # Plain float32 vectors in RAM, as collections were always created
+    DEFAULT_COLLECTION_PROFILE: CollectionProfile(),
+    # int8 vectors in RAM, float32 originals on disk for rescoring
+    "balanced": CollectionProfile(
+        quantization="scalar",
+        scalar_quantile=0.99,
+        vectors_on_disk=True,
+        hnsw_ef_construct=128,
+        search=CollectionSearchParams(hnsw_ef=128, oversampling=2.0),
+    ),
+    # 1-bit vectors in RAM; originals, payload and graph on disk
+    "memory_saver": CollectionProfile(
+        quantization="binary",
+        vectors_on_disk=True,
+        payload_on_disk=True,
+        hnsw_on_disk=True,
+        memmap_threshold=20000,
+        search=CollectionSearchParams(hnsw_ef=128, oversampling=3.0),
+    ),
+    # No quantization and a denser graph
+    "max_recall": CollectionProfile(
+        hnsw_m=32,
+        hnsw_ef_construct=256,
+        search=CollectionSearchParams(hnsw_ef=256),
+    ),
+}
+
+
+def available_collection_profiles(
+    custom: Mapping[str, CollectionProfile | Mapping[str, Any]] | None = None,
+) -> dict[str, CollectionProfile]:
+    """Built-in profiles, extended or overridden by the configured ones."""
+    profiles = dict(BUILTIN_COLLECTION_PROFILES)
+    for name, profile in (custom or {}).items():
+        profiles[name] = (
+            profile
+            if isinstance(profile, CollectionProfile)
+            else CollectionProfile.model_validate(profile)
+        )
+    return profiles
+
+
+def resolve_collection_profile(
+    name: str | None,
+    custom: Mapping[str, CollectionProfile | Mapping[str, Any]] | None = None,
+) -> CollectionProfile:
+    """Return a profile by name.
+
+    Raises:
+        ValueError: If no built-in or configured profile has this name
+    """
+    profiles = available_collection_profiles(custom)
+    try:
+        return profiles[name or DEFAULT_COLLECTION_PROFILE]
+    except KeyError:
+        raise ValueError(
+            f"Unknown collection profile {name!r}; "
+            f"expected one of {sorted(profiles)}"
+        ) from None
+
+
+def match_collection_profile(
+    info: Any,
+    profiles: Mapping[str, CollectionProfile],
+    dense_vector_name: str,
+) -> str | None:
+    """Name of the first profile a live collection matches, if any."""
+    for name, profile in profiles.items():
+        if profile.matches(info, dense_vector_name):
+            return name
+    return None
+
+
+def describe_collection(info: Any, dense_vector_name: str) -> dict[str, Any]:
+    """Storage layout of the dense vector of a Qdrant ``CollectionInfo``.
+
+    Resilient to dict-shaped and model-shaped fields, and to named and
+    unnamed dense vectors. Settings of the vector take precedence over those
+    of the collection.
+    """
+    config = _field(info, "config")
+    params = _field(config, "params")
+    vectors = _field(params, "vectors")
+    vector = (
+        vectors.get(dense_vector_name)
+        if isinstance(vectors, Mapping) and "size" not in vectors
+        else vectors
+    )
+
+    quantization = _field(vector, "quantization_config") or _field(
+        config, "quantization_config"
+    )
+    collection_hnsw = _field(config, "hnsw_config")
+    vector_hnsw = _field(vector, "hnsw_config")
+    return {
+        "quantization": _quantization_kind(quantization),
+        "vectors_on_disk": bool(_field(vector, "on_disk")),
+        "hnsw_m": _field(vector_hnsw, "m") or _field(collection_hnsw, "m"),
+        "hnsw_ef_construct": _field(vector_hnsw, "ef_construct")
+        or _field(collection_hnsw, "ef_construct"),
+    }
+
+
+def _quantization_kind(quantization: Any) -> QuantizationKind:
+    for kind in ("scalar", "binary", "product"):
+        if _field(quantization, kind) is not None:
+            return kind
+    return "none"
+
+
+def _field(value: Any, name: str) -> Any:
+    if value is None:
+        return None
+    if isinstance(value, Mapping):
+        return value.get(name)
+    return getattr(value, name, None)
@@ -0,0 +1,149 @@
+"""Versioned layout of the payload of Qdrant points.
+
+Version 1 stores the whole chunk metadata under ``metadata``. Version 2
+promotes the fields searches filter on to indexed top-level keys, marks the
+point with ``payload_version`` and can take the bulky analysis fields out of
+the payload, either into a side collection or for good. Readers rebuild the
+metadata of either version with ``payload_metadata``, and add back the
+fields of a side collection with ``merge_analysis``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any, Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+PAYLOAD_SCHEMA_VERSION = 2
+PAYLOAD_VERSION_KEY = "payload_version"
+# Analysis fields moved out of the payload are stored in <collection>__analysis,
+# in points with the IDs of the collection's points
+ANALYSIS_COLLECTION_SUFFIX = "__analysis"
+
+# Metadata fields stored as top-level keys from version 2, with the type of
+# their payload index
+PROMOTED_PAYLOAD_FIELDS: dict[str, str] = {
+    "project_id": "keyword",
+    "is_attachment": "bool",
+    "parent_document_id": "keyword",
+    "original_file_type": "keyword",
+    "is_converted": "bool",
+    "file_type": "keyword",
+    "file_name": "keyword",
+    "file_path": "keyword",
+}
+
+# Metadata fields written by the chunking strategies' text, code and schema
+# analysis; the largest part of most payloads
+DEFAULT_ANALYSIS_FIELDS: tuple[str, ...] = (
+    "entities",
+    "pos_tags",
+    "topic_analysis",
+    "cross_references",
+    "hierarchy",
+    "document_structure",
+    "semantic_indicators",
+    "entity_hints",
+    "dependencies",
+    "inferred_schema",
+    "schema_patterns",
+    "value_analysis",
+    "key_patterns",
+)
+
+
+class PayloadLayout(BaseModel):
+    """How the payload of new points is laid out."""
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    version: Literal[1, 2] = Field(
+        default=PAYLOAD_SCHEMA_VERSION,
+        description="Payload schema version; 1 is the legacy layout.",
+    )
+    analysis_fields: Literal["keep", "side_store", "drop"] = Field(
+        default="keep",
+        description=(
+            "Where the analysis fields of version 2 payloads go: kept under "
+            "metadata, moved to a side collection, or dropped."
+        ),
+    )
+    analysis_field_names: tuple[str, ...] = Field(
+        default=DEFAULT_ANALYSIS_FIELDS,
+        description="Metadata fields treated as analysis fields.",
+    )
+
+
+def build_payload(
+    fields: Mapping[str, Any],
+    metadata: Mapping[str, Any],
+    layout: PayloadLayout,
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Payload of a point with the given top-level fields and metadata.
+
+    Returns:
+        The payload, and the analysis fields taken out of it for a side
+        collection; the latter is empty unless ``analysis_fields`` is
+        ``side_store``
+    """
+    if layout.version == 1:
+        return {**fields, "metadata": dict(metadata)}, {}
+
+    promoted: dict[str, Any] = {}
+    remaining: dict[str, Any] = {}
+    analysis: dict[str, Any] = {}
+    moves_analysis = layout.analysis_fields != "keep"
+    for key, value in metadata.items():
+        if key in PROMOTED_PAYLOAD_FIELDS:
+            promoted[key] = value
+        elif moves_analysis and key in layout.analysis_field_names:
+            analysis[key] = value
+        else:
+            remaining[key] = value
+    payload = {
+        **fields,
+        **promoted,
+        "metadata": remaining,
+        PAYLOAD_VERSION_KEY: PAYLOAD_SCHEMA_VERSION,
+    }
+    return payload, analysis if layout.analysis_fields == "side_store" else {}
+
+
+def payload_metadata(payload: Mapping[str, Any]) -> dict[str, Any]:
+    """Chunk metadata of a payload of any version, promoted fields included."""
+    metadata = {key: payload[key] for key in PROMOTED_PAYLOAD_FIELDS if key in payload}
+    metadata.update(payload.get("metadata") or {})
+    return metadata
+
+
+def analysis_collection_name(collection_name: str) -> str:
+    """Side collection of the analysis fields of a collection.
+
+    ``collection_name`` is the collection itself, not an alias to it.
+    """
+    return f"{collection_name}{ANALYSIS_COLLECTION_SUFFIX}"
+
+
+def merge_analysis(
+    metadata: Mapping[str, Any], analysis_payload: Mapping[str, Any]
+) -> dict[str, Any]:
+    """Metadata with the analysis fields of its point in the side collection."""
+    merged = dict(metadata)
+    for key, value in analysis_payload.items():
+        if key != "document_id":
+            merged.setdefault(key, value)
+    return merged
+
+
+def migrate_payload(
+    payload: Mapping[str, Any], layout: PayloadLayout
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Lay out an existing payload anew; see ``build_payload``."""
+    fields = {
+        key: value
+        for key, value in payload.items()
+        if key not in PROMOTED_PAYLOAD_FIELDS
+        and key not in ("metadata", PAYLOAD_VERSION_KEY)
+    }
+    return build_payload(fields, payload_metadata(payload), layout)
@@ -1,6 +1,7 @@
 # Re-export core interfaces for convenience
 
 from .factory import create_provider
+from .ratelimit import AsyncRateLimiter, get_shared_rate_limiter
 from .settings import EmbeddingPolicy, LLMSettings, RateLimitPolicy, RequestPolicy
 from .types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 
@@ -14,4 +15,6 @@ __all__ = [
     "RateLimitPolicy",
     "EmbeddingPolicy",
     "create_provider",
+    "AsyncRateLimiter",
+    "get_shared_rate_limiter",
 ]
@@ -9,6 +9,7 @@ except Exception:  # pragma: no cover - optional dependency surface
     AzureOpenAI = None  # type: ignore
 
 from ...logging import LoggingConfig
+from ..ratelimit import RateLimitedProvider
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 from .openai import OpenAIChat, OpenAIEmbeddings, _OpenAITokenCounter
@@ -37,7 +38,9 @@ def _validate_azure_settings(settings: LLMSettings) -> None:
         )
 
 
-class AzureOpenAIProvider(LLMProvider):
+class AzureOpenAIProvider(RateLimitedProvider, LLMProvider):
+    rate_limit_label = "azure_openai"
+
     def __init__(self, settings: LLMSettings):
         self._settings = settings
         _validate_azure_settings(settings)
@@ -59,13 +62,13 @@ class AzureOpenAIProvider(LLMProvider):
                 **{k: v for k, v in kwargs.items() if v is not None}
             )
 
-    def embeddings(self) -> EmbeddingsClient:
+    def _create_embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         return OpenAIEmbeddings(
             self._client, model, self._base_host, provider_label="azure_openai"
         )
 
-    def chat(self) -> ChatClient:
+    def _create_chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
         return OpenAIChat(
             self._client, model, self._base_host, provider_label="azure_openai"
@@ -16,6 +16,7 @@ from ..errors import (
     LLMError,
     ServerError,
 )
+from ..ratelimit import RateLimitedProvider
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 
@@ -224,9 +225,11 @@ class _BedrockChat(ChatClient):
         raise NotImplementedError("Bedrock chat is not implemented")
 
 
-class BedrockProvider(LLMProvider):
+class BedrockProvider(RateLimitedProvider, LLMProvider):
     """LLM provider wrapper for AWS Bedrock Titan embedding models."""
 
+    rate_limit_label = "bedrock"
+
     SUPPORTED_MODELS = frozenset(
         {
             "amazon.titan-embed-text-v2:0",
@@ -298,7 +301,7 @@ class BedrockProvider(LLMProvider):
             )
         )
 
-    def embeddings(self) -> EmbeddingsClient:
+    def _create_embeddings(self) -> EmbeddingsClient:
         return BedrockEmbeddings(
             self._client,
             self._model_id,
@@ -308,8 +311,11 @@ class BedrockProvider(LLMProvider):
             concurrency=self._concurrency,
         )
 
-    def chat(self) -> ChatClient:
+    def _create_chat(self) -> ChatClient:
         raise NotImplementedError("Bedrock provider does not support chat()")
 
+    def _budget_fallback(self) -> TokenCounter | None:
+        return BedrockTokenizer()
+
     def tokenizer(self) -> TokenCounter:
         return BedrockTokenizer()
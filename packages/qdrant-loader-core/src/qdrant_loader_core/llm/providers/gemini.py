@@ -25,8 +25,10 @@ from ..errors import (
     ServerError,
 )
 from ..errors import TimeoutError as LLMTimeoutError
+from ..ratelimit import RateLimitedProvider
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
+from .gemini_utils import _GeminiTokenCounter
 
 logger = LoggingConfig.get_logger(__name__)
 
@@ -63,26 +65,6 @@ def _map_gemini_exception(exc: Exception) -> LLMError:
     return ServerError(str(exc))
 
 
-class _GeminiTokenCounter(TokenCounter):
-    def __init__(self, client: Any, model: str):
-        self._client = client
-        self._model = model
-
-    def count(self, text: str) -> int:
-        if self._client is None:
-            return len(text)
-        try:
-            response = self._client.models.count_tokens(
-                model=self._model, contents=text
-            )
-            total = getattr(response, "total_tokens", None)
-            if isinstance(total, int):
-                return total
-        except Exception:
-            pass
-        return len(text)
-
-
 def _messages_to_contents(
     messages: list[dict[str, Any]],
 ) -> tuple[str | None, list[Any]]:
@@ -312,7 +294,9 @@ class GeminiChat(ChatClient):
             raise mapped
 
 
-class GeminiProvider(LLMProvider):
+class GeminiProvider(RateLimitedProvider, LLMProvider):
+    rate_limit_label = "gemini"
+
     def __init__(self, settings: LLMSettings):
         self._settings = settings
         if genai is None:
@@ -330,7 +314,7 @@ class GeminiProvider(LLMProvider):
                     kwargs["location"] = provider_opts["location"]
             self._client = genai.Client(**kwargs)
 
-    def embeddings(self) -> EmbeddingsClient:
+    def _create_embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         return GeminiEmbeddings(
             self._client,
@@ -339,7 +323,7 @@ class GeminiProvider(LLMProvider):
             output_dimensionality=self._settings.embeddings.vector_size,
         )
 
-    def chat(self) -> ChatClient:
+    def _create_chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
         return GeminiChat(self._client, model, provider_label="gemini")
 
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..types import TokenCounter
+
+
+class _GeminiTokenCounter(TokenCounter):
+    def __init__(self, client: Any, model: str):
+        self._client = client
+        self._model = model
+
+    def count(self, text: str) -> int:
+        if self._client is None:
+            return len(text)
+        try:
+            response = self._client.models.count_tokens(
+                model=self._model, contents=text
+            )
+            total = getattr(response, "total_tokens", None)
+            if isinstance(total, int):
+                return total
+        except Exception:
+            pass
+        return len(text)
@@ -15,6 +15,7 @@ from ..errors import (
     ServerError,
 )
 from ..errors import TimeoutError as LLMTimeoutError
+from ..ratelimit import RateLimitedProvider
 from ..settings import LLMSettings
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 
@@ -281,11 +282,13 @@ class OllamaTokenizer(TokenCounter):
         return len(text)
 
 
-class OllamaProvider(LLMProvider):
+class OllamaProvider(RateLimitedProvider, LLMProvider):
+    rate_limit_label = "ollama"
+
     def __init__(self, settings: LLMSettings):
         self._settings = settings
 
-    def embeddings(self) -> EmbeddingsClient:
+    def _create_embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         timeout = (
             self._settings.request.timeout_s
@@ -300,7 +303,7 @@ class OllamaProvider(LLMProvider):
             provider_options=self._settings.provider_options,
         )
 
-    def chat(self) -> ChatClient:
+    def _create_chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
         return OllamaChat(self._settings.base_url, model, self._settings.headers)
 
@@ -32,7 +32,9 @@ from ..errors import (
     ServerError,
 )
 from ..errors import TimeoutError as LLMTimeoutError
+from ..ratelimit import RateLimitedProvider
 from ..settings import LLMSettings
+from ..tokenization import CharCountTokenCounter, TiktokenTokenCounter
 from ..types import ChatClient, EmbeddingsClient, LLMProvider, TokenCounter
 
 logger = LoggingConfig.get_logger(__name__)
@@ -86,10 +88,13 @@ def _map_openai_exception(exc: Exception) -> LLMError:
 class _OpenAITokenCounter(TokenCounter):
     def __init__(self, tokenizer: str):
         self._tokenizer = tokenizer
+        if tokenizer and tokenizer != "none":
+            self._counter: TokenCounter = TiktokenTokenCounter(tokenizer)
+        else:
+            self._counter = CharCountTokenCounter()
 
     def count(self, text: str) -> int:
-        # Phase 0: fallback to naive length; real tiktoken impl to come later
-        return len(text)
+        return self._counter.count(text)
 
 
 class OpenAIEmbeddings(EmbeddingsClient):
@@ -251,7 +256,9 @@ class OpenAIChat(ChatClient):
             raise mapped
 
 
-class OpenAIProvider(LLMProvider):
+class OpenAIProvider(RateLimitedProvider, LLMProvider):
+    rate_limit_label = "openai"
+
     def __init__(self, settings: LLMSettings):
         self._settings = settings
         self._base_host = _safe_host(settings.base_url)
@@ -265,13 +272,13 @@ class OpenAIProvider(LLMProvider):
                 kwargs["api_key"] = settings.api_key
             self._client = OpenAI(**kwargs)
 
-    def embeddings(self) -> EmbeddingsClient:
+    def _create_embeddings(self) -> EmbeddingsClient:
         model = self._settings.models.get("embeddings", "")
         return OpenAIEmbeddings(
             self._client, model, self._base_host, provider_label="openai"
         )
 
-    def chat(self) -> ChatClient:
+    def _create_chat(self) -> ChatClient:
         model = self._settings.models.get("chat", "")
         return OpenAIChat(self._client, model, self._base_host, provider_label="openai")
 
@@ -1,20 +1,343 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from .settings import RateLimitPolicy
+from .tokenization import CharCountTokenCounter, TiktokenTokenCounter
+from .types import ChatClient, EmbeddingsClient, TokenCounter
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding a per-minute budget.
+
+    Reservations are taken immediately and may drive the level negative; the
+    caller then waits until the refill has paid that debt back. This keeps
+    concurrent reservations strictly ordered without a separate wait queue.
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        if per_minute <= 0:
+            raise ValueError("per_minute must be a positive integer")
+        self.capacity = float(per_minute)
+        self.refill_per_second = per_minute / 60.0
+        self._clock = clock
+        self._level = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._level = min(
+                self.capacity, self._level + elapsed * self.refill_per_second
+            )
+        self._updated = now
+
+    @property
+    def level(self) -> float:
+        """Currently available budget (negative while in debt)."""
+        self._refill()
+        return self._level
+
+    @property
+    def fill_ratio(self) -> float:
+        """Available budget as a fraction of capacity, clamped to [0, 1]."""
+        return max(0.0, min(1.0, self.level / self.capacity))
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` from the bucket and return the seconds to wait.
+
+        A single reservation larger than the bucket is clamped to its capacity
+        so oversized requests are delayed rather than blocked forever.
+        """
+        amount = min(max(0.0, float(amount)), self.capacity)
+        self._refill()
+        self._level -= amount
+        if self._level >= 0:
+            return 0.0
+        return -self._level / self.refill_per_second
 
 
 class AsyncRateLimiter:
-    """Minimal async rate limiter placeholder.
+    """Async limiter enforcing concurrency, requests/minute and tokens/minute.
 
-    In later phases, enforce RPM/TPM and concurrency.
+    ``async with limiter`` takes one request slot. ``limiter.acquire(tokens)``
+    additionally charges ``tokens`` against the TPM budget. Limits left as
+    ``None`` are not enforced. A limiter may be shared across event loops and
+    threads; buckets are guarded by a thread lock and the concurrency
+    semaphore is bound to the loop that uses it.
     """
 
-    def __init__(self, max_concurrency: int = 5):
-        self._semaphore = asyncio.Semaphore(max_concurrency)
+    def __init__(
+        self,
+        max_concurrency: int = 5,
+        rpm: int | None = None,
+        tpm: int | None = None,
+        *,
+        name: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_concurrency = max(1, int(max_concurrency))
+        self._rpm = TokenBucket(rpm, clock) if rpm else None
+        self._tpm = TokenBucket(tpm, clock) if tpm else None
+        self._lock = threading.Lock()
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
+        self._last_wait_s = 0.0
+        self._total_wait_s = 0.0
+        self._requests = 0
+        self._tokens = 0
+
+    @classmethod
+    def from_policy(
+        cls, policy: RateLimitPolicy | None, *, name: str | None = None
+    ) -> AsyncRateLimiter:
+        policy = policy or RateLimitPolicy()
+        return cls(
+            max_concurrency=policy.concurrency,
+            rpm=policy.rpm,
+            tpm=policy.tpm,
+            name=name,
+        )
+
+    @property
+    def enforces_budget(self) -> bool:
+        """True when an RPM or TPM limit is configured."""
+        return self._rpm is not None or self._tpm is not None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore_loop is not loop:
+            # asyncio primitives are bound to one loop; start fresh on a new one
+            with self._lock:
+                if self._semaphore_loop is not loop:
+                    if self._semaphore_loop is not None:
+                        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+                    self._semaphore_loop = loop
+        return self._semaphore
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Charge one request and ``tokens`` tokens; return the seconds to wait."""
+        with self._lock:
+            wait_s = 0.0
+            if self._rpm is not None:
+                wait_s = max(wait_s, self._rpm.reserve(1))
+            if self._tpm is not None and tokens > 0:
+                wait_s = max(wait_s, self._tpm.reserve(tokens))
+            self._last_wait_s = wait_s
+            self._total_wait_s += wait_s
+            self._requests += 1
+            self._tokens += max(0, int(tokens))
+        return wait_s
+
+    @asynccontextmanager
+    async def acquire(self, tokens: int = 0) -> AsyncIterator[AsyncRateLimiter]:
+        """Wait for budget and a concurrency slot, holding the slot while open."""
+        wait_s = self.reserve(tokens)
+        if wait_s > 0:
+            await asyncio.sleep(wait_s)
+        semaphore = self._get_semaphore()
+        await semaphore.acquire()
+        try:
+            yield self
+        finally:
+            semaphore.release()
 
     async def __aenter__(self):
-        await self._semaphore.acquire()
+        wait_s = self.reserve(0)
+        if wait_s > 0:
+            await asyncio.sleep(wait_s)
+        await self._get_semaphore().acquire()
         return self
 
     async def __aexit__(self, exc_type, exc, tb):
-        self._semaphore.release()
+        self._get_semaphore().release()
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot of the limiter state for metrics and logging.
+
+        Bucket fill levels are ``None`` when the corresponding limit is off.
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "wait_seconds": self._last_wait_s,
+                "total_wait_seconds": self._total_wait_s,
+                "requests": self._requests,
+                "tokens": self._tokens,
+                "rpm_fill": self._rpm.fill_ratio if self._rpm else None,
+                "tpm_fill": self._tpm.fill_ratio if self._tpm else None,
+            }
+
+
+_shared_limiters: dict[tuple[Any, ...], AsyncRateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(
+    provider: str, model: str | None, policy: RateLimitPolicy | None
+) -> AsyncRateLimiter:
+    """Return the process-wide limiter for a provider/model and policy.
+
+    Every client created for the same provider, model and limits draws from
+    the same buckets, so the configured budget holds across services.
+    """
+    policy = policy or RateLimitPolicy()
+    key = (provider, model or "", policy.rpm, policy.tpm, policy.concurrency)
+    with _shared_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = AsyncRateLimiter.from_policy(
+                policy, name=f"{provider}:{model}" if model else provider
+            )
+            _shared_limiters[key] = limiter
+        return limiter
+
+
+def reset_shared_rate_limiters() -> None:
+    """Forget all shared limiters (mainly for tests)."""
+    with _shared_lock:
+        _shared_limiters.clear()
+
+
+def budget_token_counter(
+    tokenizer: str | None, fallback: TokenCounter | None = None
+) -> TokenCounter:
+    """Return a local token counter used to charge the TPM budget.
+
+    The configured tiktoken encoding is preferred; otherwise ``fallback`` (or a
+    character count) is used. Counting must stay local, so providers whose
+    tokenizer calls a remote API should not pass it as the fallback.
+    """
+    if tokenizer and tokenizer != "none":
+        return TiktokenTokenCounter(tokenizer)
+    return fallback or CharCountTokenCounter()
+
+
+def _count_tokens(counter: TokenCounter | None, texts: list[str]) -> int:
+    if counter is None:
+        return 0
+    total = 0
+    for text in texts:
+        try:
+            total += int(counter.count(text))
+        except Exception:
+            total += len(text)
+    return total
+
+
+class RateLimitedEmbeddings(EmbeddingsClient):
+    """Embeddings client that charges each call against a shared limiter.
+
+    Attribute access falls through to the wrapped client.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingsClient,
+        limiter: AsyncRateLimiter,
+        token_counter: TokenCounter | None = None,
+    ):
+        self._inner = inner
+        self.rate_limiter = limiter
+        self._token_counter = token_counter
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    async def embed(self, inputs: list[str]) -> list[list[float]]:
+        tokens = _count_tokens(self._token_counter, inputs)
+        async with self.rate_limiter.acquire(tokens):
+            return await self._inner.embed(inputs)
+
+
+class RateLimitedChat(ChatClient):
+    """Chat client that charges prompt and completion budget to a limiter."""
+
+    def __init__(
+        self,
+        inner: ChatClient,
+        limiter: AsyncRateLimiter,
+        token_counter: TokenCounter | None = None,
+    ):
+        self._inner = inner
+        self.rate_limiter = limiter
+        self._token_counter = token_counter
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    async def chat(
+        self, messages: list[dict[str, Any]], **kwargs: Any
+    ) -> dict[str, Any]:
+        texts = [m.get("content") for m in messages if isinstance(m, dict)]
+        tokens = _count_tokens(
+            self._token_counter, [t for t in texts if isinstance(t, str)]
+        )
+        max_tokens = kwargs.get("max_tokens")
+        if isinstance(max_tokens, int) and max_tokens > 0:
+            tokens += max_tokens
+        async with self.rate_limiter.acquire(tokens):
+            return await self._inner.chat(messages, **kwargs)
+
+
+class RateLimitedProvider:
+    """Mixin routing a provider's clients through the shared rate limiters.
+
+    Providers store their ``LLMSettings`` as ``_settings`` and build raw
+    clients in ``_create_embeddings`` / ``_create_chat``; the mixin wraps them
+    so every call is charged against the provider/model budget.
+    """
+
+    rate_limit_label = "llm"
+
+    def _create_embeddings(self) -> EmbeddingsClient:
+        raise NotImplementedError
+
+    def _create_chat(self) -> ChatClient:
+        raise NotImplementedError
+
+    def _budget_fallback(self) -> TokenCounter | None:
+        """Local counter used when no tiktoken encoding is configured."""
+        return None
+
+    def _limiter_for(self, model: str | None) -> AsyncRateLimiter:
+        settings = self._settings  # type: ignore[attr-defined]
+        return get_shared_rate_limiter(
+            self.rate_limit_label, model, getattr(settings, "rate_limits", None)
+        )
+
+    @property
+    def rate_limiter(self) -> AsyncRateLimiter:
+        """Limiter shared by every embeddings client of this provider/model."""
+        return self._limiter_for(self._settings.models.get("embeddings"))  # type: ignore[attr-defined]
+
+    def _budget_counter(self) -> TokenCounter:
+        counter = self.__dict__.get("_rate_limit_counter")
+        if counter is None:
+            counter = budget_token_counter(
+                getattr(self._settings, "tokenizer", None),  # type: ignore[attr-defined]
+                self._budget_fallback(),
+            )
+            self._rate_limit_counter = counter
+        return counter
+
+    def embeddings(self) -> EmbeddingsClient:
+        return RateLimitedEmbeddings(
+            self._create_embeddings(), self.rate_limiter, self._budget_counter()
+        )
+
+    def chat(self) -> ChatClient:
+        client = self._create_chat()
+        model = self._settings.models.get("chat", "")  # type: ignore[attr-defined]
+        return RateLimitedChat(client, self._limiter_for(model), self._budget_counter())
@@ -0,0 +1,103 @@
+"""Unit tests for qdrant_loader_core.config.collection_profiles."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+from qdrant_loader_core.config import (
+    BUILTIN_COLLECTION_PROFILES,
+    CollectionProfile,
+    available_collection_profiles,
+    describe_collection,
+    match_collection_profile,
+    resolve_collection_profile,
+)
+
+
+def _info(*, vectors, quantization_config=None, hnsw_config=None) -> SimpleNamespace:
+    """Minimal stand-in for a Qdrant ``CollectionInfo``."""
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors=vectors, sparse_vectors=None),
+            quantization_config=quantization_config,
+            hnsw_config=hnsw_config,
+        )
+    )
+
+
+def test_default_profile_is_plain_vectors() -> None:
+    profile = resolve_collection_profile(None)
+    assert profile == CollectionProfile()
+    assert profile.quantization == "none"
+    assert profile.vectors_on_disk is False
+
+
+def test_unknown_profile_is_rejected() -> None:
+    with pytest.raises(ValueError, match="Unknown collection profile 'fastest'"):
+        resolve_collection_profile("fastest")
+
+
+def test_custom_profiles_extend_and_override_builtins() -> None:
+    profiles = available_collection_profiles(
+        {
+            "balanced": {"quantization": "scalar", "hnsw_m": 24},
+            "pq": {"quantization": "product", "product_compression": "x32"},
+        }
+    )
+    assert profiles["balanced"].hnsw_m == 24
+    assert profiles["pq"].product_compression == "x32"
+    assert profiles["max_recall"] == BUILTIN_COLLECTION_PROFILES["max_recall"]
+
+
+def test_profile_rejects_unknown_options() -> None:
+    with pytest.raises(ValidationError):
+        CollectionProfile.model_validate({"quantisation": "scalar"})
+
+
+def test_describe_named_vector_with_vector_level_settings() -> None:
+    info = _info(
+        vectors={
+            "dense": {
+                "size": 1536,
+                "on_disk": True,
+                "quantization_config": {"binary": {"always_ram": True}},
+            }
+        },
+        hnsw_config={"m": 16, "ef_construct": 100},
+    )
+    assert describe_collection(info, "dense") == {
+        "quantization": "binary",
+        "vectors_on_disk": True,
+        "hnsw_m": 16,
+        "hnsw_ef_construct": 100,
+    }
+
+
+def test_match_builtin_profiles() -> None:
+    balanced = _info(
+        vectors={"size": 1536, "on_disk": True},
+        quantization_config=SimpleNamespace(scalar=SimpleNamespace(type="int8")),
+        hnsw_config=SimpleNamespace(m=16, ef_construct=128),
+    )
+    max_recall = _info(
+        vectors={"size": 1536},
+        hnsw_config=SimpleNamespace(m=32, ef_construct=256),
+    )
+    plain = _info(vectors={"size": 1536}, hnsw_config={"m": 16, "ef_construct": 100})
+
+    profiles = available_collection_profiles()
+    assert match_collection_profile(balanced, profiles, "dense") == "balanced"
+    assert match_collection_profile(max_recall, profiles, "dense") == "max_recall"
+    assert match_collection_profile(plain, profiles, "dense") == "default"
+
+
+def test_unmatched_collection_has_no_profile() -> None:
+    info = _info(
+        vectors={"size": 1536},
+        quantization_config={"product": {"compression": "x16"}},
+    )
+    assert (
+        match_collection_profile(info, available_collection_profiles(), "dense") is None
+    )
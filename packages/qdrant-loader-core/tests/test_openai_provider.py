@@ -199,3 +199,27 @@ async def test_openai_exception_mapping(monkeypatch, exc_ctor, expected_module_e
     mapped = ei.value
     assert isinstance(mapped, err_mod.LLMError)
     assert mapped.__class__.__name__ == expected_module_error
+
+
+@pytest.mark.asyncio
+async def test_openai_provider_charges_shared_rate_limiter(monkeypatch):
+    mod = _reload_openai_provider(monkeypatch)
+    ratelimit = import_module("qdrant_loader_core.llm.ratelimit")
+    ratelimit.reset_shared_rate_limiters()
+
+    settings = _make_llm_settings()
+    settings.rate_limits.rpm = 100
+    provider = mod.OpenAIProvider(settings)
+    other = mod.OpenAIProvider(settings)
+
+    assert provider.rate_limiter is other.rate_limiter
+    assert provider.rate_limiter.enforces_budget
+
+    await provider.embeddings().embed(["abc", "de"])
+    await other.embeddings().embed(["f"])
+
+    stats = provider.rate_limiter.stats()
+    assert stats["requests"] == 2
+    # tokenizer "none" budgets by characters
+    assert stats["tokens"] == 6
+    ratelimit.reset_shared_rate_limiters()
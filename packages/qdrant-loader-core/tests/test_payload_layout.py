@@ -0,0 +1,71 @@
+"""Unit tests for qdrant_loader_core.config.payload_layout."""
+
+from __future__ import annotations
+
+from qdrant_loader_core.config import (
+    PAYLOAD_VERSION_KEY,
+    PayloadLayout,
+    analysis_collection_name,
+    build_payload,
+    merge_analysis,
+    migrate_payload,
+    payload_metadata,
+)
+
+FIELDS = {"content": "text", "document_id": "doc1", "created_at": "2024-01-01T00:00:00"}
+METADATA = {
+    "project_id": "proj",
+    "is_attachment": False,
+    "chunk_index": 3,
+    "entities": [{"text": "Qdrant", "label": "ORG"}],
+}
+
+
+def test_version_1_keeps_legacy_layout() -> None:
+    payload, analysis = build_payload(FIELDS, METADATA, PayloadLayout(version=1))
+    assert payload == {**FIELDS, "metadata": METADATA}
+    assert analysis == {}
+
+
+def test_version_2_promotes_filterable_fields() -> None:
+    payload, analysis = build_payload(FIELDS, METADATA, PayloadLayout())
+    assert payload["project_id"] == "proj"
+    assert payload["is_attachment"] is False
+    assert payload["metadata"] == {
+        "chunk_index": 3,
+        "entities": [{"text": "Qdrant", "label": "ORG"}],
+    }
+    assert payload[PAYLOAD_VERSION_KEY] == 2
+    assert analysis == {}
+    assert payload_metadata(payload) == METADATA
+
+
+def test_analysis_fields_go_to_side_store_or_are_dropped() -> None:
+    payload, analysis = build_payload(
+        FIELDS, METADATA, PayloadLayout(analysis_fields="side_store")
+    )
+    assert "entities" not in payload["metadata"]
+    assert analysis == {"entities": [{"text": "Qdrant", "label": "ORG"}]}
+
+    payload, analysis = build_payload(
+        FIELDS, METADATA, PayloadLayout(analysis_fields="drop")
+    )
+    assert "entities" not in payload["metadata"]
+    assert analysis == {}
+
+
+def test_migrate_payload_is_idempotent() -> None:
+    legacy = {**FIELDS, "metadata": METADATA}
+    layout = PayloadLayout(analysis_fields="drop")
+    migrated, _ = migrate_payload(legacy, layout)
+    assert migrated == build_payload(FIELDS, METADATA, layout)[0]
+    assert migrate_payload(migrated, layout)[0] == migrated
+
+
+def test_side_store_fields_merge_back_into_metadata() -> None:
+    payload, analysis = build_payload(
+        FIELDS, METADATA, PayloadLayout(analysis_fields="side_store")
+    )
+    side_payload = {"document_id": "doc1", **analysis}
+    assert merge_analysis(payload_metadata(payload), side_payload) == METADATA
+    assert analysis_collection_name("docs__v2") == "docs__v2__analysis"
@@ -54,3 +54,122 @@ async def test_rate_limiter_releases_permit():
     # With concurrency=1, we should never see more than 1 in the critical section
     await asyncio.gather(work(), work(), work())
     assert max_seen == 1
+
+
+class _FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_refills_and_reports_wait():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    bucket = mod.TokenBucket(60, clock)  # 1 unit per second
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.fill_ratio == 0.0
+    # Next unit has to wait for one second of refill
+    assert bucket.reserve(1) == pytest.approx(1.0)
+
+    clock.now = 31.0
+    assert bucket.level == pytest.approx(30.0)
+    assert bucket.fill_ratio == pytest.approx(0.5)
+
+
+def test_token_bucket_clamps_oversized_reservation():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    bucket = mod.TokenBucket(60, _FakeClock())
+    bucket.reserve(60)
+    # A request larger than the whole budget waits for a full refill, not forever
+    assert bucket.reserve(10_000) == pytest.approx(60.0)
+
+
+def test_rate_limiter_charges_requests_and_tokens():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    limiter = mod.AsyncRateLimiter(rpm=120, tpm=600, clock=clock)
+
+    assert limiter.enforces_budget
+    assert limiter.reserve(600) == 0.0
+    # Token budget is exhausted: 300 tokens refill in 30 seconds
+    assert limiter.reserve(300) == pytest.approx(30.0)
+
+    stats = limiter.stats()
+    assert stats["requests"] == 2
+    assert stats["tokens"] == 900
+    assert stats["wait_seconds"] == pytest.approx(30.0)
+    assert stats["tpm_fill"] == 0.0
+    assert stats["rpm_fill"] == pytest.approx(118 / 120)
+
+
+def test_rate_limiter_without_budget_never_waits():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    limiter = mod.AsyncRateLimiter(max_concurrency=2)
+
+    assert not limiter.enforces_budget
+    assert limiter.reserve(10**9) == 0.0
+    assert limiter.stats()["rpm_fill"] is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_acquire_sleeps_for_budget(monkeypatch):
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    clock = _FakeClock()
+    limiter = mod.AsyncRateLimiter(rpm=60, clock=clock)
+    sleeps: list[float] = []
+
+    async def fake_sleep(seconds):
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(mod.asyncio, "sleep", fake_sleep)
+
+    for _ in range(61):
+        async with limiter.acquire():
+            pass
+
+    assert sleeps == [pytest.approx(1.0)]
+
+
+def test_shared_rate_limiter_is_keyed_by_provider_model_and_policy():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+    RateLimitPolicy = import_module("qdrant_loader_core.llm.settings").RateLimitPolicy
+    mod.reset_shared_rate_limiters()
+
+    policy = RateLimitPolicy(rpm=100, tpm=1000)
+    first = mod.get_shared_rate_limiter("openai", "m", policy)
+    assert (
+        mod.get_shared_rate_limiter("openai", "m", RateLimitPolicy(100, 1000)) is first
+    )
+    assert mod.get_shared_rate_limiter("ollama", "m", policy) is not first
+    assert mod.get_shared_rate_limiter("openai", "other", policy) is not first
+
+    mod.reset_shared_rate_limiters()
+    assert mod.get_shared_rate_limiter("openai", "m", policy) is not first
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_embeddings_charge_token_counts():
+    mod = import_module("qdrant_loader_core.llm.ratelimit")
+
+    class _Inner:
+        _provider_label = "fake"
+
+        async def embed(self, inputs):
+            return [[float(len(text))] for text in inputs]
+
+    class _WordCounter:
+        def count(self, text):
+            return len(text.split())
+
+    limiter = mod.AsyncRateLimiter(tpm=1000)
+    client = mod.RateLimitedEmbeddings(_Inner(), limiter, _WordCounter())
+
+    vectors = await client.embed(["one two", "three"])
+
+    assert vectors == [[7.0], [5.0]]
+    assert limiter.stats()["tokens"] == 3
+    # Attributes of the wrapped client stay reachable
+    assert client._provider_label == "fake"
@@ -0,0 +1,44 @@
+"""Yaml-loader wrapper that produces the known collection profiles.
+
+The profiles and the matching rules live in ``qdrant_loader_core.config``;
+this module reads the custom profiles from ``global.qdrant`` of the MCP
+server's ``MCP_CONFIG`` yaml file, so collections created with them are
+recognized too.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+
+from qdrant_loader_core.config import (
+    CollectionProfile,
+    available_collection_profiles,
+)
+
+from .sparse_config import _load_global_section
+
+logger = logging.getLogger(__name__)
+
+
+def load_collection_profiles(
+    mcp_config_path: str | None = None,
+) -> dict[str, CollectionProfile]:
+    """Built-in collection profiles plus the ones configured in the MCP yaml.
+
+    Invalid custom profiles are logged and ignored.
+    """
+    global_section = _load_global_section(mcp_config_path or os.getenv("MCP_CONFIG"))
+    qdrant_section = global_section.get("qdrant")
+    custom = (
+        qdrant_section.get("collection_profiles")
+        if isinstance(qdrant_section, dict)
+        else None
+    )
+    if not isinstance(custom, dict):
+        return available_collection_profiles()
+    try:
+        return available_collection_profiles(custom)
+    except Exception as e:
+        logger.warning("Ignoring invalid collection profiles in MCP config: %s", e)
+        return available_collection_profiles()
@@ -0,0 +1,121 @@
+"""Analysis fields stored outside the payload by the loader."""
+
+from __future__ import annotations
+
+import time
+from asyncio import Lock
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+from qdrant_loader_core.config import (
+    PAYLOAD_VERSION_KEY,
+    analysis_collection_name,
+    merge_analysis,
+)
+
+if TYPE_CHECKING:
+    from qdrant_client import AsyncQdrantClient
+
+from ...utils.logging import LoggingConfig
+
+# Seconds the side collection lookup is trusted. The collection name may be an
+# alias that a reindex switches to another version with its own side collection.
+ANALYSIS_COLLECTION_TTL_SECONDS = 60.0
+
+
+class AnalysisStore:
+    """Merges the analysis fields of the side collection into search hits.
+
+    With ``analysis_fields: side_store`` the loader moves the analysis fields
+    of version 2 payloads to ``<collection>__analysis``, in points with the
+    IDs of the collection's points. Hits are completed with one ``retrieve``
+    by ID; nothing is fetched for collections without a side collection or
+    for hits with a version 1 payload.
+    """
+
+    def __init__(self, qdrant_client: AsyncQdrantClient, collection_name: str):
+        self.qdrant_client = qdrant_client
+        self.collection_name = collection_name
+        self.logger = LoggingConfig.get_logger(__name__)
+        self._side_collection: str | None = None
+        self._resolved_at: float | None = None
+        self._lock = Lock()
+
+    async def merge_into(
+        self, points: Sequence[Any], hits: Sequence[dict[str, Any]]
+    ) -> None:
+        """Add the analysis fields of ``points`` to the metadata of ``hits``.
+
+        Args:
+            points: Qdrant points with ``id`` and ``payload``
+            hits: Search hits built from ``points``, in the same order
+        """
+        ids = [
+            point.id
+            for point in points
+            if getattr(point, "id", None) is not None
+            and (getattr(point, "payload", None) or {}).get(PAYLOAD_VERSION_KEY, 1) >= 2
+        ]
+        if not ids:
+            return
+        side_collection = await self._get_side_collection()
+        if side_collection is None:
+            return
+        try:
+            records = await self.qdrant_client.retrieve(
+                collection_name=side_collection,
+                ids=ids,
+                with_payload=True,
+                with_vectors=False,
+            )
+        except Exception as e:
+            self.logger.warning(
+                "Failed to fetch analysis fields; returning hits without them",
+                collection=side_collection,
+                error=str(e),
+            )
+            return
+        analysis = {str(record.id): record.payload or {} for record in records}
+        for point, hit in zip(points, hits, strict=True):
+            fields = analysis.get(str(getattr(point, "id", None)))
+            if fields:
+                hit["metadata"] = merge_analysis(hit.get("metadata") or {}, fields)
+
+    async def _get_side_collection(self) -> str | None:
+        """Side collection of the collection the name resolves to, if it exists.
+
+        Lookup failures are logged and not cached, so the next search retries.
+        """
+        if self._fresh():
+            return self._side_collection
+        async with self._lock:
+            if self._fresh():
+                return self._side_collection
+            try:
+                aliases = await self.qdrant_client.get_aliases()
+                target = next(
+                    (
+                        alias.collection_name
+                        for alias in aliases.aliases
+                        if alias.alias_name == self.collection_name
+                    ),
+                    None,
+                )
+                name = analysis_collection_name(target or self.collection_name)
+                exists = await self.qdrant_client.collection_exists(name)
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to look up the analysis side collection",
+                    collection=self.collection_name,
+                    error=str(e),
+                )
+                return None
+            self._side_collection = name if exists else None
+            self._resolved_at = time.monotonic()
+        return self._side_collection
+
+    def _fresh(self) -> bool:
+        return (
+            self._resolved_at is not None
+            and time.monotonic() - self._resolved_at < ANALYSIS_COLLECTION_TTL_SECONDS
+        )
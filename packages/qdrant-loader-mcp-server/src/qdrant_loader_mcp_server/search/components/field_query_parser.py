@@ -52,10 +52,17 @@ class FieldQueryParser:
         "chunk_index": "metadata.chunk_index",
         "total_chunks": "metadata.total_chunks",
         "chunking_strategy": "metadata.chunking_strategy",
-        "original_file_type": "metadata.original_file_type",
         "conversion_method": "metadata.conversion_method",
+        # Top-level from payload layout version 2, under metadata before
+        "original_file_type": "original_file_type",
     }
 
+    # Fields matched at the top level and under metadata, for both payload
+    # layouts
+    PROMOTED_FIELDS = frozenset(
+        {"original_file_type", "file_type", "file_name", "file_path"}
+    )
+
     # Field query pattern: field_name:value or field_name:"quoted value"
     FIELD_PATTERN = re.compile(r'(\w+):(?:"([^"]+)"|([^\s]+))')
 
@@ -177,6 +184,17 @@ class FieldQueryParser:
                 condition = models.FieldCondition(
                     key=payload_key, match=models.MatchValue(value=match_value)
                 )
+                if field_query.field_name in self.PROMOTED_FIELDS:
+                    # Version 1 payloads keep the field under metadata
+                    condition = models.Filter(
+                        should=[
+                            condition,
+                            models.FieldCondition(
+                                key=f"metadata.{payload_key}",
+                                match=models.MatchValue(value=match_value),
+                            ),
+                        ]
+                    )
 
                 must_conditions.append(condition)
                 self.logger.debug(
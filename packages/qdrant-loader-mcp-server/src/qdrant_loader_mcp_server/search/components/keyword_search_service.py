@@ -9,12 +9,14 @@ import nltk
 import numpy as np
 from nltk.stem import SnowballStemmer
 from nltk.tokenize import RegexpTokenizer
+from qdrant_loader_core.config import payload_metadata
 from rank_bm25 import BM25Okapi
 
 if TYPE_CHECKING:
     from qdrant_client import AsyncQdrantClient
 
 from ...utils.logging import LoggingConfig
+from .analysis_store import AnalysisStore
 from .field_query_parser import FieldQueryParser
 
 
@@ -35,6 +37,8 @@ class KeywordSearchService:
         self.qdrant_client = qdrant_client
         self.collection_name = collection_name
         self.field_parser = FieldQueryParser()
+        # Analysis fields the loader moved to a side collection
+        self.analysis_store = AnalysisStore(qdrant_client, collection_name)
         self.logger = LoggingConfig.get_logger(__name__)
         self._stemmer = SnowballStemmer(language="english")
 
@@ -130,11 +134,13 @@ class KeywordSearchService:
         created_ats = []
         updated_ats = []
         contextual_contents = []
+        # Points of the documents, for the analysis fields of the results
+        document_points = []
 
         for point in all_points:
             if point.payload:
                 content = point.payload.get("content", "")
-                metadata = point.payload.get("metadata", {})
+                metadata = payload_metadata(point.payload)
                 source_type = point.payload.get("source_type", "unknown")
                 # Extract fields directly from Qdrant payload
                 title = point.payload.get("title", "")
@@ -155,6 +161,7 @@ class KeywordSearchService:
                 created_ats.append(created_at)
                 updated_ats.append(updated_at)
                 contextual_contents.append(contextual_content)
+                document_points.append(point)
 
         if not documents:
             self.logger.warning("No documents found for keyword search")
@@ -182,6 +189,7 @@ class KeywordSearchService:
         )
 
         results = []
+        result_points = []
         for idx in top_indices:
             if scores[idx] > 0:
                 result = {
@@ -200,7 +208,9 @@ class KeywordSearchService:
                 }
 
                 results.append(result)
+                result_points.append(document_points[idx])
 
+        await self.analysis_store.merge_into(result_points, results)
         return results
 
     # Note: _build_filter method removed - now using FieldQueryParser.create_qdrant_filter()
@@ -16,13 +16,19 @@ if TYPE_CHECKING:
 
 from qdrant_client.http import models
 from qdrant_loader_core.config import (
+    CollectionSearchParams,
     CollectionVectorCapabilities,
+    describe_collection,
+    match_collection_profile,
     parse_collection_capabilities,
+    payload_metadata,
 )
 from qdrant_loader_core.sparse import get_sparse_encoder
 
 from ...utils.logging import LoggingConfig
+from ..collection_profiles import load_collection_profiles
 from ..sparse_config import load_sparse_runtime_config
+from .analysis_store import AnalysisStore
 from .field_query_parser import FieldQueryParser
 
 # Task-local flag set by vector_search when Qdrant fusion is used for the
@@ -32,11 +38,16 @@ _used_qdrant_hybrid_ctx: ContextVar[bool] = ContextVar(
     "vector_search_used_qdrant_hybrid", default=False
 )
 
+# Seconds a collection probe is trusted. The collection name may be an alias
+# that a reindex switches to a collection with another layout.
+CAPABILITIES_TTL_SECONDS = 60.0
+
 
 @dataclass
 class FilterResult:
     score: float
     payload: dict
+    id: Any = None
 
 
 class VectorSearchService:
@@ -88,16 +99,24 @@ class VectorSearchService:
 
         # Field query parser for handling field:value syntax
         self.field_parser = FieldQueryParser()
+        # Analysis fields the loader moved to a side collection
+        self.analysis_store = AnalysisStore(qdrant_client, collection_name)
 
         self.logger = LoggingConfig.get_logger(__name__)
 
         self.sparse_runtime = load_sparse_runtime_config()
         self._collection_capabilities: CollectionVectorCapabilities | None = None
+        self._capabilities_probed_at = 0.0
         self._capabilities_lock: Lock = Lock()
 
         # Qdrant search parameters
         self.hnsw_ef = hnsw_ef
         self.use_exact_search = use_exact_search
+        # Search parameters of the profile the collection was created with,
+        # set by the collection probe
+        self.collection_profiles = load_collection_profiles()
+        self._profile_search_params = CollectionSearchParams()
+        self._collection_quantized = False
 
     def _generate_cache_key(
         self, query: str, limit: int, project_ids: list[str] | None = None
@@ -149,13 +168,14 @@ class VectorSearchService:
 
         Transient ``get_collection`` failures are logged and returned as
         empty capabilities for the current call only — they are never cached,
-        so the next call retries.
+        so the next call retries. Successful probes are renewed every
+        ``CAPABILITIES_TTL_SECONDS``.
         """
-        if self._collection_capabilities is not None:
+        if self._capabilities_fresh():
             return self._collection_capabilities
 
         async with self._capabilities_lock:
-            if self._collection_capabilities is not None:
+            if self._capabilities_fresh():
                 return self._collection_capabilities
             try:
                 info = await self.qdrant_client.get_collection(
@@ -174,8 +194,61 @@ class VectorSearchService:
             self._collection_capabilities = parse_collection_capabilities(
                 info, self.sparse_runtime
             )
+            self._capabilities_probed_at = time.monotonic()
+            self._apply_collection_profile(info)
         return self._collection_capabilities
 
+    def _capabilities_fresh(self) -> bool:
+        return (
+            self._collection_capabilities is not None
+            and time.monotonic() - self._capabilities_probed_at
+            < CAPABILITIES_TTL_SECONDS
+        )
+
+    def _apply_collection_profile(self, info: Any) -> None:
+        """Pick the search parameters of the profile the collection matches.
+
+        Quantized collections that match no known profile are still searched
+        with rescoring, at Qdrant's default oversampling.
+        """
+        dense_vector_name = self.sparse_runtime.dense_vector_name
+        self._collection_quantized = (
+            describe_collection(info, dense_vector_name)["quantization"] != "none"
+        )
+        profile_name = match_collection_profile(
+            info, self.collection_profiles, dense_vector_name
+        )
+        self._profile_search_params = (
+            self.collection_profiles[profile_name].search
+            if profile_name
+            else CollectionSearchParams()
+        )
+        self.logger.debug(
+            "Detected collection profile",
+            collection=self.collection_name,
+            collection_profile=profile_name,
+            quantized=self._collection_quantized,
+        )
+
+    def _search_params(self) -> models.SearchParams:
+        """Search parameters for the probed collection.
+
+        ``hnsw_ef`` is raised to the profile's value when the profile asks for
+        a larger candidate list than the configured one.
+        """
+        profile_params = self._profile_search_params
+        quantization = None
+        if self._collection_quantized:
+            quantization = models.QuantizationSearchParams(
+                rescore=profile_params.rescore,
+                oversampling=profile_params.oversampling,
+            )
+        return models.SearchParams(
+            hnsw_ef=max(self.hnsw_ef, profile_params.hnsw_ef or 0),
+            exact=bool(self.use_exact_search),
+            quantization=quantization,
+        )
+
     def _dense_using(self, caps: CollectionVectorCapabilities) -> str | None:
         """Return the named-dense vector key, or None for legacy unnamed collections."""
         return self.sparse_runtime.dense_vector_name if caps.has_named_dense else None
@@ -295,6 +368,7 @@ class VectorSearchService:
             )
 
         extracted = self._extract_hits(results)
+        await self.analysis_store.merge_into(results, extracted)
         await self._cache_put(cache_key, extracted, query)
         return extracted
 
@@ -367,7 +441,9 @@ class VectorSearchService:
             with_payload=True,
             with_vectors=False,
         )
-        return [FilterResult(1.0, point.payload) for point in scroll_results[0]]
+        return [
+            FilterResult(1.0, point.payload, point.id) for point in scroll_results[0]
+        ]
 
     async def _run_vector_search(
         self,
@@ -379,9 +455,6 @@ class VectorSearchService:
         """Dispatch to either the Qdrant hybrid query or the dense-only query."""
         search_query = parsed_query.text_query or original_query
         query_embedding = await self.get_embedding(search_query)
-        search_params = models.SearchParams(
-            hnsw_ef=self.hnsw_ef, exact=bool(self.use_exact_search)
-        )
         query_filter = self.field_parser.create_qdrant_filter(
             parsed_query.field_queries, project_ids
         )
@@ -390,6 +463,7 @@ class VectorSearchService:
         # hybrid retrieval, we use hybrid; otherwise dense. Hybrid query
         # failures propagate so operators see them instead of degraded results.
         caps = await self._get_collection_capabilities()
+        search_params = self._search_params()
         if self._hybrid_query_active(caps):
             return await self._run_qdrant_hybrid_query(
                 query_embedding,
@@ -476,7 +550,7 @@ class VectorSearchService:
                 {
                     "score": hit.score,
                     "text": payload.get("content", ""),
-                    "metadata": payload.get("metadata", {}),
+                    "metadata": payload_metadata(payload),
                     "source_type": payload.get("source_type", "unknown"),
                     "title": payload.get("title", ""),
                     "url": payload.get("url", ""),
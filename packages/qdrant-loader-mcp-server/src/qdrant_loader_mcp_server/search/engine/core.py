@@ -161,9 +161,21 @@ class SearchEngine:
                 raise RuntimeError("Failed to initialize Qdrant client")
 
             collections = await self.client.get_collections()
-            if not any(
+            collection_exists = any(
                 c.name == config.collection_name for c in collections.collections
-            ):
+            )
+            if not collection_exists:
+                # Reindexed collections are served through an alias, which is
+                # what searches keep using when it is switched to a new version
+                alias_target = await self._get_alias_target(config.collection_name)
+                if alias_target is not None:
+                    collection_exists = True
+                    self.logger.info(
+                        "Searching through collection alias",
+                        alias=config.collection_name,
+                        collection=alias_target,
+                    )
+            if not collection_exists:
                 # Determine vector size from env or config file; avoid hardcoded default when possible
                 vector_size = None
                 # load_sparse_runtime_config reads MCP_CONFIG from the environment
@@ -278,6 +290,17 @@ class SearchEngine:
                 "Please ensure Qdrant is running and accessible."
             ) from e
 
+    async def _get_alias_target(self, alias: str) -> str | None:
+        """Collection an alias points to, or None when it is not an alias."""
+        try:
+            response = await self.client.get_aliases()
+            for description in response.aliases:
+                if description.alias_name == alias:
+                    return description.collection_name
+        except Exception as e:
+            self.logger.debug("Failed to list collection aliases", error=str(e))
+        return None
+
     async def cleanup(self) -> None:
         """Cleanup resources."""
         if self.client:
@@ -0,0 +1,123 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_loader_mcp_server.search.components.keyword_search_service import (
+    KeywordSearchService,
+)
+from qdrant_loader_mcp_server.search.components.vector_search_service import (
+    VectorSearchService,
+)
+
+
+class _EmbeddingsClient:
+    async def embed(self, inputs):  # type: ignore[no-untyped-def]
+        return [[0.2, 0.3, 0.4] for _ in inputs]
+
+
+class _Provider:
+    def embeddings(self):
+        return _EmbeddingsClient()
+
+
+def _point(point_id, content, version=2):
+    payload = {
+        "content": content,
+        "document_id": f"doc-{point_id}",
+        "project_id": "p1",
+        "metadata": {"chunk_index": 0},
+    }
+    if version == 2:
+        payload["payload_version"] = 2
+    return SimpleNamespace(id=point_id, score=0.9, payload=payload)
+
+
+def _client(points, side_collection_exists=True):
+    """Client of an alias ``docs`` to ``docs__v2``, with a side collection."""
+    client = MagicMock()
+    client.get_collection = AsyncMock(side_effect=RuntimeError("no probe"))
+    client.query_points = AsyncMock(return_value=SimpleNamespace(points=points))
+    client.scroll = AsyncMock(return_value=(points, None))
+    client.get_aliases = AsyncMock(
+        return_value=SimpleNamespace(
+            aliases=[SimpleNamespace(alias_name="docs", collection_name="docs__v2")]
+        )
+    )
+    client.collection_exists = AsyncMock(return_value=side_collection_exists)
+    client.retrieve = AsyncMock(
+        return_value=[
+            SimpleNamespace(
+                id=1,
+                payload={"document_id": "doc-1", "entities": [{"text": "Qdrant"}]},
+            )
+        ]
+    )
+    return client
+
+
+def _vector_service(client):
+    return VectorSearchService(
+        qdrant_client=client,
+        collection_name="docs",
+        embeddings_provider=_Provider(),
+        cache_enabled=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_vector_hits_get_analysis_fields_of_side_collection():
+    client = _client([_point(1, "qdrant"), _point(2, "other")])
+
+    hits = await _vector_service(client).vector_search("qdrant", 5)
+
+    client.collection_exists.assert_awaited_once_with("docs__v2__analysis")
+    client.retrieve.assert_awaited_once_with(
+        collection_name="docs__v2__analysis",
+        ids=[1, 2],
+        with_payload=True,
+        with_vectors=False,
+    )
+    assert hits[0]["metadata"] == {
+        "project_id": "p1",
+        "chunk_index": 0,
+        "entities": [{"text": "Qdrant"}],
+    }
+    assert hits[1]["metadata"] == {"project_id": "p1", "chunk_index": 0}
+
+
+@pytest.mark.asyncio
+async def test_side_collection_lookup_is_cached():
+    client = _client([_point(1, "qdrant")])
+    service = _vector_service(client)
+
+    await service.vector_search("qdrant", 5)
+    await service.vector_search("qdrant again", 5)
+
+    client.get_aliases.assert_awaited_once()
+    assert client.retrieve.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_fetched_without_side_collection_or_v2_payloads():
+    client = _client([_point(1, "qdrant")], side_collection_exists=False)
+    await _vector_service(client).vector_search("qdrant", 5)
+    client.retrieve.assert_not_awaited()
+
+    client = _client([_point(1, "qdrant", version=1)])
+    await _vector_service(client).vector_search("qdrant", 5)
+    client.get_aliases.assert_not_awaited()
+    client.retrieve.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_keyword_results_get_analysis_fields_of_side_collection():
+    client = _client(
+        [_point(1, "qdrant loader"), _point(2, "unrelated text"), _point(3, "more")]
+    )
+    service = KeywordSearchService(qdrant_client=client, collection_name="docs")
+
+    results = await service.keyword_search("qdrant", 5)
+
+    assert [r["document_id"] for r in results] == ["doc-1"]
+    assert results[0]["metadata"]["entities"] == [{"text": "Qdrant"}]
+    assert client.retrieve.await_args.kwargs["ids"] == [1]
@@ -166,6 +166,27 @@ class TestFieldQueryParser:
         assert filter_obj.must[0].key == "project_id"
         assert filter_obj.must[0].match.value == "specific-project"
 
+    def test_promoted_field_matches_both_payload_layouts(self, parser):
+        """Promoted fields match at the top level and under metadata."""
+        field_queries = [
+            FieldQuery(
+                field_name="original_file_type",
+                field_value="docx",
+                original_query="original_file_type:docx",
+            )
+        ]
+
+        filter_obj = parser.create_qdrant_filter(field_queries)
+
+        assert filter_obj is not None
+        condition = filter_obj.must[0]
+        assert isinstance(condition, models.Filter)
+        assert [c.key for c in condition.should] == [
+            "original_file_type",
+            "metadata.original_file_type",
+        ]
+        assert all(c.match.value == "docx" for c in condition.should)
+
     def test_numeric_field_conversion(self, parser):
         """Test that numeric fields are converted to int."""
         field_queries = [
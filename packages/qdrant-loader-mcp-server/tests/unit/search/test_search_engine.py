@@ -203,6 +203,39 @@ async def test_search_engine_collection_exists(
         mock_qdrant_client.create_collection.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_search_engine_collection_alias(
+    search_engine, qdrant_config, openai_config, mock_qdrant_client, mock_openai_client
+):
+    """A reindexed collection is searched through its alias, not recreated."""
+    collections_response = MagicMock()
+    collections_response.collections = []
+    mock_qdrant_client.get_collections.return_value = collections_response
+    alias = MagicMock()
+    alias.alias_name = "test_collection"
+    alias.collection_name = "test_collection__v2"
+    mock_qdrant_client.get_aliases.return_value = MagicMock(aliases=[alias])
+
+    with (
+        patch(
+            "qdrant_loader_mcp_server.search.engine.core.AsyncQdrantClient",
+            return_value=mock_qdrant_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.core.AsyncOpenAI",
+            return_value=mock_openai_client,
+        ),
+        patch(
+            "qdrant_loader_mcp_server.search.engine.core.HybridSearchEngine"
+        ) as mock_hybrid,
+    ):
+
+        await search_engine.initialize(qdrant_config, openai_config)
+
+        mock_qdrant_client.create_collection.assert_not_called()
+        assert mock_hybrid.call_args.kwargs["collection_name"] == "test_collection"
+
+
 @pytest.mark.asyncio
 async def test_search_engine_generate_topic_chain_not_initialized():
     """Test topic chain generation when not initialized."""
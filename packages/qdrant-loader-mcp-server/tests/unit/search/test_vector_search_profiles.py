@@ -0,0 +1,82 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_client.http import models
+from qdrant_loader_mcp_server.search.components.vector_search_service import (
+    VectorSearchService,
+)
+
+
+class _EmbeddingsClient:
+    async def embed(self, inputs):  # type: ignore[no-untyped-def]
+        return [[0.2, 0.3, 0.4] for _ in inputs]
+
+
+class _Provider:
+    def embeddings(self):
+        return _EmbeddingsClient()
+
+
+def _collection_info(
+    *, vectors, quantization_config=None, hnsw_config=None
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        config=SimpleNamespace(
+            params=SimpleNamespace(vectors=vectors, sparse_vectors=None),
+            quantization_config=quantization_config,
+            hnsw_config=hnsw_config,
+        )
+    )
+
+
+async def _search_params(info, hnsw_ef: int = 128) -> models.SearchParams:
+    qdrant_client = MagicMock()
+    qdrant_client.get_collection = AsyncMock(return_value=info)
+    qdrant_client.query_points = AsyncMock(return_value=SimpleNamespace(points=[]))
+    svc = VectorSearchService(
+        qdrant_client=qdrant_client,
+        collection_name="test_collection",
+        embeddings_provider=_Provider(),
+        hnsw_ef=hnsw_ef,
+    )
+    await svc.vector_search("test query", 5)
+    return qdrant_client.query_points.call_args.kwargs["search_params"]
+
+
+@pytest.mark.asyncio
+async def test_memory_saver_collection_is_rescored_with_oversampling():
+    info = _collection_info(
+        vectors={"size": 3, "on_disk": True},
+        quantization_config={"binary": {"always_ram": True}},
+        hnsw_config={"m": 16, "ef_construct": 100},
+    )
+
+    params = await _search_params(info)
+
+    assert params.hnsw_ef == 128
+    assert params.quantization == models.QuantizationSearchParams(
+        rescore=True, oversampling=3.0
+    )
+
+
+@pytest.mark.asyncio
+async def test_max_recall_collection_raises_hnsw_ef():
+    info = _collection_info(
+        vectors={"size": 3}, hnsw_config={"m": 32, "ef_construct": 256}
+    )
+
+    params = await _search_params(info, hnsw_ef=64)
+
+    assert params.hnsw_ef == 256
+    assert params.quantization is None
+
+
+@pytest.mark.asyncio
+async def test_plain_collection_keeps_configured_search_params():
+    info = _collection_info(vectors={"size": 3})
+
+    params = await _search_params(info, hnsw_ef=200)
+
+    assert params.hnsw_ef == 200
+    assert params.quantization is None
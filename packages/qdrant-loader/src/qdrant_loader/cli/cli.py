@@ -364,6 +364,11 @@ async def _cancel_all_tasks():
     is_flag=True,
     help="Force processing of all documents, bypassing change detection. Warning: May significantly increase processing time and costs.",
 )
+@option(
+    "--bulk",
+    is_flag=True,
+    help="Disable HNSW indexing while loading and build the index once at the end. Speeds up first ingestions and --force rebuilds of large collections.",
+)
 @async_command
 async def ingest(
     workspace: Path | None,
@@ -375,6 +380,7 @@ async def ingest(
     log_level: str,
     profile: bool,
     force: bool,
+    bulk: bool,
 ):
     """Ingest documents from configured sources.
 
@@ -396,6 +402,9 @@ async def ingest(
 
       # Force processing of all documents (bypass change detection)
       qdrant-loader ingest --force
+
+      # Rebuild a large collection, indexing it once at the end
+      qdrant-loader ingest --force --bulk
     """
     from qdrant_loader.cli.commands.ingest_cmd import run_ingest_command
 
@@ -409,6 +418,189 @@ async def ingest(
         log_level,
         profile,
         force,
+        bulk=bulk,
+    )
+
+
+@cli.command()
+@option(
+    "--workspace",
+    type=ClickPath(path_type=Path),
+    help="Workspace directory containing config.yaml and .env files. All output will be stored here.",
+)
+@option(
+    "--config", type=ClickPath(exists=True, path_type=Path), help="Path to config file."
+)
+@option("--env", type=ClickPath(exists=True, path_type=Path), help="Path to .env file.")
+@option(
+    "--log-level",
+    type=Choice(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+    ),
+    default="INFO",
+    help="Set the logging level.",
+)
+@option(
+    "--keep",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Collection versions to keep, including the new one. Defaults to qdrant.reindex_retention.",
+)
+@async_command
+async def reindex(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    log_level: str,
+    keep: int | None,
+):
+    """Rebuild the collection without downtime.
+
+    Every source is ingested into a new version of the collection,
+    <name>__v<N>, while searches keep using the live one. Once it is indexed,
+    the alias <name> is switched to it atomically and old versions are
+    deleted.
+
+    Examples:
+      # Rebuild the collection, keeping the previous version for rollback
+      qdrant-loader reindex --keep 2
+    """
+    from qdrant_loader.cli.commands.reindex_cmd import run_reindex_command
+
+    await run_reindex_command(workspace, config, env, log_level, keep)
+
+
+@cli.command("migrate-payload")
+@option(
+    "--workspace",
+    type=ClickPath(path_type=Path),
+    help="Workspace directory containing config.yaml and .env files. All output will be stored here.",
+)
+@option(
+    "--config", type=ClickPath(exists=True, path_type=Path), help="Path to config file."
+)
+@option("--env", type=ClickPath(exists=True, path_type=Path), help="Path to .env file.")
+@option(
+    "--log-level",
+    type=Choice(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+    ),
+    default="INFO",
+    help="Set the logging level.",
+)
+@option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=256,
+    help="Points rewritten per request.",
+)
+@async_command
+async def migrate_payload(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    log_level: str,
+    batch_size: int,
+):
+    """Rewrite stored payloads in the configured payload layout.
+
+    Payloads are rewritten in place, without re-embedding: filterable fields
+    move to indexed top-level keys and analysis fields are moved to the side
+    collection or dropped, per qdrant.payload. Points already migrated are
+    skipped, so an interrupted migration can be run again.
+
+    Examples:
+      # Migrate the collection to the configured layout
+      qdrant-loader migrate-payload --workspace .
+    """
+    from qdrant_loader.cli.commands.migrate_payload_cmd import (
+        run_migrate_payload_command,
+    )
+
+    await run_migrate_payload_command(workspace, config, env, log_level, batch_size)
+
+
+@cli.command()
+@option(
+    "--workspace",
+    type=ClickPath(path_type=Path),
+    help="Workspace directory containing config.yaml and .env files. All output will be stored here.",
+)
+@option(
+    "--config", type=ClickPath(exists=True, path_type=Path), help="Path to config file."
+)
+@option("--env", type=ClickPath(exists=True, path_type=Path), help="Path to .env file.")
+@option("--project", type=str, help="Only watch the LocalFile sources of this project.")
+@option("--source", type=str, help="Only watch the LocalFile source with this name.")
+@option(
+    "--log-level",
+    type=Choice(
+        ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], case_sensitive=False
+    ),
+    default="INFO",
+    help="Set the logging level.",
+)
+@option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=1.0,
+    show_default=True,
+    help="Seconds a file must stay unchanged before it is ingested.",
+)
+@option(
+    "--backend",
+    type=Choice(["auto", "inotify", "polling"], case_sensitive=False),
+    default="auto",
+    show_default=True,
+    help="Change notification backend; auto uses inotify where available.",
+)
+@option(
+    "--poll-interval",
+    type=click.FloatRange(min=0.1),
+    default=2.0,
+    show_default=True,
+    help="Seconds between two scans of the polling backend.",
+)
+@option(
+    "--initial-sync/--no-initial-sync",
+    default=True,
+    help="Run an incremental ingestion of the watched sources before watching.",
+)
+@async_command
+async def watch(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    project: str | None,
+    source: str | None,
+    log_level: str,
+    debounce: float,
+    backend: str,
+    poll_interval: float,
+    initial_sync: bool,
+):
+    """Watch LocalFile sources and ingest file changes as they happen.
+
+    Examples:
+      # Watch every LocalFile source
+      qdrant-loader watch
+
+      # Watch one source, polling a network share every 10 seconds
+      qdrant-loader watch --source docs --backend polling --poll-interval 10
+    """
+    from qdrant_loader.cli.commands.watch_cmd import run_watch_command
+
+    await run_watch_command(
+        workspace,
+        config,
+        env,
+        project,
+        source,
+        log_level,
+        debounce,
+        backend.lower(),
+        poll_interval,
+        initial_sync,
     )
 
 
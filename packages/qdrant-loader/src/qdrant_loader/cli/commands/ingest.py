@@ -15,6 +15,7 @@ async def run_pipeline_ingestion(
     source_type: str | None,
     source: str | None,
     force: bool,
+    bulk: bool = False,
     metrics_dir: str | None = None,
 ) -> None:
     from qdrant_loader.core.async_ingestion_pipeline import AsyncIngestionPipeline
@@ -27,12 +28,22 @@ async def run_pipeline_ingestion(
     logger = LoggingConfig.get_logger(__name__)
     ingestion_error: Exception | None = None
     try:
-        await pipeline.process_documents(
-            project_id=project,
-            source_type=source_type,
-            source=source,
-            force=force,
-        )
+        if bulk:
+            # Index settings are rolled back if the ingestion fails
+            async with qdrant_manager.bulk_load():
+                await pipeline.process_documents(
+                    project_id=project,
+                    source_type=source_type,
+                    source=source,
+                    force=force,
+                )
+        else:
+            await pipeline.process_documents(
+                project_id=project,
+                source_type=source_type,
+                source=source,
+                force=force,
+            )
     except Exception as e:
         ingestion_error = e
         sanitized_traceback = sanitize_exception_message(traceback.format_exc())
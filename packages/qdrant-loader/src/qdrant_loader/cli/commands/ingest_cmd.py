@@ -36,6 +36,7 @@ async def run_ingest_command(
     log_level: str,
     profile: bool,
     force: bool,
+    bulk: bool = False,
 ) -> None:
     """Implementation for the `ingest` CLI command with identical behavior."""
 
@@ -89,6 +90,7 @@ async def run_ingest_command(
                 source_type=source_type,
                 source=source,
                 force=force,
+                bulk=bulk,
                 metrics_dir=(
                     str(workspace_config.metrics_path) if workspace_config else None
                 ),
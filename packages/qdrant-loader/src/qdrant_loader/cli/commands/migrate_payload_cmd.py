@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import traceback
+from pathlib import Path
+
+from click.exceptions import ClickException
+
+from qdrant_loader.cli.config_loader import (
+    load_config_with_workspace,
+    setup_workspace,
+)
+from qdrant_loader.config.workspace import validate_workspace_flags
+from qdrant_loader.utils.logging import LoggingConfig
+from qdrant_loader.utils.sensitive import sanitize_exception_message
+
+
+def _setup_logging(log_level: str, workspace_config) -> None:
+    log_file = (
+        str(workspace_config.logs_path / "migrate-payload.log")
+        if workspace_config
+        else "qdrant-loader.log"
+    )
+    if getattr(LoggingConfig, "reconfigure", None):
+        if getattr(LoggingConfig, "_initialized", False):
+            LoggingConfig.reconfigure(file=log_file, level=log_level)
+        else:
+            LoggingConfig.setup(level=log_level, format="console", file=log_file)
+    else:
+        LoggingConfig.setup(level=log_level, format="console", file=log_file)
+
+
+async def run_migrate_payload_command(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    log_level: str,
+    batch_size: int,
+) -> None:
+    """Rewrite the payloads of the collection in the configured layout."""
+    try:
+        validate_workspace_flags(workspace, config, env)
+        workspace_config = setup_workspace(workspace) if workspace else None
+    except ValueError as exc:
+        raise ClickException(str(exc)) from exc
+
+    _setup_logging(log_level, workspace_config)
+
+    try:
+        load_config_with_workspace(workspace_config, config, env)
+    except Exception as exc:
+        safe_error = sanitize_exception_message(exc) or type(exc).__name__
+        raise ClickException(f"Failed to load configuration: {safe_error}") from exc
+
+    from qdrant_loader.config import get_settings
+
+    settings = get_settings()
+    if settings is None:
+        raise ClickException("Settings not available")
+
+    # Lazy import to avoid slow startup
+    from qdrant_loader.core.payload_migration import migrate_collection_payloads
+    from qdrant_loader.core.qdrant_manager import QdrantManager
+
+    logger = LoggingConfig.get_logger(__name__)
+    try:
+        manager = QdrantManager(settings)
+        try:
+            migrated = await migrate_collection_payloads(manager, batch_size=batch_size)
+        finally:
+            await manager.aclose()
+    except Exception as exc:
+        error_msg = sanitize_exception_message(exc) or type(exc).__name__
+        logger.error(
+            "Payload migration failed",
+            error=error_msg,
+            error_type=type(exc).__name__,
+            sanitized_traceback=sanitize_exception_message(traceback.format_exc()),
+        )
+        raise ClickException(f"Failed to migrate payloads: {error_msg}") from exc
+    logger.info(f"Migrated {migrated} payloads of {settings.qdrant_collection_name}")
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import asyncio
+import signal
+import traceback
+from pathlib import Path
+
+from click.exceptions import ClickException
+
+from qdrant_loader.cli.config_loader import (
+    load_config_with_workspace,
+    setup_workspace,
+)
+from qdrant_loader.config.workspace import validate_workspace_flags
+from qdrant_loader.utils.logging import LoggingConfig
+from qdrant_loader.utils.sensitive import sanitize_exception_message
+
+
+def _setup_logging(log_level: str, workspace_config) -> None:
+    log_file = (
+        str(workspace_config.logs_path / "watch.log")
+        if workspace_config
+        else "qdrant-loader-watch.log"
+    )
+    if getattr(LoggingConfig, "reconfigure", None):
+        if getattr(LoggingConfig, "_initialized", False):
+            LoggingConfig.reconfigure(file=log_file, level=log_level)
+        else:
+            LoggingConfig.setup(level=log_level, format="console", file=log_file)
+    else:
+        LoggingConfig.setup(level=log_level, format="console", file=log_file)
+
+
+async def run_watch_command(
+    workspace: Path | None,
+    config: Path | None,
+    env: Path | None,
+    project: str | None,
+    source: str | None,
+    log_level: str,
+    debounce: float,
+    backend: str,
+    poll_interval: float,
+    initial_sync: bool,
+) -> None:
+    """Watch LocalFile sources and ingest their changes until interrupted."""
+    try:
+        validate_workspace_flags(workspace, config, env)
+        workspace_config = setup_workspace(workspace) if workspace else None
+    except ValueError as exc:
+        raise ClickException(str(exc)) from exc
+
+    _setup_logging(log_level, workspace_config)
+
+    try:
+        load_config_with_workspace(workspace_config, config, env)
+    except Exception as exc:
+        safe_error = sanitize_exception_message(exc) or type(exc).__name__
+        raise ClickException(f"Failed to load configuration: {safe_error}") from exc
+
+    from qdrant_loader.config import get_settings
+
+    settings = get_settings()
+    if settings is None:
+        raise ClickException("Settings not available")
+
+    # Lazy import to avoid slow startup
+    from qdrant_loader.core.async_ingestion_pipeline import AsyncIngestionPipeline
+    from qdrant_loader.core.qdrant_manager import QdrantManager
+    from qdrant_loader.watch import WatchSession, resolve_watch_targets
+
+    logger = LoggingConfig.get_logger(__name__)
+    pipeline = AsyncIngestionPipeline(
+        settings,
+        QdrantManager(settings),
+        metrics_dir=str(workspace_config.metrics_path) if workspace_config else None,
+    )
+
+    loop = asyncio.get_running_loop()
+    stop_event = asyncio.Event()
+
+    def _handle_sigint():
+        logger.debug(" SIGINT received, stopping watch...")
+        stop_event.set()
+
+    try:
+        loop.add_signal_handler(signal.SIGINT, _handle_sigint)
+    except NotImplementedError:
+        signal.signal(
+            signal.SIGINT,
+            lambda _signum, _frame: loop.call_soon_threadsafe(stop_event.set),
+        )
+
+    try:
+        await pipeline.initialize()
+        try:
+            targets = resolve_watch_targets(pipeline, project, source)
+        except ValueError as exc:
+            raise ClickException(str(exc)) from exc
+        if not targets:
+            raise ClickException("No LocalFile sources to watch")
+
+        session = WatchSession(
+            pipeline,
+            targets,
+            debounce_seconds=debounce,
+            backend=backend,
+            poll_interval=poll_interval,
+        )
+        await session.run(stop_event, initial_sync=initial_sync)
+        logger.info("Watch stopped")
+    except (ClickException, asyncio.CancelledError):
+        raise
+    except Exception as exc:
+        error_msg = sanitize_exception_message(exc) or type(exc).__name__
+        logger.error(
+            "Watch failed",
+            error=error_msg,
+            error_type=type(exc).__name__,
+            sanitized_traceback=sanitize_exception_message(traceback.format_exc()),
+        )
+        raise ClickException(f"Watch failed: {error_msg}") from exc
+    finally:
+        await pipeline.cleanup()
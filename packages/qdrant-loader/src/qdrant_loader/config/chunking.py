@@ -1,5 +1,7 @@
 """Configuration for text chunking."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 
@@ -209,6 +211,20 @@ class ChunkingConfig(BaseModel):
         "Increases payload size and ingestion time.",
     )
 
+    backend: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Where documents are chunked: 'thread' runs chunking in a "
+        "thread pool, 'process' in worker processes that each load the "
+        "strategies and NLP models once. Use 'process' to spread CPU-bound "
+        "chunking across cores.",
+    )
+    process_workers: int | None = Field(
+        default=None,
+        description="Number of chunking processes for the 'process' backend "
+        "(defaults to the CPU count)",
+        gt=0,
+    )
+
     # Strategy-specific configurations
     strategies: StrategySpecificConfig = Field(
         default_factory=StrategySpecificConfig,
@@ -38,3 +38,16 @@ class EmbeddingConfig(BaseConfig):
         default=8000,
         description="Maximum tokens allowed for a single chunk (should match or be below model's context limit)",
     )
+    cache_enabled: bool = Field(
+        default=True,
+        description="Reuse embeddings of unchanged chunk text across runs from an on-disk cache",
+    )
+    cache_path: str | None = Field(
+        default=None,
+        description="Embedding cache file (defaults to embedding_cache.db next to the state database)",
+    )
+    cache_max_entries: int = Field(
+        default=500_000,
+        description="Maximum number of cached embeddings before least recently used ones are evicted",
+        gt=0,
+    )
@@ -82,6 +82,8 @@ class GlobalConfig(BaseConfig):
                 "chunk_overlap": self.chunking.chunk_overlap,
                 "enable_semantic_analysis": self.chunking.enable_semantic_analysis,
                 "enable_enhanced_semantic_analysis": self.chunking.enable_enhanced_semantic_analysis,
+                "backend": self.chunking.backend,
+                "process_workers": self.chunking.process_workers,
             },
             "embedding": self.embedding.model_dump(),
             "llm": self.llm,
@@ -101,6 +103,9 @@ class GlobalConfig(BaseConfig):
                     "llm_endpoint": self.file_conversion.markitdown.llm_endpoint,
                     "llm_api_key": self.file_conversion.markitdown.llm_api_key,
                 },
+                "max_concurrent_downloads": self.file_conversion.max_concurrent_downloads,
+                "conversion_backend": self.file_conversion.conversion_backend,
+                "conversion_workers": self.file_conversion.conversion_workers,
             },
             "qdrant": self.qdrant.to_dict(),
             "workers": self.workers.to_dict(),
@@ -3,7 +3,15 @@
 This module defines the Qdrant-specific configuration settings.
 """
 
-from pydantic import Field
+from typing import Any
+
+from pydantic import Field, model_validator
+from qdrant_loader_core.config import (
+    DEFAULT_COLLECTION_PROFILE,
+    CollectionProfile,
+    PayloadLayout,
+    resolve_collection_profile,
+)
 
 from qdrant_loader.config.base import BaseConfig
 
@@ -16,11 +24,61 @@ class QdrantConfig(BaseConfig):
     collection_name: str = Field(
         default="documents", description="Qdrant collection name"
     )
+    prefer_grpc: bool = Field(
+        default=False,
+        description="Send ingestion upserts and deletes over gRPC instead of REST",
+    )
+    grpc_port: int = Field(default=6334, gt=0, le=65535, description="Qdrant gRPC port")
+    collection_profile: str = Field(
+        default=DEFAULT_COLLECTION_PROFILE,
+        description=(
+            "Performance profile new collections are created with: 'default', "
+            "'balanced', 'memory_saver', 'max_recall' or a custom profile"
+        ),
+    )
+    collection_profiles: dict[str, CollectionProfile] = Field(
+        default_factory=dict,
+        description="Custom collection profiles, by name; may override built-in ones",
+    )
+    reindex_retention: int = Field(
+        default=2,
+        ge=1,
+        description=(
+            "Collection versions kept by 'reindex', including the one the "
+            "alias points to"
+        ),
+    )
+    payload: PayloadLayout = Field(
+        default_factory=PayloadLayout,
+        description="Payload schema version and handling of analysis fields",
+    )
+
+    @model_validator(mode="after")
+    def validate_collection_profile(self) -> "QdrantConfig":
+        """Ensure the selected collection profile exists."""
+        resolve_collection_profile(self.collection_profile, self.collection_profiles)
+        return self
+
+    @property
+    def profile(self) -> CollectionProfile:
+        """The collection profile new collections are created with."""
+        return resolve_collection_profile(
+            self.collection_profile, self.collection_profiles
+        )
 
-    def to_dict(self) -> dict[str, str | None]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert the configuration to a dictionary."""
         return {
             "url": self.url,
             "api_key": self.api_key,
             "collection_name": self.collection_name,
+            "prefer_grpc": self.prefer_grpc,
+            "grpc_port": self.grpc_port,
+            "collection_profile": self.collection_profile,
+            "collection_profiles": {
+                name: profile.model_dump()
+                for name, profile in self.collection_profiles.items()
+            },
+            "reindex_retention": self.reindex_retention,
+            "payload": self.payload.model_dump(),
         }
@@ -6,7 +6,7 @@ including database path, table prefix, and connection pool settings.
 
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import Field, ValidationInfo, field_validator
 
@@ -45,6 +45,32 @@ class StateManagementConfig(BaseConfig):
         description="Connection pool settings",
     )
 
+    # SQLite tuning profile, applied to every file-backed connection
+    journal_mode: Literal["wal", "delete", "truncate", "persist"] = Field(
+        default="wal", description="SQLite journal mode"
+    )
+    synchronous: Literal["off", "normal", "full", "extra"] = Field(
+        default="normal", description="SQLite synchronous level"
+    )
+    busy_timeout_ms: int = Field(
+        default=5000,
+        ge=0,
+        description="How long a connection waits on a locked database (ms)",
+    )
+    cache_size_kb: int = Field(
+        default=65536, ge=0, description="SQLite page cache size per connection (KiB)"
+    )
+    mmap_size_mb: int = Field(
+        default=256, ge=0, description="SQLite memory-mapped I/O size (MiB)"
+    )
+    read_write_split: bool = Field(
+        default=True,
+        description=(
+            "Serve reads from a pooled read engine and serialize writes on a "
+            "single-connection write engine"
+        ),
+    )
+
     @field_validator("database_path")
     @classmethod
     def validate_database_path(cls, v: str, info: ValidationInfo) -> str:
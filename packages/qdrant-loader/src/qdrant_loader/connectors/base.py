@@ -1,6 +1,7 @@
 import warnings
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Mapping
 from datetime import datetime
+from typing import NamedTuple
 
 from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.core.document import Document
@@ -15,9 +16,29 @@ class ConnectorConfigurationError(Exception):
     """
 
 
+class FileStat(NamedTuple):
+    """Size and modification time of a source file when it was ingested."""
+
+    size: int
+    mtime_ns: int
+    # URL of the document built from the file
+    url: str
+
+
 class BaseConnector:
     """Base class for all connectors."""
 
+    # Position reached by the last complete stream (e.g. a commit SHA), set by
+    # connectors that can list changes incrementally. The pipeline stores it
+    # once the documents are processed and hands it back on the next run.
+    sync_cursor: str | None = None
+
+    # Stats of the files seen by the last complete stream, keyed by path
+    # relative to the source root, set by file-based connectors. The pipeline
+    # stores them for the documents it processed and hands them back on the
+    # next run, so unchanged files can be skipped without being read.
+    file_stats: dict[str, FileStat] | None = None
+
     def __init__(self, config: SourceConfig):
         self.config = config
         self._initialized = False
@@ -45,6 +66,26 @@ class BaseConnector:
         # Store on the instance so connectors that opt-in can access it.
         self._file_conversion_config = file_conversion_config
 
+    def set_sync_cursor(self, cursor: str | None) -> None:
+        """Set the cursor stored after the previous complete run.
+
+        Connectors that list changes incrementally resume from it; ``None``
+        requests a full listing. The default implementation ignores it.
+
+        Args:
+            cursor: Value of ``sync_cursor`` after the previous run
+        """
+
+    def set_file_stats(self, stats: Mapping[str, FileStat] | None) -> None:
+        """Set the file stats stored after the previous runs.
+
+        ``None`` requests that every file is read. The default implementation
+        ignores them.
+
+        Args:
+            stats: Stats of the files ingested so far, keyed by relative path
+        """
+
     async def stream_documents(
         self, since: datetime | None = None
     ) -> AsyncIterator[Document]:
@@ -45,6 +45,23 @@ class ConfluenceSpaceConfig(SourceConfig):
         le=1000,
     )
 
+    # Streaming
+    prefetch_pages: int = Field(
+        default=2,
+        description=(
+            "Number of content search pages fetched ahead of the page being "
+            "processed (0 disables read-ahead)"
+        ),
+        ge=0,
+        le=20,
+    )
+    max_concurrent_attachments: int = Field(
+        default=4,
+        description="Maximum number of pages whose attachments are fetched at once",
+        ge=1,
+        le=50,
+    )
+
     include_labels: list[str] = Field(
         default=[],
         description="List of labels to include (empty list means include all)",
@@ -1,7 +1,12 @@
+import asyncio
 import re
+import warnings
+from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
-from urllib.parse import quote, urljoin
+from urllib.parse import parse_qs, quote, urljoin, urlparse
 
+import httpx
 import requests
 
 from qdrant_loader.config.types import SourceType
@@ -29,10 +34,12 @@ from qdrant_loader.connectors.shared.attachments.metadata import (
 )
 from qdrant_loader.connectors.shared.http import (
     RateLimiter,
+    create_async_client,
 )
 from qdrant_loader.connectors.shared.http import (
     request_with_policy as _http_request_with_policy,
 )
+from qdrant_loader.connectors.shared.prefetch import fetch_in_order, read_ahead
 from qdrant_loader.core.attachment_downloader import AttachmentMetadata
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import (
@@ -58,8 +65,10 @@ class ConfluenceConnector(BaseConnector):
         self.config = config
         self.base_url = config.base_url
 
-        # Initialize session
+        # Initialize session; it holds the authentication settings, and API
+        # calls go through a pooled async client created from it on first use
         self.session = requests.Session()
+        self._http_client: httpx.AsyncClient | None = None
         # Rate limiter (configurable RPM)
         self._rate_limiter = RateLimiter.per_minute(
             getattr(self.config, "requests_per_minute", 60)
@@ -131,7 +140,24 @@ class ConfluenceConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
-        self._initialized = False
+        try:
+            await self._close_http_client()
+            if self.attachment_downloader:
+                await self.attachment_downloader.aclose()
+        finally:
+            self._initialized = False
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = create_async_client(self.session)
+        return self._http_client
+
+    async def _close_http_client(self) -> None:
+        """Close the pooled async HTTP client and its connections."""
+        client, self._http_client = self._http_client, None
+        if client is not None:
+            await client.aclose()
 
     def _get_api_url(self, endpoint: str) -> str:
         """Construct the full API URL for an endpoint.
@@ -167,6 +193,7 @@ class ConfluenceConnector(BaseConnector):
                 self.session,
                 method,
                 url,
+                client=self._get_http_client(),
                 rate_limiter=self._rate_limiter,
                 retries=3,
                 backoff_factor=0.5,
@@ -188,18 +215,21 @@ class ConfluenceConnector(BaseConnector):
             )
             raise
 
-    async def _get_space_content_cloud(self, cursor: str | None = None) -> dict:
+    async def _get_space_content_cloud(
+        self, cursor: str | None = None, since: datetime | None = None
+    ) -> dict:
         """Fetch content from a Confluence Cloud space using cursor-based pagination.
 
         Args:
             cursor: Cursor for pagination. If None, starts from the beginning.
+            since: Only return content modified at or after this time
 
         Returns:
             dict: Response containing space content
         """
         # Build params via helper
         params = _build_cloud_params(
-            self.config.space_key, self.config.content_types, cursor
+            self.config.space_key, self.config.content_types, cursor, since
         )
 
         logger.debug(
@@ -218,17 +248,20 @@ class ConfluenceConnector(BaseConnector):
                 )
         return response
 
-    async def _get_space_content_datacenter(self, start: int = 0) -> dict:
+    async def _get_space_content_datacenter(
+        self, start: int = 0, since: datetime | None = None
+    ) -> dict:
         """Fetch content from a Confluence Data Center space using start/limit pagination.
 
         Args:
             start: Starting index for pagination. Defaults to 0.
+            since: Only return content modified at or after this time
 
         Returns:
             dict: Response containing space content
         """
         params = _build_dc_params(
-            self.config.space_key, self.config.content_types, start
+            self.config.space_key, self.config.content_types, start, since
         )
 
         logger.debug(
@@ -792,162 +825,168 @@ class ConfluenceConnector(BaseConnector):
         text = re.sub(r"\s+", " ", text)
         return text.strip()
 
-    async def get_documents(self) -> list[Document]:
-        """Fetch and process documents from Confluence.
+    @staticmethod
+    def _next_cursor(response: dict) -> str | None:
+        """Extract the cursor of the next page from a Cloud search response."""
+        next_url = response.get("_links", {}).get("next")
+        if not next_url:
+            logger.debug("No next page link found, ending pagination")
+            return None
 
-        Returns:
-            list[Document]: List of processed documents
-        """
-        documents = []
+        try:
+            cursor = parse_qs(urlparse(next_url).query).get("cursor", [None])[0]
+        except Exception as e:
+            logger.error(f"Failed to parse next URL: {e!s}")
+            return None
+        if not cursor:
+            logger.debug("No cursor found in next URL, ending pagination")
+        return cursor
+
+    async def _cloud_pages(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the content search results of a Cloud space, page by page."""
+        cursor = None
         page_count = 0
-        total_documents = 0
-
+        while True:
+            page_count += 1
+            logger.debug(
+                f"Fetching page {page_count} of Confluence content (cursor={cursor})"
+            )
+            response = await self._get_space_content_cloud(cursor, since)
+            results = response.get("results", [])
+            if not results:
+                logger.debug("No more results found, ending pagination")
+                return
+            yield results
+
+            cursor = self._next_cursor(response)
+            if not cursor:
+                return
+
+    async def _datacenter_pages(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """Yield the content search results of a Data Center space, page by page.
+
+        The first page gives the total size; the offsets of the other pages
+        are then known, so up to ``prefetch_pages`` of them are requested
+        concurrently.
+        """
+        limit = 25
+        response = await self._get_space_content_datacenter(0, since)
+        results = response.get("results", [])
+        if not results:
+            logger.debug("No more results found, ending pagination")
+            return
+        yield results
+
+        total_size = response.get("totalSize", response.get("size", 0))
+        pages = fetch_in_order(
+            lambda start: self._get_space_content_datacenter(start, since),
+            range(limit, total_size, limit),
+            concurrency=max(1, self.config.prefetch_pages),
+        )
+        async with aclosing(pages):
+            async for response in pages:
+                results = response.get("results", [])
+                if not results:
+                    logger.debug("No more results found, ending pagination")
+                    return
+                yield results
+
+    def _content_pages(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """Content search results of the space, fetched ahead of the consumer."""
         if self.config.deployment_type == ConfluenceDeploymentType.CLOUD:
-            # Cloud uses cursor-based pagination
-            cursor = None
-
-            while True:
-                try:
-                    page_count += 1
+            # Each cursor comes with the previous page: read one chain ahead
+            return read_ahead(self._cloud_pages(since), self.config.prefetch_pages)
+        return self._datacenter_pages(since)
+
+    def _convert_page(self, results: list[dict]) -> list[tuple[dict, Document]]:
+        """Convert the contents of a search page into documents."""
+        converted = []
+        for content in results:
+            if not self._should_process_content(content):
+                continue
+            try:
+                document = self._process_content(content, clean_html=True)
+                if document:
+                    converted.append((content, document))
                     logger.debug(
-                        f"Fetching page {page_count} of Confluence content (cursor={cursor})"
+                        f"Processed {content['type']} '{content['title']}' "
+                        f"(ID: {content['id']}) from space {self.config.space_key}"
                     )
-                    response = await self._get_space_content_cloud(cursor)
-                    results = response.get("results", [])
+            except Exception as e:
+                logger.error(
+                    f"Failed to process {content['type']} '{content['title']}' "
+                    f"(ID: {content['id']}): {e!s}"
+                )
+        return converted
 
-                    if not results:
-                        logger.debug("No more results found, ending pagination")
-                        break
+    async def stream_documents(
+        self, since: datetime | None = None
+    ) -> AsyncIterator[Document]:
+        """Stream documents from Confluence, one search page at a time.
 
-                    total_documents += len(results)
-                    logger.debug(
-                        f"Processing {len(results)} documents from page {page_count}"
-                    )
+        The next search pages are fetched while the current one is converted
+        (``prefetch_pages``) and the attachments of a page's contents are
+        fetched concurrently (``max_concurrent_attachments``), so at most a
+        few pages are held in memory whatever the size of the space.
 
-                    # Process each content item
-                    for content in results:
-                        if self._should_process_content(content):
-                            try:
-                                document = self._process_content(
-                                    content, clean_html=True
-                                )
-                                if document:
-                                    documents.append(document)
-
-                                    attachment_docs = (
-                                        await self._process_attachments_for_document(
-                                            content, document
-                                        )
-                                    )
-                                    documents.extend(attachment_docs)
-
-                                    logger.debug(
-                                        f"Processed {content['type']} '{content['title']}' "
-                                        f"(ID: {content['id']}) from space {self.config.space_key}"
-                                    )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to process {content['type']} '{content['title']}' "
-                                    f"(ID: {content['id']}): {e!s}"
-                                )
-
-                    # Get the next cursor from the response
-                    next_url = response.get("_links", {}).get("next")
-                    if not next_url:
-                        logger.debug("No next page link found, ending pagination")
-                        break
-
-                    # Extract just the cursor value from the URL
-                    try:
-                        from urllib.parse import parse_qs, urlparse
-
-                        parsed_url = urlparse(next_url)
-                        query_params = parse_qs(parsed_url.query)
-                        cursor = query_params.get("cursor", [None])[0]
-                        if not cursor:
-                            logger.debug(
-                                "No cursor found in next URL, ending pagination"
-                            )
-                            break
-                        logger.debug(f"Found next cursor: {cursor}")
-                    except Exception as e:
-                        logger.error(f"Failed to parse next URL: {e!s}")
-                        break
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch content from space {self.config.space_key}: {e!s}"
-                    )
-                    raise
-        else:
-            # Data Center/Server uses start/limit pagination
-            start = 0
-            limit = 25
-
-            while True:
-                try:
-                    page_count += 1
-                    logger.debug(
-                        f"Fetching page {page_count} of Confluence content (start={start})"
-                    )
-                    response = await self._get_space_content_datacenter(start)
-                    results = response.get("results", [])
+        Args:
+            since: Only stream content modified at or after this time
 
-                    if not results:
-                        logger.debug("No more results found, ending pagination")
-                        break
+        Yields:
+            Page, blog post and attachment documents
+        """
+        document_count = 0
+        attachment_limit = asyncio.Semaphore(self.config.max_concurrent_attachments)
 
-                    total_documents += len(results)
-                    logger.debug(
-                        f"Processing {len(results)} documents from page {page_count}"
-                    )
+        async def fetch_attachments(content: dict, document: Document):
+            async with attachment_limit:
+                return await self._process_attachments_for_document(content, document)
 
-                    # Process each content item
-                    for content in results:
-                        if self._should_process_content(content):
-                            try:
-                                document = self._process_content(
-                                    content, clean_html=True
-                                )
-                                if document:
-                                    documents.append(document)
-
-                                    attachment_docs = (
-                                        await self._process_attachments_for_document(
-                                            content, document
-                                        )
-                                    )
-                                    documents.extend(attachment_docs)
-
-                                    logger.debug(
-                                        f"Processed {content['type']} '{content['title']}' "
-                                        f"(ID: {content['id']}) from space {self.config.space_key}"
-                                    )
-                            except Exception as e:
-                                logger.error(
-                                    f"Failed to process {content['type']} '{content['title']}' "
-                                    f"(ID: {content['id']}): {e!s}"
-                                )
-
-                    # Check if there are more pages
-                    total_size = response.get("totalSize", response.get("size", 0))
-                    if start + limit >= total_size:
-                        logger.debug(
-                            f"Reached end of results: {start + limit} >= {total_size}"
+        pages = self._content_pages(since)
+        try:
+            async with aclosing(pages):
+                async for results in pages:
+                    logger.debug(f"Processing {len(results)} documents from page")
+                    converted = self._convert_page(results)
+                    attachments = await asyncio.gather(
+                        *(
+                            fetch_attachments(content, document)
+                            for content, document in converted
                         )
-                        break
-
-                    # Move to next page
-                    start += limit
-                    logger.debug(f"Moving to next page with start={start}")
-
-                except Exception as e:
-                    logger.error(
-                        f"Failed to fetch content from space {self.config.space_key}: {e!s}"
                     )
-                    raise
+                    for (_, document), attachment_docs in zip(
+                        converted, attachments, strict=True
+                    ):
+                        yield document
+                        for attachment_doc in attachment_docs:
+                            yield attachment_doc
+                        document_count += 1 + len(attachment_docs)
+        except Exception as e:
+            logger.error(
+                f"Failed to fetch content from space {self.config.space_key}: {e!s}"
+            )
+            raise
 
         logger.info(
-            f"📄 Confluence: {len(documents)} documents from space {self.config.space_key}"
+            f"📄 Confluence: {document_count} documents from space {self.config.space_key}"
         )
+
+    async def get_documents(self) -> list[Document]:
+        """Fetch and process documents from Confluence (DEPRECATED - use stream_documents)."""
+        warnings.warn(
+            "ConfluenceConnector.get_documents is deprecated. Implement stream_documents() "
+            "or use connector.stream_documents() to avoid materializing the full "
+            "document list in memory.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        documents = []
+        async for document in self.stream_documents():
+            documents.append(document)
         return documents
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from datetime import datetime
 from typing import Any
 
 _ALLOWED_TOKEN_RE = re.compile(r"^[A-Za-z0-9_-]+$")
@@ -31,34 +32,45 @@ def _sanitize_content_types(content_types: list[str]) -> list[str]:
     return sanitized
 
 
+def _build_cql(
+    space_key: str, content_types: list[str] | None, since: datetime | None
+) -> str:
+    cql = f"space = {_sanitize_space_key(space_key)}"
+    if content_types:
+        safe_types = _sanitize_content_types(content_types)
+        cql += f" and type in ({','.join(safe_types)})"
+    if since is not None:
+        # CQL dates have minute precision
+        cql += f' and lastmodified >= "{since:%Y-%m-%d %H:%M}"'
+    return cql
+
+
 def build_cloud_search_params(
-    space_key: str, content_types: list[str] | None, cursor: str | None
+    space_key: str,
+    content_types: list[str] | None,
+    cursor: str | None,
+    since: datetime | None = None,
 ) -> dict[str, Any]:
     params: dict[str, Any] = {
         "expand": "body.storage,version,metadata.labels,history,space,extensions.position,children.comment.body.storage,ancestors,children.page",
         "limit": 25,
     }
-    cql = f"space = {_sanitize_space_key(space_key)}"
-    if content_types:
-        safe_types = _sanitize_content_types(content_types)
-        cql += f" and type in ({','.join(safe_types)})"
-    params["cql"] = cql
+    params["cql"] = _build_cql(space_key, content_types, since)
     if cursor is not None:
         params["cursor"] = cursor
     return params
 
 
 def build_dc_search_params(
-    space_key: str, content_types: list[str] | None, start: int
+    space_key: str,
+    content_types: list[str] | None,
+    start: int,
+    since: datetime | None = None,
 ) -> dict[str, Any]:
     params: dict[str, Any] = {
         "expand": "body.storage,version,metadata.labels,history,space,extensions.position,children.comment.body.storage,ancestors,children.page",
         "limit": 25,
         "start": start,
     }
-    cql = f"space = {_sanitize_space_key(space_key)}"
-    if content_types:
-        safe_types = _sanitize_content_types(content_types)
-        cql += f" and type in ({','.join(safe_types)})"
-    params["cql"] = cql
+    params["cql"] = _build_cql(space_key, content_types, since)
     return params
@@ -37,6 +37,15 @@ class GitRepoConfig(SourceConfig):
     temp_dir: str | None = Field(
         None, description="Temporary directory where the repository is cloned"
     )
+    mirror_dir: str | None = Field(
+        None,
+        description=(
+            "Directory of persistent repository mirrors; when set, the "
+            "repository is fetched into a mirror kept between runs instead of "
+            "cloned into a temporary directory, and incremental runs only "
+            "process the files changed since the last ingested commit"
+        ),
+    )
 
     @field_validator("base_url")
     @classmethod
@@ -1,5 +1,7 @@
 """Git repository connector implementation."""
 
+import hashlib
+import json
 import os
 import shutil
 import tempfile
@@ -9,6 +11,7 @@ from qdrant_loader.connectors.base import BaseConnector
 from qdrant_loader.connectors.git.config import GitRepoConfig
 from qdrant_loader.connectors.git.file_processor import FileProcessor
 from qdrant_loader.connectors.git.metadata_extractor import GitMetadataExtractor
+from qdrant_loader.connectors.git.mirror import GitMirror
 from qdrant_loader.connectors.git.operations import GitOperations
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import (
@@ -37,6 +40,12 @@ class GitConnector(BaseConnector):
         self.metadata_extractor = GitMetadataExtractor(config=self.config)
         self.git_ops = GitOperations()
         self.file_processor = None  # Will be initialized in __enter__
+        self.mirror = (
+            GitMirror(config.mirror_dir, str(config.base_url), config.branch)
+            if config.mirror_dir
+            else None
+        )
+        self._previous_cursor: str | None = None
         self.logger = LoggingConfig.get_logger(__name__)
         self.logger.debug("Initializing GitConnector")
         self.logger.debug("GitConnector Configuration", config=config.model_dump())
@@ -65,78 +74,9 @@ class GitConnector(BaseConnector):
     async def __aenter__(self):
         """Async context manager entry."""
         try:
-            # Create temporary directory
-            self.temp_dir = tempfile.mkdtemp()
-            self.config.temp_dir = (
-                self.temp_dir
-            )  # Update config with the actual temp dir
-            self.logger.debug("Created temporary directory", temp_dir=self.temp_dir)
-
-            # Initialize file processor
-            self.file_processor = FileProcessor(
-                config=self.config,
-                temp_dir=self.temp_dir,
-                file_detector=self.file_detector,
-            )
-
-            # Get auth token from config
-            auth_token = None
-            if self.config.token:
-                auth_token = self.config.token
-                self.logger.debug(
-                    "Using authentication token", token_length=len(auth_token)
-                )
-
-            # Clone repository
-            self.logger.debug(
-                "Attempting to clone repository",
-                url=self.config.base_url,
-                branch=self.config.branch,
-                depth=self.config.depth,
-                temp_dir=self.temp_dir,
-            )
-
-            try:
-                self.git_ops.clone(
-                    url=str(self.config.base_url),
-                    to_path=self.temp_dir,
-                    branch=self.config.branch,
-                    depth=self.config.depth,
-                    auth_token=auth_token,
-                )
-            except Exception as clone_error:
-                self.logger.error(
-                    "Failed to clone repository",
-                    error=str(clone_error),
-                    error_type=type(clone_error).__name__,
-                    url=self.config.base_url,
-                    branch=self.config.branch,
-                    temp_dir=self.temp_dir,
-                )
-                raise
-
-            # Verify repository initialization
-            if not self.git_ops.repo:
-                self.logger.error(
-                    "Repository not initialized after clone", temp_dir=self.temp_dir
-                )
-                raise ValueError("Repository not initialized")
-
-            # Verify repository is valid
-            try:
-                self.git_ops.repo.git.status()
-                self.logger.debug(
-                    "Repository is valid and accessible", temp_dir=self.temp_dir
-                )
-            except Exception as status_error:
-                self.logger.error(
-                    "Failed to verify repository status",
-                    error=str(status_error),
-                    error_type=type(status_error).__name__,
-                    temp_dir=self.temp_dir,
-                )
-                raise
-
+            if self.mirror is not None:
+                await self.mirror.acquire()
+            self._prepare_repository()
             self._initialized = True
             return self
         except ValueError as e:
@@ -166,78 +106,123 @@ class GitConnector(BaseConnector):
         """Synchronous context manager entry."""
         if not self._initialized:
             self._initialized = True
+            if self.mirror is not None:
+                self.mirror.acquire_blocking()
+            self._prepare_repository()
+        return self
+
+    def _prepare_repository(self) -> None:
+        """Clone the repository, or bring its persistent mirror up to date."""
+        if self.mirror is not None:
+            self.temp_dir = self.mirror.path
+            self.logger.debug("Using Git mirror", mirror_dir=self.temp_dir)
+        else:
             # Create temporary directory
             self.temp_dir = tempfile.mkdtemp()
-            self.config.temp_dir = (
-                self.temp_dir
-            )  # Update config with the actual temp dir
             self.logger.debug("Created temporary directory", temp_dir=self.temp_dir)
-
-            # Initialize file processor
-            self.file_processor = FileProcessor(
-                config=self.config,
-                temp_dir=self.temp_dir,
-                file_detector=self.file_detector,
-            )
-
-            # Get auth token from config
-            auth_token = None
-            if self.config.token:
-                auth_token = self.config.token
-                self.logger.debug(
-                    "Using authentication token", token_length=len(auth_token)
-                )
-
-            # Clone repository
+        self.config.temp_dir = self.temp_dir  # Update config with the actual dir
+
+        # Initialize file processor
+        self.file_processor = FileProcessor(
+            config=self.config,
+            temp_dir=self.temp_dir,
+            file_detector=self.file_detector,
+        )
+
+        # Get auth token from config
+        auth_token = None
+        if self.config.token:
+            auth_token = self.config.token
             self.logger.debug(
-                "Attempting to clone repository",
-                url=self.config.base_url,
-                branch=self.config.branch,
-                depth=self.config.depth,
-                temp_dir=self.temp_dir,
+                "Using authentication token", token_length=len(auth_token)
             )
 
+        if self.mirror is not None and os.path.isdir(
+            os.path.join(self.temp_dir, ".git")
+        ):
             try:
-                self.git_ops.clone(
+                self.git_ops.fetch(
+                    path=self.temp_dir,
                     url=str(self.config.base_url),
-                    to_path=self.temp_dir,
                     branch=self.config.branch,
                     depth=self.config.depth,
                     auth_token=auth_token,
                 )
-            except Exception as clone_error:
-                self.logger.error(
-                    "Failed to clone repository",
-                    error=str(clone_error),
-                    error_type=type(clone_error).__name__,
-                    url=self.config.base_url,
-                    branch=self.config.branch,
-                    temp_dir=self.temp_dir,
+            except Exception as fetch_error:
+                # A broken mirror is replaced by a fresh clone
+                self.logger.warning(
+                    "Failed to update Git mirror, cloning again",
+                    error=str(fetch_error),
+                    error_type=type(fetch_error).__name__,
+                    mirror_dir=self.temp_dir,
                 )
-                raise
+                shutil.rmtree(self.temp_dir, ignore_errors=True)
+                self._clone(auth_token)
+        else:
+            self._clone(auth_token)
 
-            # Verify repository initialization
-            if not self.git_ops.repo:
-                self.logger.error(
-                    "Repository not initialized after clone", temp_dir=self.temp_dir
-                )
-                raise ValueError("Repository not initialized")
+        # Verify repository initialization
+        if not self.git_ops.repo:
+            self.logger.error(
+                "Repository not initialized after clone", temp_dir=self.temp_dir
+            )
+            raise ValueError("Repository not initialized")
+
+        # Verify repository is valid
+        try:
+            self.git_ops.repo.git.status()
+            self.logger.debug(
+                "Repository is valid and accessible", temp_dir=self.temp_dir
+            )
+        except Exception as status_error:
+            self.logger.error(
+                "Failed to verify repository status",
+                error=str(status_error),
+                error_type=type(status_error).__name__,
+                temp_dir=self.temp_dir,
+            )
+            raise
+
+    def _clone(self, auth_token: str | None) -> None:
+        """Clone the repository into the working directory."""
+        self.logger.debug(
+            "Attempting to clone repository",
+            url=self.config.base_url,
+            branch=self.config.branch,
+            depth=self.config.depth,
+            temp_dir=self.temp_dir,
+        )
+
+        try:
+            self.git_ops.clone(
+                url=str(self.config.base_url),
+                to_path=self.temp_dir,
+                branch=self.config.branch,
+                depth=self.config.depth,
+                auth_token=auth_token,
+            )
+        except Exception as clone_error:
+            self.logger.error(
+                "Failed to clone repository",
+                error=str(clone_error),
+                error_type=type(clone_error).__name__,
+                url=self.config.base_url,
+                branch=self.config.branch,
+                temp_dir=self.temp_dir,
+            )
+            raise
 
-            # Verify repository is valid
+        if self.mirror is not None and auth_token and self.git_ops.repo:
+            # Do not keep the token in the configuration of a persistent mirror
             try:
-                self.git_ops.repo.git.status()
-                self.logger.debug(
-                    "Repository is valid and accessible", temp_dir=self.temp_dir
+                self.git_ops.repo.git.remote(
+                    "set-url", "origin", str(self.config.base_url)
                 )
-            except Exception as status_error:
-                self.logger.error(
-                    "Failed to verify repository status",
-                    error=str(status_error),
-                    error_type=type(status_error).__name__,
-                    temp_dir=self.temp_dir,
+            except Exception as e:
+                self.logger.warning(
+                    "Failed to remove credentials from Git mirror remote",
+                    error=str(e),
                 )
-                raise
-        return self
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
@@ -249,7 +234,10 @@ class GitConnector(BaseConnector):
         self._cleanup()
 
     def _cleanup(self):
-        """Clean up temporary directory."""
+        """Clean up temporary directory, or release the mirror."""
+        if self.mirror is not None:
+            self.mirror.release()
+            return
         if self.temp_dir and os.path.exists(self.temp_dir):
             try:
                 shutil.rmtree(self.temp_dir)
@@ -257,6 +245,111 @@ class GitConnector(BaseConnector):
             except Exception as e:
                 self.logger.error(f"Failed to clean up temporary directory: {e}")
 
+    def set_sync_cursor(self, cursor: str | None) -> None:
+        """Set the commit ingested by the previous complete run.
+
+        Args:
+            cursor: ``sync_cursor`` of the previous run
+        """
+        self._previous_cursor = cursor
+
+    def _filter_fingerprint(self) -> str:
+        """Hash of the settings that decide which files are ingested.
+
+        It is part of the sync cursor, so changing them triggers a full
+        listing instead of a diff.
+        """
+        settings = json.dumps(
+            [
+                self.config.file_types,
+                self.config.include_paths,
+                self.config.exclude_paths,
+                self.config.max_file_size,
+                self.config.enable_file_conversion,
+            ]
+        )
+        return hashlib.sha256(settings.encode()).hexdigest()[:12]
+
+    def _list_changed_files(self) -> tuple[list[str], list[str], str]:
+        """List the files to process and the files deleted since the last run.
+
+        The files changed since the commit of the previous run are listed with
+        a diff. Every tracked file is listed, and no deletion reported, on the
+        first run, with ``--force``, when the file filters changed or when the
+        previous commit is not in the local repository.
+
+        Returns:
+            Files to process, deleted files and the new sync cursor
+        """
+        head = self.git_ops.head_commit()
+        fingerprint = self._filter_fingerprint()
+        cursor = f"{head}:{fingerprint}"
+
+        previous_commit = None
+        if self._previous_cursor:
+            commit, _, previous_fingerprint = self._previous_cursor.partition(":")
+            if previous_fingerprint == fingerprint:
+                previous_commit = commit
+
+        if previous_commit == head:
+            self.logger.info("Git repository unchanged since last ingestion")
+            return [], [], cursor
+
+        if previous_commit and self.git_ops.has_commit(previous_commit):
+            changes = self.git_ops.diff_name_status(previous_commit, head)
+            files = [path for status, path in changes if status != "D"]
+            deleted = [path for status, path in changes if status == "D"]
+            self.logger.info(
+                f"Git incremental listing: {len(files)} changed, {len(deleted)} deleted files",
+                base_commit=previous_commit,
+                head_commit=head,
+            )
+            return files, deleted, cursor
+
+        return self.git_ops.list_files(), [], cursor
+
+    def _relative_path(self, file_path: str) -> str:
+        """Path of a file relative to the repository root."""
+        rel_path = os.path.relpath(file_path, self.temp_dir)
+
+        # Fix cross-platform path issues: ensure we get a proper relative path
+        # If relpath returns a path that goes up directories (contains ..),
+        # it means the path calculation failed (common with mixed path styles)
+        if rel_path.startswith("..") and self.temp_dir:
+            # Fallback: try to extract relative path manually
+            if file_path.startswith(self.temp_dir):
+                # Remove temp_dir prefix and any leading separators
+                rel_path = (
+                    file_path[len(self.temp_dir) :]
+                    .lstrip(os.sep)
+                    .lstrip("/")
+                    .lstrip("\\")
+                )
+            else:
+                # Last resort: use basename
+                rel_path = os.path.basename(file_path)
+        return rel_path
+
+    def _document_url(self, rel_path: str) -> str:
+        """URL of the document for a file of the repository."""
+        # Normalize path separators for URL (use forward slashes on all platforms)
+        normalized_rel_path = rel_path.replace(os.sep, "/").replace("\\", "/")
+        return f"{str(self.config.base_url).replace('.git', '')}/blob/{self.config.branch}/{normalized_rel_path}"
+
+    def _deleted_document(self, file_path: str) -> Document:
+        """Deletion marker for a file removed from the repository."""
+        rel_path = self._relative_path(file_path)
+        return Document(
+            title=os.path.basename(file_path),
+            content="",
+            content_type=os.path.splitext(file_path)[1].lower().lstrip("."),
+            metadata={},
+            source_type=SourceType.GIT,
+            source=self.config.source,
+            url=self._document_url(rel_path),
+            is_deleted=True,
+        )
+
     def _process_file(self, file_path: str) -> Document:
         """Process a single file.
 
@@ -270,25 +363,7 @@ class GitConnector(BaseConnector):
             Exception: If file processing fails
         """
         try:
-            # Get relative path from repository root
-            rel_path = os.path.relpath(file_path, self.temp_dir)
-
-            # Fix cross-platform path issues: ensure we get a proper relative path
-            # If relpath returns a path that goes up directories (contains ..),
-            # it means the path calculation failed (common with mixed path styles)
-            if rel_path.startswith("..") and self.temp_dir:
-                # Fallback: try to extract relative path manually
-                if file_path.startswith(self.temp_dir):
-                    # Remove temp_dir prefix and any leading separators
-                    rel_path = (
-                        file_path[len(self.temp_dir) :]
-                        .lstrip(os.sep)
-                        .lstrip("/")
-                        .lstrip("\\")
-                    )
-                else:
-                    # Last resort: use basename
-                    rel_path = os.path.basename(file_path)
+            rel_path = self._relative_path(file_path)
 
             # Check if file needs conversion
             needs_conversion = (
@@ -364,8 +439,6 @@ class GitConnector(BaseConnector):
             self.logger.debug(f"Processed Git file: /{rel_path!s}")
 
             # Create document
-            # Normalize path separators for URL (use forward slashes on all platforms)
-            normalized_rel_path = rel_path.replace(os.sep, "/").replace("\\", "/")
             git_document = Document(
                 title=os.path.basename(file_path),
                 content=content,
@@ -373,7 +446,7 @@ class GitConnector(BaseConnector):
                 metadata=metadata,
                 source_type=SourceType.GIT,
                 source=self.config.source,
-                url=f"{str(self.config.base_url).replace('.git', '')}/blob/{self.config.branch}/{normalized_rel_path}",
+                url=self._document_url(rel_path),
                 is_deleted=False,
                 created_at=first_commit_date,
                 updated_at=last_commit_date,
@@ -387,7 +460,10 @@ class GitConnector(BaseConnector):
             raise
 
     async def get_documents(self) -> list[Document]:
-        """Get all documents from the repository.
+        """Get the documents of the files changed since the last run.
+
+        Deleted files are returned as documents with ``is_deleted`` set. See
+        ``_list_changed_files`` for when every file is returned instead.
 
         Returns:
             List of documents
@@ -397,20 +473,27 @@ class GitConnector(BaseConnector):
         """
         try:
             self._ensure_initialized()
+            self.sync_cursor = None
             try:
-                files = (
-                    self.git_ops.list_files()
-                )  # This will raise ValueError if not initialized
+                # This will raise ValueError if not initialized
+                files, deleted_files, cursor = self._list_changed_files()
             except ValueError as e:
                 self.logger.error("Failed to list files", error=str(e))
                 raise ValueError("Repository not initialized") from e
 
+            files = [
+                file_path
+                for file_path in files
+                if self.file_processor.should_process_file(file_path)  # type: ignore
+            ]
+            if files:
+                # One history pass for all files instead of walks per file
+                self.metadata_extractor.history = self.git_ops.build_history_index()
+
             documents = []
+            failed = False
 
             for file_path in files:
-                if not self.file_processor.should_process_file(file_path):  # type: ignore
-                    continue
-
                 try:
                     document = self._process_file(file_path)
                     documents.append(document)
@@ -419,8 +502,16 @@ class GitConnector(BaseConnector):
                     self.logger.error(
                         "Failed to process file", file_path=file_path, error=str(e)
                     )
+                    failed = True
                     continue
 
+            documents.extend(self._deleted_document(path) for path in deleted_files)
+
+            # Keep the previous cursor when a file failed, so the next run
+            # lists it again
+            if not failed:
+                self.sync_cursor = cursor
+
             # Return all documents that need to be processed
             return documents
 
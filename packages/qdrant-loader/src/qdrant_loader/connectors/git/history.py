@@ -0,0 +1,129 @@
+"""Per-file commit history of a repository, read in a single pass."""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+import git
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Commit header of each `git log` record: hash, committer date, author, subject
+_RECORD = "\x1e"
+_FIELD = "\x1f"
+_LOG_FORMAT = "%x1e%H%x1f%cI%x1f%an%x1f%s"
+
+
+@dataclass(frozen=True)
+class CommitInfo:
+    """Commit metadata stored in the history index."""
+
+    sha: str
+    date: datetime
+    author: str
+    message: str
+
+
+class GitHistoryIndex:
+    """First and last commit of every path reachable from HEAD.
+
+    Built from one ``git log --name-only`` stream instead of one history walk
+    per file. Commits are stored once and paths only keep the positions of
+    their first and last commit, so the index stays small for large
+    repositories.
+    """
+
+    def __init__(self, head: str | None = None):
+        self.head = head
+        self._commits: list[CommitInfo] = []
+        # path -> (last commit position, first commit position)
+        self._paths: dict[str, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    @property
+    def latest_commit(self) -> CommitInfo | None:
+        """Most recent commit of the branch."""
+        return self._commits[0] if self._commits else None
+
+    def last_commit(self, path: str) -> CommitInfo | None:
+        """Latest commit touching ``path`` (relative, POSIX separators)."""
+        positions = self._paths.get(path)
+        return self._commits[positions[0]] if positions else None
+
+    def first_commit(self, path: str) -> CommitInfo | None:
+        """Earliest commit touching ``path`` (relative, POSIX separators)."""
+        positions = self._paths.get(path)
+        return self._commits[positions[1]] if positions else None
+
+    def _add_commit(self, header: str) -> int:
+        sha, date, author, message = header.split(_FIELD, 3)
+        self._commits.append(
+            CommitInfo(
+                sha=sha,
+                date=datetime.fromisoformat(date),
+                author=author,
+                message=message,
+            )
+        )
+        return len(self._commits) - 1
+
+    def _add_path(self, path: str, commit: int) -> None:
+        # Commits arrive newest first: the first sighting is the last commit,
+        # and every later one moves the first commit further back
+        positions = self._paths.get(path)
+        self._paths[path] = (positions[0] if positions else commit, commit)
+
+    def feed(self, records: bytes) -> None:
+        """Add NUL-separated ``git log -z`` output, newest commit first."""
+        commit = -1
+        if self._commits:
+            commit = len(self._commits) - 1
+        for token in records.split(b"\0"):
+            text = token.decode("utf-8", errors="surrogateescape").lstrip("\n")
+            if not text:
+                continue
+            if text.startswith(_RECORD):
+                commit = self._add_commit(text[1:])
+            elif commit >= 0:
+                self._add_path(text, commit)
+
+    @classmethod
+    def build(cls, repo: git.Repo, chunk_size: int = 1 << 16) -> "GitHistoryIndex":
+        """Read the history of the checked out branch.
+
+        Args:
+            repo: Repository to index
+            chunk_size: Bytes read from ``git log`` at a time
+
+        Returns:
+            The history index
+        """
+        index = cls(head=repo.head.commit.hexsha)
+        process = repo.git.log(
+            "--name-only",
+            "--no-renames",
+            "-z",
+            f"--format={_LOG_FORMAT}",
+            as_process=True,
+        )
+        pending = b""
+        try:
+            while chunk := process.stdout.read(chunk_size):
+                # Keep the trailing partial token for the next chunk
+                pending += chunk
+                complete, _, pending = pending.rpartition(b"\0")
+                index.feed(complete)
+            index.feed(pending)
+        finally:
+            process.wait()
+
+        logger.info(
+            "Built Git history index",
+            paths=len(index),
+            commits=len(index._commits),
+            head=index.head,
+        )
+        return index
@@ -7,6 +7,7 @@ import chardet
 import git
 
 from qdrant_loader.connectors.git.config import GitRepoConfig
+from qdrant_loader.connectors.git.history import CommitInfo, GitHistoryIndex
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -23,6 +24,8 @@ class GitMetadataExtractor:
         """
         self.config = config
         self.logger = logger
+        # Set by the connector once per run; None reads the history per file
+        self.history: GitHistoryIndex | None = None
 
     def extract_all_metadata(self, file_path: str, content: str) -> dict[str, Any]:
         """Extract all metadata for a file.
@@ -195,8 +198,25 @@ class GitMetadataExtractor:
             self.logger.error(f"Failed to extract repository metadata: {str(e)!s}")
             return {}
 
+    @staticmethod
+    def _commit_metadata(commit: CommitInfo) -> dict[str, Any]:
+        return {
+            "last_commit_date": commit.date.isoformat(),
+            "last_commit_author": commit.author,
+            "last_commit_message": commit.message,
+        }
+
     def _extract_git_metadata(self, file_path: str) -> dict[str, Any]:
         """Extract Git-specific metadata."""
+        if self.history is not None:
+            rel_path = file_path
+            if os.path.isabs(rel_path) and self.config.temp_dir:
+                rel_path = os.path.relpath(rel_path, self.config.temp_dir)
+            rel_path = rel_path.replace("\\", "/")
+            # Files without commits get the latest commit, as below
+            commit = self.history.last_commit(rel_path) or self.history.latest_commit
+            return self._commit_metadata(commit) if commit else {}
+
         try:
             repo = git.Repo(self.config.temp_dir)
             metadata = {}
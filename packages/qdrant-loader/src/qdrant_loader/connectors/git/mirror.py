@@ -0,0 +1,88 @@
+"""Persistent repository mirrors shared across ingestion runs."""
+
+import asyncio
+import hashlib
+import os
+import time
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+class GitMirror:
+    """Working copy of one repository branch kept between runs.
+
+    Each repository URL and branch gets its own directory under the mirror
+    root, so later runs fetch new commits instead of cloning again. An
+    exclusive file lock next to the directory keeps two connectors (in this
+    or another process) from updating or reading the same mirror at once.
+    """
+
+    def __init__(self, root: str, url: str, branch: str):
+        """Initialize the mirror.
+
+        Args:
+            root: Directory holding all mirrors
+            url: Repository URL, without credentials
+            branch: Branch the mirror tracks
+        """
+        key = hashlib.sha256(f"{url}#{branch}".encode()).hexdigest()[:16]
+        self.root = os.path.abspath(os.path.expanduser(root))
+        self.path = os.path.join(self.root, key)
+        self.lock_path = f"{self.path}.lock"
+        self._lock_file = None
+
+    @property
+    def locked(self) -> bool:
+        """Whether this instance holds the mirror lock."""
+        return self._lock_file is not None
+
+    def _try_lock(self) -> bool:
+        os.makedirs(self.root, exist_ok=True)
+        lock_file = open(self.lock_path, "a+")  # noqa: SIM115 - held until release
+        try:
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:  # pragma: no cover - Windows
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        return True
+
+    async def acquire(self, poll_interval: float = 0.2) -> None:
+        """Wait for the mirror lock without blocking the event loop."""
+        waited = False
+        while not self._try_lock():
+            if not waited:
+                logger.info("Waiting for Git mirror lock", path=self.path)
+                waited = True
+            await asyncio.sleep(poll_interval)
+
+    def acquire_blocking(self, poll_interval: float = 0.2) -> None:
+        """Wait for the mirror lock."""
+        while not self._try_lock():
+            time.sleep(poll_interval)
+
+    def release(self) -> None:
+        """Release the mirror lock if held."""
+        if self._lock_file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file.fileno(), fcntl.LOCK_UN)
+            else:  # pragma: no cover - Windows
+                self._lock_file.seek(0)
+                msvcrt.locking(self._lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._lock_file.close()
+            self._lock_file = None
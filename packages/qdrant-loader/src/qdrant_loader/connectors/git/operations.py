@@ -8,6 +8,7 @@ from datetime import datetime
 import git
 from git.exc import GitCommandError
 
+from qdrant_loader.connectors.git.history import GitHistoryIndex
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -19,6 +20,8 @@ class GitOperations:
     def __init__(self):
         """Initialize Git operations."""
         self.repo = None
+        # Built once per run by build_history_index; None means per-file walks
+        self.history: GitHistoryIndex | None = None
         self.logger = LoggingConfig.get_logger(__name__)
         self.logger.info("Initializing GitOperations")
 
@@ -206,6 +209,10 @@ class GitOperations:
             rel_path = self._to_git_path(rel_path)
             self.logger.debug("Getting last commit date", file_path=rel_path)
 
+            if self.history is not None:
+                commit = self.history.last_commit(rel_path)
+                return commit.date if commit else None
+
             # Get the last commit for the file
             try:
                 commits = list(self.repo.iter_commits(paths=rel_path, max_count=1))
@@ -272,6 +279,10 @@ class GitOperations:
             rel_path = self._to_git_path(rel_path)
             self.logger.debug("Getting creation date", file_path=rel_path)
 
+            if self.history is not None:
+                commit = self.history.first_commit(rel_path)
+                return commit.date if commit else None
+
             # Get the first commit for the file
             try:
                 # Use git log with --reverse to get commits in chronological order
@@ -323,6 +334,33 @@ class GitOperations:
             )
             return None
 
+    def build_history_index(self) -> GitHistoryIndex | None:
+        """Index the commit history of every file in one ``git log`` pass.
+
+        The index is reused while HEAD does not move. Commit dates fall back to
+        one history walk per file when it cannot be built.
+
+        Returns:
+            The history index, or None if it could not be built
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+
+        head = self.head_commit()
+        if self.history is not None and self.history.head == head:
+            return self.history
+
+        try:
+            self.history = GitHistoryIndex.build(self.repo)
+        except Exception as e:
+            self.logger.warning(
+                "Failed to build Git history index, reading history per file",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            self.history = None
+        return self.history
+
     def list_files(self) -> list[str]:
         """List all files in the repository.
 
@@ -342,3 +380,84 @@ class GitOperations:
         except Exception as e:
             self.logger.error("Failed to list files", error=str(e))
             raise
+
+    def fetch(
+        self,
+        path: str,
+        url: str,
+        branch: str,
+        depth: int,
+        auth_token: str | None = None,
+    ) -> None:
+        """Update an existing clone to the tip of a branch.
+
+        The working tree is reset to the fetched commit and untracked files
+        are removed, so it matches a fresh clone of the branch.
+
+        Args:
+            path: Path of the existing clone
+            url: Repository URL or local path
+            branch: Branch to fetch
+            depth: Fetch depth (use 0 for full history)
+            auth_token: Authentication token
+        """
+        self.repo = git.Repo(path)
+
+        fetch_url = url
+        if os.path.exists(url):
+            fetch_url = os.path.abspath(url)
+        elif auth_token and url.startswith("https://"):
+            fetch_url = url.replace("https://", f"https://{auth_token}@")
+
+        fetch_args = [fetch_url, branch]
+        if depth > 0:
+            fetch_args = ["--depth", str(depth), *fetch_args]
+
+        self.logger.info(f"Fetching repository : {url} | branch: {branch}")
+        # Disable credential prompts for this command only
+        with self.repo.git.custom_environment(GIT_TERMINAL_PROMPT="0"):
+            self.repo.git.fetch(*fetch_args)
+        self.repo.git.reset("--hard", "FETCH_HEAD")
+        self.repo.git.clean("-ffdx")
+
+    def head_commit(self) -> str:
+        """Return the SHA of the checked out commit."""
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+        return self.repo.head.commit.hexsha
+
+    def has_commit(self, sha: str) -> bool:
+        """Check whether a commit is available in the local repository."""
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+        try:
+            self.repo.git.cat_file("-e", f"{sha}^{{commit}}")
+            return True
+        except GitCommandError:
+            return False
+
+    def diff_name_status(self, old: str, new: str) -> list[tuple[str, str]]:
+        """List the files changed between two commits.
+
+        Renames are reported as a deletion of the old path and an addition of
+        the new one.
+
+        Args:
+            old: Base commit SHA
+            new: Target commit SHA
+
+        Returns:
+            ``(status, absolute path)`` pairs where status is ``A``, ``M``,
+            ``D`` or ``T`` (type change)
+        """
+        if not self.repo:
+            raise ValueError("Repository not initialized")
+        output = self.repo.git.diff(
+            "--name-status", "--no-renames", "-z", f"{old}..{new}"
+        )
+        fields = output.split("\0") if output else []
+        changes = []
+        for status, path in zip(fields[0::2], fields[1::2], strict=False):
+            if path:
+                changes.append((status[:1], os.path.join(self.repo.working_dir, path)))
+        return changes
@@ -155,6 +155,31 @@ class JiraProjectConfig(SourceConfig):
         default=False, description="Whether to download and process issue attachments"
     )
 
+    # Streaming
+    prefetch_pages: int = Field(
+        default=1,
+        description=(
+            "Number of issue search pages fetched ahead of the issues being "
+            "processed (0 disables read-ahead)"
+        ),
+        ge=0,
+        le=10,
+    )
+    max_concurrent_attachments: int = Field(
+        default=4,
+        description="Maximum number of issues whose attachments are processed at once",
+        ge=1,
+        le=50,
+    )
+    max_attachment_bytes_in_flight: int = Field(
+        default=100 * 1024 * 1024,
+        description=(
+            "Maximum total size of attachments being downloaded and converted "
+            "at once, in bytes"
+        ),
+        ge=1,
+    )
+
     # Additional configuration
     issue_types: list[str] = Field(
         default=[],
@@ -4,9 +4,11 @@ import asyncio
 import warnings
 from abc import abstractmethod
 from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
 from urllib.parse import urlparse  # noqa: F401 - may be used in URL handling
 
+import httpx
 import requests
 from requests.auth import HTTPBasicAuth  # noqa: F401 - compatibility
 
@@ -39,10 +41,16 @@ from qdrant_loader.connectors.shared.attachments.metadata import (
 )
 from qdrant_loader.connectors.shared.http import (
     RateLimiter,
+    create_async_client,
 )
 from qdrant_loader.connectors.shared.http import (
     request_with_policy as _http_request_with_policy,
 )
+from qdrant_loader.connectors.shared.prefetch import (
+    ByteBudget,
+    map_in_order,
+    read_ahead,
+)
 from qdrant_loader.core.attachment_downloader import (
     AttachmentDownloader,
     AttachmentMetadata,
@@ -58,6 +66,11 @@ from qdrant_loader.utils.logging import LoggingConfig
 logger = LoggingConfig.get_logger(__name__)
 
 
+async def _iterate(items: list[JiraIssue]) -> AsyncIterator[JiraIssue]:
+    for item in items:
+        yield item
+
+
 class BaseJiraConnector(BaseConnector):
     """Base class for all Jira connectors."""
 
@@ -74,8 +87,10 @@ class BaseJiraConnector(BaseConnector):
         self.config = config
         self.base_url = str(config.base_url).rstrip("/")
 
-        # Initialize session
+        # Initialize session; it holds the authentication settings, and API
+        # calls go through a pooled async client created from it on first use
         self.session = requests.Session()
+        self._http_client: httpx.AsyncClient | None = None
 
         # Set up authentication based on deployment type
         self._setup_authentication()
@@ -308,10 +323,25 @@ class BaseJiraConnector(BaseConnector):
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
         try:
+            await self._close_http_client()
+            if self.attachment_reader is not None:
+                await self.attachment_reader.aclose()
             self.session.close()
         finally:
             self._initialized = False
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the pooled async HTTP client, creating it on first use."""
+        if self._http_client is None:
+            self._http_client = create_async_client(self.session)
+        return self._http_client
+
+    async def _close_http_client(self) -> None:
+        """Close the pooled async HTTP client and its connections."""
+        client, self._http_client = self._http_client, None
+        if client is not None:
+            await client.aclose()
+
     @abstractmethod
     def _get_api_url(self, endpoint: str) -> str:
         """Construct the full API URL for an endpoint."""
@@ -352,6 +382,7 @@ class BaseJiraConnector(BaseConnector):
                 self.session,
                 method,
                 url,
+                client=self._get_http_client(),
                 rate_limiter=self._rate_limiter,
                 retries=3,
                 backoff_factor=0.5,
@@ -490,129 +521,182 @@ class BaseJiraConnector(BaseConnector):
         return documents
 
     async def _stream_issues_to_documents(
-        self, issues: list[JiraIssue], include_attachments: bool = True
+        self,
+        issues: list[JiraIssue] | AsyncIterator[JiraIssue],
+        include_attachments: bool = True,
     ) -> AsyncGenerator[Document, None]:
         """Stream Jira issues as Document objects, including attachments.
 
         Yields documents one at a time, with attachments yielded immediately after
-        their parent issue document.
+        their parent issue document. Attachments of up to
+        ``max_concurrent_attachments`` issues are downloaded and converted
+        concurrently, holding at most ``max_attachment_bytes_in_flight`` bytes;
+        documents keep the order of ``issues``.
         """
-        for issue in issues:
-            content_parts = [issue.summary]
-            if issue.description:
-                content_parts.append(issue.description)
-
-            for comment in issue.comments:
-                content_parts.append(
-                    f"\nComment by {comment.author.display_name} on {comment.created.strftime('%Y-%m-%d %H:%M')}:"
-                )
-                content_parts.append(comment.body)
-
-            content = "\n\n".join(content_parts)
-            metadata = {
-                "project": self.config.project_key,
-                "issue_type": issue.issue_type,
-                "status": issue.status,
-                "key": issue.key,
-                "priority": issue.priority,
-                "labels": issue.labels,
-                "reporter": issue.reporter.display_name if issue.reporter else None,
-                "assignee": issue.assignee.display_name if issue.assignee else None,
-                "created": issue.created.isoformat(),
-                "updated": issue.updated.isoformat(),
-                "parent_key": issue.parent_key,
-                "subtasks": issue.subtasks,
-                "linked_issues": issue.linked_issues,
-                "comments": [
-                    {
-                        "id": comment.id,
-                        "body": comment.body,
-                        "created": comment.created.isoformat(),
-                        "updated": (
-                            comment.updated.isoformat() if comment.updated else None
-                        ),
-                        "author": (
-                            comment.author.display_name if comment.author else None
-                        ),
-                    }
-                    for comment in issue.comments
-                ],
-                "attachments": (
-                    [
-                        {
-                            "id": att.id,
-                            "filename": att.filename,
-                            "size": att.size,
-                            "mime_type": att.mime_type,
-                            "created": att.created.isoformat(),
-                            "author": (att.author.display_name if att.author else None),
-                        }
-                        for att in issue.attachments
-                    ]
-                    if issue.attachments
-                    else []
-                ),
-            }
-            if self.config.extra_fields:
-                for field in self.config.extra_fields:
-                    metadata[field.name] = getattr(issue, field.name)
-            base_url = str(self.config.base_url).rstrip("/")
-            document = Document(
-                id=issue.id,
-                content=content,
-                content_type="text",
-                source=self.config.source,
-                source_type=SourceType.JIRA,
-                created_at=issue.created,
-                url=f"{base_url}/browse/{issue.key}",
-                title=issue.summary,
-                updated_at=issue.updated,
-                is_deleted=False,
-                metadata=metadata,
-            )
-            logger.debug(
-                "Jira document created",
-                document_id=document.id,
-                source_type=document.source_type,
-                source=document.source,
-                title=document.title,
-            )
-            yield document
+        if isinstance(issues, list):
+            issues = _iterate(issues)
+
+        budget = ByteBudget(self.config.max_attachment_bytes_in_flight)
 
-            if (
+        async def process(issue: JiraIssue) -> list[Document]:
+            document = self._issue_to_document(issue)
+            if not (
                 include_attachments
                 and self.config.download_attachments
                 and self.attachment_reader
             ):
-                attachment_metadata = self._get_issue_attachments(issue)
-                if attachment_metadata:
-                    logger.info(
-                        "Processing attachments for JIRA issue",
-                        issue_key=issue.key,
-                        attachment_count=len(attachment_metadata),
-                    )
-
-                    attachment_documents = (
-                        await self.attachment_reader.fetch_and_process(
-                            attachment_metadata, document
-                        )
-                    )
-                    for attachment_document in attachment_documents:
-                        yield attachment_document
-
-                    logger.debug(
-                        "Processed attachments for JIRA issue",
-                        issue_key=issue.key,
-                        processed_count=len(attachment_documents),
-                    )
+                return [document]
+            return [
+                document,
+                *await self._process_issue_attachments(issue, document, budget),
+            ]
+
+        results = map_in_order(
+            process, issues, concurrency=self.config.max_concurrent_attachments
+        )
+        async with aclosing(results):
+            async for documents in results:
+                for document in documents:
+                    yield document
+
+    def _issue_to_document(self, issue: JiraIssue) -> Document:
+        """Convert a Jira issue into its Document."""
+        content_parts = [issue.summary]
+        if issue.description:
+            content_parts.append(issue.description)
+
+        for comment in issue.comments:
+            content_parts.append(
+                f"\nComment by {comment.author.display_name} on {comment.created.strftime('%Y-%m-%d %H:%M')}:"
+            )
+            content_parts.append(comment.body)
+
+        content = "\n\n".join(content_parts)
+        metadata = {
+            "project": self.config.project_key,
+            "issue_type": issue.issue_type,
+            "status": issue.status,
+            "key": issue.key,
+            "priority": issue.priority,
+            "labels": issue.labels,
+            "reporter": issue.reporter.display_name if issue.reporter else None,
+            "assignee": issue.assignee.display_name if issue.assignee else None,
+            "created": issue.created.isoformat(),
+            "updated": issue.updated.isoformat(),
+            "parent_key": issue.parent_key,
+            "subtasks": issue.subtasks,
+            "linked_issues": issue.linked_issues,
+            "comments": [
+                {
+                    "id": comment.id,
+                    "body": comment.body,
+                    "created": comment.created.isoformat(),
+                    "updated": (
+                        comment.updated.isoformat() if comment.updated else None
+                    ),
+                    "author": (comment.author.display_name if comment.author else None),
+                }
+                for comment in issue.comments
+            ],
+            "attachments": (
+                [
+                    {
+                        "id": att.id,
+                        "filename": att.filename,
+                        "size": att.size,
+                        "mime_type": att.mime_type,
+                        "created": att.created.isoformat(),
+                        "author": (att.author.display_name if att.author else None),
+                    }
+                    for att in issue.attachments
+                ]
+                if issue.attachments
+                else []
+            ),
+        }
+        if self.config.extra_fields:
+            for field in self.config.extra_fields:
+                metadata[field.name] = getattr(issue, field.name)
+        base_url = str(self.config.base_url).rstrip("/")
+        document = Document(
+            id=issue.id,
+            content=content,
+            content_type="text",
+            source=self.config.source,
+            source_type=SourceType.JIRA,
+            created_at=issue.created,
+            url=f"{base_url}/browse/{issue.key}",
+            title=issue.summary,
+            updated_at=issue.updated,
+            is_deleted=False,
+            metadata=metadata,
+        )
+        logger.debug(
+            "Jira document created",
+            document_id=document.id,
+            source_type=document.source_type,
+            source=document.source,
+            title=document.title,
+        )
+        return document
+
+    async def _process_issue_attachments(
+        self,
+        issue: JiraIssue,
+        document: Document,
+        budget: ByteBudget,
+    ) -> list[Document]:
+        """Download and convert the attachments of an issue.
+
+        Args:
+            issue: Issue owning the attachments
+            document: Document of the issue
+            budget: Bounds the attachment bytes held at once
+
+        Returns:
+            The attachment documents
+        """
+        attachment_metadata = self._get_issue_attachments(issue)
+        if not attachment_metadata or self.attachment_reader is None:
+            return []
+
+        size = sum(max(attachment.size, 0) for attachment in attachment_metadata)
+        await budget.acquire(size)
+        try:
+            logger.info(
+                "Processing attachments for JIRA issue",
+                issue_key=issue.key,
+                attachment_count=len(attachment_metadata),
+            )
+            attachment_documents = await self.attachment_reader.fetch_and_process(
+                attachment_metadata, document
+            )
+        finally:
+            await budget.release(size)
+
+        logger.debug(
+            "Processed attachments for JIRA issue",
+            issue_key=issue.key,
+            processed_count=len(attachment_documents),
+        )
+        return attachment_documents
 
     async def stream_documents(
         self, since: datetime | None = None
     ) -> AsyncGenerator[Document, None]:
-        """Stream documents from Jira (WS-1 connector contract)."""
+        """Stream documents from Jira (WS-1 connector contract).
+
+        The issue search runs ``prefetch_pages`` pages ahead of the conversion
+        of issues into documents.
+        """
         effective_since = since if since is not None else self.config.updated_after
-        async for issue in self.get_issues(updated_after=effective_since):
-            async for document in self._stream_issues_to_documents([issue]):
+        issues = read_ahead(
+            self.get_issues(updated_after=effective_since),
+            self.config.prefetch_pages * self.config.page_size,
+        )
+        documents = self._stream_issues_to_documents(issues)
+        async with aclosing(documents):
+            async for document in documents:
                 yield document
 
     async def get_documents(self) -> list[Document]:
@@ -22,6 +22,12 @@ class LocalFileConfig(SourceConfig):
     max_file_size: int = Field(
         default=1048576, description="Maximum file size in bytes"
     )
+    max_concurrent_files: int = Field(
+        default=8,
+        description="Maximum number of files read or converted at once",
+        ge=1,
+        le=64,
+    )
 
     @field_validator("base_url")
     @classmethod
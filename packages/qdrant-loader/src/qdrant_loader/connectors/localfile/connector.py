@@ -1,10 +1,18 @@
+import asyncio
 import os
+import warnings
+from collections.abc import AsyncGenerator, AsyncIterator, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
 from datetime import UTC, datetime
+from itertools import islice
 from urllib.parse import unquote, urlparse
 
-from qdrant_loader.connectors.base import BaseConnector
+from qdrant_loader.connectors.base import BaseConnector, FileStat
+from qdrant_loader.connectors.shared.prefetch import map_in_order
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import (
+    ConversionTimeoutError,
     FileConversionConfig,
     FileConversionError,
     FileConverter,
@@ -16,6 +24,9 @@ from .config import LocalFileConfig
 from .file_processor import LocalFileFileProcessor
 from .metadata_extractor import LocalFileMetadataExtractor
 
+# Files handed from the directory walk to the readers at a time
+SCAN_BATCH_SIZE = 256
+
 
 class LocalFileConnector(BaseConnector):
     """Connector for ingesting local files."""
@@ -30,6 +41,8 @@ class LocalFileConnector(BaseConnector):
         self.metadata_extractor = LocalFileMetadataExtractor(self.base_path)
         self.logger = LoggingConfig.get_logger(__name__)
         self._initialized = True
+        # Stats of the files ingested by the previous runs, keyed by relative path
+        self._known_files: Mapping[str, FileStat] | None = None
 
         # Initialize file conversion components if enabled
         self.file_converter = None
@@ -78,129 +91,352 @@ class LocalFileConnector(BaseConnector):
             self.file_converter = FileConverter(file_conversion_config)
             self.logger.debug("File converter initialized with global config")
 
-    async def get_documents(self) -> list[Document]:
-        """Get all documents from the local file source."""
-        documents = []
-        for root, _, files in os.walk(self.base_path):
-            for file in files:
-                file_path = os.path.join(root, file)
-                if not self.file_processor.should_process_file(file_path):
-                    continue
-                try:
-                    # Get relative path from base directory
-                    rel_path = os.path.relpath(file_path, self.base_path)
-                    file_extension = os.path.splitext(file)[1].lower()
-
-                    if self.config.enable_file_conversion and file_extension in {
-                        ".doc",
-                        ".ppt",
-                    }:
-                        file_info = (
-                            self.file_detector.get_file_type_info(file_path)
-                            if self.file_detector
-                            else {
-                                "mime_type": None,
-                                "file_extension": file_extension,
-                            }
-                        )
-                        self.logger.warning(
-                            "Skipping file: old doc/ppt are not supported for MarkItDown conversion",
-                            file_path=rel_path.replace("\\", "/"),
-                            mime_type=file_info.get("mime_type"),
-                            file_extension=file_info.get("file_extension"),
-                        )
-                        continue
+    def set_file_stats(self, stats: Mapping[str, FileStat] | None) -> None:
+        """Set the stats of the files ingested by the previous runs."""
+        self._known_files = stats
 
-                    # Check if file needs conversion
-                    needs_conversion = (
-                        self.config.enable_file_conversion
-                        and self.file_detector
-                        and self.file_converter
-                        and self.file_detector.is_supported_for_conversion(file_path)
-                    )
+    def _relative_path(self, file_path: str) -> str:
+        """Path of a file relative to the base path, with forward slashes."""
+        return os.path.relpath(file_path, self.base_path).replace("\\", "/")
 
-                    if needs_conversion:
-                        self.logger.debug(
-                            "File needs conversion",
-                            file_path=rel_path.replace("\\", "/"),
-                        )
-                        try:
-                            # Convert file to markdown
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.convert_file(file_path)
-                            content_type = "md"  # Converted files are markdown
-                            conversion_method = "markitdown"
-                            conversion_failed = False
-                            self.logger.info(
-                                "File conversion successful",
-                                file_path=rel_path.replace("\\", "/"),
-                            )
-                        except FileConversionError as e:
-                            self.logger.warning(
-                                "File conversion failed, creating fallback document",
-                                file_path=rel_path.replace("\\", "/"),
-                                error=str(e),
-                            )
-                            # Create fallback document
-                            assert self.file_converter is not None  # Type checker hint
-                            content = self.file_converter.create_fallback_document(
-                                file_path, e
-                            )
-                            content_type = "md"  # Fallback is also markdown
-                            conversion_method = "markitdown_fallback"
-                            conversion_failed = True
-                    else:
-                        # Read file content normally
-                        with open(file_path, encoding="utf-8", errors="ignore") as f:
-                            content = f.read()
-                        # Get file extension without the dot
-                        content_type = os.path.splitext(file)[1].lower().lstrip(".")
-                        conversion_method = None
-                        conversion_failed = False
-
-                    # Get file modification time
-                    file_mtime = os.path.getmtime(file_path)
-                    updated_at = datetime.fromtimestamp(file_mtime, tz=UTC)
-
-                    metadata = self.metadata_extractor.extract_all_metadata(
-                        file_path, content
-                    )
+    def _scan_files(
+        self, unreadable_dirs: list[str], root: str | None = None
+    ) -> Iterator[tuple[str, str, os.stat_result]]:
+        """Walk a directory with ``os.scandir`` and yield the files to process.
 
-                    # Add file conversion metadata if applicable
-                    if needs_conversion:
-                        metadata.update(
-                            {
-                                "conversion_method": conversion_method,
-                                "conversion_failed": conversion_failed,
-                                "original_file_type": os.path.splitext(file)[1]
-                                .lower()
-                                .lstrip("."),
-                            }
-                        )
+        Like ``os.walk``, symlinked files are listed but symlinked directories
+        are not entered. The stat of each file comes from its directory entry,
+        so files are not opened.
 
-                    self.logger.debug(
-                        f"Processed local file: {rel_path.replace('\\', '/')}"
-                    )
+        Args:
+            unreadable_dirs: Relative paths of the directories that could not
+                be listed are appended to it
+            root: Directory to walk; defaults to the base path
 
-                    # Create consistent URL with forward slashes for cross-platform compatibility
-                    normalized_path = os.path.realpath(file_path).replace("\\", "/")
-                    doc = Document(
-                        title=os.path.basename(file_path),
-                        content=content,
-                        content_type=content_type,
-                        metadata=metadata,
-                        source_type="localfile",
-                        source=self.config.source,
-                        url=f"file://{normalized_path}",
-                        is_deleted=False,
-                        updated_at=updated_at,
-                    )
-                    documents.append(doc)
-                except Exception as e:
-                    self.logger.error(
-                        "Failed to process file",
-                        file_path=file_path.replace("\\", "/"),
+        Yields:
+            The path, relative path and stat of every file passing the filters
+        """
+        directories = [root or self.base_path]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                rel_dir = self._relative_path(directory)
+                self.logger.warning(
+                    "Failed to list directory",
+                    directory=rel_dir,
+                    error=str(e),
+                )
+                unreadable_dirs.append("" if rel_dir == "." else rel_dir)
+                continue
+
+            subdirectories = []
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    self.logger.debug(
+                        "Skipping file: stat failed",
+                        file_path=entry.path.replace("\\", "/"),
                         error=str(e),
                     )
                     continue
-        return documents
+                if not self.file_processor.should_process_file(entry.path):
+                    continue
+                yield entry.path, self._relative_path(entry.path), stat
+            # Visit subdirectories in listing order
+            directories.extend(reversed(subdirectories))
+
+    async def stream_documents(
+        self, since: datetime | None = None
+    ) -> AsyncGenerator[Document, None]:
+        """Stream the documents of the files under the base path.
+
+        The tree is walked with ``os.scandir`` in a worker thread. A file
+        whose size and modification time match the stats of the previous
+        runs is skipped without being opened. The other files are read, or
+        converted, by a pool of ``max_concurrent_files`` threads and yielded
+        in walk order. Known files that are gone, or no longer pass the
+        filters, are yielded as deleted documents. Once the stream completed,
+        ``file_stats`` holds the stats of every file ingested.
+
+        Args:
+            since: Ignored; changes are detected from the file stats
+
+        Yields:
+            Documents of the new and changed files, then deletion markers
+        """
+        self.file_stats = None
+        known = self._known_files or {}
+        listed: set[str] = set()
+        ingested: dict[str, FileStat] = {}
+        unreadable_dirs: list[str] = []
+        unchanged = 0
+        executor = ThreadPoolExecutor(
+            max_workers=self.config.max_concurrent_files,
+            thread_name_prefix="localfile",
+        )
+
+        async def changed_files() -> AsyncIterator[tuple[str, str, os.stat_result]]:
+            nonlocal unchanged
+            files = self._scan_files(unreadable_dirs)
+            while batch := await asyncio.to_thread(
+                list, islice(files, SCAN_BATCH_SIZE)
+            ):
+                for file_path, rel_path, stat in batch:
+                    listed.add(rel_path)
+                    previous = known.get(rel_path)
+                    if (
+                        previous is not None
+                        and previous.size == stat.st_size
+                        and previous.mtime_ns == stat.st_mtime_ns
+                    ):
+                        ingested[rel_path] = previous
+                        unchanged += 1
+                        continue
+                    yield file_path, rel_path, stat
+
+        async def load(item: tuple[str, str, os.stat_result]) -> Document | None:
+            file_path, rel_path, stat = item
+            try:
+                document = await self._load_in_pool(executor, file_path)
+            except Exception as e:
+                self.logger.error(
+                    "Failed to process file",
+                    file_path=file_path.replace("\\", "/"),
+                    error=str(e),
+                )
+                return None
+            if document is not None:
+                ingested[rel_path] = FileStat(
+                    stat.st_size, stat.st_mtime_ns, document.url
+                )
+            return document
+
+        try:
+            async with aclosing(
+                map_in_order(
+                    load,
+                    changed_files(),
+                    concurrency=self.config.max_concurrent_files,
+                )
+            ) as documents:
+                async for document in documents:
+                    if document is not None:
+                        yield document
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        deleted = 0
+        for rel_path, stat in known.items():
+            if rel_path in listed or any(
+                not directory
+                or rel_path == directory
+                or rel_path.startswith(directory + "/")
+                for directory in unreadable_dirs
+            ):
+                # Files below directories that could not be listed are kept
+                continue
+            deleted += 1
+            yield self._deleted_document(rel_path, stat)
+
+        self.logger.debug(
+            "Scanned local files",
+            files=len(listed),
+            unchanged=unchanged,
+            deleted=deleted,
+        )
+        self.file_stats = ingested
+
+    def _deleted_document(self, rel_path: str, stat: FileStat) -> Document:
+        """Deletion marker for a file removed from the base path."""
+        return Document(
+            title=os.path.basename(rel_path),
+            content="",
+            content_type=os.path.splitext(rel_path)[1].lower().lstrip("."),
+            metadata={},
+            source_type="localfile",
+            source=self.config.source,
+            url=stat.url,
+            is_deleted=True,
+        )
+
+    async def fetch_by_id(self, entity_id: str) -> Document | None:
+        """Fetch the document of a single file.
+
+        Args:
+            entity_id: Path of the file relative to the base path
+
+        Returns:
+            The document, or None if the file is gone or filtered out
+        """
+        file_path = os.path.join(self.base_path, entity_id)
+        if not await asyncio.to_thread(
+            self.file_processor.should_process_file, file_path
+        ):
+            return None
+        return await self._load_in_pool(None, file_path)
+
+    async def _load_in_pool(
+        self, executor: ThreadPoolExecutor | None, file_path: str
+    ) -> Document | None:
+        """Read or convert a file in the worker pool, or the default executor.
+
+        Conversions in worker threads cannot use the signal-based timeout of
+        the converter, so the wait is bounded here instead. A conversion that
+        times out yields the fallback document; its thread runs to completion
+        in the background.
+        """
+        future = asyncio.get_running_loop().run_in_executor(
+            executor, self._load_document, file_path
+        )
+        if self.file_converter is None:
+            return await future
+        timeout = self.file_converter.config.conversion_timeout
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            error = ConversionTimeoutError(timeout, file_path)
+            self.logger.warning(
+                "File conversion failed, creating fallback document",
+                file_path=self._relative_path(file_path),
+                error=str(error),
+            )
+            content = self.file_converter.create_fallback_document(file_path, error)
+            return await asyncio.to_thread(
+                self._build_document,
+                file_path,
+                content,
+                "md",
+                ("markitdown_fallback", True),
+            )
+
+    def _load_document(self, file_path: str) -> Document | None:
+        """Read or convert a file into a document; runs in a worker thread.
+
+        Returns:
+            The document, or None for file types that are skipped
+        """
+        rel_path = self._relative_path(file_path)
+        file_extension = os.path.splitext(file_path)[1].lower()
+
+        if self.config.enable_file_conversion and file_extension in {".doc", ".ppt"}:
+            file_info = (
+                self.file_detector.get_file_type_info(file_path)
+                if self.file_detector
+                else {
+                    "mime_type": None,
+                    "file_extension": file_extension,
+                }
+            )
+            self.logger.warning(
+                "Skipping file: old doc/ppt are not supported for MarkItDown conversion",
+                file_path=rel_path,
+                mime_type=file_info.get("mime_type"),
+                file_extension=file_info.get("file_extension"),
+            )
+            return None
+
+        # Check if file needs conversion
+        needs_conversion = (
+            self.config.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(file_path)
+        )
+
+        if not needs_conversion:
+            # Read file content normally
+            with open(file_path, encoding="utf-8", errors="ignore") as f:
+                content = f.read()
+            return self._build_document(
+                file_path, content, file_extension.lstrip("."), None
+            )
+
+        self.logger.debug("File needs conversion", file_path=rel_path)
+        assert self.file_converter is not None  # Type checker hint
+        try:
+            # Convert file to markdown
+            content = self.file_converter.convert_file(file_path)
+            conversion = ("markitdown", False)
+            self.logger.info("File conversion successful", file_path=rel_path)
+        except FileConversionError as e:
+            self.logger.warning(
+                "File conversion failed, creating fallback document",
+                file_path=rel_path,
+                error=str(e),
+            )
+            content = self.file_converter.create_fallback_document(file_path, e)
+            conversion = ("markitdown_fallback", True)
+        # Converted files and fallbacks are markdown
+        return self._build_document(file_path, content, "md", conversion)
+
+    def _build_document(
+        self,
+        file_path: str,
+        content: str,
+        content_type: str,
+        conversion: tuple[str, bool] | None,
+    ) -> Document:
+        """Create the document of a file from its content.
+
+        Args:
+            file_path: Path to the file
+            content: Text content, or the Markdown produced by the conversion
+            content_type: Content type of the document
+            conversion: Conversion method and whether it failed, for
+                converted files
+        """
+        # Get file modification time
+        file_mtime = os.path.getmtime(file_path)
+        updated_at = datetime.fromtimestamp(file_mtime, tz=UTC)
+
+        metadata = self.metadata_extractor.extract_all_metadata(file_path, content)
+
+        # Add file conversion metadata if applicable
+        if conversion is not None:
+            conversion_method, conversion_failed = conversion
+            metadata.update(
+                {
+                    "conversion_method": conversion_method,
+                    "conversion_failed": conversion_failed,
+                    "original_file_type": os.path.splitext(file_path)[1]
+                    .lower()
+                    .lstrip("."),
+                }
+            )
+
+        self.logger.debug(f"Processed local file: {self._relative_path(file_path)}")
+
+        # Create consistent URL with forward slashes for cross-platform compatibility
+        normalized_path = os.path.realpath(file_path).replace("\\", "/")
+        return Document(
+            title=os.path.basename(file_path),
+            content=content,
+            content_type=content_type,
+            metadata=metadata,
+            source_type="localfile",
+            source=self.config.source,
+            url=f"file://{normalized_path}",
+            is_deleted=False,
+            updated_at=updated_at,
+        )
+
+    async def get_documents(self) -> list[Document]:
+        """Get all documents from the local file source (DEPRECATED - use stream_documents)."""
+        warnings.warn(
+            "LocalFileConnector.get_documents is deprecated. Use "
+            "connector.stream_documents() to avoid materializing the full "
+            "document list in memory.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return [document async for document in self.stream_documents()]
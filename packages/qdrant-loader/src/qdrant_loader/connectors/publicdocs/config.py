@@ -62,6 +62,42 @@ class PublicDocsSourceConfig(SourceConfig):
         le=2000,
     )
 
+    # Crawling
+    max_depth: int = Field(
+        default=1,
+        description=(
+            "Number of link hops followed from the base URL (0 only fetches "
+            "the base URL)"
+        ),
+        ge=0,
+        le=20,
+    )
+    max_concurrent_requests: int = Field(
+        default=8,
+        description="Maximum number of pages fetched and processed at once",
+        ge=1,
+        le=100,
+    )
+    max_concurrent_requests_per_host: int = Field(
+        default=4,
+        description="Maximum number of requests running against a single host",
+        ge=1,
+        le=100,
+    )
+    delay: float = Field(
+        default=0.0,
+        description="Minimum delay in seconds between two requests to a host",
+        ge=0.0,
+    )
+    http_cache_dir: str | None = Field(
+        default=None,
+        description=(
+            "Directory of the HTTP validator cache; when set, pages are "
+            "revalidated with If-None-Match/If-Modified-Since and pages not "
+            "modified since the last complete crawl are skipped"
+        ),
+    )
+
     @field_validator("content_type")
     @classmethod
     def validate_content_type(cls, v: str) -> str:
@@ -4,11 +4,14 @@ import fnmatch
 import logging
 import warnings
 from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import aclosing
 from datetime import UTC, datetime
 from typing import cast
 from urllib.parse import urljoin, urlparse
 
 import aiohttp
+import requests
 from bs4 import BeautifulSoup, XMLParsedAsHTMLWarning
 
 from qdrant_loader.connectors.base import BaseConnector
@@ -22,9 +25,14 @@ from qdrant_loader.connectors.publicdocs.config import PublicDocsSourceConfig
 from qdrant_loader.connectors.publicdocs.crawler import (
     discover_pages as _discover_pages,
 )
+from qdrant_loader.connectors.publicdocs.frontier import CrawlFrontier, HostLimiter
 
 # Local HTTP helper for safe text reading
 from qdrant_loader.connectors.publicdocs.http import read_text_response as _read_text
+from qdrant_loader.connectors.publicdocs.http_cache import (
+    CachedPage,
+    HttpValidatorCache,
+)
 from qdrant_loader.connectors.shared.http import (
     RateLimiter,
 )
@@ -68,6 +76,14 @@ class PublicDocsConnector(BaseConnector):
         self.url_queue = deque()
         self.visited_urls = set()
         self.version = config.version
+        # Attachment downloads use one requests session for the connector
+        self.session = requests.Session()
+        self._hosts = HostLimiter(
+            config.max_concurrent_requests_per_host, delay=config.delay
+        )
+        # Validators of the last complete crawl, when http_cache_dir is set
+        self._http_cache: HttpValidatorCache | None = None
+        self._cache_generation: str | None = None
         self.logger.debug(
             "Initialized PublicDocsConnector",
             base_url=self.base_url,
@@ -91,13 +107,9 @@ class PublicDocsConnector(BaseConnector):
             self._client = aiohttp.ClientSession()
             self._initialized = True
 
-            # Initialize attachment downloader with aiohttp session if needed
-            if self.config.download_attachments:
-                # Convert aiohttp session to requests session for compatibility
-                import requests
-
-                session = requests.Session()
-                self.attachment_downloader = AttachmentDownloader(session=session)
+            # Initialize attachment downloader if needed
+            if self.config.download_attachments and not self.attachment_downloader:
+                self.attachment_downloader = AttachmentDownloader(session=self.session)
 
             # Initialize rate limiter for crawling (configurable)
             self._rate_limiter = RateLimiter.per_minute(self.config.requests_per_minute)
@@ -106,6 +118,8 @@ class PublicDocsConnector(BaseConnector):
 
     async def __aexit__(self, exc_type, exc_val, _exc_tb):
         """Async context manager exit."""
+        if self.attachment_downloader:
+            await self.attachment_downloader.aclose()
         if self._initialized and self._client:
             await self._client.close()
             self._client = None
@@ -130,11 +144,8 @@ class PublicDocsConnector(BaseConnector):
             self.file_converter = FileConverter(config)
             if self.config.download_attachments and self.attachment_downloader:
                 # Reinitialize attachment downloader with file conversion config
-                import requests
-
-                session = requests.Session()
                 self.attachment_downloader = AttachmentDownloader(
-                    session=session,
+                    session=self.session,
                     file_conversion_config=config,
                     enable_file_conversion=True,
                     max_attachment_size=config.max_file_size,
@@ -176,165 +187,278 @@ class PublicDocsConnector(BaseConnector):
         self.logger.debug(f"URL passed all checks, will be processed: {url}")
         return True
 
-    async def get_documents(self) -> list[Document]:
-        """Get documentation pages from the source.
+    def set_sync_cursor(self, cursor: str | None) -> None:
+        """Set the HTTP cache generation of the last complete crawl."""
+        self._cache_generation = cursor
 
-        Returns:
-            List of documents
+    async def stream_documents(
+        self, since: datetime | None = None
+    ) -> AsyncGenerator[Document, None]:
+        """Crawl the documentation and stream its pages as documents.
+
+        Pages are fetched concurrently from a frontier seeded with the base
+        URL and following links up to ``max_depth`` hops. Each page is
+        downloaded once; its content, title, links and attachments all come
+        from that response. Documents are yielded as soon as their page is
+        parsed, followed by the page attachments.
+
+        With ``http_cache_dir`` set, pages are revalidated with the ETag and
+        Last-Modified of the last complete crawl. Pages answering 304 Not
+        Modified yield no document, and their links come from the cache.
+
+        Args:
+            since: Ignored; public documentation pages carry no modification
+                time, changes are detected from the content hash
 
         Raises:
             RuntimeError: If connector is not initialized
-            RuntimeError: If change detector is not initialized
         """
         if not self._initialized:
             raise RuntimeError(
                 "Connector not initialized. Use the connector as an async context manager."
             )
 
+        frontier = CrawlFrontier(
+            max_depth=self.config.max_depth,
+            concurrency=self.config.max_concurrent_requests,
+        )
+        frontier.add(self.base_url)
+        if self.config.http_cache_dir:
+            self._http_cache = HttpValidatorCache(
+                self.config.http_cache_dir, self.base_url
+            )
+            cached_pages = self._http_cache.load(self._cache_generation)
+            self.logger.debug("Loaded HTTP cache", pages=cached_pages)
+        document_count = 0
         try:
-            # Get all pages
-            pages = await self._get_all_pages()
-            self.logger.debug(f"Found {len(pages)} pages to process", pages=pages)
-            documents = []
-
-            for page in pages:
-                try:
-                    if not self._should_process_url(page):
-                        self.logger.debug("Skipping URL", url=page)
-                        continue
-
-                    self.logger.debug("Processing URL", url=page)
-
-                    content, title = await self._process_page(page)
-                    if (
-                        content and content.strip()
-                    ):  # Only add documents with non-empty content
-                        # Generate a consistent document ID based on the URL
-                        doc_id = str(hash(page))  # Use URL hash as document ID
-                        doc = Document(
-                            id=doc_id,
-                            title=title,
-                            content=content,
-                            content_type="html",
-                            metadata={
-                                "title": title,
-                                "url": page,
-                                "version": self.version,
-                            },
-                            source_type=self.config.source_type,
-                            source=self.config.source,
-                            url=page,
-                            # For public docs, we don't have a created or updated date. So we use a very old date.
-                            # The content hash will be the same for the same page, so it will be update if the hash changes.
-                            created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                            updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
-                        )
-                        self.logger.debug(
-                            "Created document",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-                        documents.append(doc)
-                        self.logger.debug(
-                            "Document created",
-                            url=page,
-                            content_length=len(content),
-                            title=title,
-                            doc_id=doc_id,
-                        )
-
-                        # Process attachments if enabled
-                        if (
-                            self.config.download_attachments
-                            and self.attachment_downloader
-                        ):
-                            # We need to get the HTML again to extract attachments
-                            try:
-                                try:
-                                    response = await _aiohttp_request(
-                                        self.client,
-                                        "GET",
-                                        page,
-                                        rate_limiter=self._rate_limiter,
-                                        retries=3,
-                                        backoff_factor=0.5,
-                                        overall_timeout=60.0,
-                                    )
-                                    # Ensure HTTP errors are surfaced consistently
-                                    response.raise_for_status()
-                                except aiohttp.ClientError as e:
-                                    raise HTTPRequestError(
-                                        url=page, message=str(e)
-                                    ) from e
-
-                                html = await _read_text(response)
-                                attachment_metadata = self._extract_attachments(
-                                    html, page, doc_id
-                                )
-
-                                if attachment_metadata:
-                                    self.logger.info(
-                                        "Processing attachments for PublicDocs page",
-                                        page_url=page,
-                                        attachment_count=len(attachment_metadata),
-                                    )
-
-                                    attachment_documents = await self.attachment_downloader.download_and_process_attachments(
-                                        attachment_metadata, doc
-                                    )
-                                    documents.extend(attachment_documents)
-
-                                    self.logger.debug(
-                                        "Processed attachments for PublicDocs page",
-                                        page_url=page,
-                                        processed_count=len(attachment_documents),
-                                    )
-                            except Exception as e:
-                                self.logger.error(
-                                    f"Failed to process attachments for page {page}: {e}"
-                                )
-                                # Continue processing even if attachment processing fails
-                    else:
-                        self.logger.warning(
-                            "Skipping page with empty content",
-                            url=page,
-                            title=title,
-                        )
-                except Exception as e:
-                    self.logger.error(f"Failed to process page {page}: {e}")
-                    continue
+            results = frontier.crawl(self._visit_page)
+            async with aclosing(results):
+                async for documents in results:
+                    for document in documents:
+                        document_count += 1
+                        yield document
+        except Exception as e:
+            self.logger.error("Failed to get documentation", error=str(e))
+            raise
+
+        self.logger.debug(
+            "Crawl completed", pages=len(frontier), documents=document_count
+        )
+        if self._http_cache is not None:
+            try:
+                self.sync_cursor = self._http_cache.save()
+            except OSError as e:
+                self.logger.warning("Failed to save HTTP cache", error=str(e))
+        if not document_count:
+            self.logger.warning("No valid documents found to process")
+
+    async def get_documents(self) -> list[Document]:
+        """Get documentation pages from the source (DEPRECATED - use stream_documents).
+
+        Returns:
+            List of documents
+
+        Raises:
+            RuntimeError: If connector is not initialized
+        """
+        warnings.warn(
+            "PublicDocsConnector.get_documents is deprecated. Use "
+            "connector.stream_documents() to avoid materializing the full "
+            "document list in memory.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return [document async for document in self.stream_documents()]
 
-            if not documents:
-                self.logger.warning("No valid documents found to process")
-                return []
+    async def _visit_page(
+        self, url: str, depth: int
+    ) -> tuple[list[Document], list[str]]:
+        """Fetch a page once and turn it into documents and links to follow.
 
-            return documents
+        Errors are logged and the page skipped so the crawl continues.
 
+        Args:
+            url: Page URL
+            depth: Number of link hops from the base URL
+
+        Returns:
+            The page and attachment documents, and the links found on the page
+        """
+        process = self._should_process_url(url)
+        follow_links = depth < self.config.max_depth
+        if not process and not follow_links:
+            self.logger.debug("Skipping URL", url=url)
+            return [], []
+
+        cached = self._http_cache.get(url) if self._http_cache else None
+        try:
+            html, page = await self._fetch_page(url, cached)
         except Exception as e:
-            self.logger.error("Failed to get documentation", error=str(e))
-            raise
+            self.logger.error(f"Failed to process page {url}: {e}")
+            return [], []
+
+        if html is None and cached is not None:
+            # Unchanged since the last complete crawl
+            self.logger.debug("Page not modified", url=url)
+            if self._http_cache is not None:
+                self._http_cache.record(url, cached)
+            return [], cached.links if follow_links else []
+
+        documents, links = await self._page_documents(
+            url, html or "", process, follow_links or page is not None
+        )
+        if page is not None and self._http_cache is not None:
+            page.links = links
+            self._http_cache.record(url, page)
+        return documents, links if follow_links else []
 
-    async def _process_page(self, url: str) -> tuple[str | None, str | None]:
-        """Process a single documentation page.
+    async def _page_documents(
+        self, url: str, html: str, process: bool, extract_links: bool
+    ) -> tuple[list[Document], list[str]]:
+        """Turn a fetched page into documents and the links it contains.
+
+        Args:
+            url: Page URL
+            html: Page HTML
+            process: Whether the page becomes a document
+            extract_links: Whether the links of the page are needed
 
         Returns:
-            tuple[str | None, str | None]: A tuple containing (content, title)
+            The page and attachment documents, and the links of the page
+        """
+        links = self._extract_links(html, url) if extract_links else []
+        if not process:
+            self.logger.debug("Skipping URL", url=url)
+            return [], links
+
+        self.logger.debug("Processing URL", url=url)
+        try:
+            content, title = self._parse_page(url, html)
+        except Exception as e:
+            self.logger.error(f"Failed to process page {url}: {e}")
+            return [], links
+
+        if not (content and content.strip()):
+            self.logger.warning(
+                "Skipping page with empty content", url=url, title=title
+            )
+            return [], links
+
+        document = self._create_document(url, content, title)
+        documents = [document]
+        if self.config.download_attachments and self.attachment_downloader:
+            try:
+                attachments = self._extract_attachments(html, url, document.id)
+            except Exception as e:
+                self.logger.error(f"Failed to process attachments for page {url}: {e}")
+                attachments = []
+            # Attachments are downloaded as files, not crawled as pages
+            attachment_urls = {attachment.download_url for attachment in attachments}
+            links = [link for link in links if link not in attachment_urls]
+            documents.extend(
+                await self._process_attachments(url, attachments, document)
+            )
+        return documents, links
+
+    def _create_document(self, url: str, content: str, title: str | None) -> Document:
+        """Create the document of a page."""
+        # Generate a consistent document ID based on the URL
+        doc_id = str(hash(url))  # Use URL hash as document ID
+        document = Document(
+            id=doc_id,
+            title=title,
+            content=content,
+            content_type="html",
+            metadata={
+                "title": title,
+                "url": url,
+                "version": self.version,
+            },
+            source_type=self.config.source_type,
+            source=self.config.source,
+            url=url,
+            # For public docs, we don't have a created or updated date. So we use a very old date.
+            # The content hash will be the same for the same page, so it will be update if the hash changes.
+            created_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+            updated_at=datetime(1970, 1, 1, 0, 0, 0, 0, UTC),
+        )
+        self.logger.debug(
+            "Document created",
+            url=url,
+            content_length=len(content),
+            title=title,
+            doc_id=doc_id,
+        )
+        return document
+
+    async def _process_attachments(
+        self,
+        url: str,
+        attachment_metadata: list[AttachmentMetadata],
+        document: Document,
+    ) -> list[Document]:
+        """Download and convert the attachments linked from a page.
+
+        Args:
+            url: Page URL
+            attachment_metadata: Attachments found in the page HTML
+            document: Page document
+
+        Returns:
+            The attachment documents; empty if processing failed
+        """
+        if not attachment_metadata or self.attachment_downloader is None:
+            return []
+
+        try:
+
+            self.logger.info(
+                "Processing attachments for PublicDocs page",
+                page_url=url,
+                attachment_count=len(attachment_metadata),
+            )
+            attachment_documents = (
+                await self.attachment_downloader.download_and_process_attachments(
+                    attachment_metadata, document
+                )
+            )
+            self.logger.debug(
+                "Processed attachments for PublicDocs page",
+                page_url=url,
+                processed_count=len(attachment_documents),
+            )
+            return attachment_documents
+        except Exception as e:
+            self.logger.error(f"Failed to process attachments for page {url}: {e}")
+            # Continue processing even if attachment processing fails
+            return []
+
+    async def _fetch_page(
+        self, url: str, cached: CachedPage | None = None
+    ) -> tuple[str | None, CachedPage | None]:
+        """Download a page through the shared session.
+
+        Args:
+            url: Page URL
+            cached: Validators of the previous crawl, sent as a conditional
+                request
+
+        Returns:
+            The page HTML, or None if the server answered 304 Not Modified,
+            and the validators of the response when the HTTP cache is enabled
 
         Raises:
             ConnectorNotInitializedError: If connector is not initialized
             HTTPRequestError: If HTTP request fails
-            PageProcessingError: If page processing fails
         """
-        self.logger.debug("Starting page processing", url=url)
-        try:
-            if not self._initialized:
-                raise ConnectorNotInitializedError(
-                    "Connector not initialized. Use async context manager."
-                )
+        if not self._initialized:
+            raise ConnectorNotInitializedError(
+                "Connector not initialized. Use async context manager."
+            )
 
-            self.logger.debug("Making HTTP request", url=url)
+        self.logger.debug("Making HTTP request", url=url)
+        headers = cached.request_headers() if cached is not None else {}
+        async with self._hosts.slot(url):
             try:
                 response = await _aiohttp_request(
                     self.client,
@@ -344,53 +468,85 @@ class PublicDocsConnector(BaseConnector):
                     retries=3,
                     backoff_factor=0.5,
                     overall_timeout=60.0,
+                    **({"headers": headers} if headers else {}),
                 )
-                response.raise_for_status()  # This is a synchronous method, no need to await
+                if headers and response.status == 304:
+                    await response.release()
+                    return None, cached
+                # Ensure HTTP errors are surfaced consistently
+                response.raise_for_status()
             except aiohttp.ClientError as e:
                 raise HTTPRequestError(url=url, message=str(e)) from e
 
             self.logger.debug(
                 "HTTP request successful", url=url, status_code=response.status
             )
+            try:
+                html = await _read_text(response)
+            except aiohttp.ClientError as e:
+                raise HTTPRequestError(url=url, message=str(e)) from e
+            if self._http_cache is None:
+                return html, None
+            return html, CachedPage.from_headers(response.headers)
+
+    def _parse_page(self, url: str, html: str) -> tuple[str | None, str | None]:
+        """Extract the content and title of a fetched page.
 
+        Raises:
+            DocumentProcessingError: If page processing fails
+        """
+        try:
+            # Extract title from raw HTML
+            title = self._extract_title(html)
+            self.logger.debug("Extracted title", url=url, title=title)
+
+            if self.config.content_type == "html":
+                self.logger.debug("Processing Page", url=url)
+                content = self._extract_content(html)
+                self.logger.debug(
+                    "HTML content processed",
+                    url=url,
+                    content_length=len(content) if content else 0,
+                )
+                return content, title
+
+            self.logger.debug("Processing raw content", url=url)
+            self.logger.debug(
+                "Raw content length",
+                url=url,
+                content_length=len(html) if html else 0,
+            )
+            return html, title
+        except Exception as e:
+            raise DocumentProcessingError(f"Failed to process page {url}: {e!s}") from e
+
+    async def _process_page(self, url: str) -> tuple[str | None, str | None]:
+        """Process a single documentation page.
+
+        Returns:
+            tuple[str | None, str | None]: A tuple containing (content, title)
+
+        Raises:
+            ConnectorNotInitializedError: If connector is not initialized
+            HTTPRequestError: If HTTP request fails
+            PageProcessingError: If page processing fails
+        """
+        self.logger.debug("Starting page processing", url=url)
+        try:
+            html, _ = await self._fetch_page(url)
+            html = html or ""
             try:
                 # Extract links for crawling
-                self.logger.debug("Extracting links from page", url=url)
-                html = await response.text()
                 links = self._extract_links(html, url)
-                self.logger.info(
-                    "Adding new links to queue", url=url, new_links=len(links)
-                )
-                for link in links:
-                    if link not in self.visited_urls:
-                        self.url_queue.append(link)
-
-                # Extract title from raw HTML
-                title = self._extract_title(html)
-                self.logger.debug("Extracted title", url=url, title=title)
-
-                if self.config.content_type == "html":
-                    self.logger.debug("Processing Page", url=url)
-                    content = self._extract_content(html)
-                    self.logger.debug(
-                        "HTML content processed",
-                        url=url,
-                        content_length=len(content) if content else 0,
-                    )
-                    return content, title
-                else:
-                    self.logger.debug("Processing raw content", url=url)
-                    self.logger.debug(
-                        "Raw content length",
-                        url=url,
-                        content_length=len(html) if html else 0,
-                    )
-                    return html, title
             except Exception as e:
                 raise DocumentProcessingError(
                     f"Failed to process page {url}: {e!s}"
                 ) from e
-
+            self.logger.info("Adding new links to queue", url=url, new_links=len(links))
+            for link in links:
+                if link not in self.visited_urls:
+                    self.url_queue.append(link)
+            return self._parse_page(url, html)
         except (
             ConnectorNotInitializedError,
             HTTPRequestError,
@@ -650,43 +806,22 @@ class PublicDocsConnector(BaseConnector):
                 path_pattern=self.config.path_pattern,
             )
 
-            # Reuse existing client if available; otherwise, create a temporary session
-            if getattr(self, "_client", None):
-                client = self.client
-                try:
-                    return await _discover_pages(
-                        client,
-                        str(self.config.base_url),
-                        path_pattern=self.config.path_pattern,
-                        exclude_paths=self.config.exclude_paths,
-                        logger=self.logger,
-                    )
-                except aiohttp.ClientError as e:
-                    raise HTTPRequestError(
-                        url=str(self.config.base_url), message=str(e)
-                    ) from e
-                except Exception as e:
-                    raise ConnectorError(
-                        f"Failed to process page content: {e!s}"
-                    ) from e
-            else:
-                async with aiohttp.ClientSession() as client:
-                    try:
-                        return await _discover_pages(
-                            client,
-                            str(self.config.base_url),
-                            path_pattern=self.config.path_pattern,
-                            exclude_paths=self.config.exclude_paths,
-                            logger=self.logger,
-                        )
-                    except aiohttp.ClientError as e:
-                        raise HTTPRequestError(
-                            url=str(self.config.base_url), message=str(e)
-                        ) from e
-                    except Exception as e:
-                        raise ConnectorError(
-                            f"Failed to process page content: {e!s}"
-                        ) from e
+            try:
+                return await _discover_pages(
+                    self.client,
+                    str(self.config.base_url),
+                    path_pattern=self.config.path_pattern,
+                    exclude_paths=self.config.exclude_paths,
+                    logger=self.logger,
+                )
+            except aiohttp.ClientError as e:
+                raise HTTPRequestError(
+                    url=str(self.config.base_url), message=str(e)
+                ) from e
+            except RuntimeError as e:
+                raise ConnectorNotInitializedError(str(e)) from e
+            except Exception as e:
+                raise ConnectorError(f"Failed to process page content: {e!s}") from e
 
         except (ConnectorNotInitializedError, HTTPRequestError, ConnectorError):
             raise
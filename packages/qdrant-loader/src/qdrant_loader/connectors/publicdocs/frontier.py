@@ -0,0 +1,121 @@
+"""Bounded crawl frontier for documentation sites."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from urllib.parse import urldefrag, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str) -> str:
+    """Return the key under which ``url`` is deduplicated.
+
+    Scheme and host are lowercased, default ports and fragments dropped and an
+    empty path becomes ``/``; path and query are kept as they are.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = host if port in (None, _DEFAULT_PORTS.get(scheme)) else f"{host}:{port}"
+    if parts.username:
+        netloc = f"{parts.username}@{netloc}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+
+class HostLimiter:
+    """Per-host request concurrency and politeness delay.
+
+    At most ``per_host`` requests run against a host at once, and request
+    starts on the same host are spaced by at least ``delay`` seconds.
+    """
+
+    def __init__(self, per_host: int, delay: float = 0.0):
+        self.per_host = per_host
+        self.delay = delay
+        self._slots: dict[str, asyncio.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Hold a request slot for the host of ``url``."""
+        host = (urlsplit(url).hostname or "").lower()
+        semaphore = self._slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        async with semaphore:
+            if self.delay > 0:
+                now = asyncio.get_running_loop().time()
+                start = max(now, self._next_start.get(host, now))
+                # Reserve the start time before sleeping so waiters queue up
+                self._next_start[host] = start + self.delay
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+
+class CrawlFrontier:
+    """Breadth-first crawl with a bounded number of pages in flight.
+
+    URLs are deduplicated by :func:`normalize_url` and visited without their
+    fragment. Links of a page are followed until ``max_depth`` (the seeds have
+    depth 0), and results are yielded as soon as their page is visited while
+    the other pages keep loading.
+    """
+
+    def __init__(self, *, max_depth: int = 1, concurrency: int = 8):
+        self.max_depth = max_depth
+        self.concurrency = max(1, concurrency)
+        self._queue: deque[tuple[str, int]] = deque()
+        self._seen: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def add(self, url: str, depth: int = 0) -> bool:
+        """Queue ``url`` unless it was seen before or is too deep."""
+        key = normalize_url(url)
+        if depth > self.max_depth or key in self._seen:
+            return False
+        self._seen.add(key)
+        self._queue.append((urldefrag(url).url, depth))
+        return True
+
+    async def crawl[R](
+        self,
+        visit: Callable[[str, int], Awaitable[tuple[R, list[str]]]],
+    ) -> AsyncIterator[R]:
+        """Visit queued URLs concurrently and follow the links they return.
+
+        Args:
+            visit: Coroutine function taking a URL and its depth, returning
+                the page result and the links found on the page
+
+        Yields:
+            Page results, in completion order
+        """
+        running: dict[asyncio.Future, int] = {}
+        try:
+            while self._queue or running:
+                while self._queue and len(running) < self.concurrency:
+                    url, depth = self._queue.popleft()
+                    running[asyncio.ensure_future(visit(url, depth))] = depth
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    depth = running.pop(task)
+                    result, links = task.result()
+                    for link in links:
+                        self.add(link, depth + 1)
+                    yield result
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
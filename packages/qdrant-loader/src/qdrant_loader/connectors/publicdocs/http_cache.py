@@ -0,0 +1,137 @@
+"""HTTP validators of crawled pages, kept between runs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+import uuid
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass, field
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+@dataclass
+class CachedPage:
+    """Validators and outgoing links of a page."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    links: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_headers(cls, headers: Mapping[str, str]) -> CachedPage | None:
+        """Read the validators of a response; None if it has neither."""
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not isinstance(etag, str):
+            etag = None
+        if not isinstance(last_modified, str):
+            last_modified = None
+        if etag is None and last_modified is None:
+            return None
+        return cls(etag=etag, last_modified=last_modified)
+
+    def request_headers(self) -> dict[str, str]:
+        """Conditional request headers revalidating the page."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpValidatorCache:
+    """Page validators of a documentation site, one file per crawl.
+
+    Each crawl writes a new generation file next to the previous one. The
+    connector reports the generation as its sync cursor, so the pipeline
+    only hands it back once every document of that crawl was processed; an
+    interrupted or failed run keeps revalidating against the last complete
+    crawl. Older generations are removed when a new one is saved.
+    """
+
+    def __init__(self, root: str, base_url: str):
+        """Initialize the cache.
+
+        Args:
+            root: Directory holding the caches of all sites
+            base_url: Base URL of the crawled site
+        """
+        key = hashlib.sha256(base_url.encode()).hexdigest()[:16]
+        self.path = os.path.join(os.path.abspath(os.path.expanduser(root)), key)
+        self.generation: str | None = None
+        self._previous: dict[str, CachedPage] = {}
+        self._current: dict[str, CachedPage] = {}
+
+    def _file(self, generation: str) -> str:
+        return os.path.join(self.path, f"{generation}.json")
+
+    def load(self, generation: str | None) -> int:
+        """Load the pages recorded by a previous crawl.
+
+        Args:
+            generation: Generation saved by the last complete crawl; None
+                starts without validators
+
+        Returns:
+            Number of pages loaded
+        """
+        self.generation = generation
+        self._previous = {}
+        if not generation:
+            return 0
+        try:
+            with open(self._file(generation), encoding="utf-8") as f:
+                pages = json.load(f)
+            self._previous = {url: CachedPage(**page) for url, page in pages.items()}
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(
+                "HTTP cache unavailable, crawling without validators",
+                path=self.path,
+                generation=generation,
+                error=str(e),
+            )
+        return len(self._previous)
+
+    def get(self, url: str) -> CachedPage | None:
+        """Page recorded for ``url`` by the previous crawl."""
+        return self._previous.get(url)
+
+    def record(self, url: str, page: CachedPage) -> None:
+        """Record the validators of a page fetched by this crawl."""
+        self._current[url] = page
+
+    def save(self) -> str:
+        """Write the pages recorded by this crawl as a new generation.
+
+        Returns:
+            The new generation
+        """
+        generation = f"{int(time.time() * 1000):x}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self.path, exist_ok=True)
+        target = self._file(generation)
+        with open(f"{target}.tmp", "w", encoding="utf-8") as f:
+            json.dump({url: asdict(page) for url, page in self._current.items()}, f)
+        os.replace(f"{target}.tmp", target)
+
+        # Keep the generation the pipeline still points to until it moves on
+        keep = {f"{generation}.json", f"{self.generation}.json"}
+        for name in os.listdir(self.path):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.path, name))
+                except OSError:
+                    pass
+        logger.debug(
+            "Saved HTTP cache",
+            path=self.path,
+            generation=generation,
+            pages=len(self._current),
+        )
+        return generation
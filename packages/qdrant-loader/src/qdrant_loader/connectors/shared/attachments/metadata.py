@@ -135,6 +135,9 @@ def confluence_attachment_to_metadata(
             created_at=created_at,
             updated_at=updated_at,
             author=author,
+            version=(
+                str(version["number"]) if version.get("number") is not None else None
+            ),
         )
     except Exception:
         return None
@@ -29,11 +29,10 @@ class AttachmentReader:
 
     # Optional cleanup hooks to allow connectors to close resources when reconfiguring
     async def aclose(self) -> None:  # noqa: D401 - simple cleanup hook
-        """Asynchronous cleanup for compatibility; currently no async resources."""
-        # If downloader/session expose explicit async cleanup in the future, call here
-        return None
+        """Close the downloader's HTTP client."""
+        await self.downloader.aclose()
 
     def close(self) -> None:  # noqa: D401 - simple cleanup hook
-        """Synchronous cleanup for compatibility; currently no resources to close."""
+        """Synchronous cleanup for compatibility; async resources need ``aclose``."""
         # requests.Session is owned by the connector, not by the reader
         return None
@@ -4,8 +4,10 @@ Prefer importing from this package instead of legacy
 `qdrant_loader.connectors.http`.
 """
 
+from .async_client import create_async_client
 from .client import (
     aiohttp_request_with_retries,
+    httpx_request_with_retries,
     make_request_async,
     make_request_with_retries_async,
 )
@@ -20,6 +22,8 @@ __all__ = [
     "make_request_async",
     "make_request_with_retries_async",
     "aiohttp_request_with_retries",
+    "httpx_request_with_retries",
+    "create_async_client",
     "HTTPRequestError",
     "RateLimiter",
     "request_with_policy",
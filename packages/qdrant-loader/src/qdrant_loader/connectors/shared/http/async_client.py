@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import importlib.util
+from typing import Any
+
+import httpx
+import requests
+from requests.auth import HTTPBasicAuth
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 60.0
+
+
+def http2_available() -> bool:
+    """Whether the optional `h2` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _convert_auth(auth: Any) -> Any:
+    """Translate `requests` auth objects to their httpx equivalent."""
+    if isinstance(auth, HTTPBasicAuth):
+        return httpx.BasicAuth(auth.username, auth.password)
+    return auth
+
+
+def _convert_timeout(timeout: Any) -> Any:
+    """Translate a `requests` (connect, read) timeout tuple to httpx."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(read, connect=connect)
+    return timeout
+
+
+def create_async_client(
+    session: requests.Session | None = None,
+    *,
+    max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY,
+    timeout: float = DEFAULT_TIMEOUT,
+    http2: bool = True,
+    transport: httpx.AsyncBaseTransport | None = None,
+) -> httpx.AsyncClient:
+    """Create a pooled async client mirroring a configured `requests` session.
+
+    Headers, basic auth and TLS verification are copied from ``session`` so
+    connectors can keep configuring authentication on their session. Each
+    connector talks to a single host, so the pool limit is the number of
+    connections per host. HTTP/2 is used when the `h2` package is installed.
+
+    Args:
+        session: Session whose headers, auth and verify setting are reused
+        max_connections_per_host: Maximum open (and kept-alive) connections
+        keepalive_expiry: Seconds an idle connection is kept open
+        timeout: Default request timeout in seconds
+        http2: Negotiate HTTP/2 when available
+        transport: Optional transport replacing the connection pool (e.g. stubs)
+
+    Returns:
+        httpx.AsyncClient
+    """
+    headers: dict[str, str] = {}
+    auth = None
+    verify: Any = True
+    if session is not None:
+        headers = dict(session.headers)
+        auth = _convert_auth(session.auth)
+        verify = session.verify
+
+    return httpx.AsyncClient(
+        headers=headers,
+        auth=auth,
+        verify=verify,
+        timeout=timeout,
+        http2=http2 and http2_available(),
+        limits=httpx.Limits(
+            max_connections=max_connections_per_host,
+            max_keepalive_connections=max_connections_per_host,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        transport=transport,
+    )
+
+
+def to_httpx_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
+    """Translate `requests.Session.request` keyword arguments for httpx."""
+    converted = dict(kwargs)
+    if "auth" in converted:
+        converted["auth"] = _convert_auth(converted["auth"])
+    if "timeout" in converted:
+        converted["timeout"] = _convert_timeout(converted["timeout"])
+    if "allow_redirects" in converted:
+        converted["follow_redirects"] = converted.pop("allow_redirects")
+    if "data" in converted and not isinstance(converted["data"], dict):
+        converted["content"] = converted.pop("data")
+    return converted
+
+
+def to_requests_response(response: httpx.Response) -> requests.Response:
+    """Wrap an httpx response in a `requests.Response`.
+
+    Connectors keep using `raise_for_status()`, `.json()` and the `requests`
+    exception hierarchy regardless of the transport.
+    """
+    converted = requests.Response()
+    converted.status_code = response.status_code
+    converted._content = response.content
+    converted.headers = CaseInsensitiveDict(response.headers.items())
+    converted.url = str(response.url)
+    converted.reason = response.reason_phrase
+    converted.encoding = response.encoding
+    request = response.request
+    converted.request = requests.Request(
+        method=request.method, url=str(request.url)
+    ).prepare()
+    return converted
+
+
+def to_requests_exception(
+    exc: httpx.HTTPError,
+) -> requests.exceptions.RequestException:
+    """Map an httpx transport error onto the matching `requests` exception."""
+    if isinstance(exc, httpx.TimeoutException):
+        return requests.exceptions.Timeout(str(exc))
+    if isinstance(exc, httpx.NetworkError | httpx.ProxyError):
+        return requests.exceptions.ConnectionError(str(exc))
+    if isinstance(exc, httpx.TooManyRedirects):
+        return requests.exceptions.TooManyRedirects(str(exc))
+    return requests.exceptions.RequestException(str(exc))
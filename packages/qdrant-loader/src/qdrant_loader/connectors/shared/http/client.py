@@ -4,8 +4,11 @@ import asyncio
 import random
 from typing import Any
 
+import httpx
 import requests
 
+from .async_client import to_httpx_kwargs, to_requests_exception, to_requests_response
+
 try:  # Optional import for async HTTP client
     import aiohttp  # type: ignore
 except Exception:  # pragma: no cover - optional import for http client
@@ -63,6 +66,42 @@ async def make_request_with_retries_async(
             await asyncio.sleep(sleep_s)
 
 
+async def httpx_request_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    *,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+    status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+    **kwargs: Any,
+) -> requests.Response:
+    """Issue a request on a pooled `httpx` client with exponential backoff and jitter.
+
+    Accepts `requests`-style keyword arguments and returns a `requests.Response`;
+    transport errors are raised as the matching `requests` exceptions.
+    """
+    request_kwargs = to_httpx_kwargs(kwargs)
+    attempt = 0
+    while True:
+        try:
+            response = await client.request(method, url, **request_kwargs)
+            if response.status_code in status_forcelist and attempt < retries:
+                attempt += 1
+                sleep_s = backoff_factor * (2 ** (attempt - 1)) + random.uniform(
+                    0, 0.25
+                )
+                await asyncio.sleep(sleep_s)
+                continue
+            return to_requests_response(response)
+        except httpx.HTTPError as e:
+            if attempt >= retries:
+                raise to_requests_exception(e) from e
+            attempt += 1
+            sleep_s = backoff_factor * (2 ** (attempt - 1)) + random.uniform(0, 0.25)
+            await asyncio.sleep(sleep_s)
+
+
 async def aiohttp_request_with_retries(
     session: aiohttp.ClientSession,
     method: str,
@@ -3,10 +3,12 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
+import httpx
 import requests
 
 from .client import (
     aiohttp_request_with_retries,
+    httpx_request_with_retries,
     make_request_with_retries_async,
 )
 from .rate_limit import RateLimiter
@@ -24,12 +26,15 @@ async def request_with_policy(
     backoff_factor: float = 0.5,
     status_forcelist: tuple[int, ...] = DEFAULT_STATUS_FORCELIST,
     overall_timeout: float | None = None,
+    client: httpx.AsyncClient | None = None,
     **kwargs: Any,
 ) -> requests.Response:
-    """Perform a requests-based HTTP call with optional rate limiting and retries.
+    """Perform a requests-style HTTP call with optional rate limiting and retries.
 
     This helper centralizes our connectors' behavior by combining an optional
-    rate limiter with retry-and-jitter semantics.
+    rate limiter with retry-and-jitter semantics. With ``client``, the call runs
+    natively on the pooled async client; otherwise the blocking session is
+    offloaded to a worker thread.
 
     Args:
         session: Synchronous requests session (executed via thread offloading)
@@ -40,6 +45,7 @@ async def request_with_policy(
         backoff_factor: Base backoff factor for exponential backoff with jitter
         status_forcelist: HTTP status codes that should be retried
         timeout: Optional overall timeout (seconds) applied to the awaitable
+        client: Optional pooled async client used instead of ``session``
         **kwargs: Forwarded to requests.Session.request
 
     Returns:
@@ -47,6 +53,16 @@ async def request_with_policy(
     """
 
     async def _do_call() -> requests.Response:
+        if client is not None:
+            return await httpx_request_with_retries(
+                client,
+                method,
+                url,
+                retries=retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=status_forcelist,
+                **kwargs,
+            )
         return await make_request_with_retries_async(
             session,
             method,
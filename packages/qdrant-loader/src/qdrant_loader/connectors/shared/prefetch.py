@@ -0,0 +1,153 @@
+"""Read-ahead and bounded-concurrency helpers for connector streams."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+
+_DONE = object()
+
+
+async def read_ahead[T](items: AsyncIterator[T], depth: int = 2) -> AsyncIterator[T]:
+    """Pull up to ``depth`` items ahead of the consumer in a background task.
+
+    Used for cursor-paginated APIs, where the next request depends on the
+    previous response: the next page is fetched while the current one is
+    processed. Errors of ``items`` are raised to the consumer after the items
+    fetched before them.
+
+    Args:
+        items: Source iterator
+        depth: Maximum number of buffered items; 0 disables read-ahead
+
+    Yields:
+        The items of ``items``, in order
+    """
+    if depth <= 0:
+        async with aclosing(items):
+            async for item in items:
+                yield item
+        return
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+
+    async def produce() -> None:
+        try:
+            async with aclosing(items):
+                async for item in items:
+                    await queue.put(item)
+        except Exception as e:
+            await queue.put(e)
+            return
+        await queue.put(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (item := await queue.get()) is not _DONE:
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+
+
+async def fetch_in_order[T](
+    fetch: Callable[[int], Awaitable[T]],
+    offsets: Iterable[int],
+    concurrency: int = 2,
+) -> AsyncIterator[T]:
+    """Fetch offset-addressed pages concurrently and yield them in order.
+
+    At most ``concurrency`` requests are in flight; a page is only requested
+    once an earlier one was yielded, so memory stays bounded.
+
+    Args:
+        fetch: Coroutine function fetching the page at an offset
+        offsets: Offsets to fetch, in order
+        concurrency: Maximum number of pages requested at once
+
+    Yields:
+        The fetched pages, in offset order
+    """
+    pending: list[asyncio.Task] = []
+    remaining = iter(offsets)
+    try:
+        for offset in remaining:
+            pending.append(asyncio.ensure_future(fetch(offset)))
+            if len(pending) < max(1, concurrency):
+                continue
+            yield await pending.pop(0)
+        while pending:
+            yield await pending.pop(0)
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def map_in_order[T, R](
+    func: Callable[[T], Awaitable[R]],
+    items: AsyncIterator[T],
+    concurrency: int = 2,
+) -> AsyncIterator[R]:
+    """Apply ``func`` to up to ``concurrency`` items at once, keeping their order.
+
+    A slow item only holds back the results after it, while the following
+    items keep being processed in the background.
+
+    Args:
+        func: Coroutine function applied to each item
+        items: Source iterator
+        concurrency: Maximum number of items processed at once
+
+    Yields:
+        The results of ``func``, in the order of ``items``
+    """
+    pending: deque[asyncio.Future] = deque()
+    try:
+        async with aclosing(items):
+            async for item in items:
+                pending.append(asyncio.ensure_future(func(item)))
+                if len(pending) >= max(1, concurrency):
+                    yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+class ByteBudget:
+    """Caps the number of bytes held by concurrent tasks.
+
+    A reservation larger than the whole budget is granted once nothing else
+    is reserved, so oversized items still go through, one at a time.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.reserved = 0
+        self._changed = asyncio.Condition()
+
+    async def acquire(self, size: int) -> None:
+        """Wait until ``size`` bytes fit into the budget and reserve them."""
+        async with self._changed:
+            await self._changed.wait_for(
+                lambda: self.reserved == 0 or self.reserved + size <= self.limit
+            )
+            self.reserved += size
+
+    async def release(self, size: int) -> None:
+        """Return ``size`` reserved bytes to the budget."""
+        async with self._changed:
+            self.reserved -= size
+            self._changed.notify_all()
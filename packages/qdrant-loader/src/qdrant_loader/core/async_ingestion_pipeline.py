@@ -1,6 +1,7 @@
 """Refactored async ingestion pipeline using the new modular architecture."""
 
 from pathlib import Path
+from typing import Any
 
 from qdrant_loader.config import Settings, SourcesConfig
 from qdrant_loader.core.document import Document
@@ -41,6 +42,11 @@ class AsyncIngestionPipeline:
         upsert_batch_size: int | None = None,
         enable_metrics: bool = False,
         metrics_dir: Path | None = None,  # New parameter for workspace support
+        prefetch_batches: int = 2,
+        prefetch_max_bytes: int | None = 256 * 1024 * 1024,
+        max_concurrent_sources: int = 4,
+        max_concurrent_sources_per_type: int = 2,
+        max_concurrent_projects: int = 2,
     ):
         """Initialize the async ingestion pipeline.
 
@@ -56,6 +62,14 @@ class AsyncIngestionPipeline:
             upsert_batch_size: Batch size for upserts
             enable_metrics: Whether to enable metrics server
             metrics_dir: Custom metrics directory (for workspace support)
+            prefetch_batches: Source batches fetched ahead of processing
+                (0 disables read-ahead)
+            prefetch_max_bytes: Ceiling on the approximate size of prefetched
+                document contents
+            max_concurrent_sources: Sources fetched at the same time
+            max_concurrent_sources_per_type: Sources of one connector type
+                fetched at the same time
+            max_concurrent_projects: Projects ingested at the same time
         """
         self.settings = settings
         self.qdrant_manager = qdrant_manager
@@ -74,6 +88,11 @@ class AsyncIngestionPipeline:
             queue_size=queue_size,
             upsert_batch_size=upsert_batch_size,
             enable_metrics=enable_metrics,
+            prefetch_batches=prefetch_batches,
+            prefetch_max_bytes=prefetch_max_bytes,
+            max_concurrent_sources=max_concurrent_sources,
+            max_concurrent_sources_per_type=max_concurrent_sources_per_type,
+            max_concurrent_projects=max_concurrent_projects,
         )
 
         # Create resource manager to handle cleanup and signal handling.
@@ -108,7 +127,10 @@ class AsyncIngestionPipeline:
 
         # Create orchestrator with project manager support
         self.orchestrator = PipelineOrchestrator(
-            settings, self.components, self.project_manager
+            settings,
+            self.components,
+            self.project_manager,
+            pipeline_config=self.pipeline_config,
         )
 
         # Initialize performance monitor with custom or default metrics directory
@@ -214,6 +236,7 @@ class AsyncIngestionPipeline:
             },
         )
 
+        cache_stats_before = self._embedding_cache_stats()
         documents = []  # Initialize to avoid UnboundLocalError in exception handler
         try:
             logger.debug("Starting document processing with new pipeline architecture")
@@ -262,6 +285,7 @@ class AsyncIngestionPipeline:
                     total_size_bytes=total_size_bytes,
                 )
 
+            self._record_embedding_cache(cache_stats_before)
             self.monitor.end_operation("ingestion_process")
 
             logger.debug(
@@ -278,11 +302,47 @@ class AsyncIngestionPipeline:
                 documents_attempted=len(documents),
                 suggestion="Check data source connectivity, document formats, and system resources",
             )
+            self._record_embedding_cache(cache_stats_before)
             self.monitor.end_operation(
                 "ingestion_process", success=False, error=safe_error
             )
             raise
 
+    def _embedding_service(self) -> Any:
+        """Return the embedding service of the document pipeline, if any."""
+        document_pipeline = getattr(self.components, "document_pipeline", None)
+        embedding_worker = getattr(document_pipeline, "embedding_worker", None)
+        return getattr(embedding_worker, "embedding_service", None)
+
+    def _close_embedding_service(self) -> None:
+        """Flush and close the embedding cache."""
+        try:
+            close = getattr(self._embedding_service(), "close", None)
+            if callable(close):
+                close()
+        except Exception as e:
+            logger.warning(
+                f"Error closing embedding cache: {sanitize_exception_message(e)}"
+            )
+
+    def _embedding_cache_stats(self) -> dict[str, int] | None:
+        """Return the embedding service's cumulative cache hits and misses."""
+        cache_stats = getattr(self._embedding_service(), "cache_stats", None)
+        if not callable(cache_stats):
+            return None
+        stats = cache_stats()
+        return stats if isinstance(stats, dict) else None
+
+    def _record_embedding_cache(self, before: dict[str, int] | None) -> None:
+        """Add the cache hits and misses of the current run to the monitor."""
+        after = self._embedding_cache_stats()
+        if before is None or after is None:
+            return
+        self.monitor.record_embedding_cache(
+            hits=after["hits"] - before["hits"],
+            misses=after["misses"] - before["misses"],
+        )
+
     async def cleanup(self):
         """Clean up resources."""
         if self._cleanup_performed:
@@ -308,6 +368,16 @@ class AsyncIngestionPipeline:
             if hasattr(self, "resource_manager"):
                 await self.resource_manager.cleanup()
 
+            self._close_embedding_service()
+
+            # Close the async Qdrant client used for upserts
+            try:
+                await self.qdrant_manager.aclose()
+            except Exception as e:
+                logger.warning(
+                    f"Error closing Qdrant client: {sanitize_exception_message(e)}"
+                )
+
             logger.info("Pipeline cleanup completed")
         except Exception as e:
             logger.error(
@@ -356,4 +426,6 @@ class AsyncIngestionPipeline:
                 f"Error in resource manager cleanup: {sanitize_exception_message(e)}"
             )
 
+        self._close_embedding_service()
+
         logger.info("Pipeline cleanup completed (sync)")
@@ -1,23 +1,43 @@
 """Generic attachment downloader for connectors that support file attachments."""
 
+import asyncio
 import os
 import tempfile
 import uuid
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import AsyncExitStack
 from pathlib import Path
 
+import httpx
 import requests
 
+from qdrant_loader.connectors.shared.http.async_client import create_async_client
+from qdrant_loader.core.attachment_pipeline import (
+    AttachmentStage,
+    ConvertedAttachment,
+    convert_in_worker,
+    discard_conversion_pool,
+    get_conversion_pool,
+)
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion import (
+    ConversionTimeoutError,
     FileConversionConfig,
     FileConversionError,
     FileConverter,
     FileDetector,
 )
+from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+DOWNLOAD_TIMEOUT = 30.0
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Converted text kept for reuse by other documents linking the same attachment
+CONVERTED_CACHE_MAX_CHARS = 64 * 1024 * 1024
+
 
 class AttachmentMetadata:
     """Metadata for an attachment."""
@@ -33,6 +53,7 @@ class AttachmentMetadata:
         created_at: str | None = None,
         updated_at: str | None = None,
         author: str | None = None,
+        version: str | None = None,
     ):
         """Initialize attachment metadata.
 
@@ -46,6 +67,7 @@ class AttachmentMetadata:
             created_at: Creation timestamp
             updated_at: Last update timestamp
             author: Author of the attachment
+            version: Version of the attachment content, if the source has one
         """
         self.id = id
         self.filename = filename
@@ -56,10 +78,32 @@ class AttachmentMetadata:
         self.created_at = created_at
         self.updated_at = updated_at
         self.author = author
+        self.version = version
+
+    @property
+    def content_key(self) -> tuple[str, str, int]:
+        """Identifies the attachment content across documents.
+
+        The download URL rather than the ID is used, since some sources
+        number attachments per parent document.
+        """
+        return (
+            self.download_url,
+            self.version or self.updated_at or "",
+            self.size,
+        )
 
 
 class AttachmentDownloader:
-    """Generic attachment downloader for various connector types."""
+    """Generic attachment downloader for various connector types.
+
+    Attachments are downloaded and converted through two bounded stages, so
+    a source processes several attachments at once while holding at most
+    ``max_concurrent_downloads`` connections and ``conversion_workers``
+    conversions. Downloads stream to disk over a pooled async HTTP client
+    built from the connector's session. The text of an attachment linked
+    from several documents is downloaded and converted once.
+    """
 
     def __init__(
         self,
@@ -67,6 +111,7 @@ class AttachmentDownloader:
         file_conversion_config: FileConversionConfig | None = None,
         enable_file_conversion: bool = False,
         max_attachment_size: int = 52428800,  # 50MB default
+        transport: httpx.AsyncBaseTransport | None = None,
     ):
         """Initialize the attachment downloader.
 
@@ -75,11 +120,38 @@ class AttachmentDownloader:
             file_conversion_config: File conversion configuration
             enable_file_conversion: Whether to enable file conversion
             max_attachment_size: Maximum attachment size to download (bytes)
+            transport: Optional transport replacing the connection pool (e.g. stubs)
         """
         self.session = session
         self.enable_file_conversion = enable_file_conversion
         self.max_attachment_size = max_attachment_size
         self.logger = logger
+        self.file_conversion_config = file_conversion_config
+        self._transport = transport
+        self._client: httpx.AsyncClient | None = None
+
+        conversion_config = file_conversion_config or FileConversionConfig()
+        self.conversion_backend = conversion_config.conversion_backend
+        self.conversion_workers = (
+            conversion_config.conversion_workers or os.cpu_count() or 1
+        )
+        self.download_stage = AttachmentStage(
+            "download", conversion_config.max_concurrent_downloads
+        )
+        self.convert_stage = AttachmentStage("convert", self.conversion_workers)
+        # Conversions in progress and converted text, by attachment content key
+        self._in_progress: dict[
+            tuple[str, str, int], asyncio.Future[ConvertedAttachment | None]
+        ] = {}
+        self._converted: OrderedDict[tuple[str, str, int], ConvertedAttachment] = (
+            OrderedDict()
+        )
+        self._converted_chars = 0
+        self.deduplicated = 0
+        # Tasks releasing the slot and temporary file of a timed-out thread
+        # conversion once the thread finishes, and those files
+        self._abandoned: set[asyncio.Task[None]] = set()
+        self._abandoned_files: set[str] = set()
 
         # Initialize file conversion components if enabled
         self.file_converter = None
@@ -132,9 +204,41 @@ class AttachmentDownloader:
         # In the future, this could be configurable by file type
         return True
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the pooled download client, creating it on first use."""
+        if self._client is None:
+            self._client = create_async_client(
+                self.session,
+                max_connections_per_host=self.download_stage.concurrency,
+                timeout=DOWNLOAD_TIMEOUT,
+                transport=self._transport,
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the download client and its connections.
+
+        Conversion threads that outlived their timeout are waited for, so
+        that their temporary files are deleted.
+        """
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+        if self._abandoned:
+            await asyncio.gather(*self._abandoned, return_exceptions=True)
+
+    def _size_limit(self, attachment: AttachmentMetadata) -> int:
+        """Bytes after which a download is abandoned."""
+        if attachment.size > 0:
+            return min(self.max_attachment_size, int(attachment.size * 1.5))
+        return self.max_attachment_size
+
     async def download_attachment(self, attachment: AttachmentMetadata) -> str | None:
         """Download an attachment to a temporary file.
 
+        The response is streamed to disk and abandoned once it exceeds the
+        size limit. At most ``max_concurrent_downloads`` downloads run at once.
+
         Args:
             attachment: Attachment metadata
 
@@ -144,6 +248,13 @@ class AttachmentDownloader:
         if not self.should_download_attachment(attachment):
             return None
 
+        async with self.download_stage.slot():
+            temp_path = await self._download(attachment)
+            size = os.path.getsize(temp_path) if temp_path else 0
+            self.download_stage.record(temp_path is not None, size)
+            return temp_path
+
+    async def _download(self, attachment: AttachmentMetadata) -> str | None:
         try:
             self.logger.info(
                 "Downloading attachment",
@@ -152,51 +263,51 @@ class AttachmentDownloader:
                 url=attachment.download_url,
             )
 
-            # Prepare headers for download request
-            headers = {}
-
-            # For Confluence downloads, we need to handle authentication properly
-            # The session should already have the right authentication, but we may need
-            # to handle redirects and different response types
-
-            # Some Confluence instances return different content types or require
-            # specific headers for attachment downloads
-            headers.update(
-                {
-                    "Accept": "*/*",
-                    "User-Agent": "qdrant-loader-attachment-downloader/1.0",
-                }
-            )
-
-            # Download the file with proper error handling for different deployment types
-            response = self.session.get(
+            # The client carries the session's authentication; some Confluence
+            # setups redirect downloads or need these headers
+            headers = {
+                "Accept": "*/*",
+                "User-Agent": "qdrant-loader-attachment-downloader/1.0",
+            }
+            async with self._get_client().stream(
+                "GET",
                 attachment.download_url,
-                stream=True,
                 headers=headers,
-                allow_redirects=True,  # Important for some Confluence setups
-                timeout=30,  # Reasonable timeout for downloads
-            )
-            response.raise_for_status()
-
-            # Validate content type if possible
-            content_type = response.headers.get("content-type", "").lower()
-            if content_type and "text/html" in content_type:
-                # This might indicate an authentication error or redirect to login page
-                self.logger.warning(
-                    "Received HTML response for attachment download, possible authentication issue",
-                    filename=attachment.filename,
-                    url=attachment.download_url,
-                    content_type=content_type,
-                )
-                return None
-
-            # Validate content length if available
-            content_length = response.headers.get("content-length")
-            if content_length:
-                try:
-                    actual_size = int(content_length)
+                follow_redirects=True,
+            ) as response:
+                response.raise_for_status()
+
+                # Validate content type if possible
+                content_type = response.headers.get("content-type", "").lower()
+                if content_type and "text/html" in content_type:
+                    # This might indicate an authentication error or redirect to login page
+                    self.logger.warning(
+                        "Received HTML response for attachment download, possible authentication issue",
+                        filename=attachment.filename,
+                        url=attachment.download_url,
+                        content_type=content_type,
+                    )
+                    return None
+
+                limit = self._size_limit(attachment)
+                content_length = response.headers.get("content-length")
+                if content_length:
+                    try:
+                        actual_size = int(content_length)
+                    except ValueError:
+                        actual_size = None  # Invalid content-length header
+                    if actual_size is not None and actual_size > limit:
+                        self.logger.warning(
+                            "Attachment larger than allowed, skipping",
+                            filename=attachment.filename,
+                            expected_size=attachment.size,
+                            actual_size=actual_size,
+                            max_size=limit,
+                        )
+                        return None
                     if (
-                        attachment.size > 0
+                        actual_size is not None
+                        and attachment.size > 0
                         and abs(actual_size - attachment.size) > 1024
                     ):
                         # Size mismatch (allowing for small differences)
@@ -206,39 +317,34 @@ class AttachmentDownloader:
                             expected_size=attachment.size,
                             actual_size=actual_size,
                         )
-                except ValueError:
-                    pass  # Invalid content-length header
 
-            # Create temporary file with original extension
-            file_ext = Path(attachment.filename).suffix
-            temp_file = tempfile.NamedTemporaryFile(
-                delete=False, suffix=file_ext, prefix=f"attachment_{attachment.id}_"
-            )
-
-            # Write content to temporary file with progress tracking
-            downloaded_size = 0
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    temp_file.write(chunk)
-                    downloaded_size += len(chunk)
-
-                    # Check if we're exceeding expected size significantly
-                    if attachment.size > 0 and downloaded_size > attachment.size * 1.5:
-                        self.logger.warning(
-                            "Download size exceeding expected size, stopping",
-                            filename=attachment.filename,
-                            expected_size=attachment.size,
-                            downloaded_size=downloaded_size,
-                        )
-                        temp_file.close()
-                        self.cleanup_temp_file(temp_file.name)
-                        return None
-
-            temp_file.close()
-
-            # Final size validation
-            actual_file_size = os.path.getsize(temp_file.name)
-            if actual_file_size == 0:
+                # Create temporary file with original extension
+                temp_file = tempfile.NamedTemporaryFile(
+                    delete=False,
+                    suffix=Path(attachment.filename).suffix,
+                    prefix=f"attachment_{attachment.id}_",
+                )
+                downloaded_size = 0
+                try:
+                    with temp_file:
+                        async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                            downloaded_size += len(chunk)
+                            if downloaded_size > limit:
+                                self.logger.warning(
+                                    "Download size exceeding limit, stopping",
+                                    filename=attachment.filename,
+                                    expected_size=attachment.size,
+                                    downloaded_size=downloaded_size,
+                                    max_size=limit,
+                                )
+                                self.cleanup_temp_file(temp_file.name)
+                                return None
+                            temp_file.write(chunk)
+                except BaseException:
+                    self.cleanup_temp_file(temp_file.name)
+                    raise
+
+            if downloaded_size == 0:
                 self.logger.warning(
                     "Downloaded file is empty",
                     filename=attachment.filename,
@@ -252,24 +358,23 @@ class AttachmentDownloader:
                 filename=attachment.filename,
                 temp_path=temp_file.name,
                 expected_size=attachment.size,
-                actual_size=actual_file_size,
+                actual_size=downloaded_size,
             )
-
             return temp_file.name
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             self.logger.error(
                 "Timeout downloading attachment",
                 filename=attachment.filename,
                 url=attachment.download_url,
             )
             return None
-        except requests.exceptions.HTTPError as e:
+        except httpx.HTTPStatusError as e:
             self.logger.error(
                 "HTTP error downloading attachment",
                 filename=attachment.filename,
                 url=attachment.download_url,
-                status_code=e.response.status_code if e.response else None,
+                status_code=e.response.status_code,
                 error=str(e),
             )
             return None
@@ -282,6 +387,154 @@ class AttachmentDownloader:
             )
             return None
 
+    def _needs_conversion(self, temp_file_path: str) -> bool:
+        return bool(
+            self.enable_file_conversion
+            and self.file_detector
+            and self.file_converter
+            and self.file_detector.is_supported_for_conversion(temp_file_path)
+        )
+
+    def _describe(self, attachment: AttachmentMetadata) -> ConvertedAttachment:
+        """Placeholder text for attachments that are not converted."""
+        content = f"# {attachment.filename}\n\nFile type: {attachment.mime_type}\nSize: {attachment.size} bytes\n\nThis attachment could not be converted to text."
+        return ConvertedAttachment(content, "md", None, False, False)
+
+    def convert_attachment(
+        self, attachment: AttachmentMetadata, temp_file_path: str
+    ) -> ConvertedAttachment:
+        """Convert a downloaded attachment to Markdown in the calling thread."""
+        if not self._needs_conversion(temp_file_path):
+            return self._describe(attachment)
+
+        self.logger.debug("Attachment needs conversion", filename=attachment.filename)
+        assert self.file_converter is not None  # Type checker hint
+        try:
+            # Convert file to markdown
+            content = self.file_converter.convert_file(temp_file_path)
+        except FileConversionError as e:
+            return self._fallback(attachment, temp_file_path, e)
+        self.logger.info(
+            "Attachment conversion successful", filename=attachment.filename
+        )
+        return ConvertedAttachment(content, "md", "markitdown", False, True)
+
+    def _fallback(
+        self,
+        attachment: AttachmentMetadata,
+        temp_file_path: str,
+        error: FileConversionError,
+    ) -> ConvertedAttachment:
+        self.logger.warning(
+            "Attachment conversion failed, creating fallback document",
+            filename=attachment.filename,
+            error=str(error),
+        )
+        assert self.file_converter is not None  # Type checker hint
+        content = self.file_converter.create_fallback_document(temp_file_path, error)
+        return ConvertedAttachment(content, "md", "markitdown_fallback", True, True)
+
+    async def _convert(
+        self, attachment: AttachmentMetadata, temp_file_path: str
+    ) -> ConvertedAttachment:
+        """Convert a downloaded attachment in the conversion stage."""
+        if not await asyncio.to_thread(self._needs_conversion, temp_file_path):
+            return self._describe(attachment)
+
+        assert self.file_converter is not None  # Type checker hint
+        timeout = self.file_converter.config.conversion_timeout
+        async with AsyncExitStack() as resources:
+            await resources.enter_async_context(self.convert_stage.slot())
+            try:
+                if self.conversion_backend == "process":
+                    converted = await self._convert_in_process(
+                        attachment, temp_file_path, timeout
+                    )
+                else:
+                    converted = await self._convert_in_thread(
+                        attachment, temp_file_path, timeout, resources
+                    )
+            except TimeoutError:
+                converted = self._fallback(
+                    attachment,
+                    temp_file_path,
+                    ConversionTimeoutError(timeout, temp_file_path),
+                )
+            self.convert_stage.record(
+                not converted.conversion_failed, len(converted.content)
+            )
+            return converted
+
+    async def _convert_in_thread(
+        self,
+        attachment: AttachmentMetadata,
+        temp_file_path: str,
+        timeout: int,
+        resources: AsyncExitStack,
+    ) -> ConvertedAttachment:
+        """Convert in a thread, giving up on it after ``timeout`` seconds.
+
+        A thread cannot be stopped, so one still running when the wait ends
+        keeps its conversion slot and temporary file: ``resources`` is handed
+        over to a task that releases them once the thread finishes.
+        """
+        conversion = asyncio.ensure_future(
+            asyncio.to_thread(self.convert_attachment, attachment, temp_file_path)
+        )
+        try:
+            return await asyncio.wait_for(asyncio.shield(conversion), timeout)
+        except BaseException:
+            if not conversion.done():
+                self._abandoned_files.add(temp_file_path)
+                held = resources.pop_all()
+                held.callback(self._release_file, temp_file_path)
+                self._release_when_done(conversion, held)
+            raise
+
+    def _release_when_done(
+        self, conversion: asyncio.Future, resources: AsyncExitStack
+    ) -> None:
+        async def release() -> None:
+            try:
+                await conversion
+            except Exception as e:
+                self.logger.debug("Abandoned conversion failed", error=str(e))
+            finally:
+                await resources.aclose()
+
+        task = asyncio.create_task(release())
+        self._abandoned.add(task)
+        task.add_done_callback(self._abandoned.discard)
+
+    def _release_file(self, temp_file_path: str) -> None:
+        self._abandoned_files.discard(temp_file_path)
+        self.cleanup_temp_file(temp_file_path)
+
+    async def _convert_in_process(
+        self, attachment: AttachmentMetadata, temp_file_path: str, timeout: int
+    ) -> ConvertedAttachment:
+        assert self.file_conversion_config is not None  # Type checker hint
+        pool = get_conversion_pool(self.file_conversion_config, self.conversion_workers)
+        try:
+            future = pool.submit(convert_in_worker, temp_file_path)
+            # Workers enforce the timeout themselves; the margin covers start-up
+            content, failed = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout + 30
+            )
+        except BrokenProcessPool:
+            discard_conversion_pool(pool)
+            raise
+        if failed:
+            self.logger.warning(
+                "Attachment conversion failed, created fallback document",
+                filename=attachment.filename,
+            )
+            return ConvertedAttachment(content, "md", "markitdown_fallback", True, True)
+        self.logger.info(
+            "Attachment conversion successful", filename=attachment.filename
+        )
+        return ConvertedAttachment(content, "md", "markitdown", False, True)
+
     def process_attachment(
         self,
         attachment: AttachmentMetadata,
@@ -290,6 +543,8 @@ class AttachmentDownloader:
     ) -> Document | None:
         """Process a downloaded attachment into a Document.
 
+        The file is converted in the calling thread.
+
         Args:
             attachment: Attachment metadata
             temp_file_path: Path to downloaded temporary file
@@ -299,49 +554,33 @@ class AttachmentDownloader:
             Document: Processed attachment document, or None if processing failed
         """
         try:
-            # Check if file needs conversion
-            needs_conversion = (
-                self.enable_file_conversion
-                and self.file_detector
-                and self.file_converter
-                and self.file_detector.is_supported_for_conversion(temp_file_path)
+            converted = self.convert_attachment(attachment, temp_file_path)
+        except Exception as e:
+            self.logger.error(
+                "Failed to process attachment",
+                filename=attachment.filename,
+                error=str(e),
             )
+            return None
+        return self.build_attachment_document(attachment, converted, parent_document)
 
-            if needs_conversion:
-                self.logger.debug(
-                    "Attachment needs conversion", filename=attachment.filename
-                )
-                try:
-                    # Convert file to markdown
-                    assert self.file_converter is not None  # Type checker hint
-                    content = self.file_converter.convert_file(temp_file_path)
-                    content_type = "md"  # Converted files are markdown
-                    conversion_method = "markitdown"
-                    conversion_failed = False
-                    self.logger.info(
-                        "Attachment conversion successful", filename=attachment.filename
-                    )
-                except FileConversionError as e:
-                    self.logger.warning(
-                        "Attachment conversion failed, creating fallback document",
-                        filename=attachment.filename,
-                        error=str(e),
-                    )
-                    # Create fallback document
-                    assert self.file_converter is not None  # Type checker hint
-                    content = self.file_converter.create_fallback_document(
-                        temp_file_path, e
-                    )
-                    content_type = "md"  # Fallback is also markdown
-                    conversion_method = "markitdown_fallback"
-                    conversion_failed = True
-            else:
-                # For non-convertible files, create a minimal document
-                content = f"# {attachment.filename}\n\nFile type: {attachment.mime_type}\nSize: {attachment.size} bytes\n\nThis attachment could not be converted to text."
-                content_type = "md"
-                conversion_method = None
-                conversion_failed = False
+    def build_attachment_document(
+        self,
+        attachment: AttachmentMetadata,
+        converted: ConvertedAttachment,
+        parent_document: Document,
+    ) -> Document | None:
+        """Build the document of a converted attachment.
+
+        Args:
+            attachment: Attachment metadata
+            converted: Text of the attachment
+            parent_document: Parent document this attachment belongs to
 
+        Returns:
+            Document: Attachment document, or None if it could not be built
+        """
+        try:
             # Create attachment metadata
             attachment_metadata = {
                 "attachment_id": attachment.id,
@@ -354,11 +593,11 @@ class AttachmentDownloader:
             }
 
             # Add conversion metadata if applicable
-            if needs_conversion:
+            if converted.converted:
                 attachment_metadata.update(
                     {
-                        "conversion_method": conversion_method,
-                        "conversion_failed": conversion_failed,
+                        "conversion_method": converted.conversion_method,
+                        "conversion_failed": converted.conversion_failed,
                         "original_file_type": Path(attachment.filename)
                         .suffix.lower()
                         .lstrip("."),
@@ -378,8 +617,8 @@ class AttachmentDownloader:
             document = Document(
                 id=attachment_doc_id,
                 title=f"Attachment: {attachment.filename}",
-                content=content,
-                content_type=content_type,
+                content=converted.content,
+                content_type=converted.content_type,
                 metadata=attachment_metadata,
                 source_type=parent_document.source_type,
                 source=parent_document.source,
@@ -420,49 +659,121 @@ class AttachmentDownloader:
                 error=str(e),
             )
 
+    async def _converted_content(
+        self, attachment: AttachmentMetadata
+    ) -> ConvertedAttachment | None:
+        """Download and convert an attachment, once per content key.
+
+        Documents linking an attachment that is being, or was recently,
+        converted for another document reuse its text.
+        """
+        key = attachment.content_key
+        cached = self._converted.get(key)
+        if cached is not None:
+            self._converted.move_to_end(key)
+            self._count_duplicate(attachment)
+            return cached
+        in_progress = self._in_progress.get(key)
+        if in_progress is not None:
+            self._count_duplicate(attachment)
+            return await asyncio.shield(in_progress)
+
+        future: asyncio.Future[ConvertedAttachment | None] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._in_progress[key] = future
+        try:
+            temp_file_path = await self.download_attachment(attachment)
+            converted = None
+            if temp_file_path:
+                try:
+                    converted = await self._convert(attachment, temp_file_path)
+                finally:
+                    # A conversion thread still reading the file deletes it
+                    if temp_file_path not in self._abandoned_files:
+                        self.cleanup_temp_file(temp_file_path)
+        except BaseException:
+            # Documents waiting for this attachment skip it as well
+            future.set_result(None)
+            raise
+        finally:
+            del self._in_progress[key]
+        future.set_result(converted)
+        if converted is not None:
+            self._remember(key, converted)
+        return converted
+
+    def _count_duplicate(self, attachment: AttachmentMetadata) -> None:
+        self.deduplicated += 1
+        prometheus_metrics.ATTACHMENT_DEDUPLICATED.inc()
+        self.logger.debug(
+            "Reusing converted attachment",
+            filename=attachment.filename,
+            url=attachment.download_url,
+        )
+
+    def _remember(
+        self, key: tuple[str, str, int], converted: ConvertedAttachment
+    ) -> None:
+        """Keep converted text for reuse, evicting the least recently used."""
+        size = len(converted.content)
+        if size > CONVERTED_CACHE_MAX_CHARS // 4:
+            return
+        self._converted[key] = converted
+        self._converted_chars += size
+        while self._converted_chars > CONVERTED_CACHE_MAX_CHARS:
+            _, evicted = self._converted.popitem(last=False)
+            self._converted_chars -= len(evicted.content)
+
+    def stats(self) -> dict:
+        """Counters of the download and conversion stages."""
+        return {
+            "download": self.download_stage.snapshot(),
+            "convert": self.convert_stage.snapshot(),
+            "deduplicated": self.deduplicated,
+        }
+
     async def download_and_process_attachments(
         self,
         attachments: list[AttachmentMetadata],
         parent_document: Document,
     ) -> list[Document]:
-        """Download and process multiple attachments.
+        """Download and process multiple attachments concurrently.
 
         Args:
             attachments: List of attachment metadata
             parent_document: Parent document
 
         Returns:
-            List[Document]: List of processed attachment documents
+            List[Document]: List of processed attachment documents, in the
+            order of ``attachments``
         """
-        attachment_documents = []
-        temp_files = []
 
-        try:
-            for attachment in attachments:
-                # Download attachment
-                temp_file_path = await self.download_attachment(attachment)
-                if not temp_file_path:
-                    continue
-
-                temp_files.append(temp_file_path)
-
-                # Process attachment
-                attachment_doc = self.process_attachment(
-                    attachment, temp_file_path, parent_document
+        async def process(attachment: AttachmentMetadata) -> Document | None:
+            try:
+                converted = await self._converted_content(attachment)
+            except Exception as e:
+                self.logger.error(
+                    "Failed to process attachment",
+                    filename=attachment.filename,
+                    error=str(e),
                 )
-                if attachment_doc:
-                    attachment_documents.append(attachment_doc)
+                return None
+            if converted is None:
+                return None
+            return self.build_attachment_document(
+                attachment, converted, parent_document
+            )
 
-        finally:
-            # Clean up all temporary files
-            for temp_file in temp_files:
-                self.cleanup_temp_file(temp_file)
+        results = await asyncio.gather(*(process(a) for a in attachments))
+        attachment_documents = [doc for doc in results if doc is not None]
 
         self.logger.debug(
             "Processed attachments",
             total_attachments=len(attachments),
             processed_attachments=len(attachment_documents),
             parent_document_id=parent_document.id,
+            **self.stats(),
         )
 
         return attachment_documents
@@ -0,0 +1,209 @@
+"""Stages and conversion workers of the attachment pipeline.
+
+Attachments go through two bounded stages: downloading, which streams the
+file to disk on the event loop, and converting, which runs MarkItDown in a
+thread or in worker processes. Each stage reports how many attachments wait
+for a slot, how many are in flight and how many went through, both to
+Prometheus and through ``AttachmentStage.snapshot``.
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any, NamedTuple
+
+from qdrant_loader.core.file_conversion import (
+    FileConversionConfig,
+    FileConversionError,
+    FileConverter,
+)
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+class ConvertedAttachment(NamedTuple):
+    """Text of an attachment, ready to become a document."""
+
+    content: str
+    content_type: str
+    conversion_method: str | None
+    conversion_failed: bool
+    # Whether the file went through MarkItDown, rather than being described
+    converted: bool
+
+
+class AttachmentStage:
+    """A bounded stage of the attachment pipeline and its counters."""
+
+    def __init__(self, name: str, concurrency: int):
+        self.name = name
+        self.concurrency = concurrency
+        self._slots = asyncio.Semaphore(concurrency)
+        self.waiting = 0
+        self.active = 0
+        self.completed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.busy_seconds = 0.0
+        self._started: float | None = None
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the stage's slots; an exception counts as a failure."""
+        self.waiting += 1
+        prometheus_metrics.ATTACHMENT_STAGE_WAITING.labels(stage=self.name).inc()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+            prometheus_metrics.ATTACHMENT_STAGE_WAITING.labels(stage=self.name).dec()
+
+        if self._started is None:
+            self._started = time.monotonic()
+        self.active += 1
+        prometheus_metrics.ATTACHMENT_STAGE_IN_FLIGHT.labels(stage=self.name).inc()
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            self.record(False)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.busy_seconds += elapsed
+            prometheus_metrics.ATTACHMENT_STAGE_DURATION.labels(
+                stage=self.name
+            ).observe(elapsed)
+            self.active -= 1
+            prometheus_metrics.ATTACHMENT_STAGE_IN_FLIGHT.labels(stage=self.name).dec()
+            self._slots.release()
+
+    def record(self, succeeded: bool, size: int = 0) -> None:
+        """Count an attachment that went through the stage."""
+        outcome = "succeeded" if succeeded else "failed"
+        if succeeded:
+            self.completed += 1
+        else:
+            self.failed += 1
+        prometheus_metrics.ATTACHMENT_STAGE_ITEMS.labels(
+            stage=self.name, outcome=outcome
+        ).inc()
+        if size:
+            self.bytes += size
+            prometheus_metrics.ATTACHMENT_STAGE_BYTES.labels(stage=self.name).inc(size)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Counters of the stage, with its throughput since its first item."""
+        items = self.completed + self.failed
+        elapsed = time.monotonic() - self._started if self._started else 0.0
+        return {
+            "waiting": self.waiting,
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "busy_seconds": round(self.busy_seconds, 3),
+            "items_per_second": round(items / elapsed, 2) if elapsed else 0.0,
+        }
+
+
+# The file converter of the current worker process
+_converter: FileConverter | None = None
+
+
+def _initialize_worker(config: FileConversionConfig, logging_config: Any) -> None:
+    """Build the file converter of a worker process."""
+    global _converter
+
+    if logging_config is not None:
+        level, format, file, clean_output, suppress_warnings, disable_console = (
+            logging_config
+        )
+        LoggingConfig.setup(
+            level=level,
+            format=format,
+            file=file,
+            clean_output=clean_output,
+            suppress_qdrant_warnings=suppress_warnings,
+            disable_console=disable_console,
+        )
+    _converter = FileConverter(config)
+    logger.debug("Conversion worker process ready", pid=os.getpid())
+
+
+def convert_in_worker(file_path: str) -> tuple[str, bool]:
+    """Convert a file in a worker process.
+
+    The converter's signal-based timeout applies, since the conversion runs
+    on the worker's main thread.
+
+    Returns:
+        The Markdown, and whether it is a fallback for a failed conversion
+    """
+    if _converter is None:
+        raise RuntimeError("Conversion worker process was not initialized")
+    try:
+        return _converter.convert_file(file_path), False
+    except FileConversionError as e:
+        return _converter.create_fallback_document(file_path, e), True
+
+
+class ConversionProcessPool(concurrent.futures.ProcessPoolExecutor):
+    """Process pool whose workers can run ``convert_in_worker``.
+
+    Workers are spawned rather than forked, so they do not inherit the event
+    loop or the open connections of the parent. They start on first use.
+    """
+
+    def __init__(self, config: FileConversionConfig, max_workers: int):
+        logging_config = getattr(LoggingConfig, "_current_config", None)
+        if logging_config is not None and len(logging_config) != 6:
+            logging_config = None
+        logger.info(f"Starting conversion process pool with {max_workers} workers")
+        super().__init__(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(config, logging_config),
+        )
+
+
+_pools: dict[str, ConversionProcessPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_conversion_pool(
+    config: FileConversionConfig, max_workers: int
+) -> ConversionProcessPool:
+    """Return the process pool shared by every source with this configuration."""
+    key = f"{max_workers}:{config.model_dump_json()}"
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConversionProcessPool(config, max_workers)
+        return pool
+
+
+def discard_conversion_pool(pool: ConversionProcessPool) -> None:
+    """Forget a broken pool so that the next conversion starts a new one."""
+    with _pools_lock:
+        for key, candidate in list(_pools.items()):
+            if candidate is pool:
+                del _pools[key]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_conversion_pools() -> None:
+    """Stop the worker processes of every conversion pool."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -14,6 +14,7 @@ from qdrant_loader.core.chunking.strategy import (
 )
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from qdrant_loader.utils.logging import LoggingConfig
 
 
@@ -72,8 +73,16 @@ class ChunkingService:
             # Add more strategies here as needed
         }
 
+        # Strategies and the NLP models behind them are loaded once per process
+        # (per chunking thread for strategies) and reused for every document.
+        self.model_registry = get_model_registry()
+
         # Default strategy for unknown file types
-        self.default_strategy = DefaultChunkingStrategy(settings=self.settings)
+        self.default_strategy = self._strategy_for(DefaultChunkingStrategy)
+
+        self.logger.info(
+            "Chunking models ready", model_registry=self.model_registry.stats()
+        )
 
     def validate_config(self) -> None:
         """Validate the configuration.
@@ -88,6 +97,19 @@ class ChunkingService:
         if self.config.chunking.chunk_overlap >= self.config.chunking.chunk_size:
             raise ValueError("Chunk overlap must be less than chunk size")
 
+    def _strategy_for(
+        self, strategy_class: type[BaseChunkingStrategy]
+    ) -> BaseChunkingStrategy:
+        """Return the shared instance of a strategy class for the calling thread.
+
+        Args:
+            strategy_class: The chunking strategy class
+
+        Returns:
+            A strategy instance built from this service's settings
+        """
+        return self.model_registry.get_strategy(strategy_class, self.settings)
+
     def _get_strategy(self, document: Document) -> BaseChunkingStrategy:
         """Get the appropriate chunking strategy for a document.
 
@@ -108,7 +130,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._strategy_for(MarkdownChunkingStrategy)
         elif conversion_method == "markitdown_fallback":
             # Fallback documents are also in markdown format
             self.logger.info(
@@ -119,7 +141,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return MarkdownChunkingStrategy(self.settings)
+            return self._strategy_for(MarkdownChunkingStrategy)
 
         # Get file extension from the document content type
         file_type = document.content_type.lower()
@@ -145,7 +167,7 @@ class ChunkingService:
                 document_id=document.id,
                 document_title=document.title,
             )
-            return strategy_class(self.settings)
+            return self._strategy_for(strategy_class)
 
         self.logger.debug(
             "No specific strategy found for this file type, using default text chunking strategy",
@@ -153,7 +175,7 @@ class ChunkingService:
             document_id=document.id,
             document_title=document.title,
         )
-        return self.default_strategy
+        return self._strategy_for(DefaultChunkingStrategy)
 
     def chunk_document(self, document: Document) -> list[Document]:
         """Chunk a document into smaller pieces.
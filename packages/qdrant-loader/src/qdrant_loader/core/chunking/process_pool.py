@@ -0,0 +1,138 @@
+"""Process-pool backend for chunking.
+
+Most chunking work (markdown section splitting, BeautifulSoup, AST parsing,
+spaCy) holds the GIL, so a thread pool keeps a single core busy. This module
+runs ``ChunkingService.chunk_document`` in worker processes instead. Each
+worker builds its own service and warms every chunking strategy once when it
+starts; documents and chunks cross the process boundary as plain field tuples
+rather than pydantic models.
+"""
+
+import asyncio
+import concurrent.futures
+import multiprocessing
+import os
+from typing import TYPE_CHECKING, Any
+
+from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+
+if TYPE_CHECKING:
+    from qdrant_loader.config import Settings
+    from qdrant_loader.core.chunking.chunking_service import ChunkingService
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Document fields shipped between processes, in tuple order
+_FIELDS = (
+    "id",
+    "title",
+    "content_type",
+    "content",
+    "contextual_content",
+    "metadata",
+    "content_hash",
+    "source_type",
+    "source",
+    "url",
+    "is_deleted",
+    "created_at",
+    "updated_at",
+)
+
+# The chunking service of the current worker process
+_service: "ChunkingService | None" = None
+
+
+def pack_document(document: Document) -> tuple:
+    """Flatten a document into a picklable tuple of its fields."""
+    metadata = {
+        key: value
+        for key, value in document.metadata.items()
+        if key != "parent_document"
+    }
+    return tuple(
+        metadata if field == "metadata" else getattr(document, field)
+        for field in _FIELDS
+    )
+
+
+def unpack_document(values: tuple) -> Document:
+    """Rebuild a document from ``pack_document`` output without re-validating it."""
+    return Document.model_construct(**dict(zip(_FIELDS, values, strict=True)))
+
+
+def _initialize_worker(settings: "Settings", logging_config: Any) -> None:
+    """Build the chunking service of a worker process and warm its strategies."""
+    global _service
+
+    if logging_config is not None:
+        level, format, file, clean_output, suppress_warnings, disable_console = (
+            logging_config
+        )
+        LoggingConfig.setup(
+            level=level,
+            format=format,
+            file=file,
+            clean_output=clean_output,
+            suppress_qdrant_warnings=suppress_warnings,
+            disable_console=disable_console,
+        )
+
+    from qdrant_loader.core.chunking.chunking_service import ChunkingService
+
+    _service = ChunkingService(config=settings.global_config, settings=settings)
+    for strategy_class in {*_service.strategies.values()}:
+        _service._strategy_for(strategy_class)
+    logger.debug("Chunking worker process ready", pid=os.getpid())
+
+
+def chunk_packed_document(packed: tuple) -> list[tuple]:
+    """Chunk a packed document in a worker process.
+
+    Args:
+        packed: Output of ``pack_document``
+
+    Returns:
+        The packed chunks
+    """
+    if _service is None:
+        raise RuntimeError("Chunking worker process was not initialized")
+    chunks = _service.chunk_document(unpack_document(packed))
+    return [pack_document(chunk) for chunk in chunks]
+
+
+class ChunkingProcessPool(concurrent.futures.ProcessPoolExecutor):
+    """Process pool whose workers can run ``chunk_packed_document``.
+
+    Workers are spawned rather than forked, so they do not inherit the event
+    loop, open database connections or locks of the parent. All workers are
+    started right away; ``wait_until_ready`` lets callers keep the start-up
+    and warm-up time out of their per-document timeouts.
+    """
+
+    def __init__(self, settings: "Settings", max_workers: int | None = None):
+        """Start the pool.
+
+        Args:
+            settings: Application settings the worker chunking services are
+                built from
+            max_workers: Number of worker processes (defaults to the CPU count)
+        """
+        self.workers = max_workers or os.cpu_count() or 1
+        logging_config = getattr(LoggingConfig, "_current_config", None)
+        if logging_config is not None and len(logging_config) != 6:
+            logging_config = None
+        logger.info(f"Starting chunking process pool with {self.workers} workers")
+        super().__init__(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(settings, logging_config),
+        )
+        # One no-op per worker makes the executor spawn all of them now
+        self._ready = [self.submit(os.getpid) for _ in range(self.workers)]
+
+    async def wait_until_ready(self) -> None:
+        """Wait until the worker processes have started and warmed up."""
+        await asyncio.gather(*(asyncio.wrap_future(future) for future in self._ready))
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 import tiktoken
 
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from qdrant_loader.core.text_processing.text_processor import TextProcessor
 from qdrant_loader.utils.logging import LoggingConfig
 
@@ -51,7 +52,9 @@ class BaseChunkingStrategy(ABC):
             self.encoding = None
         else:
             try:
-                self.encoding = tiktoken.get_encoding(self.tokenizer)
+                self.encoding = get_model_registry().get_tiktoken_encoding(
+                    self.tokenizer, lambda: tiktoken.get_encoding(self.tokenizer)
+                )
             except Exception as e:
                 logger.warning(
                     "Failed to initialize tokenizer, falling back to simple character counting",
@@ -48,6 +48,12 @@ class ChunkProcessor:
         # Cache for processed chunks to avoid recomputation
         self._processed_chunks: dict[str, dict[str, Any]] = {}
 
+    def reset(self) -> None:
+        """Drop per-document state so the processor can be reused for another document."""
+        self._processed_chunks.clear()
+        if self.semantic_analyzer is not None:
+            self.semantic_analyzer.clear_cache()
+
     def process_chunk(
         self, chunk: str, chunk_index: int, total_chunks: int
     ) -> dict[str, Any]:
@@ -64,6 +64,9 @@ class MarkdownChunkingStrategy(BaseChunkingStrategy):
         Returns:
             List of chunked documents
         """
+        # Strategies are reused across documents; start from a clean slate
+        self.chunk_processor.reset()
+
         file_name = (
             document.metadata.get("file_name")
             or document.metadata.get("original_filename")
@@ -0,0 +1,176 @@
+"""Adaptive concurrency window for outbound embedding requests."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from qdrant_loader_core.llm.errors import RateLimitedError, ServerError
+
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """Return True when an error means the provider is overloaded (429/5xx)."""
+    if isinstance(error, RateLimitedError | ServerError):
+        return True
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD window bounding how many embedding requests are in flight.
+
+    The window starts small and grows by one slot every time a full window of
+    requests completes without latency degradation. It is halved when the
+    provider answers with 429/5xx, and shrinks by one slot when latency rises
+    well above the best latency observed so far.
+    """
+
+    def __init__(
+        self,
+        max_limit: int,
+        min_limit: int = 1,
+        initial_limit: int | None = None,
+        latency_tolerance: float = 2.0,
+        ewma_alpha: float = 0.3,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_limit: Upper bound for concurrent requests
+            min_limit: Lower bound for concurrent requests
+            initial_limit: Starting window (defaults to half of max_limit)
+            latency_tolerance: Shrink when smoothed latency exceeds the best
+                observed latency by this factor
+            ewma_alpha: Smoothing factor for the latency moving average
+        """
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self._limit = (
+            initial_limit
+            if initial_limit is not None
+            else max(self.min_limit, self.max_limit // 2)
+        )
+        self._limit = max(self.min_limit, min(self._limit, self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.ewma_alpha = ewma_alpha
+
+        self._in_flight = 0
+        self._successes_since_change = 0
+        self._latency_ewma: float | None = None
+        self._best_latency: float | None = None
+        self._condition: asyncio.Condition | None = None
+        self._publish()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the limiter can be built outside a running loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    def _publish(self) -> None:
+        prometheus_metrics.EMBED_CONCURRENCY_LIMIT.set(self._limit)
+        prometheus_metrics.EMBED_IN_FLIGHT.set(self._in_flight)
+
+    async def _acquire(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._in_flight < self._limit)
+            self._in_flight += 1
+            self._publish()
+
+    async def _release(self) -> None:
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            self._publish()
+            condition.notify_all()
+
+    def record_success(self, latency: float) -> None:
+        """Feed a successful request's latency into the window.
+
+        Args:
+            latency: Request latency in seconds, normalized per input item
+        """
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma = (
+                self.ewma_alpha * latency + (1 - self.ewma_alpha) * self._latency_ewma
+            )
+        # Let the best latency drift up slowly so one lucky sample cannot
+        # pin the window at its minimum forever
+        if self._best_latency is None:
+            self._best_latency = self._latency_ewma
+        else:
+            self._best_latency = min(self._latency_ewma, self._best_latency * 1.05)
+
+        if self._latency_ewma > self._best_latency * self.latency_tolerance:
+            self._set_limit(self._limit - 1, reason="latency")
+            return
+
+        self._successes_since_change += 1
+        if self._successes_since_change >= self._limit:
+            self._set_limit(self._limit + 1, reason="healthy")
+
+    def record_throttle(self) -> None:
+        """Shrink the window after a 429/5xx response."""
+        self._set_limit(self._limit // 2, reason="throttled")
+
+    def _set_limit(self, new_limit: int, reason: str) -> None:
+        new_limit = max(self.min_limit, min(new_limit, self.max_limit))
+        self._successes_since_change = 0
+        if new_limit == self._limit:
+            return
+
+        logger.debug(
+            "Embedding concurrency window adjusted",
+            previous=self._limit,
+            limit=new_limit,
+            reason=reason,
+            latency_ewma=(
+                round(self._latency_ewma, 3) if self._latency_ewma is not None else None
+            ),
+        )
+        # Waiters are woken by the release that always follows an outcome
+        self._limit = new_limit
+        self._publish()
+
+    @asynccontextmanager
+    async def slot(self, size: int = 1) -> AsyncIterator[None]:
+        """Hold one request slot, recording the outcome for window sizing.
+
+        Args:
+            size: Number of inputs in the request, used to normalize latency
+                so small trailing batches do not skew the window
+        """
+        await self._acquire()
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_throttling_error(e):
+                self.record_throttle()
+            raise
+        else:
+            self.record_success((time.perf_counter() - started) / max(1, size))
+        finally:
+            await self._release()
@@ -0,0 +1,198 @@
+"""Persistent, content-addressed cache of embedding vectors.
+
+Vectors are stored in a small SQLite file next to the state database, keyed by
+a hash of (provider, model, dimension, normalized text). Re-ingesting a
+document whose chunks did not change (``--force`` runs, one-line edits) then
+only pays for the chunks that actually differ.
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+CACHE_FILENAME = "embedding_cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    key TEXT PRIMARY KEY,
+    dimension INTEGER NOT NULL,
+    vector BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_embedding_cache_last_used
+    ON embedding_cache (last_used_at);
+"""
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMS = 500
+
+
+def normalize_text(text: str) -> str:
+    """Normalize chunk text so cosmetic differences share a cache entry.
+
+    Applies Unicode NFC, unifies line endings, drops trailing whitespace on
+    each line and trims the whole text.
+    """
+    text = unicodedata.normalize("NFC", text)
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n")).strip()
+
+
+def resolve_cache_path(state_db_path: object, cache_path: str | None) -> Path | None:
+    """Return the cache file location, or None when no file can be used.
+
+    An explicit ``cache_path`` wins; otherwise the cache lives next to the
+    state database. In-memory and URL-style state databases have no
+    directory to share, so the cache is disabled for them.
+    """
+    if cache_path:
+        return Path(os.path.expanduser(os.path.expandvars(cache_path)))
+    if not isinstance(state_db_path, str) or not state_db_path:
+        return None
+    if state_db_path == ":memory:" or state_db_path.startswith("sqlite:"):
+        return None
+    state_path = Path(os.path.expanduser(os.path.expandvars(state_db_path)))
+    return state_path.parent / CACHE_FILENAME
+
+
+class EmbeddingCache:
+    """SQLite-backed embedding store with least-recently-used eviction."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        namespace: tuple[str, str, int],
+        max_entries: int = 500_000,
+    ):
+        """Open (or create) the cache file.
+
+        Args:
+            path: SQLite file to store vectors in
+            namespace: (provider, model, dimension) the vectors belong to
+            max_entries: Number of vectors kept before the least recently
+                used ones are evicted
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.max_entries = max(1, max_entries)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._entries = self._conn.execute(
+            "SELECT COUNT(*) FROM embedding_cache"
+        ).fetchone()[0]
+
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, text: str) -> str:
+        """Return the cache key of ``text`` within this cache's namespace."""
+        provider, model, dimension = self.namespace
+        digest = hashlib.sha256()
+        for part in (provider, model, str(dimension), normalize_text(text)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, list[float]]:
+        """Return cached vectors for ``keys`` and mark them as recently used."""
+        unique_keys = list(dict.fromkeys(keys))
+        found: dict[str, list[float]] = {}
+        if not unique_keys:
+            return found
+
+        now = time.time()
+        with self._lock:
+            for start in range(0, len(unique_keys), _MAX_PARAMS):
+                chunk = unique_keys[start : start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT key, vector FROM embedding_cache "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+            if found:
+                self._conn.executemany(
+                    "UPDATE embedding_cache SET last_used_at = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+            self.hits += len(found)
+            self.misses += len(unique_keys) - len(found)
+        return found
+
+    def put_many(self, items: Iterable[tuple[str, list[float]]]) -> None:
+        """Store vectors, evicting the least recently used ones when full."""
+        now = time.time()
+        rows = [
+            (key, len(vector), array("f", vector).tobytes(), now, now)
+            for key, vector in items
+            if vector
+        ]
+        if not rows:
+            return
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO embedding_cache "
+                    "(key, dimension, vector, created_at, last_used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+                self._entries += self._conn.total_changes - before
+                if self._entries > self.max_entries:
+                    self._evict()
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                self._entries = self._conn.execute(
+                    "SELECT COUNT(*) FROM embedding_cache"
+                ).fetchone()[0]
+                raise
+
+    def _evict(self) -> None:
+        # Trim to 90% so eviction does not run again on every insert
+        target = int(self.max_entries * 0.9)
+        excess = self._entries - target
+        deleted = self._conn.execute(
+            "DELETE FROM embedding_cache WHERE key IN ("
+            "SELECT key FROM embedding_cache ORDER BY last_used_at ASC LIMIT ?)",
+            (excess,),
+        ).rowcount
+        self._entries -= deleted
+        logger.debug(
+            "Evicted least recently used embeddings",
+            evicted=deleted,
+            remaining=self._entries,
+        )
+
+    def __len__(self) -> int:
+        return self._entries
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,14 +1,25 @@
 import asyncio
 import logging
+import sqlite3
 import time
 from collections.abc import Sequence
 from importlib import import_module
 
 import requests
 import tiktoken
+from qdrant_loader_core.llm.errors import RateLimitedError, ServerError
+from qdrant_loader_core.llm.errors import TimeoutError as LLMTimeoutError
+from qdrant_loader_core.llm.ratelimit import AsyncRateLimiter
 
 from qdrant_loader.config import Settings
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.embedding.concurrency import AdaptiveConcurrencyLimiter
+from qdrant_loader.core.embedding.embedding_cache import (
+    EmbeddingCache,
+    resolve_cache_path,
+)
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -17,11 +28,13 @@ logger = LoggingConfig.get_logger(__name__)
 class EmbeddingService:
     """Service for generating embeddings using provider-agnostic API (via core)."""
 
-    def __init__(self, settings: Settings):
+    def __init__(self, settings: Settings, max_concurrent_requests: int = 1):
         """Initialize the embedding service.
 
         Args:
             settings: The application settings containing API key and endpoint.
+            max_concurrent_requests: Upper bound of the adaptive window of
+                embedding requests allowed in flight at the same time.
         """
         self.settings = settings
         # Build LLM settings from global config and create provider
@@ -42,7 +55,9 @@ class EmbeddingService:
             self.encoding = None
         else:
             try:
-                self.encoding = tiktoken.get_encoding(self.tokenizer)
+                self.encoding = get_model_registry().get_tiktoken_encoding(
+                    self.tokenizer, lambda: tiktoken.get_encoding(self.tokenizer)
+                )
             except Exception as e:
                 logger.warning(
                     "Failed to initialize tokenizer, falling back to simple character counting",
@@ -54,18 +69,125 @@ class EmbeddingService:
         self.last_request_time = 0
         self.min_request_interval = 0.5  # 500ms between requests
 
+        # Providers charge requests against a shared RPM/TPM limiter; when it
+        # enforces a budget, the fixed spacing above is redundant
+        limiter = getattr(self.provider, "rate_limiter", None)
+        self.rate_limiter = limiter if isinstance(limiter, AsyncRateLimiter) else None
+        if self.rate_limiter is not None and self.rate_limiter.enforces_budget:
+            self.min_request_interval = 0.0
+
+        # Adaptive window of in-flight requests, sized by latency and 429/5xx
+        self.request_window = AdaptiveConcurrencyLimiter(
+            max_limit=max_concurrent_requests
+        )
+
         # Retry configuration for network resilience
         self.max_retries = 3
         self.base_retry_delay = 1.0  # Start with 1 second
         self.max_retry_delay = 30.0  # Cap at 30 seconds
 
+        # Persistent cache of embeddings keyed by normalized chunk text
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.cache = self._open_cache()
+
+    def _open_cache(self) -> EmbeddingCache | None:
+        """Open the on-disk embedding cache when enabled and a location exists."""
+        global_config = self.settings.global_config
+        embedding_config = global_config.embedding
+        if not embedding_config.cache_enabled:
+            return None
+
+        path = resolve_cache_path(
+            global_config.state_management.database_path,
+            embedding_config.cache_path,
+        )
+        if path is None:
+            logger.debug("Embedding cache disabled: no on-disk state directory")
+            return None
+
+        llm_settings = self.settings.llm_settings
+        dimension = (
+            llm_settings.embeddings.vector_size or embedding_config.vector_size or 0
+        )
+        try:
+            cache = EmbeddingCache(
+                path,
+                namespace=(str(llm_settings.provider), str(self.model), int(dimension)),
+                max_entries=embedding_config.cache_max_entries,
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(
+                "Failed to open embedding cache, continuing without it",
+                path=str(path),
+                error=str(e),
+            )
+            return None
+
+        logger.debug("Embedding cache ready", path=str(path), entries=len(cache))
+        return cache
+
+    async def _cache_lookup(self, keys: list[str]) -> dict[str, list[float]]:
+        """Fetch cached vectors, treating cache failures as misses."""
+        try:
+            return await asyncio.to_thread(self.cache.get_many, keys)
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache lookup failed", error=str(e))
+            return {}
+
+    async def _cache_store(self, vectors: dict[str, list[float]]) -> None:
+        """Persist freshly computed vectors; failures only cost future hits."""
+        try:
+            await asyncio.to_thread(self.cache.put_many, vectors.items())
+        except sqlite3.Error as e:
+            logger.warning("Embedding cache update failed", error=str(e))
+
+    def _record_cache_outcome(self, hits: int, misses: int) -> None:
+        self.cache_hits += hits
+        self.cache_misses += misses
+        prometheus_metrics.EMBEDDING_CACHE_HITS.inc(hits)
+        prometheus_metrics.EMBEDDING_CACHE_MISSES.inc(misses)
+
+    def cache_stats(self) -> dict[str, int]:
+        """Return cumulative embedding cache hits and misses of this service."""
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
+
+    def close(self) -> None:
+        """Release the embedding cache."""
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
     async def _apply_rate_limit(self):
-        """Apply rate limiting between API requests."""
+        """Apply rate limiting between API requests.
+
+        Each caller reserves the next free start slot before sleeping, so
+        concurrent requests stay spaced by ``min_request_interval`` while
+        still overlapping in flight.
+        """
         current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            await asyncio.sleep(self.min_request_interval - time_since_last_request)
-        self.last_request_time = time.time()
+        start_time = max(
+            current_time, self.last_request_time + self.min_request_interval
+        )
+        self.last_request_time = start_time
+        if start_time > current_time:
+            await asyncio.sleep(start_time - current_time)
+
+    def _publish_rate_limit_metrics(self) -> None:
+        """Export the provider rate limiter's wait time and bucket fill levels."""
+        if self.rate_limiter is None:
+            return
+        stats = self.rate_limiter.stats()
+        name = stats["name"] or "default"
+        prometheus_metrics.LLM_RATE_LIMIT_WAIT.labels(limiter=name).set(
+            stats["wait_seconds"]
+        )
+        for bucket in ("rpm", "tpm"):
+            fill = stats[f"{bucket}_fill"]
+            if fill is not None:
+                prometheus_metrics.LLM_RATE_LIMIT_FILL.labels(
+                    limiter=name, bucket=bucket
+                ).set(fill)
 
     async def _retry_with_backoff(self, operation, operation_name: str, **kwargs):
         """Execute an operation with exponential backoff retry logic.
@@ -114,6 +236,9 @@ class EmbeddingService:
 
             except (
                 TimeoutError,
+                LLMTimeoutError,
+                RateLimitedError,
+                ServerError,
                 requests.exceptions.Timeout,
                 requests.exceptions.ConnectionError,
                 requests.exceptions.HTTPError,
@@ -231,23 +356,38 @@ class EmbeddingService:
                 f"⚠️ Truncated {truncated_count} content items due to token limits. You might want to adjust chunk size and/or max tokens settings in config.yaml"
             )
 
+        # Serve unchanged chunk text from the cache; only misses hit the API,
+        # and text repeated within the request is embedded once
+        to_embed = validated_contents
+        cache_keys: list[str] = []
+        miss_keys: list[str] = []
+        resolved: dict[str, list[float]] = {}
+        if self.cache is not None:
+            cache_keys = [self.cache.key_for(content) for content in validated_contents]
+            resolved = await self._cache_lookup(cache_keys)
+            to_embed = []
+            queued: set[str] = set()
+            for key, content in zip(cache_keys, validated_contents, strict=True):
+                if key not in resolved and key not in queued:
+                    queued.add(key)
+                    miss_keys.append(key)
+                    to_embed.append(content)
+            hits = sum(1 for key in cache_keys if key in resolved)
+            self._record_cache_outcome(hits, len(cache_keys) - hits)
+
         # Create smart batches that respect token limits
-        embeddings = []
+        batches: list[list[str]] = []
         current_batch = []
         current_batch_tokens = 0
-        batch_count = 0
 
-        for content in validated_contents:
+        for content in to_embed:
             content_tokens = self.count_tokens(content)
 
             # Check if adding this content would exceed the token limit
             if current_batch and (
                 current_batch_tokens + content_tokens > MAX_TOKENS_PER_REQUEST
             ):
-                # Process current batch
-                batch_count += 1
-                batch_embeddings = await self._process_batch(current_batch)
-                embeddings.extend(batch_embeddings)
+                batches.append(current_batch)
 
                 # Start new batch
                 current_batch = [content]
@@ -257,16 +397,37 @@ class EmbeddingService:
                 current_batch.append(content)
                 current_batch_tokens += content_tokens
 
-        # Process final batch if it exists
         if current_batch:
-            batch_count += 1
-            batch_embeddings = await self._process_batch(current_batch)
+            batches.append(current_batch)
+
+        # Dispatch the sub-batches concurrently; the request window bounds how
+        # many are actually in flight. Results come back in batch order.
+        batch_count = len(batches)
+        embeddings = []
+        for batch_embeddings in await self._process_batches(batches):
             embeddings.extend(batch_embeddings)
 
         logger.info(
             f"🔗 Generated embeddings: {len(embeddings)} items in {batch_count} batches"
+            + (
+                f" ({len(validated_contents) - len(to_embed)} served from cache)"
+                if self.cache is not None
+                else ""
+            )
         )
 
+        if self.cache is not None:
+            if len(embeddings) != len(miss_keys):
+                raise ValueError(
+                    "Embedding count mismatch: "
+                    f"expected {len(miss_keys)} embeddings for uncached contents, "
+                    f"got {len(embeddings)}"
+                )
+            fresh = dict(zip(miss_keys, embeddings, strict=True))
+            await self._cache_store(fresh)
+            resolved.update(fresh)
+            embeddings = [resolved[key] for key in cache_keys]
+
         if len(valid_indices) != len(embeddings):
             raise ValueError(
                 "Embedding count mismatch: "
@@ -282,6 +443,32 @@ class EmbeddingService:
             full_result[idx] = embedding
         return full_result
 
+    async def _process_batches(
+        self, batches: list[list[str]]
+    ) -> list[list[list[float]]]:
+        """Embed several batches concurrently, preserving their order.
+
+        If any batch fails, the remaining ones are cancelled and the error is
+        raised.
+
+        Args:
+            batches: Batches of content strings to embed
+
+        Returns:
+            One list of embedding vectors per input batch
+        """
+        if len(batches) <= 1:
+            return [await self._process_batch(batch) for batch in batches]
+
+        tasks = [asyncio.create_task(self._process_batch(batch)) for batch in batches]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     async def _process_batch(self, batch: list[str]) -> list[list[float]]:
         """Process a single batch of content for embeddings.
 
@@ -331,7 +518,9 @@ class EmbeddingService:
         try:
             # Use core provider for embeddings
             embeddings_client = self.provider.embeddings()
-            batch_embeddings = await embeddings_client.embed(batch)
+            async with self.request_window.slot(size=len(batch)):
+                batch_embeddings = await embeddings_client.embed(batch)
+            self._publish_rate_limit_metrics()
 
             logger.debug(
                 "Completed batch processing",
@@ -378,7 +567,9 @@ class EmbeddingService:
         try:
             await self._apply_rate_limit()
             embeddings_client = self.provider.embeddings()
-            vectors = await embeddings_client.embed([text])
+            async with self.request_window.slot():
+                vectors = await embeddings_client.embed([text])
+            self._publish_rate_limit_metrics()
             return vectors[0]
         except Exception as e:
             logger.debug(
@@ -1,5 +1,7 @@
 """Configuration models for file conversion settings."""
 
+from typing import Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -45,6 +47,28 @@ class FileConversionConfig(BaseModel):
         default_factory=MarkItDownConfig, description="MarkItDown specific settings"
     )
 
+    max_concurrent_downloads: int = Field(
+        default=8,
+        description="Attachments downloaded at once by each source",
+        ge=1,
+        le=64,
+    )
+
+    conversion_backend: Literal["thread", "process"] = Field(
+        default="thread",
+        description="Where attachments are converted: 'thread' runs MarkItDown "
+        "in threads of the ingestion process, 'process' in worker processes "
+        "shared by all sources. Use 'process' for CPU-heavy attachments such "
+        "as large PDFs and Office documents.",
+    )
+
+    conversion_workers: int | None = Field(
+        default=None,
+        description="Attachments converted at once, and the number of "
+        "processes of the 'process' backend (defaults to the CPU count)",
+        gt=0,
+    )
+
     def get_max_file_size_mb(self) -> float:
         """Get maximum file size in megabytes.
 
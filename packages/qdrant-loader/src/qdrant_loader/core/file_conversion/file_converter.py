@@ -115,13 +115,25 @@ class TimeoutHandler:
 
             self.timer = threading.Thread(target=self._timeout_thread, daemon=True)
             self.timer.start()
-        else:
+        elif self._use_signals():
             # Unix/Linux/macOS: use signal-based timeout
-            if hasattr(signal, "SIGALRM"):
-                self.old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
-                signal.alarm(self.timeout_seconds)
+            self.old_handler = signal.signal(signal.SIGALRM, self._timeout_handler)
+            signal.alarm(self.timeout_seconds)
         return self
 
+    @staticmethod
+    def _use_signals() -> bool:
+        """Whether SIGALRM can be used; signal handlers only work in the main thread.
+
+        Conversions running in worker threads are bounded by their caller.
+        """
+        import threading
+
+        return (
+            hasattr(signal, "SIGALRM")
+            and threading.current_thread() is threading.main_thread()
+        )
+
     def __exit__(self, exc_type, exc_val, _exc_tb):
         """Clean up timeout handler."""
         if sys.platform == "win32":
@@ -131,7 +143,7 @@ class TimeoutHandler:
             pass
         else:
             # Unix/Linux/macOS: clean up signal handler
-            if hasattr(signal, "SIGALRM"):
+            if self._use_signals():
                 signal.alarm(0)  # Cancel the alarm
                 if self.old_handler is not None:
                     signal.signal(signal.SIGALRM, self.old_handler)
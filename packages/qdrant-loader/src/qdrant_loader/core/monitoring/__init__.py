@@ -5,6 +5,7 @@ Monitoring package for tracking ingestion metrics and processing statistics.
 from qdrant_loader.core.monitoring.batch_summary import BatchSummary
 from qdrant_loader.core.monitoring.ingestion_metrics import (
     BatchMetrics,
+    EmbeddingCacheMetrics,
     IngestionMetrics,
     IngestionMonitor,
 )
@@ -13,6 +14,7 @@ from qdrant_loader.core.monitoring.processing_stats import ProcessingStats
 __all__ = [
     "IngestionMetrics",
     "BatchMetrics",
+    "EmbeddingCacheMetrics",
     "IngestionMonitor",
     "ProcessingStats",
     "BatchSummary",
@@ -79,6 +79,20 @@ class ConversionMetrics:
         return self.total_conversion_time / self.total_files_processed
 
 
+@dataclass
+class EmbeddingCacheMetrics:
+    """Hits and misses of the persistent embedding cache."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Percentage of chunks served from the cache."""
+        total = self.hits + self.misses
+        return (self.hits / total) * 100 if total else 0.0
+
+
 class IngestionMonitor:
     """Simple monitor for tracking ingestion metrics."""
 
@@ -99,6 +113,7 @@ class IngestionMonitor:
         self.processing_stats = ProcessingStats()
         self.batch_summary = BatchSummary()
         self.conversion_metrics = ConversionMetrics()
+        self.embedding_cache_metrics = EmbeddingCacheMetrics()
 
         # Track current operation
         self.current_operation: str | None = None
@@ -389,6 +404,16 @@ class IngestionMonitor:
 
         logger.debug(f"Updated conversion metrics for batch {batch_id}")
 
+    def record_embedding_cache(self, hits: int, misses: int) -> None:
+        """Record embedding cache hits and misses.
+
+        Args:
+            hits: Number of chunks served from the embedding cache
+            misses: Number of chunks that required an embedding request
+        """
+        self.embedding_cache_metrics.hits += hits
+        self.embedding_cache_metrics.misses += misses
+
     def get_conversion_summary(self) -> dict:
         """Get a summary of all conversion metrics."""
         return {
@@ -476,6 +501,11 @@ class IngestionMonitor:
                 "error_types": dict(self.conversion_metrics.error_types),
                 "summary": self.get_conversion_summary(),
             },
+            "embedding_cache_metrics": {
+                "hits": self.embedding_cache_metrics.hits,
+                "misses": self.embedding_cache_metrics.misses,
+                "hit_rate": self.embedding_cache_metrics.hit_rate,
+            },
         }
 
         try:
@@ -492,6 +522,7 @@ class IngestionMonitor:
         self.processing_stats = ProcessingStats()
         self.batch_summary = BatchSummary()
         self.conversion_metrics = ConversionMetrics()
+        self.embedding_cache_metrics = EmbeddingCacheMetrics()
         self.current_operation = None
         self.current_batch = None
         logger.debug("Cleared all metrics")
@@ -19,12 +19,86 @@ EMBEDDING_DURATION = Histogram(
 UPSERT_DURATION = Histogram(
     "qdrant_upsert_duration_seconds", "Time spent upserting to Qdrant"
 )
-CHUNK_QUEUE_SIZE = Gauge("qdrant_chunk_queue_size", "Current size of the chunk queue")
+UPSERT_IN_FLIGHT = Gauge(
+    "qdrant_upsert_in_flight_requests", "Upsert requests currently in flight"
+)
+CHUNK_QUEUE_SIZE = Gauge(
+    "qdrant_chunk_queue_size",
+    "Current size of the chunk queue (fetched documents waiting to be processed)",
+)
 EMBED_QUEUE_SIZE = Gauge(
-    "qdrant_embed_queue_size", "Current size of the embedding queue"
+    "qdrant_embed_queue_size",
+    "Current size of the embedding queue (chunks buffered or in flight)",
+)
+PIPELINE_STALL_SECONDS = Counter(
+    "qdrant_pipeline_stall_seconds_total",
+    "Time a pipeline stage spent waiting: 'source' when document processing "
+    "waits for fetched batches, 'processing' when fetching waits for room in "
+    "the prefetch buffer",
+    ["stage"],
+)
+EMBED_CONCURRENCY_LIMIT = Gauge(
+    "qdrant_embed_concurrency_limit",
+    "Current adaptive limit of concurrent embedding requests",
+)
+EMBED_IN_FLIGHT = Gauge(
+    "qdrant_embed_in_flight_requests", "Embedding requests currently in flight"
+)
+LLM_RATE_LIMIT_WAIT = Gauge(
+    "qdrant_llm_rate_limit_wait_seconds",
+    "Most recent wait imposed by the provider RPM/TPM rate limiter",
+    ["limiter"],
+)
+LLM_RATE_LIMIT_FILL = Gauge(
+    "qdrant_llm_rate_limit_bucket_fill_ratio",
+    "Remaining RPM/TPM budget of the provider rate limiter (1.0 = full)",
+    ["limiter", "bucket"],
+)
+EMBEDDING_CACHE_HITS = Counter(
+    "qdrant_embedding_cache_hits_total",
+    "Chunks whose embedding was served from the persistent cache",
+)
+EMBEDDING_CACHE_MISSES = Counter(
+    "qdrant_embedding_cache_misses_total",
+    "Chunks whose embedding had to be requested from the provider",
+)
+ATTACHMENT_STAGE_ITEMS = Counter(
+    "qdrant_attachment_stage_items_total",
+    "Attachments that went through a stage of the attachment pipeline "
+    "('download' or 'convert')",
+    ["stage", "outcome"],
+)
+ATTACHMENT_STAGE_BYTES = Counter(
+    "qdrant_attachment_stage_bytes_total",
+    "Bytes of the attachments that went through a stage",
+    ["stage"],
+)
+ATTACHMENT_STAGE_DURATION = Histogram(
+    "qdrant_attachment_stage_duration_seconds",
+    "Time an attachment held a slot of a stage",
+    ["stage"],
+)
+ATTACHMENT_STAGE_WAITING = Gauge(
+    "qdrant_attachment_stage_waiting",
+    "Attachments waiting for a slot of a stage",
+    ["stage"],
+)
+ATTACHMENT_STAGE_IN_FLIGHT = Gauge(
+    "qdrant_attachment_stage_in_flight",
+    "Attachments currently holding a slot of a stage",
+    ["stage"],
+)
+ATTACHMENT_DEDUPLICATED = Counter(
+    "qdrant_attachment_deduplicated_total",
+    "Attachments whose converted text was reused from another document",
 )
 CPU_USAGE = Gauge("qdrant_cpu_usage_percent", "CPU usage percent")
 MEMORY_USAGE = Gauge("qdrant_memory_usage_percent", "Memory usage percent")
+MODELS_LOADED = Gauge(
+    "qdrant_models_loaded",
+    "Number of NLP models, tokenizers and chunking strategies loaded by this process",
+    ["kind"],
+)
 
 _metrics_server_thread: threading.Thread | None = None
 _metrics_server_started = False
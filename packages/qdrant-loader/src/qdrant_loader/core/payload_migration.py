@@ -0,0 +1,130 @@
+"""Migration of stored payloads to the configured payload layout.
+
+Points keep the payload they were written with until they are ingested
+again. A migration rewrites the payload of every point of the collection in
+place, without touching its vectors: filterable fields move to the top level,
+analysis fields move to the side collection or are dropped, as configured.
+The payload indexes are then brought in line with the layout. A migration
+can be interrupted and run again; points already migrated are skipped.
+"""
+
+from typing import Any
+
+from qdrant_client.http import models
+from qdrant_loader_core.config import migrate_payload
+
+from qdrant_loader.core.qdrant_manager import QdrantManager
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+async def migrate_collection_payloads(
+    manager: QdrantManager, batch_size: int = 256
+) -> int:
+    """Lay out the payload of every point of the collection anew.
+
+    Args:
+        manager: Manager of the collection to migrate
+        batch_size: Points read and rewritten per request
+
+    Returns:
+        Number of points whose payload changed
+    """
+    layout = manager.payload_layout
+    client = manager._get_async_client()
+    if manager.uses_analysis_store:
+        manager._create_analysis_collection(manager._ensure_client_connected())
+
+    logger.info(
+        "Migrating payloads",
+        collection=manager.collection_name,
+        version=layout.version,
+        analysis_fields=layout.analysis_fields,
+    )
+    migrated = scanned = 0
+    offset: Any = None
+    while True:
+        records, offset = await client.scroll(
+            collection_name=manager.collection_name,
+            limit=batch_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False,
+        )
+        operations: list[Any] = []
+        analysis_points: list[models.PointStruct] = []
+        for record in records:
+            payload = record.payload or {}
+            new_payload, analysis = migrate_payload(payload, layout)
+            if new_payload == payload:
+                continue
+            operations.append(
+                models.OverwritePayloadOperation(
+                    overwrite_payload=models.SetPayload(
+                        payload=new_payload, points=[record.id]
+                    )
+                )
+            )
+            if analysis:
+                analysis_points.append(
+                    models.PointStruct(
+                        id=record.id,
+                        vector={},
+                        payload={
+                            "document_id": payload.get("document_id"),
+                            **analysis,
+                        },
+                    )
+                )
+        # Analysis fields are stored before they leave the payload
+        if analysis_points:
+            await manager.upsert_analysis(analysis_points)
+        if operations:
+            await client.batch_update_points(
+                collection_name=manager.collection_name,
+                update_operations=operations,
+                wait=True,
+            )
+        migrated += len(operations)
+        scanned += len(records)
+        logger.info("Migrated payloads", scanned=scanned, migrated=migrated)
+        if offset is None:
+            break
+
+    await _update_payload_indexes(manager, client)
+    logger.info(
+        "Payload migration completed",
+        collection=manager.collection_name,
+        scanned=scanned,
+        migrated=migrated,
+    )
+    return migrated
+
+
+async def _update_payload_indexes(manager: QdrantManager, client: Any) -> None:
+    """Create the payload indexes of the layout, replacing mistyped ones."""
+    info = await client.get_collection(collection_name=manager.collection_name)
+    existing = getattr(info, "payload_schema", None) or {}
+    for field_name, field_schema in manager.payload_indexes():
+        current = existing.get(field_name)
+        data_type = getattr(getattr(current, "data_type", None), "value", None)
+        if data_type == field_schema["type"]:
+            continue
+        try:
+            if current is not None:
+                await client.delete_payload_index(
+                    collection_name=manager.collection_name,
+                    field_name=field_name,
+                    wait=True,
+                )
+            await client.create_payload_index(
+                collection_name=manager.collection_name,
+                field_name=field_name,
+                field_schema=field_schema,  # type: ignore
+                wait=True,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to update payload index", field=field_name, error=str(e)
+            )
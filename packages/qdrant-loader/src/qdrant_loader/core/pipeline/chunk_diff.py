@@ -0,0 +1,144 @@
+"""Chunk-level diffing between the stored and the current chunk set of documents."""
+
+import hashlib
+from collections.abc import AsyncIterator
+from typing import Any
+
+from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def chunk_content_hash(chunk: Any) -> str:
+    """Hash the parts of a chunk that end up in its vector or text payload."""
+    digest = hashlib.sha256()
+    for part in (
+        chunk.content,
+        getattr(chunk, "contextual_content", None) or "",
+        getattr(chunk, "title", None) or "",
+    ):
+        digest.update(str(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class ChunkDiff:
+    """Per-batch bookkeeping that lets updated documents skip unchanged chunks.
+
+    The diff sits between chunking and embedding. It hashes every chunk,
+    drops the ones whose hash matches the stored state (when
+    ``skip_unchanged`` is set) and remembers the full current chunk set so
+    that disappeared point IDs can be deleted and the state replaced once the
+    batch has been upserted. The hash leaves out the document metadata, so
+    the dropped chunks are kept for their payload to be rewritten: a
+    document updated only in its metadata then costs no embedding.
+    """
+
+    def __init__(
+        self,
+        previous: dict[str, dict[str, str]] | None = None,
+        skip_unchanged: bool = True,
+    ):
+        """Initialize the diff.
+
+        Args:
+            previous: Stored ``{document_id: {chunk_id: content_hash}}``
+            skip_unchanged: Drop chunks whose content hash did not change
+        """
+        self.previous = dict(previous or {})
+        self.skip_unchanged = skip_unchanged
+        self.documents: dict[str, Document] = {}
+        self.current: dict[str, dict[str, tuple[int, str]]] = {}
+        self.unchanged: dict[str, set[str]] = {}
+        # Chunks skipped as unchanged, whose payload may still be outdated
+        self.unchanged_chunks: list[Any] = []
+
+    @property
+    def skipped_count(self) -> int:
+        """Number of chunks that were not sent to embedding."""
+        return sum(len(chunk_ids) for chunk_ids in self.unchanged.values())
+
+    async def filter_chunks(self, chunks: AsyncIterator[Any]) -> AsyncIterator[Any]:
+        """Yield only the chunks that are new or changed.
+
+        Args:
+            chunks: AsyncIterator of chunks from the chunking worker
+
+        Yields:
+            Chunks that need to be embedded and upserted
+        """
+        async for chunk in chunks:
+            document = chunk.metadata.get("parent_document")
+            if document is None:
+                yield chunk
+                continue
+
+            chunk_id = str(chunk.id)
+            content_hash = chunk_content_hash(chunk)
+            index = chunk.metadata.get("chunk_index")
+            self.documents[document.id] = document
+            current = self.current.setdefault(document.id, {})
+            current[chunk_id] = (
+                index if isinstance(index, int) else len(current),
+                content_hash,
+            )
+
+            if (
+                self.skip_unchanged
+                and self.previous.get(document.id, {}).get(chunk_id) == content_hash
+            ):
+                self.unchanged.setdefault(document.id, set()).add(chunk_id)
+                self.unchanged_chunks.append(chunk)
+                continue
+            yield chunk
+
+        if self.skipped_count:
+            logger.info(
+                f"♻️ Skipped {self.skipped_count} unchanged chunks across "
+                f"{len(self.unchanged)} documents"
+            )
+
+    def unchanged_documents(self) -> set[str]:
+        """Documents whose every current chunk was skipped as unchanged."""
+        return {
+            document_id
+            for document_id, chunks in self.current.items()
+            if chunks and len(self.unchanged.get(document_id, ())) == len(chunks)
+        }
+
+    def stale_point_ids(self, document_ids: set[str]) -> list[str]:
+        """Point IDs stored for ``document_ids`` that no longer have a chunk."""
+        stale: list[str] = []
+        for document_id in document_ids:
+            if document_id not in self.current:
+                continue
+            current = self.current[document_id]
+            stale.extend(
+                chunk_id
+                for chunk_id in self.previous.get(document_id, {})
+                if chunk_id not in current
+            )
+        return stale
+
+    def chunk_states(
+        self, document_ids: set[str], upserted_chunk_ids: set[str]
+    ) -> dict[str, dict[str, tuple[int, str]]]:
+        """Chunk states to persist for ``document_ids``.
+
+        Only chunks that were upserted or skipped as unchanged are included;
+        a chunk lost to an embedding failure is left out so the next run sees
+        it as new.
+        """
+        states: dict[str, dict[str, tuple[int, str]]] = {}
+        for document_id in document_ids:
+            current = self.current.get(document_id)
+            if current is None:
+                continue
+            unchanged = self.unchanged.get(document_id, set())
+            states[document_id] = {
+                chunk_id: state
+                for chunk_id, state in current.items()
+                if chunk_id in upserted_chunk_ids or chunk_id in unchanged
+            }
+        return states
@@ -13,3 +13,13 @@ class PipelineConfig:
     queue_size: int = 1000
     upsert_batch_size: int | None = None
     enable_metrics: bool = False
+    # Source batches fetched ahead of document processing (0 disables)
+    prefetch_batches: int = 2
+    # Ceiling on the approximate size of prefetched document contents
+    prefetch_max_bytes: int | None = 256 * 1024 * 1024
+    # Sources fetched at the same time, across all projects
+    max_concurrent_sources: int = 4
+    # Sources of one connector type fetched at the same time
+    max_concurrent_sources_per_type: int = 2
+    # Projects ingested at the same time
+    max_concurrent_projects: int = 2
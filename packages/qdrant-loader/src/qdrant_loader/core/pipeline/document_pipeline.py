@@ -7,6 +7,7 @@ from dataclasses import dataclass
 from qdrant_loader.core.document import Document
 from qdrant_loader.utils.logging import LoggingConfig
 
+from .chunk_diff import ChunkDiff
 from .workers import ChunkingWorker, EmbeddingWorker, UpsertWorker
 from .workers.upsert_worker import PipelineResult
 
@@ -22,6 +23,7 @@ class BatchResult:
     skipped_count: int = 0
     successfully_processed_documents: set[str] | None = None
     failed_document_ids: set[str] | None = None
+    upserted_chunk_ids: set[str] | None = None
     errors: list[str] | None = None
 
     def __post_init__(self) -> None:
@@ -29,6 +31,8 @@ class BatchResult:
             self.successfully_processed_documents = set()
         if self.failed_document_ids is None:
             self.failed_document_ids = set()
+        if self.upserted_chunk_ids is None:
+            self.upserted_chunk_ids = set()
         if self.errors is None:
             self.errors = []
 
@@ -46,11 +50,15 @@ class DocumentPipeline:
         self.embedding_worker = embedding_worker
         self.upsert_worker = upsert_worker
 
-    async def process_batch(self, batch: list[Document]) -> BatchResult:
+    async def process_batch(
+        self, batch: list[Document], chunk_diff: ChunkDiff | None = None
+    ) -> BatchResult:
         """Process a bounded batch of documents through the pipeline.
 
         Args:
             batch: List of documents to process (bounded size, typically 256)
+            chunk_diff: Optional chunk diff; unchanged chunks are then neither
+                embedded nor upserted
 
         Returns:
             BatchResult with processing statistics.
@@ -62,6 +70,8 @@ class DocumentPipeline:
             logger.debug("🔄 Starting chunking phase for batch...")
             chunking_start = time.time()
             chunks_iter = self.chunking_worker.process_documents(batch)
+            if chunk_diff is not None:
+                chunks_iter = chunk_diff.filter_chunks(chunks_iter)
 
             logger.debug("🔄 Chunking completed, transitioning to embedding phase...")
             chunking_duration = time.time() - chunking_start
@@ -95,12 +105,20 @@ class DocumentPipeline:
                 f"{pipeline_result.error_count} errors in {total_duration:.2f}s"
             )
 
+            skipped_count = 0
+            if chunk_diff is not None:
+                await self._apply_unchanged_chunks(chunk_diff, pipeline_result)
+                skipped_count = chunk_diff.skipped_count
+
             return BatchResult(
                 success_count=pipeline_result.success_count,
                 failure_count=pipeline_result.error_count,
-                skipped_count=0,
-                successfully_processed_documents=pipeline_result.successfully_processed_documents,
+                skipped_count=skipped_count,
+                successfully_processed_documents=set(
+                    pipeline_result.successfully_processed_documents
+                ),
                 failed_document_ids=pipeline_result.failed_document_ids,
+                upserted_chunk_ids=pipeline_result.upserted_chunk_ids,
                 errors=pipeline_result.errors,
             )
 
@@ -115,11 +133,15 @@ class DocumentPipeline:
                 errors=[f"Batch processing failed: {e}"],
             )
 
-    async def process_documents(self, documents: list[Document]) -> PipelineResult:
+    async def process_documents(
+        self, documents: list[Document], chunk_diff: ChunkDiff | None = None
+    ) -> PipelineResult:
         """Process documents through the pipeline.
 
         Args:
             documents: List of documents to process
+            chunk_diff: Optional chunk diff; unchanged chunks are then neither
+                embedded nor upserted
 
         Returns:
             PipelineResult with processing statistics
@@ -131,6 +153,8 @@ class DocumentPipeline:
             logger.info("🔄 Starting chunking phase...")
             chunking_start = time.time()
             chunks_iter = self.chunking_worker.process_documents(documents)
+            if chunk_diff is not None:
+                chunks_iter = chunk_diff.filter_chunks(chunks_iter)
 
             logger.info("🔄 Chunking completed, transitioning to embedding phase...")
             chunking_duration = time.time() - chunking_start
@@ -165,6 +189,9 @@ class DocumentPipeline:
                 f"{result.error_count} errors"
             )
 
+            if chunk_diff is not None:
+                await self._apply_unchanged_chunks(chunk_diff, result)
+
             return result
 
         except Exception as e:
@@ -177,3 +204,22 @@ class DocumentPipeline:
             result.error_count = len(documents)
             result.errors = [f"Pipeline failed: {e}"]
             return result
+
+    async def _apply_unchanged_chunks(
+        self, chunk_diff: ChunkDiff, result: PipelineResult
+    ) -> None:
+        """Bring the chunks skipped by the diff up to date in the result.
+
+        The payload of skipped chunks is rewritten, since the document hash
+        covers metadata that the chunk hash leaves out. Documents without a
+        changed chunk never reach the upsert worker and are added here.
+        """
+        failed_documents, errors = await self.upsert_worker.update_payloads(
+            chunk_diff.unchanged_chunks
+        )
+        result.successfully_processed_documents |= (
+            chunk_diff.unchanged_documents() - result.failed_document_ids
+        )
+        result.successfully_processed_documents -= failed_documents
+        result.failed_document_ids |= failed_documents
+        result.errors.extend(errors)
@@ -1,10 +1,12 @@
 """Factory for creating pipeline components."""
 
 import concurrent.futures
+import os
 from pathlib import Path
 
 from qdrant_loader.config import Settings
 from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import ChunkingProcessPool
 from qdrant_loader.core.embedding.embedding_service import EmbeddingService
 from qdrant_loader.core.monitoring.ingestion_metrics import IngestionMonitor
 from qdrant_loader.core.qdrant_manager import QdrantManager
@@ -60,12 +62,24 @@ class PipelineComponentsFactory:
         chunking_service = ChunkingService(
             config=settings.global_config, settings=settings
         )
-        embedding_service = EmbeddingService(settings)
-
-        # Create thread pool executor for chunking
-        chunk_executor = concurrent.futures.ThreadPoolExecutor(
-            max_workers=config.max_chunk_workers
+        embedding_service = EmbeddingService(
+            settings, max_concurrent_requests=config.max_embed_workers
         )
+
+        # Create the chunking executor: threads by default, worker processes
+        # when the chunking backend is "process"
+        chunking_config = settings.global_config.chunking
+        chunk_executor: concurrent.futures.Executor
+        if chunking_config.backend == "process":
+            process_workers = chunking_config.process_workers or os.cpu_count() or 1
+            chunk_executor = ChunkingProcessPool(settings, process_workers)
+            # Keep enough documents in flight to feed every process
+            chunk_workers = max(config.max_chunk_workers, process_workers)
+        else:
+            chunk_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=config.max_chunk_workers
+            )
+            chunk_workers = config.max_chunk_workers
         resource_manager.set_chunk_executor(chunk_executor)
 
         # Create performance monitor
@@ -84,7 +98,7 @@ class PipelineComponentsFactory:
         chunking_worker = ChunkingWorker(
             chunking_service=chunking_service,
             chunk_executor=chunk_executor,
-            max_workers=config.max_chunk_workers,
+            max_workers=chunk_workers,
             queue_size=config.queue_size,
             shutdown_event=resource_manager.shutdown_event,
         )
@@ -1,11 +1,13 @@
 """Main orchestrator for the ingestion pipeline."""
 
+import asyncio
 import traceback
 from collections.abc import AsyncIterator
+from contextlib import aclosing
 from datetime import datetime
 
 from qdrant_loader.config import Settings, SourcesConfig
-from qdrant_loader.connectors.base import ConnectorConfigurationError
+from qdrant_loader.connectors.base import ConnectorConfigurationError, FileStat
 from qdrant_loader.connectors.factory import get_connector_instance
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.project_manager import ProjectManager
@@ -15,9 +17,13 @@ from qdrant_loader.core.state.state_manager import StateManager
 from qdrant_loader.utils.logging import LoggingConfig
 from qdrant_loader.utils.sensitive import sanitize_exception_message
 
+from .chunk_diff import ChunkDiff
+from .config import PipelineConfig
 from .document_pipeline import DocumentPipeline
+from .prefetch import prefetch_batches
 from .source_filter import SourceFilter
 from .source_processor import SourceProcessor
+from .source_scheduler import SourceRun, SourceScheduler, log_source_runs
 from .workers.upsert_worker import PipelineResult
 
 logger = LoggingConfig.get_logger(__name__)
@@ -49,10 +55,18 @@ class PipelineOrchestrator:
         settings: Settings,
         components: PipelineComponents,
         project_manager: ProjectManager | None = None,
+        pipeline_config: PipelineConfig | None = None,
     ):
         self.settings = settings
         self.components = components
         self.project_manager = project_manager
+        self.pipeline_config = pipeline_config or PipelineConfig()
+        self.source_scheduler = SourceScheduler(
+            components.source_processor,
+            max_concurrent_sources=self.pipeline_config.max_concurrent_sources,
+            max_concurrent_per_type=self.pipeline_config.max_concurrent_sources_per_type,
+            queue_size=self.pipeline_config.queue_size,
+        )
         self.last_pipeline_result = None
 
     async def _stream_batches_from_sources(
@@ -62,31 +76,31 @@ class PipelineOrchestrator:
         since: datetime | None = None,
         project_id: str | None = None,
         seen_uris: set[str] | None = None,
+        source_runs: list[SourceRun] | None = None,
+        sync_cursors: dict[tuple[str, str], str] | None = None,
+        file_stats: dict[tuple[str, str], dict[str, FileStat]] | None = None,
     ) -> AsyncIterator[list[Document]]:
         """Stream source documents in bounded micro-batches.
 
-        This helper collects documents from each source type and yields
-        batches of a fixed size, keeping memory usage bounded.
+        Documents of all sources, fetched concurrently by the source
+        scheduler, are collected into batches of a fixed size, keeping memory
+        usage bounded.
         """
         batch: list[Document] = []
 
-        # Note: previous implementation contained vestigial async inner
-        # helpers `_flush_batch` and `_append_document` which attempted to
-        # yield from inside non-generator contexts. These were dead code
-        # and confusing. Batching is handled inline in `_process_source_type`.
-
-        async def _process_source_type(source_type_name: str, source_configs):
-            if not source_configs:
-                return
-
-            async for (
-                document
-            ) in self.components.source_processor.stream_source_documents(
-                source_configs,
-                get_connector_instance,
-                source_type_name,
-                since=since,
-            ):
+        # Independent sources are fetched concurrently and their documents
+        # merged into one batch stream
+        documents = self.source_scheduler.stream_documents(
+            filtered_config,
+            get_connector_instance,
+            since=since,
+            project_id=project_id,
+            runs=source_runs,
+            sync_cursors=sync_cursors,
+            file_stats=file_stats,
+        )
+        async with aclosing(documents):
+            async for document in documents:
                 # Inject project metadata when running with project context
                 if project_id and self.project_manager:
                     try:
@@ -116,34 +130,6 @@ class PipelineOrchestrator:
                     yield batch.copy()
                     batch.clear()
 
-        if filtered_config.confluence:
-            async for yielded_batch in _process_source_type(
-                "Confluence", filtered_config.confluence
-            ):
-                yield yielded_batch
-
-        if filtered_config.git:
-            async for yielded_batch in _process_source_type("Git", filtered_config.git):
-                yield yielded_batch
-
-        if filtered_config.jira:
-            async for yielded_batch in _process_source_type(
-                "Jira", filtered_config.jira
-            ):
-                yield yielded_batch
-
-        if filtered_config.publicdocs:
-            async for yielded_batch in _process_source_type(
-                "PublicDocs", filtered_config.publicdocs
-            ):
-                yield yielded_batch
-
-        if filtered_config.localfile:
-            async for yielded_batch in _process_source_type(
-                "LocalFile", filtered_config.localfile
-            ):
-                yield yielded_batch
-
         if batch:
             yield batch
 
@@ -230,134 +216,222 @@ class PipelineOrchestrator:
             ):
                 raise ValueError(f"No sources found for type '{source_type}'")
 
-            # Stream documents in bounded micro-batches and process each batch
-            total_documents = 0
-            processed_documents: list[Document] = []
-            aggregated_result = PipelineResult()
-            batch_count = 0
-
-            if not force and not self.components.state_manager._initialized:
-                logger.debug("Initializing state manager for change detection")
-                await self.components.state_manager.initialize()
+            documents, pipeline_result = await self._ingest_sources(
+                filtered_config, current_project_id, force, since
+            )
+            # Set without awaiting in between, so that concurrent project
+            # runs each read back their own result
+            self.last_pipeline_result = pipeline_result
+            return documents
 
-            change_detector = None
-            if not force:
-                change_detector = await StateChangeDetector(
-                    self.components.state_manager
-                ).__aenter__()
+        except Exception as e:
+            logger.error(
+                f"❌ Pipeline orchestration failed: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+                sanitized_traceback=sanitize_exception_message(traceback.format_exc()),
+            )
+            raise
 
-            seen_uris: set[str] = set()
-            try:
-                # Prefer calling the new signature but fall back to the
-                # legacy 3-arg signature for backwards compatibility / tests.
-                try:
-                    stream_iter = self._stream_batches_from_sources(
-                        filtered_config,
-                        256,
-                        since,
-                        project_id=current_project_id,
-                        seen_uris=seen_uris,
-                    )
-                except TypeError:
-                    # Callable likely expects the old signature
-                    stream_iter = self._stream_batches_from_sources(
-                        filtered_config, 256, since
-                    )
+    async def _ingest_sources(
+        self,
+        filtered_config: SourcesConfig,
+        current_project_id: str | None,
+        force: bool,
+        since: datetime | None,
+    ) -> tuple[list[Document], PipelineResult]:
+        """Stream the configured sources through the document pipeline.
 
-                async for batch in stream_iter:
-                    total_documents += len(batch)
-                    batch_count += 1
+        Returns:
+            The processed documents and the aggregated pipeline result
+        """
+        # Stream documents in bounded micro-batches and process each batch
+        total_documents = 0
+        processed_documents: list[Document] = []
+        aggregated_result = PipelineResult()
+        batch_count = 0
 
-                    if not force and change_detector is not None:
-                        batch = await change_detector.classify_batch(
-                            batch, filtered_config, current_project_id
-                        )
+        if not force and not self.components.state_manager._initialized:
+            logger.debug("Initializing state manager for change detection")
+            await self.components.state_manager.initialize()
 
-                    if not batch:
-                        continue
+        change_detector = None
+        if not force:
+            change_detector = await StateChangeDetector(
+                self.components.state_manager
+            ).__aenter__()
+
+        seen_uris: set[str] = set()
+        source_runs: list[SourceRun] = []
+        # Sources whose documents failed; their sync cursors are not advanced
+        failed_sources: set[tuple[str, str]] = set()
+        sync_cursors = (
+            None if force else await self._load_sync_cursors(current_project_id)
+        )
+        # Loaded in force mode too, so stats of vanished files get dropped
+        file_stats = await self._load_file_stats(current_project_id)
+        # Documents that failed, including failed deletions; their files keep
+        # the stats of the previous run
+        failed_document_ids: set[str] = set()
+        prefetched = None
+        try:
+            # Prefer calling the new signature but fall back to the
+            # legacy 3-arg signature for backwards compatibility / tests.
+            try:
+                stream_iter = self._stream_batches_from_sources(
+                    filtered_config,
+                    256,
+                    since,
+                    project_id=current_project_id,
+                    seen_uris=seen_uris,
+                    source_runs=source_runs,
+                    sync_cursors=sync_cursors,
+                    file_stats=None if force else file_stats,
+                )
+            except TypeError:
+                # Callable likely expects the old signature
+                stream_iter = self._stream_batches_from_sources(
+                    filtered_config, 256, since
+                )
 
-                    batch_result = (
-                        await self.components.document_pipeline.process_batch(batch)
-                    )
-                    aggregated_result.success_count += batch_result.success_count
-                    aggregated_result.error_count += batch_result.failure_count
-                    aggregated_result.errors.extend(batch_result.errors)
-                    aggregated_result.successfully_processed_documents.update(
-                        batch_result.successfully_processed_documents
-                    )
-                    aggregated_result.failed_document_ids.update(
-                        batch_result.failed_document_ids
-                    )
+            # Fetch the next batches while the current one is processed
+            prefetched = prefetch_batches(
+                stream_iter,
+                depth=self.pipeline_config.prefetch_batches,
+                max_bytes=self.pipeline_config.prefetch_max_bytes,
+            )
 
-                    if batch_result.successfully_processed_documents:
-                        await self._update_document_states(
-                            batch,
-                            batch_result.successfully_processed_documents,
-                            current_project_id,
+            async for batch in prefetched:
+                total_documents += len(batch)
+                batch_count += 1
+
+                # Connectors that list changes incrementally report deleted
+                # documents explicitly
+                deleted = [doc for doc in batch if getattr(doc, "is_deleted", False)]
+                if deleted:
+                    batch = [
+                        doc for doc in batch if not getattr(doc, "is_deleted", False)
+                    ]
+                    try:
+                        await self._process_deleted_documents(
+                            deleted, current_project_id
                         )
-                        processed_documents.extend(
-                            [
-                                doc
-                                for doc in batch
-                                if doc.id
-                                in batch_result.successfully_processed_documents
-                            ]
+                    except Exception:
+                        failed_sources.update(
+                            (doc.source_type, doc.source) for doc in deleted
                         )
+                        failed_document_ids.update(doc.id for doc in deleted)
 
-                if total_documents == 0 and not force:
-                    logger.warning(
-                        "⚠️ EMPTY SNAPSHOT in non-force mode. About to enter change detection "
-                        "which may classify existing corpus as deleted if source API returned partial/null results. "
-                        "This is a known risk (WS-3: add explicit snapshot_is_complete signal or per-source enable_deletion_detection). "
-                        "Proceeding carefully."
+                if not force and change_detector is not None:
+                    batch = await change_detector.classify_batch(
+                        batch, filtered_config, current_project_id
                     )
 
-                if total_documents == 0 and force:
-                    logger.info("✅ No documents found from sources")
-                    return []
+                if not batch:
+                    continue
 
-                if not force and not processed_documents:
-                    self.last_pipeline_result = aggregated_result
-                    if aggregated_result.error_count > 0:
-                        logger.error(
-                            "No documents were successfully processed",
-                            error_count=aggregated_result.error_count,
-                        )
-                    else:
-                        logger.info("No new or updated documents to process")
-                    return []
-
-                    # Deletion detection / reconciliation note:
-                    # Streaming classification only detects new/updated documents
-                    # per-batch. Full deletion detection (documents present in the
-                    # state DB but absent from the current snapshot across all
-                    # batches) requires a post-stream reconciliation (WS-3).
-                    # For now we only log that reconciliation is possible and
-                    # record the set of seen URIs; implementors can enable a
-                    # reconciliation pass that compares previous state URIs to
-                    # `seen_uris` and call `_process_deleted_documents`.
-                    if not force:
-                        logger.debug(
-                            "Post-stream reconciliation not enabled. Seen URIs collected for potential WS-3 reconciliation",
-                            seen_count=len(seen_uris),
+                chunk_diff = await self._load_chunk_diff(
+                    batch, current_project_id, skip_unchanged=not force
+                )
+                batch_result = await self.components.document_pipeline.process_batch(
+                    batch, chunk_diff=chunk_diff
+                )
+                aggregated_result.success_count += batch_result.success_count
+                aggregated_result.error_count += batch_result.failure_count
+                aggregated_result.errors.extend(batch_result.errors)
+                aggregated_result.successfully_processed_documents.update(
+                    batch_result.successfully_processed_documents
+                )
+                aggregated_result.failed_document_ids.update(
+                    batch_result.failed_document_ids
+                )
+                failed_sources.update(
+                    (doc.source_type, doc.source)
+                    for doc in batch
+                    if doc.id in batch_result.failed_document_ids
+                )
+                failed_document_ids.update(batch_result.failed_document_ids)
+
+                if batch_result.successfully_processed_documents:
+                    await self._update_document_states(
+                        batch,
+                        batch_result.successfully_processed_documents,
+                        current_project_id,
+                    )
+                    if chunk_diff is not None:
+                        await self._apply_chunk_diff(
+                            chunk_diff, batch_result, current_project_id
                         )
+                    processed_documents.extend(
+                        [
+                            doc
+                            for doc in batch
+                            if doc.id in batch_result.successfully_processed_documents
+                        ]
+                    )
 
-                self.last_pipeline_result = aggregated_result
-                logger.info(
-                    f"✅ Ingestion completed: {aggregated_result.success_count} chunks processed successfully"
+            for run in source_runs:
+                if run.error is not None:
+                    failed_sources.add((run.source_type.lower(), run.source))
+                    aggregated_result.errors.append(
+                        f"{run.source_type} source {run.source}: {run.error}"
+                    )
+            aggregated_result.failed_sources = failed_sources
+
+            await self._store_sync_cursors(
+                source_runs, failed_sources, current_project_id
+            )
+            await self._store_file_stats(
+                source_runs, file_stats, failed_document_ids, current_project_id
+            )
+
+            if total_documents == 0 and not force:
+                logger.warning(
+                    "⚠️ EMPTY SNAPSHOT in non-force mode. About to enter change detection "
+                    "which may classify existing corpus as deleted if source API returned partial/null results. "
+                    "This is a known risk (WS-3: add explicit snapshot_is_complete signal or per-source enable_deletion_detection). "
+                    "Proceeding carefully."
                 )
-                return processed_documents
-            finally:
-                if change_detector is not None:
-                    await change_detector.__aexit__(None, None, None)
 
-        except Exception as e:
-            logger.error(
-                f"❌ Pipeline orchestration failed: {sanitize_exception_message(e)}",
-                error_type=type(e).__name__,
-                sanitized_traceback=sanitize_exception_message(traceback.format_exc()),
+            if total_documents == 0 and force:
+                logger.info("✅ No documents found from sources")
+                return [], aggregated_result
+
+            if not force and not processed_documents:
+                if aggregated_result.error_count > 0:
+                    logger.error(
+                        "No documents were successfully processed",
+                        error_count=aggregated_result.error_count,
+                    )
+                else:
+                    logger.info("No new or updated documents to process")
+                return [], aggregated_result
+
+                # Deletion detection / reconciliation note:
+                # Streaming classification only detects new/updated documents
+                # per-batch. Full deletion detection (documents present in the
+                # state DB but absent from the current snapshot across all
+                # batches) requires a post-stream reconciliation (WS-3).
+                # For now we only log that reconciliation is possible and
+                # record the set of seen URIs; implementors can enable a
+                # reconciliation pass that compares previous state URIs to
+                # `seen_uris` and call `_process_deleted_documents`.
+                if not force:
+                    logger.debug(
+                        "Post-stream reconciliation not enabled. Seen URIs collected for potential WS-3 reconciliation",
+                        seen_count=len(seen_uris),
+                    )
+
+            logger.info(
+                f"✅ Ingestion completed: {aggregated_result.success_count} chunks processed successfully"
             )
-            raise
+            return processed_documents, aggregated_result
+        finally:
+            # Stop the background fetch if processing ended early
+            if prefetched is not None:
+                await prefetched.aclose()
+            log_source_runs(source_runs)
+            if change_detector is not None:
+                await change_detector.__aexit__(None, None, None)
 
     async def _process_all_projects(
         self,
@@ -374,74 +448,95 @@ class PipelineOrchestrator:
         aggregated_result = PipelineResult()
         failed_projects: list[str] = []
         project_ids = self.project_manager.list_project_ids()
+        # Projects share the document pipeline workers and the source limits
+        # of the scheduler; this bounds how many are ingested at once
+        project_limit = asyncio.Semaphore(
+            max(1, self.pipeline_config.max_concurrent_projects)
+        )
 
         logger.info(f"Processing {len(project_ids)} projects")
 
-        for project_id in project_ids:
-            try:
-                logger.debug(f"Processing project: {project_id}")
-                project_documents = await self.process_documents(
-                    project_id=project_id,
-                    source_type=source_type,
-                    source=source,
-                    force=force,
-                    since=since,
-                )
-                project_result = self.last_pipeline_result
-                all_documents.extend(project_documents)
-
-                if project_result is not None:
-                    aggregated_result.success_count += project_result.success_count
-                    aggregated_result.error_count += project_result.error_count
-                    aggregated_result.successfully_processed_documents.update(
-                        project_result.successfully_processed_documents
+        async def process_project(
+            project_id: str,
+        ) -> tuple[list[Document], PipelineResult | None, bool]:
+            async with project_limit:
+                try:
+                    logger.debug(f"Processing project: {project_id}")
+                    project_documents = await self.process_documents(
+                        project_id=project_id,
+                        source_type=source_type,
+                        source=source,
+                        force=force,
+                        since=since,
                     )
-                    aggregated_result.failed_document_ids.update(
-                        project_result.failed_document_ids
+                    project_result = self.last_pipeline_result
+                    logger.debug(
+                        f"Processed {len(project_documents)} documents from project: {project_id}"
                     )
-                    aggregated_result.errors.extend(project_result.errors)
-
-                logger.debug(
-                    f"Processed {len(project_documents)} documents from project: {project_id}"
-                )
-            except ConnectorConfigurationError as e:
-                logger.error(
-                    f"Configuration error in project {project_id}: "
-                    f"{sanitize_exception_message(e)}. "
-                    "Skipping this project — check connector settings.",
-                    error_type=type(e).__name__,
-                    sanitized_traceback=sanitize_exception_message(
+                    return project_documents, project_result, False
+                except ConnectorConfigurationError as e:
+                    logger.error(
+                        f"Configuration error in project {project_id}: "
+                        f"{sanitize_exception_message(e)}. "
+                        "Skipping this project — check connector settings.",
+                        error_type=type(e).__name__,
+                        sanitized_traceback=sanitize_exception_message(
+                            traceback.format_exc()
+                        ),
+                    )
+                    failure = PipelineResult()
+                    failure.errors.append(
+                        f"Configuration error in project {project_id}: "
+                        f"{sanitize_exception_message(e)}"
+                    )
+                    return [], failure, True
+                except Exception as e:
+                    safe_error = sanitize_exception_message(e)
+                    sanitized_traceback = sanitize_exception_message(
                         traceback.format_exc()
-                    ),
-                )
-                aggregated_result.errors.append(
-                    f"Configuration error in project {project_id}: "
-                    f"{sanitize_exception_message(e)}"
-                )
+                    )
+                    failure = PipelineResult()
+                    failure.error_count = 1
+                    failure.errors.append(
+                        "project_id="
+                        f"{project_id}; "
+                        "error_type="
+                        f"{type(e).__name__}; "
+                        "message="
+                        f"{safe_error}; "
+                        "traceback="
+                        f"{sanitized_traceback}"
+                    )
+                    logger.error(
+                        f"Failed to process project {project_id}: {safe_error}",
+                        error_type=type(e).__name__,
+                        sanitized_traceback=sanitized_traceback,
+                    )
+                    # Other projects keep running
+                    return [], failure, True
+
+        outcomes = await asyncio.gather(
+            *(process_project(project_id) for project_id in project_ids)
+        )
+
+        # Aggregate in project order
+        for project_id, (project_documents, project_result, failed) in zip(
+            project_ids, outcomes, strict=True
+        ):
+            all_documents.extend(project_documents)
+            if failed:
                 failed_projects.append(project_id)
-                continue
-            except Exception as e:
-                safe_error = sanitize_exception_message(e)
-                sanitized_traceback = sanitize_exception_message(traceback.format_exc())
-                aggregated_result.error_count += 1
-                aggregated_result.errors.append(
-                    "project_id="
-                    f"{project_id}; "
-                    "error_type="
-                    f"{type(e).__name__}; "
-                    "message="
-                    f"{safe_error}; "
-                    "traceback="
-                    f"{sanitized_traceback}"
+            if project_result is not None:
+                aggregated_result.success_count += project_result.success_count
+                aggregated_result.error_count += project_result.error_count
+                aggregated_result.successfully_processed_documents.update(
+                    project_result.successfully_processed_documents
                 )
-                logger.error(
-                    f"Failed to process project {project_id}: {safe_error}",
-                    error_type=type(e).__name__,
-                    sanitized_traceback=sanitized_traceback,
+                aggregated_result.failed_document_ids.update(
+                    project_result.failed_document_ids
                 )
-                failed_projects.append(project_id)
-                # Continue processing other projects
-                continue
+                aggregated_result.errors.extend(project_result.errors)
+                aggregated_result.failed_sources.update(project_result.failed_sources)
 
         self.last_pipeline_result = aggregated_result
 
@@ -623,6 +718,22 @@ class PipelineOrchestrator:
             logger.debug("Initializing state manager for document state updates")
             await self.components.state_manager.initialize()
 
+        if not successfully_processed_docs:
+            return
+
+        try:
+            await self.components.state_manager.update_document_states(
+                successfully_processed_docs, project_id
+            )
+            return
+        except Exception as e:
+            # Fall back to per-document writes so one bad row does not lose
+            # the state of the whole batch
+            logger.warning(
+                f"Bulk document state update failed, retrying per document: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+            )
+
         for doc in successfully_processed_docs:
             try:
                 await self.components.state_manager.update_document_state(
@@ -634,3 +745,180 @@ class PipelineOrchestrator:
                     f"Failed to update document state for {doc.id}: {sanitize_exception_message(e)}",
                     error_type=type(e).__name__,
                 )
+
+    async def _load_sync_cursors(
+        self, project_id: str | None = None
+    ) -> dict[tuple[str, str], str]:
+        """Load the sync cursors stored by the previous run.
+
+        Returns an empty mapping when they cannot be read, in which case
+        incremental connectors list all their documents.
+        """
+        try:
+            if not self.components.state_manager._initialized:
+                await self.components.state_manager.initialize()
+            cursors = await self.components.state_manager.get_sync_cursors(project_id)
+        except Exception as e:
+            logger.warning(
+                f"Sync cursors unavailable, listing sources in full: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+            )
+            return {}
+        return cursors if isinstance(cursors, dict) else {}
+
+    async def _store_sync_cursors(
+        self,
+        source_runs: list[SourceRun],
+        failed_sources: set[tuple[str, str]],
+        project_id: str | None = None,
+    ) -> None:
+        """Store the cursors of the sources whose documents were all processed."""
+        for run in source_runs:
+            key = (run.source_type.lower(), run.source)
+            if run.sync_cursor is None or key in failed_sources:
+                continue
+            try:
+                if not self.components.state_manager._initialized:
+                    await self.components.state_manager.initialize()
+                await self.components.state_manager.set_sync_cursor(
+                    key[0], key[1], run.sync_cursor, project_id
+                )
+            except Exception as e:
+                # The next run then lists the source from the previous cursor
+                logger.warning(
+                    f"Failed to store sync cursor for {run.source_type} source {run.source}: {sanitize_exception_message(e)}",
+                    error_type=type(e).__name__,
+                )
+
+    async def _load_file_stats(
+        self, project_id: str | None = None
+    ) -> dict[tuple[str, str], dict[str, FileStat]]:
+        """Load the file stats stored by the previous runs.
+
+        Returns an empty mapping when they cannot be read, in which case
+        file-based connectors read every file.
+        """
+        try:
+            if not self.components.state_manager._initialized:
+                await self.components.state_manager.initialize()
+            stats = await self.components.state_manager.get_file_stats(project_id)
+        except Exception as e:
+            logger.warning(
+                f"File stats unavailable, reading all files: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+            )
+            return {}
+        if not isinstance(stats, dict):
+            return {}
+        return {
+            key: {path: FileStat(*stat) for path, stat in files.items()}
+            for key, files in stats.items()
+        }
+
+    async def _store_file_stats(
+        self,
+        source_runs: list[SourceRun],
+        previous_stats: dict[tuple[str, str], dict[str, FileStat]],
+        failed_document_ids: set[str],
+        project_id: str | None = None,
+    ) -> None:
+        """Store the file stats reported by the sources that completed.
+
+        Only stats that differ from the previous run are written. Files whose
+        document failed keep their previous stats, or none, so the next run
+        reads them again.
+        """
+        for run in source_runs:
+            if run.file_stats is None:
+                continue
+            key = (run.source_type.lower(), run.source)
+            previous = previous_stats.get(key, {})
+            current = dict(run.file_stats)
+            if failed_document_ids:
+                for path, stat in {**previous, **run.file_stats}.items():
+                    document_id = Document.generate_id(key[0], key[1], stat.url)
+                    if document_id not in failed_document_ids:
+                        continue
+                    if path in previous:
+                        current[path] = previous[path]
+                    else:
+                        current.pop(path, None)
+            changed = {
+                path: tuple(stat)
+                for path, stat in current.items()
+                if previous.get(path) != stat
+            }
+            removed = [path for path in previous if path not in current]
+            if not changed and not removed:
+                continue
+            try:
+                await self.components.state_manager.update_file_stats(
+                    key[0], key[1], changed, removed, project_id
+                )
+            except Exception as e:
+                # The next run then reads the changed files again
+                logger.warning(
+                    f"Failed to store file stats for {run.source_type} source {run.source}: {sanitize_exception_message(e)}",
+                    error_type=type(e).__name__,
+                )
+
+    async def _load_chunk_diff(
+        self,
+        documents: list[Document],
+        project_id: str | None = None,
+        skip_unchanged: bool = True,
+    ) -> ChunkDiff | None:
+        """Build the chunk diff for a batch from the stored chunk hashes.
+
+        Returns None when the chunk states cannot be read, in which case the
+        batch is processed in full.
+        """
+        try:
+            if not self.components.state_manager._initialized:
+                await self.components.state_manager.initialize()
+            previous = await self.components.state_manager.get_chunk_hashes(
+                documents, project_id
+            )
+        except Exception as e:
+            logger.warning(
+                f"Chunk states unavailable, processing batch in full: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+            )
+            return None
+        if not isinstance(previous, dict):
+            return None
+        return ChunkDiff(previous, skip_unchanged=skip_unchanged)
+
+    async def _apply_chunk_diff(
+        self,
+        chunk_diff: ChunkDiff,
+        batch_result,
+        project_id: str | None = None,
+    ) -> None:
+        """Delete disappeared chunk points and store the new chunk hashes."""
+        document_ids = set(batch_result.successfully_processed_documents) & set(
+            chunk_diff.documents
+        )
+        if not document_ids:
+            return
+
+        stale_point_ids = chunk_diff.stale_point_ids(document_ids)
+        try:
+            if stale_point_ids:
+                await self.components.qdrant_manager.delete_points(stale_point_ids)
+                logger.info(
+                    f"🧹 Deleted {len(stale_point_ids)} stale chunk points from Qdrant"
+                )
+            await self.components.state_manager.replace_chunk_states(
+                [chunk_diff.documents[document_id] for document_id in document_ids],
+                chunk_diff.chunk_states(
+                    document_ids, set(batch_result.upserted_chunk_ids or ())
+                ),
+                project_id,
+            )
+        except Exception as e:
+            # Keeping the old chunk states lets the next update retry the cleanup
+            logger.error(
+                f"Failed to apply chunk diff: {sanitize_exception_message(e)}",
+                error_type=type(e).__name__,
+            )
@@ -0,0 +1,120 @@
+"""Bounded read-ahead between the source stream and the document pipeline."""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+
+def batch_size_bytes(batch: list[Document]) -> int:
+    """Approximate memory held by a batch: the length of its document contents."""
+    return sum(len(document.content or "") for document in batch)
+
+
+async def prefetch_batches(
+    batches: AsyncIterator[list[Document]],
+    depth: int = 2,
+    max_bytes: int | None = None,
+) -> AsyncIterator[list[Document]]:
+    """Fetch batches ahead of the consumer in a background task.
+
+    While the consumer processes batch N, the producer already pulls batch
+    N+1 (and more, up to ``depth``) from the sources. The producer pauses
+    with the batch it just fetched when ``depth`` batches are buffered or
+    when buffering that batch would exceed ``max_bytes``; a single batch is
+    always admitted so an oversized batch cannot stall the pipeline.
+
+    Buffered documents are reported through ``CHUNK_QUEUE_SIZE``. Time the
+    consumer spends waiting for the sources, and time the producer spends
+    waiting for the consumer, is added to ``PIPELINE_STALL_SECONDS``.
+
+    Args:
+        batches: Source batch stream
+        depth: Maximum number of buffered batches; 0 disables read-ahead
+        max_bytes: Maximum approximate size of the buffered batches
+
+    Yields:
+        The batches of ``batches``, in order
+    """
+    if depth <= 0:
+        async for batch in batches:
+            yield batch
+        return
+
+    buffer: deque[tuple[list[Document], int]] = deque()
+    condition = asyncio.Condition()
+    queued_bytes = 0
+    finished = False
+    error: BaseException | None = None
+
+    def has_room(size: int) -> bool:
+        if not buffer:
+            return True
+        if len(buffer) >= depth:
+            return False
+        return max_bytes is None or queued_bytes + size <= max_bytes
+
+    def report() -> None:
+        prometheus_metrics.CHUNK_QUEUE_SIZE.set(sum(len(b) for b, _ in buffer))
+
+    async def produce() -> None:
+        nonlocal queued_bytes, finished, error
+        try:
+            async for batch in batches:
+                size = batch_size_bytes(batch)
+                async with condition:
+                    started = time.perf_counter()
+                    await condition.wait_for(lambda size=size: has_room(size))
+                    prometheus_metrics.PIPELINE_STALL_SECONDS.labels(
+                        stage="processing"
+                    ).inc(time.perf_counter() - started)
+                    buffer.append((batch, size))
+                    queued_bytes += size
+                    report()
+                    condition.notify_all()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = e
+        finally:
+            aclose = getattr(batches, "aclose", None)
+            if aclose is not None:
+                try:
+                    await aclose()
+                except Exception:
+                    logger.debug("Closing the source batch stream failed")
+            async with condition:
+                finished = True
+                condition.notify_all()
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            async with condition:
+                started = time.perf_counter()
+                await condition.wait_for(lambda: bool(buffer) or finished)
+                prometheus_metrics.PIPELINE_STALL_SECONDS.labels(stage="source").inc(
+                    time.perf_counter() - started
+                )
+                if not buffer:
+                    if error is not None:
+                        raise error
+                    return
+                batch, size = buffer.popleft()
+                queued_bytes -= size
+                report()
+                condition.notify_all()
+            yield batch
+    finally:
+        producer.cancel()
+        try:
+            await producer
+        except asyncio.CancelledError:
+            pass
+        prometheus_metrics.CHUNK_QUEUE_SIZE.set(0)
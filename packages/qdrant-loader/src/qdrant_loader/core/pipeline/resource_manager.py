@@ -5,6 +5,7 @@ import atexit
 import concurrent.futures
 import signal
 
+from qdrant_loader.core.attachment_pipeline import shutdown_conversion_pools
 from qdrant_loader.utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
@@ -17,12 +18,12 @@ class ResourceManager:
         self.shutdown_event = asyncio.Event()
         self.active_tasks: set[asyncio.Task] = set()
         self.cleanup_done = False
-        self.chunk_executor: concurrent.futures.ThreadPoolExecutor | None = None
+        self.chunk_executor: concurrent.futures.Executor | None = None
         self._signal_shutdown = (
             False  # Flag to track if shutdown was triggered by signal
         )
 
-    def set_chunk_executor(self, executor: concurrent.futures.ThreadPoolExecutor):
+    def set_chunk_executor(self, executor: concurrent.futures.Executor):
         """Set the chunk executor for cleanup."""
         self.chunk_executor = executor
 
@@ -58,11 +59,14 @@ class ResourceManager:
                     except Exception as e:
                         logger.error(f"Error in async cleanup: {e}")
 
-            # Shutdown thread pool executor
+            # Shutdown chunk executor (thread or process pool)
             if self.chunk_executor:
                 logger.debug("Shutting down chunk executor")
                 self.chunk_executor.shutdown(wait=True)
 
+            # Stop the attachment conversion workers
+            shutdown_conversion_pools()
+
             self.cleanup_done = True
             logger.info("Cleanup completed")
         except Exception as e:
@@ -158,6 +162,7 @@ class ResourceManager:
     async def cleanup(self):
         """Clean up all resources."""
         await self._async_cleanup()
+        shutdown_conversion_pools()
 
     def add_task(self, task: asyncio.Task):
         """Add a task to be tracked for cleanup."""
@@ -114,10 +114,13 @@ class SourceProcessor:
         connector_factory: Callable[[SourceConfig], BaseConnector],
         source_type: str,
         since: datetime | None = None,
+        on_error: Callable[[str, Exception], None] | None = None,
     ) -> AsyncIterator[Document]:
         """Stream documents from a specific source type (WS-1).
 
         Yields documents one at a time as they are fetched from the source.
+        A failed source is logged and skipped; ``on_error`` is called with
+        its name and the exception.
         """
         logger.debug(f"Streaming {source_type} sources: {list(source_configs.keys())}")
 
@@ -167,4 +170,6 @@ class SourceProcessor:
                     f"Failed to stream {source_type} source {source_name}: {safe_error}",
                     error_type=type(e).__name__,
                 )
+                if on_error is not None:
+                    on_error(source_name, e)
                 continue
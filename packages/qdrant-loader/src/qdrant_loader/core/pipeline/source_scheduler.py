@@ -0,0 +1,249 @@
+"""Concurrent scheduling of source fetches."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime
+
+from qdrant_loader.config import SourcesConfig
+from qdrant_loader.config.source_config import SourceConfig
+from qdrant_loader.connectors.base import BaseConnector, FileStat
+from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+from qdrant_loader.utils.sensitive import sanitize_exception_message
+
+from .source_processor import SourceProcessor
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Source types in the order their fetches are started
+SOURCE_TYPES = (
+    ("Confluence", "confluence"),
+    ("Git", "git"),
+    ("Jira", "jira"),
+    ("PublicDocs", "publicdocs"),
+    ("LocalFile", "localfile"),
+)
+
+
+@dataclass
+class SourceRun:
+    """Wall-clock time and throughput of one source during a run."""
+
+    source_type: str
+    source: str
+    project_id: str | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    document_count: int = 0
+    content_bytes: int = 0
+    # Cursor reported by the connector after a complete stream
+    sync_cursor: str | None = None
+    # File stats reported by the connector after a complete stream
+    file_stats: dict[str, FileStat] | None = None
+    # Error the fetch failed with; the source processor logs and skips it
+    error: str | None = None
+
+    @property
+    def duration(self) -> float:
+        """Seconds between the start and the end of the fetch."""
+        if self.started_at is None:
+            return 0.0
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return end - self.started_at
+
+    @property
+    def documents_per_second(self) -> float:
+        """Documents fetched per second of wall-clock time."""
+        return self.document_count / self.duration if self.duration else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Document content bytes fetched per second of wall-clock time."""
+        return self.content_bytes / self.duration if self.duration else 0.0
+
+
+_DONE = object()
+
+
+class SourceScheduler:
+    """Fetches independent sources concurrently and merges their documents.
+
+    Every source runs in its own task. A global limit bounds the number of
+    sources fetched at once (across all projects sharing the scheduler) and
+    a per-connector limit bounds the sources of one type, so that e.g. two
+    Confluence spaces on the same server do not both hit its rate limit.
+    Sources are started in source-type order, so a limit of 1 reproduces
+    the sequential behaviour.
+    """
+
+    def __init__(
+        self,
+        source_processor: SourceProcessor,
+        max_concurrent_sources: int = 4,
+        max_concurrent_per_type: int = 2,
+        queue_size: int = 1000,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            source_processor: Processor that streams the documents of a source
+            max_concurrent_sources: Sources fetched at the same time
+            max_concurrent_per_type: Sources of one connector type fetched at
+                the same time
+            queue_size: Fetched documents buffered before the producers wait
+        """
+        self.source_processor = source_processor
+        self.max_concurrent_sources = max(1, max_concurrent_sources)
+        self.max_concurrent_per_type = max(1, max_concurrent_per_type)
+        self.queue_size = queue_size
+        self._global_limit = asyncio.Semaphore(self.max_concurrent_sources)
+        self._type_limits: dict[str, asyncio.Semaphore] = {}
+
+    def _type_limit(self, source_type: str) -> asyncio.Semaphore:
+        if source_type not in self._type_limits:
+            self._type_limits[source_type] = asyncio.Semaphore(
+                self.max_concurrent_per_type
+            )
+        return self._type_limits[source_type]
+
+    async def stream_documents(
+        self,
+        sources_config: SourcesConfig,
+        connector_factory: Callable[[SourceConfig], BaseConnector],
+        since: datetime | None = None,
+        project_id: str | None = None,
+        runs: list[SourceRun] | None = None,
+        sync_cursors: Mapping[tuple[str, str], str] | None = None,
+        file_stats: Mapping[tuple[str, str], Mapping[str, FileStat]] | None = None,
+    ) -> AsyncIterator[Document]:
+        """Stream the documents of all configured sources as they are fetched.
+
+        Documents of different sources are interleaved. A connector
+        configuration error stops all fetches and is raised to the caller;
+        other source failures are handled by the source processor.
+
+        Args:
+            sources_config: Sources to fetch
+            connector_factory: Factory that creates a connector from a source config
+            since: Only fetch documents updated after this timestamp
+            project_id: Project the sources belong to, for reporting
+            runs: Optional list the timing of each started source is added to
+            sync_cursors: Cursors of the previous run keyed by ``(source_type,
+                source)``, handed to the connectors before they stream
+
+        Yields:
+            Documents of all sources
+        """
+        sources: list[tuple[str, str, SourceConfig]] = []
+        for source_type, attribute in SOURCE_TYPES:
+            configs: Mapping[str, SourceConfig] = (
+                getattr(sources_config, attribute, None) or {}
+            )
+            sources.extend(
+                (source_type, name, config) for name, config in configs.items()
+            )
+        if not sources:
+            return
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        async def fetch(source_type: str, name: str, config: SourceConfig) -> None:
+            try:
+                async with self._global_limit, self._type_limit(source_type):
+                    run = SourceRun(source_type, name, project_id, time.perf_counter())
+                    if runs is not None:
+                        runs.append(run)
+                    connectors: list[BaseConnector] = []
+
+                    def create_connector(source_config: SourceConfig) -> BaseConnector:
+                        connector = connector_factory(source_config)
+                        if sync_cursors is not None and hasattr(
+                            connector, "set_sync_cursor"
+                        ):
+                            connector.set_sync_cursor(
+                                sync_cursors.get((source_type.lower(), name))
+                            )
+                        if file_stats is not None and hasattr(
+                            connector, "set_file_stats"
+                        ):
+                            connector.set_file_stats(
+                                file_stats.get((source_type.lower(), name), {})
+                            )
+                        connectors.append(connector)
+                        return connector
+
+                    def record_error(_source: str, error: Exception) -> None:
+                        run.error = (
+                            sanitize_exception_message(error) or type(error).__name__
+                        )
+
+                    documents = self.source_processor.stream_source_documents(
+                        {name: config},
+                        create_connector,
+                        source_type,
+                        since=since,
+                        on_error=record_error,
+                    )
+                    try:
+                        async with aclosing(documents):
+                            async for document in documents:
+                                run.document_count += 1
+                                run.content_bytes += len(document.content or "")
+                                await queue.put(document)
+                    finally:
+                        run.finished_at = time.perf_counter()
+                    # Connectors only set a cursor once their stream completed
+                    cursor = (
+                        getattr(connectors[0], "sync_cursor", None)
+                        if connectors
+                        else None
+                    )
+                    if isinstance(cursor, str):
+                        run.sync_cursor = cursor
+                    stats = (
+                        getattr(connectors[0], "file_stats", None)
+                        if connectors
+                        else None
+                    )
+                    if isinstance(stats, dict):
+                        run.file_stats = stats
+                await queue.put(_DONE)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [asyncio.create_task(fetch(*source)) for source in sources]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                item = await queue.get()
+                if item is _DONE:
+                    remaining -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def log_source_runs(runs: list[SourceRun]) -> None:
+    """Log the wall-clock time and throughput of each source of a run."""
+    for run in sorted(runs, key=lambda r: r.duration, reverse=True):
+        logger.info(
+            f"⏱️ {run.source_type} source {run.source}: {run.document_count} documents "
+            f"in {run.duration:.2f}s ({run.documents_per_second:.1f} docs/s, "
+            f"{run.bytes_per_second / 1024:.1f} KiB/s)",
+            project_id=run.project_id,
+            source_type=run.source_type,
+            source=run.source,
+            duration_seconds=round(run.duration, 3),
+            document_count=run.document_count,
+            content_bytes=run.content_bytes,
+        )
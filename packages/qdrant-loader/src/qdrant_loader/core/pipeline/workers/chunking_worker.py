@@ -7,6 +7,12 @@ from collections.abc import AsyncIterator
 import psutil
 
 from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import (
+    ChunkingProcessPool,
+    chunk_packed_document,
+    pack_document,
+    unpack_document,
+)
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.utils.logging import LoggingConfig
@@ -22,7 +28,7 @@ class ChunkingWorker(BaseWorker):
     def __init__(
         self,
         chunking_service: ChunkingService,
-        chunk_executor: concurrent.futures.ThreadPoolExecutor,
+        chunk_executor: concurrent.futures.Executor,
         max_workers: int = 10,
         queue_size: int = 1000,
         shutdown_event: asyncio.Event | None = None,
@@ -31,6 +37,8 @@ class ChunkingWorker(BaseWorker):
         self.chunking_service = chunking_service
         self.chunk_executor = chunk_executor
         self.shutdown_event = shutdown_event or asyncio.Event()
+        # Process pools get packed documents and chunk with their own services
+        self.uses_process_pool = isinstance(chunk_executor, ChunkingProcessPool)
 
     async def process(self, document: Document) -> list:
         """Process a single document into chunks.
@@ -53,7 +61,11 @@ class ChunkingWorker(BaseWorker):
             prometheus_metrics.CPU_USAGE.set(psutil.cpu_percent())
             prometheus_metrics.MEMORY_USAGE.set(psutil.virtual_memory().percent)
 
-            # Run chunking in a thread pool for true parallelism
+            # Worker process start-up does not count against the timeout
+            if self.uses_process_pool:
+                await self.chunk_executor.wait_until_ready()
+
+            # Run chunking on the executor (threads or worker processes)
             with prometheus_metrics.CHUNKING_DURATION.time():
                 # Calculate adaptive timeout based on document size
                 adaptive_timeout = self._calculate_adaptive_timeout(document)
@@ -66,12 +78,7 @@ class ChunkingWorker(BaseWorker):
 
                 # Add timeout to prevent hanging on chunking
                 chunks = await asyncio.wait_for(
-                    asyncio.get_running_loop().run_in_executor(
-                        self.chunk_executor,
-                        self.chunking_service.chunk_document,
-                        document,
-                    ),
-                    timeout=adaptive_timeout,
+                    self._run_chunking(document), timeout=adaptive_timeout
                 )
 
                 # Check for shutdown before returning chunks
@@ -105,6 +112,18 @@ class ChunkingWorker(BaseWorker):
             logger.error(f"Chunking failed for doc {document.url}: {e}")
             raise
 
+    async def _run_chunking(self, document: Document) -> list:
+        """Chunk ``document`` on the executor."""
+        loop = asyncio.get_running_loop()
+        if not self.uses_process_pool:
+            return await loop.run_in_executor(
+                self.chunk_executor, self.chunking_service.chunk_document, document
+            )
+        packed_chunks = await loop.run_in_executor(
+            self.chunk_executor, chunk_packed_document, pack_document(document)
+        )
+        return [unpack_document(packed) for packed in packed_chunks]
+
     async def process_documents(self, documents: list[Document]) -> AsyncIterator:
         """Process documents into chunks.
 
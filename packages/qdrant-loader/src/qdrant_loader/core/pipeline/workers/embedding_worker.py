@@ -2,6 +2,7 @@
 
 import asyncio
 import gc
+from collections import deque
 from collections.abc import AsyncIterator
 from typing import Any
 
@@ -94,11 +95,38 @@ class EmbeddingWorker(BaseWorker):
             logger.error(f"EmbeddingWorker error processing batch: {e}")
             raise
 
+    async def _collect(
+        self, batch: list[Any], task: "asyncio.Task[list[tuple[Any, list[float]]]]"
+    ) -> list[tuple[Any, list[float]]]:
+        """Await an in-flight batch, logging failures instead of raising.
+
+        Args:
+            batch: The chunks submitted with the task
+            task: Task running ``process`` for the batch
+
+        Returns:
+            The batch results, or an empty list if embedding failed
+        """
+        try:
+            return await task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"EmbeddingWorker batch processing failed: {e}")
+            # Mark chunks as failed but continue processing
+            for chunk in batch:
+                logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
+            return []
+
     async def process_chunks(
         self, chunks: AsyncIterator[Any]
     ) -> AsyncIterator[tuple[Any, list[float]]]:
         """Process chunks into embeddings.
 
+        Up to ``max_workers`` batches are embedded concurrently. Results are
+        yielded in the order the chunks arrived, so downstream bookkeeping
+        sees the same sequence as with sequential processing.
+
         Args:
             chunks: AsyncIterator of chunks to process
 
@@ -109,8 +137,18 @@ class EmbeddingWorker(BaseWorker):
         logger.info("🔄 Starting embedding generation...")
         batch_size = self.embedding_service.batch_size
         batch = []
+        in_flight: deque[tuple[list[Any], asyncio.Task]] = deque()
         total_processed = 0
 
+        def submit(items: list[Any]) -> None:
+            logger.debug(f"🔄 Processing embedding batch of {len(items)} chunks...")
+            in_flight.append((items, asyncio.create_task(self.process(items))))
+
+        def report_queue() -> None:
+            prometheus_metrics.EMBED_QUEUE_SIZE.set(
+                len(batch) + sum(len(items) for items, _ in in_flight)
+            )
+
         try:
             async for chunk in chunks:
                 if self.shutdown_event.is_set():
@@ -119,46 +157,46 @@ class EmbeddingWorker(BaseWorker):
 
                 batch.append(chunk)
 
-                # Process batch when it reaches the desired size
+                # Submit batch when it reaches the desired size
                 if len(batch) >= batch_size:
-                    try:
-                        logger.debug(
-                            f"🔄 Processing embedding batch of {len(batch)} chunks..."
-                        )
-                        results = await self.process(batch)
+                    submit(batch)
+                    batch = []
+                    report_queue()
+                    # Let the new request start before reading more chunks
+                    await asyncio.sleep(0)
+
+                    # Drain finished batches in order, and block on the oldest
+                    # one while the in-flight window is full
+                    while in_flight and (
+                        len(in_flight) >= self.max_workers or in_flight[0][1].done()
+                    ):
+                        done_batch, task = in_flight.popleft()
+                        results = await self._collect(done_batch, task)
+                        report_queue()
                         total_processed += len(results)
                         logger.info(
                             f"🔗 Generated embeddings: {len(results)} items in batch, {total_processed} total processed"
                         )
-
                         for result in results:
                             yield result
-                    except Exception as e:
-                        logger.error(f"EmbeddingWorker batch processing failed: {e}")
-                        # Mark chunks as failed but continue processing
-                        for chunk in batch:
-                            logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
 
-                    batch = []
-
-            # Process any remaining chunks in the final batch
+            # Submit any remaining chunks as the final batch
             if batch and not self.shutdown_event.is_set():
-                try:
-                    logger.debug(
-                        f"🔄 Processing final embedding batch of {len(batch)} chunks..."
-                    )
-                    results = await self.process(batch)
-                    total_processed += len(results)
-                    logger.info(
-                        f"🔗 Generated embeddings: {len(results)} items in final batch, {total_processed} total processed"
-                    )
-
-                    for result in results:
-                        yield result
-                except Exception as e:
-                    logger.error(f"EmbeddingWorker final batch processing failed: {e}")
-                    for chunk in batch:
-                        logger.error(f"Embedding failed for chunk {chunk.id}: {e}")
+                submit(batch)
+            batch = []
+            report_queue()
+
+            # Drain everything still in flight, in submission order
+            while in_flight:
+                done_batch, task = in_flight.popleft()
+                results = await self._collect(done_batch, task)
+                report_queue()
+                total_processed += len(results)
+                logger.info(
+                    f"🔗 Generated embeddings: {len(results)} items in batch, {total_processed} total processed"
+                )
+                for result in results:
+                    yield result
 
             logger.info(f"✅ Embedding completed: {total_processed} chunks processed")
 
@@ -166,4 +204,7 @@ class EmbeddingWorker(BaseWorker):
             logger.debug("EmbeddingWorker cancelled")
             raise
         finally:
+            for _, task in in_flight:
+                task.cancel()
+            prometheus_metrics.EMBED_QUEUE_SIZE.set(0)
             logger.debug("EmbeddingWorker exited")
@@ -1,11 +1,12 @@
 """Upsert worker for upserting embedded chunks to Qdrant."""
 
 import asyncio
-from collections import Counter
+from collections import Counter, deque
 from collections.abc import AsyncIterator
 from typing import Any
 
 from qdrant_client.http import models
+from qdrant_loader_core.config import build_payload
 
 from qdrant_loader.core.monitoring import prometheus_metrics
 from qdrant_loader.core.qdrant_manager import QdrantManager
@@ -15,6 +16,12 @@ from .base_worker import BaseWorker
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Ceiling on the approximate request size of an upsert batch; Qdrant rejects
+# REST requests larger than 32 MiB by default
+UPSERT_BATCH_MAX_BYTES = 16 * 1024 * 1024
+# Approximate serialized size of one vector dimension
+_BYTES_PER_DIMENSION = 12
+
 
 class PipelineResult:
     """Result of pipeline processing."""
@@ -24,11 +31,30 @@ class PipelineResult:
         self.error_count: int = 0
         self.successfully_processed_documents: set[str] = set()
         self.failed_document_ids: set[str] = set()
+        self.upserted_chunk_ids: set[str] = set()
         self.errors: list[str] = []
+        # (source_type, source) of the sources that failed, in full or in part
+        self.failed_sources: set[tuple[str, str]] = set()
+
+    @property
+    def has_failures(self) -> bool:
+        """Whether a source or a document of the run failed."""
+        return bool(
+            self.error_count
+            or self.failed_document_ids
+            or self.failed_sources
+            or self.errors
+        )
 
 
 class UpsertWorker(BaseWorker):
-    """Handles upserting embedded chunks to Qdrant."""
+    """Handles upserting embedded chunks to Qdrant.
+
+    Batches are sent as soon as they fill up, with up to ``max_workers`` of
+    them in flight, and are acknowledged by Qdrant once written to its
+    write-ahead log. Once the last batch is acknowledged, a barrier waits until
+    all of them are applied.
+    """
 
     def __init__(
         self,
@@ -37,10 +63,12 @@ class UpsertWorker(BaseWorker):
         max_workers: int = 4,
         queue_size: int = 1000,
         shutdown_event: asyncio.Event | None = None,
+        max_batch_bytes: int = UPSERT_BATCH_MAX_BYTES,
     ):
         super().__init__(max_workers, queue_size)
         self.qdrant_manager = qdrant_manager
         self.batch_size = batch_size
+        self.max_batch_bytes = max_batch_bytes
         self.shutdown_event = shutdown_event or asyncio.Event()
 
     def _handle_duplicate_chunk_ids(
@@ -92,11 +120,120 @@ class UpsertWorker(BaseWorker):
         )
         result.error_count += duplicate_chunk_attempts
 
+    def _build_payload(
+        self, chunk: Any
+    ) -> tuple[dict[str, Any], models.PointStruct | None]:
+        """Build the payload of a chunk.
+
+        Returns:
+            The payload, and the point of its analysis fields in the side
+            collection when the payload layout moves them there
+        """
+        created_at = chunk.created_at.isoformat()
+        updated_at = getattr(chunk, "updated_at", None)
+        document_id = chunk.metadata.get("parent_document_id", chunk.id)
+        payload, analysis = build_payload(
+            {
+                "content": chunk.content,
+                "contextual_content": chunk.contextual_content,
+                "source": chunk.source,
+                "source_type": chunk.source_type,
+                "created_at": created_at,
+                "updated_at": (
+                    updated_at.isoformat() if updated_at is not None else created_at
+                ),
+                "title": getattr(chunk, "title", chunk.metadata.get("title", "")),
+                "url": getattr(chunk, "url", chunk.metadata.get("url", "")),
+                "document_id": document_id,
+            },
+            {k: v for k, v in chunk.metadata.items() if k != "parent_document"},
+            self.qdrant_manager.payload_layout,
+        )
+        analysis_point = None
+        if analysis:
+            analysis_point = models.PointStruct.model_construct(
+                id=chunk.id,
+                vector={},
+                payload={"document_id": document_id, **analysis},
+            )
+        return payload, analysis_point
+
+    def _build_point(
+        self, chunk: Any, embedding: list[float]
+    ) -> tuple[models.PointStruct, models.PointStruct | None]:
+        """Build the point of an embedded chunk.
+
+        The point is constructed without validation: its fields come from
+        chunks and vectors that are already validated, and validating every
+        point costs more than sending it.
+
+        Returns:
+            The point, and the point of its analysis fields in the side
+            collection when the payload layout moves them there
+        """
+        payload, analysis_point = self._build_payload(chunk)
+        # QdrantManager.build_point_vector owns the dense / dense+sparse
+        # decision and has its own dense-only fallback on encode failure,
+        # so no defensive wrapper is needed here.
+        point = models.PointStruct.model_construct(
+            id=chunk.id,
+            vector=self.qdrant_manager.build_point_vector(embedding, chunk.content),
+            payload=payload,
+        )
+        return point, analysis_point
+
+    async def update_payloads(self, chunks: list[Any]) -> tuple[set[str], list[str]]:
+        """Rewrite the payload of chunks whose vectors are already stored.
+
+        Chunks skipped by the chunk diff keep their point, but the metadata
+        of their document may have changed since it was written.
+
+        Args:
+            chunks: Chunks whose point exists with the current vectors
+
+        Returns:
+            Tuple of (failed_doc_ids, errors)
+        """
+        failed_doc_ids: set[str] = set()
+        errors: list[str] = []
+        for start in range(0, len(chunks), self.batch_size):
+            batch = chunks[start : start + self.batch_size]
+            try:
+                built = [(chunk.id, *self._build_payload(chunk)) for chunk in batch]
+                analysis_points = [point for *_, point in built if point is not None]
+                # Analysis fields are stored before they leave the payload
+                if analysis_points:
+                    await self.qdrant_manager.upsert_analysis(analysis_points)
+                await self.qdrant_manager.overwrite_payloads(
+                    [(point_id, payload) for point_id, payload, _ in built]
+                )
+            except Exception as e:
+                logger.error(f"Payload update failed for {len(batch)} chunks: {e}")
+                errors.append(f"Payload update failed for {len(batch)} chunks: {e}")
+                failed_doc_ids.update(
+                    chunk.metadata["parent_document"].id
+                    for chunk in batch
+                    if chunk.metadata.get("parent_document") is not None
+                )
+        return failed_doc_ids, errors
+
+    @staticmethod
+    def _approximate_size(chunk: Any, embedding: list[float]) -> int:
+        """Approximate size of the point of a chunk in an upsert request."""
+        size = _BYTES_PER_DIMENSION * len(embedding)
+        for text in (chunk.content, getattr(chunk, "contextual_content", None)):
+            if isinstance(text, str):
+                size += len(text)
+        return size
+
     async def process(
         self, batch: list[tuple[Any, list[float]]]
     ) -> tuple[int, int, set[str], list[str]]:
         """Process a batch of embedded chunks.
 
+        The batch is upserted without waiting for Qdrant to apply it;
+        ``process_embedded_chunks`` waits for all of its batches at the end.
+
         Args:
             batch: List of (chunk, embedding) tuples
 
@@ -113,46 +250,21 @@ class UpsertWorker(BaseWorker):
 
         try:
             with prometheus_metrics.UPSERT_DURATION.time():
-                # QdrantManager.build_point_vector owns the dense / dense+sparse
-                # decision and has its own dense-only fallback on encode failure,
-                # so no defensive wrapper is needed here.
-                points = [
-                    models.PointStruct(
-                        id=chunk.id,
-                        vector=self.qdrant_manager.build_point_vector(
-                            embedding, chunk.content
-                        ),
-                        payload={
-                            "content": chunk.content,
-                            "contextual_content": chunk.contextual_content,
-                            "metadata": {
-                                k: v
-                                for k, v in chunk.metadata.items()
-                                if k != "parent_document"
-                            },
-                            "source": chunk.source,
-                            "source_type": chunk.source_type,
-                            "created_at": chunk.created_at.isoformat(),
-                            "updated_at": (
-                                getattr(
-                                    chunk, "updated_at", chunk.created_at
-                                ).isoformat()
-                                if hasattr(chunk, "updated_at")
-                                else chunk.created_at.isoformat()
-                            ),
-                            "title": getattr(
-                                chunk, "title", chunk.metadata.get("title", "")
-                            ),
-                            "url": getattr(chunk, "url", chunk.metadata.get("url", "")),
-                            "document_id": chunk.metadata.get(
-                                "parent_document_id", chunk.id
-                            ),
-                        },
-                    )
-                    for chunk, embedding in batch
+                built = [
+                    self._build_point(chunk, embedding) for chunk, embedding in batch
                 ]
-
-                await self.qdrant_manager.upsert_points(points)
+                points = [point for point, _ in built]
+                analysis_points = [point for _, point in built if point is not None]
+
+                prometheus_metrics.UPSERT_IN_FLIGHT.inc()
+                try:
+                    await self.qdrant_manager.upsert_points(points, wait=False)
+                    if analysis_points:
+                        await self.qdrant_manager.upsert_analysis(
+                            analysis_points, wait=False
+                        )
+                finally:
+                    prometheus_metrics.UPSERT_IN_FLIGHT.dec()
                 prometheus_metrics.INGESTED_DOCUMENTS.inc(len(points))
                 success_count = len(points)
 
@@ -174,6 +286,50 @@ class UpsertWorker(BaseWorker):
 
         return success_count, error_count, successful_doc_ids, errors
 
+    def _record_batch(
+        self,
+        result: PipelineResult,
+        batch: list[tuple[Any, list[float]]],
+        outcome: tuple[int, int, set[str], list[str]],
+        seen_chunk_ids: set[str],
+    ) -> None:
+        """Add the outcome of a batch to the result, in submission order."""
+        success_count, error_count, successful_doc_ids, errors = outcome
+        batch_chunk_id_list = [str(chunk.id) for chunk, _ in batch]
+        batch_chunk_ids = set(batch_chunk_id_list)
+        batch_chunk_id_counts = Counter(batch_chunk_id_list)
+
+        if success_count > 0:
+            same_batch_duplicates = {
+                chunk_id
+                for chunk_id, count in batch_chunk_id_counts.items()
+                if count > 1
+            }
+            cross_batch_duplicates = batch_chunk_ids & seen_chunk_ids
+            duplicate_chunk_ids = cross_batch_duplicates | same_batch_duplicates
+            new_chunk_ids = batch_chunk_ids - seen_chunk_ids - same_batch_duplicates
+
+            self._handle_duplicate_chunk_ids(
+                batch=batch,
+                batch_chunk_id_counts=batch_chunk_id_counts,
+                duplicate_chunk_ids=duplicate_chunk_ids,
+                same_batch_duplicates=same_batch_duplicates,
+                cross_batch_duplicates=cross_batch_duplicates,
+                new_chunk_ids=new_chunk_ids,
+                successful_doc_ids=successful_doc_ids,
+                result=result,
+                errors=errors,
+            )
+
+            # Only update seen_chunk_ids with non-duplicate IDs
+            seen_chunk_ids.update(new_chunk_ids)
+            result.success_count += len(new_chunk_ids)
+            result.upserted_chunk_ids.update(batch_chunk_ids)
+
+        result.error_count += error_count
+        result.successfully_processed_documents.update(successful_doc_ids)
+        result.errors.extend(errors)
+
     async def process_embedded_chunks(
         self, embedded_chunks: AsyncIterator[tuple[Any, list[float]]]
     ) -> PipelineResult:
@@ -187,8 +343,24 @@ class UpsertWorker(BaseWorker):
         """
         logger.debug("UpsertWorker started")
         result = PipelineResult()
-        batch = []
+        batch: list[tuple[Any, list[float]]] = []
+        batch_bytes = 0
         seen_chunk_ids: set[str] = set()
+        # Batches sent to Qdrant, oldest first
+        in_flight: deque[tuple[list[tuple[Any, list[float]]], asyncio.Task]] = deque()
+
+        def record_completed() -> None:
+            while in_flight and in_flight[0][1].done():
+                sent, task = in_flight.popleft()
+                self._record_batch(result, sent, task.result(), seen_chunk_ids)
+
+        async def submit(sent: list[tuple[Any, list[float]]]) -> None:
+            # Waiting for a free slot holds back the embedding stage
+            await self.semaphore.acquire()
+            task = asyncio.create_task(self.process(sent))
+            task.add_done_callback(lambda _: self.semaphore.release())
+            in_flight.append((sent, task))
+            record_completed()
 
         try:
             async for chunk_embedding in embedded_chunks:
@@ -196,97 +368,53 @@ class UpsertWorker(BaseWorker):
                     logger.debug("UpsertWorker exiting due to shutdown")
                     break
 
+                size = self._approximate_size(*chunk_embedding)
+                if batch and batch_bytes + size > self.max_batch_bytes:
+                    await submit(batch)
+                    batch, batch_bytes = [], 0
+
                 batch.append(chunk_embedding)
+                batch_bytes += size
 
-                # Process batch when it reaches the desired size
+                # Send the batch when it reaches the desired size
                 if len(batch) >= self.batch_size:
-                    batch_chunk_id_list = [str(chunk.id) for chunk, _ in batch]
-                    batch_chunk_ids = set(batch_chunk_id_list)
-                    batch_chunk_id_counts = Counter(batch_chunk_id_list)
-                    success_count, error_count, successful_doc_ids, errors = (
-                        await self.process(batch)
-                    )
-
-                    if success_count > 0:
-                        same_batch_duplicates = {
-                            chunk_id
-                            for chunk_id, count in batch_chunk_id_counts.items()
-                            if count > 1
-                        }
-                        cross_batch_duplicates = batch_chunk_ids & seen_chunk_ids
-                        duplicate_chunk_ids = (
-                            cross_batch_duplicates | same_batch_duplicates
-                        )
-                        new_chunk_ids = (
-                            batch_chunk_ids - seen_chunk_ids - same_batch_duplicates
-                        )
+                    await submit(batch)
+                    batch, batch_bytes = [], 0
 
-                        self._handle_duplicate_chunk_ids(
-                            batch=batch,
-                            batch_chunk_id_counts=batch_chunk_id_counts,
-                            duplicate_chunk_ids=duplicate_chunk_ids,
-                            same_batch_duplicates=same_batch_duplicates,
-                            cross_batch_duplicates=cross_batch_duplicates,
-                            new_chunk_ids=new_chunk_ids,
-                            successful_doc_ids=successful_doc_ids,
-                            result=result,
-                            errors=errors,
-                        )
-
-                        # Only update seen_chunk_ids with non-duplicate IDs
-                        seen_chunk_ids.update(new_chunk_ids)
-                        result.success_count += len(new_chunk_ids)
-
-                    result.error_count += error_count
-                    result.successfully_processed_documents.update(successful_doc_ids)
-                    result.errors.extend(errors)
-                    batch = []
-
-            # Process any remaining chunks in the final batch
+            # Send any remaining chunks in the final batch
             if batch and not self.shutdown_event.is_set():
-                batch_chunk_id_list = [str(chunk.id) for chunk, _ in batch]
-                batch_chunk_ids = set(batch_chunk_id_list)
-                batch_chunk_id_counts = Counter(batch_chunk_id_list)
-                success_count, error_count, successful_doc_ids, errors = (
-                    await self.process(batch)
-                )
+                await submit(batch)
+
+            while in_flight:
+                sent, task = in_flight.popleft()
+                self._record_batch(result, sent, await task, seen_chunk_ids)
 
-                if success_count > 0:
-                    same_batch_duplicates = {
-                        chunk_id
-                        for chunk_id, count in batch_chunk_id_counts.items()
-                        if count > 1
-                    }
-                    cross_batch_duplicates = batch_chunk_ids & seen_chunk_ids
-                    duplicate_chunk_ids = cross_batch_duplicates | same_batch_duplicates
-                    new_chunk_ids = (
-                        batch_chunk_ids - seen_chunk_ids - same_batch_duplicates
-                    )
-
-                    self._handle_duplicate_chunk_ids(
-                        batch=batch,
-                        batch_chunk_id_counts=batch_chunk_id_counts,
-                        duplicate_chunk_ids=duplicate_chunk_ids,
-                        same_batch_duplicates=same_batch_duplicates,
-                        cross_batch_duplicates=cross_batch_duplicates,
-                        new_chunk_ids=new_chunk_ids,
-                        successful_doc_ids=successful_doc_ids,
-                        result=result,
-                        errors=errors,
-                    )
-
-                    # Only update seen_chunk_ids with non-duplicate IDs
-                    seen_chunk_ids.update(new_chunk_ids)
-                    result.success_count += len(new_chunk_ids)
-
-                result.error_count += error_count
-                result.successfully_processed_documents.update(successful_doc_ids)
-                result.errors.extend(errors)
+            if result.upserted_chunk_ids:
+                await self._wait_for_updates(result)
 
         except asyncio.CancelledError:
             logger.debug("UpsertWorker cancelled")
             raise
         finally:
+            for _, task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(
+                    *(task for _, task in in_flight), return_exceptions=True
+                )
             logger.debug("UpsertWorker exited")
 
         return result
+
+    async def _wait_for_updates(self, result: PipelineResult) -> None:
+        """Wait until Qdrant has applied every batch sent by this run."""
+        try:
+            with prometheus_metrics.UPSERT_DURATION.time():
+                await self.qdrant_manager.wait_for_updates()
+        except Exception as e:
+            # The batches were acknowledged, so Qdrant applies them from its
+            # write-ahead log even if the barrier fails
+            logger.error(
+                "Failed to wait for upserted points to be applied", error=str(e)
+            )
+            result.errors.append(f"Failed to wait for upserts to be applied: {e}")
@@ -1,17 +1,27 @@
 import asyncio
+import re
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, cast
 from urllib.parse import urlparse
 
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient, QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import (
     Distance,
     VectorParams,
 )
 from qdrant_loader_core.config import (
+    DEFAULT_COLLECTION_PROFILE,
+    PROMOTED_PAYLOAD_FIELDS,
+    CollectionProfile,
     CollectionVectorCapabilities,
+    PayloadLayout,
     SparseRuntimeConfig,
+    analysis_collection_name,
     parse_collection_capabilities,
+    resolve_collection_profile,
 )
 from qdrant_loader_core.sparse import get_sparse_encoder
 
@@ -20,6 +30,17 @@ from ..utils.logging import LoggingConfig
 
 logger = LoggingConfig.get_logger(__name__)
 
+# Qdrant's defaults, restored after a bulk load that left no settings to restore
+_DEFAULT_HNSW_M = 16
+_DEFAULT_INDEXING_THRESHOLD = 20000
+
+# Versions of a collection built by ``reindex`` are named <name>__v<N>
+_VERSION_SEPARATOR = "__v"
+
+# Seconds the side collection name is trusted. The collection name may be an
+# alias that a reindex switches to another version with its own side collection.
+ANALYSIS_COLLECTION_TTL_SECONDS = 60.0
+
 
 class QdrantConnectionError(Exception):
     """Custom exception for Qdrant connection errors."""
@@ -34,18 +55,33 @@ class QdrantConnectionError(Exception):
 
 
 class QdrantManager:
-    def __init__(self, settings: Settings | None = None):
+    def __init__(
+        self, settings: Settings | None = None, collection_name: str | None = None
+    ):
         """Initialize the qDrant manager.
 
         Args:
             settings: The application settings
+            collection_name: Collection to work on instead of the configured
+                one, such as a version being built by ``reindex``
         """
         self.settings = settings or get_settings()
         self.client = None
-        self.collection_name = self.settings.qdrant_collection_name
+        # Ingestion upserts and deletes go through the async client, which is
+        # created on first use in the event loop that runs them
+        self.async_client: AsyncQdrantClient | None = None
+        self._async_client_loop: asyncio.AbstractEventLoop | None = None
+        self._url: str | None = None
+        self._api_key: str | None = None
+        self.collection_name = collection_name or self.settings.qdrant_collection_name
         self.logger = LoggingConfig.get_logger(__name__)
         self.batch_size = get_global_config().embedding.batch_size
         self.sparse_runtime = self._resolve_sparse_runtime_config()
+        self.payload_layout = self._resolve_payload_layout()
+        self._analysis_collection_name: str | None = None
+        self._analysis_collection_resolved_at: float | None = None
+        # Collections other than the main one written since the last barrier
+        self._written_collections: set[str] = set()
         self._collection_vector_capabilities: CollectionVectorCapabilities | None = None
         self._sparse_fallback_warning_emitted = False
         self.connect()
@@ -182,6 +218,8 @@ class QdrantManager:
                     api_key=api_key,
                     timeout=60,  # 60 seconds timeout
                 )
+                self._url = url
+                self._api_key = api_key
                 self.logger.debug("Successfully connected to qDrant")
             except Exception as e:
                 raise QdrantConnectionError(
@@ -205,14 +243,238 @@ class QdrantManager:
             )
         return cast(QdrantClient, self.client)
 
+    def _get_async_client(self) -> AsyncQdrantClient:
+        """Return the async client of the running event loop.
+
+        The client is bound to the loop it was created in, so a new one is
+        created when the manager is used from another loop.
+        """
+        self._ensure_client_connected()
+        loop = asyncio.get_running_loop()
+        if self.async_client is not None and self._async_client_loop is loop:
+            return self.async_client
+
+        qdrant_config = get_global_config().qdrant
+        try:
+            self.async_client = AsyncQdrantClient(
+                url=self._url,
+                api_key=self._api_key,
+                timeout=60,
+                prefer_grpc=qdrant_config.prefer_grpc,
+                grpc_port=qdrant_config.grpc_port,
+            )
+        except Exception as e:
+            raise QdrantConnectionError(
+                "Failed to connect to qDrant: Connection error",
+                original_error=str(e),
+                url=self._url,
+            ) from e
+        self._async_client_loop = loop
+        self.logger.debug(
+            "Created async qDrant client", prefer_grpc=qdrant_config.prefer_grpc
+        )
+        return self.async_client
+
+    async def aclose(self) -> None:
+        """Close the async client."""
+        client, self.async_client = self.async_client, None
+        loop, self._async_client_loop = self._async_client_loop, None
+        if client is None or loop is not asyncio.get_running_loop():
+            return
+        try:
+            await client.close()
+        except Exception as e:
+            self.logger.warning("Failed to close async qDrant client", error=str(e))
+
+    def _resolve_payload_layout(self) -> PayloadLayout:
+        """Layout of the payload of new points."""
+        qdrant_config = getattr(get_global_config(), "qdrant", None)
+        layout = getattr(qdrant_config, "payload", None)
+        return layout if isinstance(layout, PayloadLayout) else PayloadLayout()
+
+    @property
+    def analysis_collection_name(self) -> str:
+        """Side collection of the analysis fields taken out of the payload.
+
+        It belongs to the collection the name resolves to, so that every
+        version built by ``reindex`` has its own. The alias is resolved again
+        once the name is older than ``ANALYSIS_COLLECTION_TTL_SECONDS``, since
+        a long-lived session may see a reindex switch it. A failed lookup
+        keeps the previous name and is retried on the next call.
+        """
+        resolved_at = self._analysis_collection_resolved_at
+        if (
+            self._analysis_collection_name is not None
+            and resolved_at is not None
+            and time.monotonic() - resolved_at < ANALYSIS_COLLECTION_TTL_SECONDS
+        ):
+            return self._analysis_collection_name
+        try:
+            target = self.get_alias_target()
+        except Exception as e:
+            self.logger.debug("Failed to resolve collection alias", error=str(e))
+            if self._analysis_collection_name is None:
+                return analysis_collection_name(self.collection_name)
+            return self._analysis_collection_name
+        name = analysis_collection_name(target or self.collection_name)
+        if self._analysis_collection_name not in (None, name):
+            self.logger.info(
+                "The collection alias moved; using its new analysis side collection",
+                collection=name,
+            )
+        self._analysis_collection_name = name
+        self._analysis_collection_resolved_at = time.monotonic()
+        return name
+
+    @property
+    def uses_analysis_store(self) -> bool:
+        return (
+            self.payload_layout.version >= 2
+            and self.payload_layout.analysis_fields == "side_store"
+        )
+
+    def _collection_profile(self) -> tuple[str, CollectionProfile]:
+        """Name and options of the profile new collections are created with."""
+        qdrant_config = getattr(get_global_config(), "qdrant", None)
+        name = getattr(qdrant_config, "collection_profile", None)
+        profile = getattr(qdrant_config, "profile", None)
+        if isinstance(name, str) and isinstance(profile, CollectionProfile):
+            return name, profile
+        return DEFAULT_COLLECTION_PROFILE, resolve_collection_profile(None)
+
+    def _collection_profile_options(self, profile: CollectionProfile) -> dict[str, Any]:
+        """Keyword arguments of ``create_collection`` set by a profile.
+
+        Options the profile leaves unset are not sent, so Qdrant's defaults
+        apply to them.
+        """
+        options: dict[str, Any] = {}
+        if profile.quantization == "scalar":
+            options["quantization_config"] = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8,
+                    quantile=profile.scalar_quantile,
+                    always_ram=profile.quantization_always_ram,
+                )
+            )
+        elif profile.quantization == "binary":
+            options["quantization_config"] = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(
+                    always_ram=profile.quantization_always_ram
+                )
+            )
+        elif profile.quantization == "product":
+            options["quantization_config"] = models.ProductQuantization(
+                product=models.ProductQuantizationConfig(
+                    compression=models.CompressionRatio(profile.product_compression),
+                    always_ram=profile.quantization_always_ram,
+                )
+            )
+
+        if (
+            profile.hnsw_m is not None
+            or profile.hnsw_ef_construct is not None
+            or (profile.hnsw_on_disk)
+        ):
+            options["hnsw_config"] = models.HnswConfigDiff(
+                m=profile.hnsw_m,
+                ef_construct=profile.hnsw_ef_construct,
+                on_disk=profile.hnsw_on_disk or None,
+            )
+        if (
+            profile.indexing_threshold is not None
+            or profile.memmap_threshold is not None
+        ):
+            options["optimizers_config"] = models.OptimizersConfigDiff(
+                indexing_threshold=profile.indexing_threshold,
+                memmap_threshold=profile.memmap_threshold,
+            )
+        if profile.payload_on_disk:
+            options["on_disk_payload"] = True
+        return options
+
+    def payload_indexes(self) -> list[tuple[str, dict[str, str]]]:
+        """Payload indexes of the collection, for the configured layout.
+
+        Version 2 payloads keep the filterable fields at the top level and
+        index their dates as datetimes.
+        """
+        date_type = "datetime" if self.payload_layout.version >= 2 else "keyword"
+        indexes = [
+            # Essential performance indexes
+            ("document_id", "keyword"),  # Existing index, kept for compatibility
+            ("project_id", "keyword"),  # Critical for multi-tenant filtering
+            ("source_type", "keyword"),  # Document type filtering
+            ("source", "keyword"),  # Source path filtering
+            ("title", "keyword"),  # Title-based search and filtering
+            ("created_at", date_type),  # Temporal filtering
+            ("updated_at", date_type),  # Temporal filtering
+            # Secondary performance indexes
+            ("is_attachment", "bool"),  # Attachment filtering
+            ("parent_document_id", "keyword"),  # Hierarchical relationships
+            ("original_file_type", "keyword"),  # File type filtering
+            ("is_converted", "bool"),  # Conversion status filtering
+        ]
+        if self.payload_layout.version >= 2:
+            indexed = {name for name, _ in indexes}
+            indexes += [
+                (name, schema)
+                for name, schema in PROMOTED_PAYLOAD_FIELDS.items()
+                if name not in indexed
+            ]
+        return [(name, {"type": schema}) for name, schema in indexes]
+
+    def _create_analysis_collection(self, client: QdrantClient) -> None:
+        """Create the side collection of the analysis fields, if missing.
+
+        Its points have the IDs of the collection's points and no vector.
+        """
+        name = self.analysis_collection_name
+        if any(c.name == name for c in client.get_collections().collections):
+            return
+        client.create_collection(collection_name=name, vectors_config={})
+        client.create_payload_index(
+            collection_name=name,
+            field_name="document_id",
+            field_schema={"type": "keyword"},  # type: ignore
+        )
+        self.logger.info("Created analysis side collection", collection=name)
+
+    def _warn_on_profile_mismatch(self, client: QdrantClient) -> None:
+        """Warn when an existing collection was created with another profile."""
+        profile_name, profile = self._collection_profile()
+        try:
+            info = client.get_collection(collection_name=self.collection_name)
+            if profile.matches(info, self.sparse_runtime.dense_vector_name):
+                return
+        except Exception as e:
+            self.logger.debug("Failed to inspect collection profile", error=str(e))
+            return
+        self.logger.warning(
+            "Existing collection was not created with the configured profile; "
+            "recreate it to apply the profile",
+            collection=self.collection_name,
+            collection_profile=profile_name,
+        )
+
     def create_collection(self) -> None:
-        """Create a new collection if it doesn't exist."""
+        """Create a new collection if it doesn't exist.
+
+        The collection is created with the options of the configured
+        collection profile: quantization, on-disk storage and HNSW tuning.
+        """
         try:
             client = self._ensure_client_connected()
             # Check if collection already exists
             collections = client.get_collections()
-            if any(c.name == self.collection_name for c in collections.collections):
+            if (
+                any(c.name == self.collection_name for c in collections.collections)
+                or self.get_alias_target() is not None
+            ):
                 self.logger.info(f"Collection {self.collection_name} already exists")
+                self._warn_on_profile_mismatch(client)
+                if self.uses_analysis_store:
+                    self._create_analysis_collection(client)
                 return
 
             # Get vector size from unified LLM settings first, then legacy embedding
@@ -250,16 +512,30 @@ class QdrantManager:
             # is created with a sparse vector; failures propagate. If False,
             # dense-only. Operators on Qdrant servers that don't support sparse
             # vectors must set sparse.enabled=false explicitly.
-            dense_params = VectorParams(size=vector_size, distance=Distance.COSINE)
+            profile_name, profile = self._collection_profile()
+            profile_options = self._collection_profile_options(profile)
+            dense_params = VectorParams(
+                size=vector_size,
+                distance=Distance.COSINE,
+                on_disk=profile.vectors_on_disk or None,
+            )
             if self.sparse_runtime.enabled:
+                sparse_params = (
+                    models.SparseVectorParams(
+                        index=models.SparseIndexParams(on_disk=True)
+                    )
+                    if profile.vectors_on_disk
+                    else models.SparseVectorParams()
+                )
                 client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config={
                         self.sparse_runtime.dense_vector_name: dense_params
                     },
                     sparse_vectors_config={
-                        self.sparse_runtime.sparse_vector_name: models.SparseVectorParams()
+                        self.sparse_runtime.sparse_vector_name: sparse_params
                     },
+                    **profile_options,
                 )
                 self.logger.info(
                     "Created Qdrant collection with dense+sparse vectors",
@@ -267,11 +543,13 @@ class QdrantManager:
                     dense_vector_name=self.sparse_runtime.dense_vector_name,
                     sparse_vector_name=self.sparse_runtime.sparse_vector_name,
                     sparse_model=self.sparse_runtime.model,
+                    collection_profile=profile_name,
                 )
             else:
                 client.create_collection(
                     collection_name=self.collection_name,
                     vectors_config=dense_params,
+                    **profile_options,
                 )
 
             self._collection_vector_capabilities = CollectionVectorCapabilities(
@@ -279,31 +557,11 @@ class QdrantManager:
                 has_sparse=self.sparse_runtime.enabled,
             )
 
+            if self.uses_analysis_store:
+                self._create_analysis_collection(client)
+
             # Create payload indexes for optimal search performance
-            indexes_to_create = [
-                # Essential performance indexes
-                (
-                    "document_id",
-                    {"type": "keyword"},
-                ),  # Existing index, kept for backward compatibility
-                (
-                    "project_id",
-                    {"type": "keyword"},
-                ),  # Critical for multi-tenant filtering
-                ("source_type", {"type": "keyword"}),  # Document type filtering
-                ("source", {"type": "keyword"}),  # Source path filtering
-                ("title", {"type": "keyword"}),  # Title-based search and filtering
-                ("created_at", {"type": "keyword"}),  # Temporal filtering
-                ("updated_at", {"type": "keyword"}),  # Temporal filtering
-                # Secondary performance indexes
-                ("is_attachment", {"type": "bool"}),  # Attachment filtering
-                (
-                    "parent_document_id",
-                    {"type": "keyword"},
-                ),  # Hierarchical relationships
-                ("original_file_type", {"type": "keyword"}),  # File type filtering
-                ("is_converted", {"type": "bool"}),  # Conversion status filtering
-            ]
+            indexes_to_create = self.payload_indexes()
 
             # Create indexes with proper error handling
             created_indexes = []
@@ -343,11 +601,15 @@ class QdrantManager:
             self.logger.error("Failed to create collection", error=str(e))
             raise
 
-    async def upsert_points(self, points: list[models.PointStruct]) -> None:
+    async def upsert_points(
+        self, points: list[models.PointStruct], wait: bool = True
+    ) -> None:
         """Upsert points into the collection.
 
         Args:
             points: List of points to upsert
+            wait: Return once the points are applied, rather than once Qdrant
+                has acknowledged them; see ``wait_for_updates``
         """
         self.logger.debug(
             "Upserting points",
@@ -355,9 +617,9 @@ class QdrantManager:
         )
 
         try:
-            client = self._ensure_client_connected()
-            await asyncio.to_thread(
-                client.upsert, collection_name=self.collection_name, points=points
+            client = self._get_async_client()
+            await client.upsert(
+                collection_name=self.collection_name, points=points, wait=wait
             )
             self.logger.debug(
                 "Successfully upserted points",
@@ -374,6 +636,215 @@ class QdrantManager:
             )
             raise
 
+    async def upsert_analysis(
+        self, points: list[models.PointStruct], wait: bool = True
+    ) -> None:
+        """Upsert the analysis fields of points into the side collection."""
+        client = self._get_async_client()
+        collection_name = self.analysis_collection_name
+        self._written_collections.add(collection_name)
+        await client.upsert(collection_name=collection_name, points=points, wait=wait)
+
+    async def overwrite_payloads(
+        self, payloads: list[tuple[Any, dict[str, Any]]], wait: bool = True
+    ) -> None:
+        """Replace the payload of points without touching their vectors.
+
+        Args:
+            payloads: ``(point_id, payload)`` pairs, sent in one request
+            wait: Return once the payloads are applied
+        """
+        if not payloads:
+            return
+        client = self._get_async_client()
+        await client.batch_update_points(
+            collection_name=self.collection_name,
+            update_operations=[
+                models.OverwritePayloadOperation(
+                    overwrite_payload=models.SetPayload(
+                        payload=payload, points=[point_id]
+                    )
+                )
+                for point_id, payload in payloads
+            ],
+            wait=wait,
+        )
+
+    def _point_collections(self) -> list[str]:
+        """Collections holding data of the collection's points."""
+        if self.uses_analysis_store:
+            return [self.collection_name, self.analysis_collection_name]
+        return [self.collection_name]
+
+    async def wait_for_updates(self) -> None:
+        """Wait until every update sent to the collections so far is applied.
+
+        Updates sent with ``wait=False`` return once Qdrant has written them to
+        its write-ahead log. Each shard applies its updates in order, so a
+        waited delete that matches nothing, which reaches every shard, returns
+        once all of them are visible to searches. The barrier is sent to the
+        collection and to every side collection written to.
+        """
+        client = self._get_async_client()
+        collections = dict.fromkeys(
+            [*self._point_collections(), *sorted(self._written_collections)]
+        )
+        self._written_collections.clear()
+        for collection_name in collections:
+            await client.delete(
+                collection_name=collection_name,
+                points_selector=models.Filter(
+                    must=[
+                        models.FieldCondition(
+                            key="document_id", match=models.MatchAny(any=[])
+                        )
+                    ]
+                ),
+                wait=True,
+            )
+
+    @asynccontextmanager
+    async def bulk_load(self, poll_interval: float = 5.0) -> AsyncIterator[None]:
+        """Load the collection with HNSW indexing disabled.
+
+        Building the HNSW graph while points stream in is several times slower
+        than building it once at the end. Inside the context the collection
+        keeps no graph (``m=0``) and indexes no segment
+        (``indexing_threshold=0``). On exit the HNSW settings of the collection
+        profile are restored and the collection is waited on until it is
+        green. If the load or the restore fails, the settings the collection
+        had before are put back.
+
+        Args:
+            poll_interval: Seconds between two checks of the indexing progress
+        """
+        original = await self._get_index_settings()
+        self.logger.info(
+            "Disabling HNSW indexing for bulk load",
+            collection=self.collection_name,
+            **original,
+        )
+        await self._update_index_settings(m=0, indexing_threshold=0)
+        try:
+            yield
+            restored = self._bulk_load_restore_settings(original)
+            self.logger.info(
+                "Bulk load finished, restoring HNSW indexing",
+                collection=self.collection_name,
+                **restored,
+            )
+            await self._update_index_settings(**restored)
+        except BaseException:
+            await self._rollback_index_settings(original)
+            raise
+        await self.wait_until_green(poll_interval)
+
+    async def wait_until_green(
+        self, poll_interval: float = 5.0, timeout: float | None = None
+    ) -> None:
+        """Wait until the optimizers of the collection are done.
+
+        Logs how many vectors are indexed at every check.
+
+        Raises:
+            RuntimeError: If the optimizers of the collection failed
+            TimeoutError: If the collection is not green after ``timeout`` seconds
+        """
+        client = self._get_async_client()
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            info = await client.get_collection(collection_name=self.collection_name)
+            progress = {
+                "collection": self.collection_name,
+                "points": info.points_count,
+                "indexed_vectors": info.indexed_vectors_count,
+            }
+            if info.status == models.CollectionStatus.GREEN:
+                self.logger.info("Collection is green", **progress)
+                return
+            if info.status == models.CollectionStatus.RED:
+                raise RuntimeError(
+                    f"Optimization of collection {self.collection_name} failed: "
+                    f"{info.optimizer_status}"
+                )
+            if info.status == models.CollectionStatus.GREY:
+                # Pending optimizations only start on the next collection update
+                await client.update_collection(
+                    collection_name=self.collection_name,
+                    optimizers_config=models.OptimizersConfigDiff(),
+                )
+            self.logger.info(
+                "Waiting for collection to be indexed",
+                status=info.status.value,
+                **progress,
+            )
+            if deadline is not None and loop.time() >= deadline:
+                raise TimeoutError(
+                    f"Collection {self.collection_name} is not green after "
+                    f"{timeout} seconds"
+                )
+            await asyncio.sleep(poll_interval)
+
+    async def _get_index_settings(self) -> dict[str, int | None]:
+        """HNSW ``m`` and indexing threshold the collection currently has."""
+        client = self._get_async_client()
+        info = await client.get_collection(collection_name=self.collection_name)
+        return {
+            "m": info.config.hnsw_config.m,
+            "indexing_threshold": info.config.optimizer_config.indexing_threshold,
+        }
+
+    async def _update_index_settings(
+        self, m: int | None, indexing_threshold: int | None
+    ) -> None:
+        client = self._get_async_client()
+        await client.update_collection(
+            collection_name=self.collection_name,
+            hnsw_config=models.HnswConfigDiff(m=m),
+            optimizers_config=models.OptimizersConfigDiff(
+                indexing_threshold=indexing_threshold
+            ),
+        )
+
+    def _bulk_load_restore_settings(
+        self, original: dict[str, int | None]
+    ) -> dict[str, int | None]:
+        """Index settings to restore after a bulk load.
+
+        The profile's settings come first. Without them the collection gets
+        back what it had, unless that is the disabled indexing left behind by
+        an interrupted bulk load.
+        """
+        _, profile = self._collection_profile()
+        m = profile.hnsw_m if profile.hnsw_m is not None else original["m"]
+        indexing_threshold = (
+            profile.indexing_threshold
+            if profile.indexing_threshold is not None
+            else original["indexing_threshold"]
+        )
+        return {
+            "m": m or _DEFAULT_HNSW_M,
+            "indexing_threshold": indexing_threshold or _DEFAULT_INDEXING_THRESHOLD,
+        }
+
+    async def _rollback_index_settings(self, original: dict[str, int | None]) -> None:
+        """Put back the index settings of a failed bulk load."""
+        self.logger.warning(
+            "Bulk load failed, rolling back index settings",
+            collection=self.collection_name,
+            **original,
+        )
+        try:
+            await self._update_index_settings(**original)
+        except Exception as e:
+            self.logger.error(
+                "Failed to roll back index settings; restore them manually",
+                collection=self.collection_name,
+                error=str(e),
+                **original,
+            )
+
     def search(
         self, query_vector: list[float], limit: int = 5
     ) -> list[models.ScoredPoint]:
@@ -471,15 +942,175 @@ class QdrantManager:
             raise
 
     def delete_collection(self) -> None:
-        """Delete the collection."""
+        """Delete the collection.
+
+        When the collection name is an alias, the alias and the collection it
+        points to are deleted.
+        """
         try:
             client = self._ensure_client_connected()
+            target = self.get_alias_target()
+            if target is not None:
+                client.update_collection_aliases(
+                    change_aliases_operations=[
+                        models.DeleteAliasOperation(
+                            delete_alias=models.DeleteAlias(
+                                alias_name=self.collection_name
+                            )
+                        )
+                    ]
+                )
+                client.delete_collection(collection_name=target)
+                self._delete_analysis_collection(client, target)
+                logger.debug(
+                    "Alias and collection deleted",
+                    alias=self.collection_name,
+                    collection=target,
+                )
+                return
             client.delete_collection(collection_name=self.collection_name)
+            self._delete_analysis_collection(client, self.collection_name)
             logger.debug("Collection deleted", collection=self.collection_name)
         except Exception as e:
             logger.error("Failed to delete collection", error=str(e))
             raise
 
+    def _delete_analysis_collection(
+        self, client: QdrantClient, collection_name: str
+    ) -> None:
+        """Delete the analysis side collection of a collection, if any."""
+        name = analysis_collection_name(collection_name)
+        if any(c.name == name for c in client.get_collections().collections):
+            client.delete_collection(collection_name=name)
+
+    def get_alias_target(self) -> str | None:
+        """Collection the collection name points to, when it is an alias."""
+        client = self._ensure_client_connected()
+        for alias in client.get_aliases().aliases:
+            if alias.alias_name == self.collection_name:
+                return alias.collection_name
+        return None
+
+    def version_name(self, version: int) -> str:
+        """Name of a version of the collection built by ``reindex``."""
+        return f"{self.collection_name}{_VERSION_SEPARATOR}{version}"
+
+    def list_collection_versions(self) -> list[tuple[int, str]]:
+        """Versions of the collection built by ``reindex``, oldest first."""
+        client = self._ensure_client_connected()
+        pattern = re.compile(
+            rf"{re.escape(self.collection_name)}{_VERSION_SEPARATOR}(\d+)"
+        )
+        versions = []
+        for collection in client.get_collections().collections:
+            match = pattern.fullmatch(collection.name)
+            if match:
+                versions.append((int(match.group(1)), collection.name))
+        return sorted(versions)
+
+    def swap_alias(self, target: str) -> str | None:
+        """Point the collection name, as an alias, at another collection.
+
+        Switching an existing alias is atomic: searches go to the previous
+        collection until they all go to the new one. A collection that has
+        the name of the alias is deleted first, since an alias cannot shadow
+        it; searches fail for the moment between the two calls.
+
+        Returns:
+            The collection the alias pointed to before, if any
+        """
+        client = self._ensure_client_connected()
+        previous = self.get_alias_target()
+        operations: list[Any] = []
+        if previous is not None:
+            operations.append(
+                models.DeleteAliasOperation(
+                    delete_alias=models.DeleteAlias(alias_name=self.collection_name)
+                )
+            )
+        elif any(
+            c.name == self.collection_name for c in client.get_collections().collections
+        ):
+            self.logger.warning(
+                "Replacing collection by an alias to its new version",
+                collection=self.collection_name,
+                target=target,
+            )
+            client.delete_collection(collection_name=self.collection_name)
+        operations.append(
+            models.CreateAliasOperation(
+                create_alias=models.CreateAlias(
+                    collection_name=target, alias_name=self.collection_name
+                )
+            )
+        )
+        client.update_collection_aliases(change_aliases_operations=operations)
+        self.logger.info(
+            "Alias switched",
+            alias=self.collection_name,
+            target=target,
+            previous=previous,
+        )
+        return previous
+
+    def delete_old_versions(self, retention: int) -> list[str]:
+        """Delete the versions of the collection beyond the newest ``retention``.
+
+        The version the alias points to is always kept.
+
+        Returns:
+            Names of the deleted collections
+        """
+        client = self._ensure_client_connected()
+        live = self.get_alias_target()
+        versions = [name for _, name in self.list_collection_versions()]
+        stale = [
+            name
+            for name in versions[: max(len(versions) - retention, 0)]
+            if name != live
+        ]
+        for name in stale:
+            client.delete_collection(collection_name=name)
+            self._delete_analysis_collection(client, name)
+            self.logger.info("Deleted old collection version", collection=name)
+        return stale
+
+    async def delete_points(self, point_ids: list[str]) -> None:
+        """Delete points from the collection by point ID.
+
+        Args:
+            point_ids: List of point IDs to delete
+        """
+        self.logger.debug(
+            "Deleting points by ID",
+            extra={"point_count": len(point_ids), "collection": self.collection_name},
+        )
+
+        try:
+            client = self._get_async_client()
+            for collection_name in self._point_collections():
+                await client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.PointIdsList(points=point_ids),
+                )
+            self.logger.debug(
+                "Successfully deleted points",
+                extra={
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to delete points",
+                extra={
+                    "error": str(e),
+                    "point_count": len(point_ids),
+                    "collection": self.collection_name,
+                },
+            )
+            raise
+
     async def delete_points_by_document_id(self, document_ids: list[str]) -> None:
         """Delete points from the collection by document ID.
 
@@ -495,18 +1126,19 @@ class QdrantManager:
         )
 
         try:
-            client = self._ensure_client_connected()
-            await asyncio.to_thread(
-                client.delete,
-                collection_name=self.collection_name,
-                points_selector=models.Filter(
-                    must=[
-                        models.FieldCondition(
-                            key="document_id", match=models.MatchAny(any=document_ids)
-                        )
-                    ]
-                ),
-            )
+            client = self._get_async_client()
+            for collection_name in self._point_collections():
+                await client.delete(
+                    collection_name=collection_name,
+                    points_selector=models.Filter(
+                        must=[
+                            models.FieldCondition(
+                                key="document_id",
+                                match=models.MatchAny(any=document_ids),
+                            )
+                        ]
+                    ),
+                )
             self.logger.debug(
                 "Successfully deleted points",
                 extra={
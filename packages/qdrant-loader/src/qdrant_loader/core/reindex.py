@@ -0,0 +1,196 @@
+"""Blue/green reindexing through a collection alias.
+
+A reindex builds every source into a new version of the collection,
+``<name>__v<N>``, while searches keep going to the live one. The new version
+is loaded with HNSW indexing disabled and indexed once at the end. Only then
+is the alias ``<name>`` switched to it, in one atomic operation. Versions
+beyond the retention count are then deleted. A reindex in which a source or
+a document failed deletes its version and leaves the live collection
+untouched, since the new version would lack their documents.
+
+The ingestion records its document, chunk and file states in a copy of the
+state database, ``<state>.<name>__v<N>.db``. The copy replaces the live
+state only once the alias points to the new version, so a failed reindex
+leaves the state describing the live collection.
+"""
+
+import asyncio
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from qdrant_loader.config import Settings
+from qdrant_loader.core.qdrant_manager import QdrantManager
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+_MEMORY_DATABASES = (":memory:", "sqlite:///:memory:", "sqlite://:memory:")
+
+
+async def reindex_collection(
+    settings: Settings,
+    retention: int | None = None,
+    metrics_dir: str | None = None,
+) -> str:
+    """Rebuild the collection into a new version and switch the alias to it.
+
+    Args:
+        settings: The application settings
+        retention: Versions to keep, including the new one; defaults to
+            ``qdrant.reindex_retention``
+        metrics_dir: Directory of the ingestion metrics
+
+    Returns:
+        Name of the collection the alias now points to
+    """
+    from qdrant_loader.core.async_ingestion_pipeline import AsyncIngestionPipeline
+    from qdrant_loader.core.state.state_manager import StateManager
+
+    if retention is None:
+        retention = settings.global_config.qdrant.reindex_retention
+    alias = QdrantManager(settings)
+    versions = alias.list_collection_versions()
+    version = versions[-1][0] + 1 if versions else 1
+    shadow = QdrantManager(settings, collection_name=alias.version_name(version))
+    logger.info(
+        "Reindexing into a new collection version",
+        alias=alias.collection_name,
+        collection=shadow.collection_name,
+        live=alias.get_alias_target(),
+    )
+
+    state_config = settings.global_config.state_management
+    state_paths = _state_paths(state_config.database_path, shadow.collection_name)
+    busy_timeout = state_config.busy_timeout_ms / 1000
+
+    shadow.create_collection()
+    state_manager = None
+    try:
+        if state_paths is not None:
+            live_state, shadow_state = state_paths
+            _remove_database(shadow_state)
+            await asyncio.to_thread(
+                _copy_database, live_state, shadow_state, busy_timeout
+            )
+            state_manager = StateManager(
+                state_config.model_copy(update={"database_path": str(shadow_state)})
+            )
+        pipeline = (
+            AsyncIngestionPipeline(
+                settings, shadow, state_manager=state_manager, metrics_dir=metrics_dir
+            )
+            if metrics_dir
+            else AsyncIngestionPipeline(settings, shadow, state_manager=state_manager)
+        )
+        try:
+            async with shadow.bulk_load():
+                await pipeline.process_documents(force=True)
+                _check_complete(
+                    getattr(pipeline.orchestrator, "last_pipeline_result", None)
+                )
+        finally:
+            await pipeline.cleanup()
+            if state_manager is not None:
+                await state_manager.dispose()
+        alias.swap_alias(shadow.collection_name)
+    except BaseException:
+        logger.error(
+            "Reindex failed; the live collection and its state are unchanged",
+            collection=shadow.collection_name,
+        )
+        try:
+            shadow.delete_collection()
+        except Exception as e:
+            logger.warning(
+                "Failed to delete the unfinished collection version",
+                collection=shadow.collection_name,
+                error=str(e),
+            )
+        if state_paths is not None:
+            _remove_database(state_paths[1])
+        raise
+
+    if state_paths is not None:
+        live_state, shadow_state = state_paths
+        try:
+            await asyncio.to_thread(
+                _copy_database, shadow_state, live_state, busy_timeout
+            )
+        except Exception as e:
+            logger.error(
+                "The alias was switched but its state could not be stored; the "
+                "next incremental ingestion reprocesses the documents it lacks",
+                collection=shadow.collection_name,
+                state=str(shadow_state),
+                error=str(e),
+            )
+            raise
+        _remove_database(shadow_state)
+
+    deleted = alias.delete_old_versions(retention)
+    logger.info(
+        "Reindex completed",
+        alias=alias.collection_name,
+        collection=shadow.collection_name,
+        deleted_versions=deleted,
+    )
+    return shadow.collection_name
+
+
+def _check_complete(result: Any) -> None:
+    """Raise unless the pipeline result shows every source and document ingested.
+
+    Source failures are logged and skipped by the pipeline, which suits
+    incremental ingestions but would make the new version lose documents.
+    """
+    if result is None:
+        raise RuntimeError("Reindex aborted: the ingestion reported no result")
+    if result.has_failures:
+        raise RuntimeError(
+            f"Reindex aborted: {len(result.failed_sources)} sources and "
+            f"{len(result.failed_document_ids)} documents failed to ingest "
+            f"({len(result.errors)} errors)"
+        )
+
+
+def _state_paths(database_path: str, collection_name: str) -> tuple[Path, Path] | None:
+    """Paths of the live state database and of the copy built by a reindex.
+
+    Returns None for an in-memory database, which no other run shares.
+    """
+    if database_path in _MEMORY_DATABASES:
+        return None
+    if database_path.startswith("sqlite:///"):
+        database_path = database_path[len("sqlite:///") :]
+    live = Path(database_path).resolve()
+    return live, live.with_name(f"{live.stem}.{collection_name}{live.suffix}")
+
+
+def _copy_database(source: Path, target: Path, timeout: float) -> None:
+    """Copy a SQLite database with the backup API, consistent while in use.
+
+    Nothing is copied from a missing source, as before a first ingestion.
+    """
+    if not source.exists():
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        closing(sqlite3.connect(source, timeout=timeout)) as src,
+        closing(sqlite3.connect(target, timeout=timeout)) as dst,
+    ):
+        src.backup(dst)
+
+
+def _remove_database(path: Path) -> None:
+    """Delete a SQLite database file along with its journal files."""
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        try:
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(
+                "Failed to delete a reindex state file",
+                path=f"{path}{suffix}",
+                error=str(e),
+            )
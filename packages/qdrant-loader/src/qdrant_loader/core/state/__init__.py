@@ -12,16 +12,25 @@ from .exceptions import (
     MissingMetadataError,
     StateError,
 )
-from .models import DocumentStateRecord, IngestionHistory
+from .models import (
+    ChunkStateRecord,
+    DocumentStateRecord,
+    FileStatRecord,
+    IngestionHistory,
+    SyncCursorRecord,
+)
 from .state_manager import StateManager
 
 __all__ = [
+    "ChunkStateRecord",
     "DatabaseError",
     "DocumentStateRecord",
+    "FileStatRecord",
     "IngestionHistory",
     "InvalidDocumentStateError",
     "MigrationError",
     "MissingMetadataError",
     "StateError",
     "StateManager",
+    "SyncCursorRecord",
 ]
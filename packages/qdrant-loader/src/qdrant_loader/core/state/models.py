@@ -6,6 +6,7 @@ from datetime import UTC
 
 import sqlalchemy as sa
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     Float,
@@ -212,6 +213,89 @@ class DocumentStateRecord(Base):
     )
 
 
+class ChunkStateRecord(Base):
+    """Tracks the content hash of every chunk written for a document."""
+
+    __tablename__ = "chunk_states"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=True
+    )  # Nullable for backward compatibility
+    source_type = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    document_id = Column(String, nullable=False)
+    chunk_id = Column(String, nullable=False)  # Qdrant point ID of the chunk
+    chunk_index = Column(Integer, nullable=False)
+    content_hash = Column(String, nullable=False)
+    updated_at = Column(UTCDateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id",
+            "source_type",
+            "source",
+            "document_id",
+            "chunk_id",
+            name="uix_project_chunk",
+        ),
+        Index("ix_chunk_document", "source_type", "source", "document_id"),
+    )
+
+
+class SyncCursorRecord(Base):
+    """Position reached by the last complete ingestion of a source.
+
+    Set for connectors that list changes incrementally, e.g. the commit SHA
+    of a Git repository.
+    """
+
+    __tablename__ = "sync_cursors"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=True
+    )  # Nullable for backward compatibility
+    source_type = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    cursor = Column(String, nullable=False)
+    updated_at = Column(UTCDateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "source_type", "source", name="uix_project_sync_cursor"
+        ),
+    )
+
+
+class FileStatRecord(Base):
+    """Size and modification time of a file when its document was last ingested.
+
+    Lets file-based connectors skip unchanged files without reading them.
+    """
+
+    __tablename__ = "file_stats"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(
+        String, ForeignKey("projects.id", ondelete="CASCADE"), nullable=True
+    )  # Nullable for backward compatibility
+    source_type = Column(String, nullable=False)
+    source = Column(String, nullable=False)
+    path = Column(String, nullable=False)  # Path relative to the source root
+    url = Column(String, nullable=False)  # URL of the document built from the file
+    size = Column(BigInteger, nullable=False)
+    mtime_ns = Column(BigInteger, nullable=False)
+    updated_at = Column(UTCDateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "project_id", "source_type", "source", "path", name="uix_project_file"
+        ),
+        Index("ix_file_stat_source", "source_type", "source"),
+    )
+
+
 class Job(Base):
     """Queue job persisted in the state database."""
 
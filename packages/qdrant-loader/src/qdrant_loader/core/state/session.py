@@ -1,29 +1,209 @@
 from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
-from sqlalchemy.pool import StaticPool
+import asyncio
+import weakref
+from typing import Any
+
+from sqlalchemy import Select, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, StaticPool
 
 from qdrant_loader.config.state import StateManagementConfig
 from qdrant_loader.core.state.models import Base
 from qdrant_loader.core.state.utils import generate_sqlite_aiosqlite_url as _gen_url
 
+# Read engines created alongside a write engine, disposed together with it
+_read_engines: weakref.WeakKeyDictionary[AsyncEngine, AsyncEngine] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+class _ReadWriteSession(Session):
+    """Session that can serve the SELECTs of read-only sessions from a read engine.
+
+    Sessions opened through ``read_session`` send their SELECTs to the read
+    engine; every other statement, and every statement of a regular session,
+    goes to the write engine so read-modify-write sequences stay in one
+    transaction.
+    """
+
+    def __init__(self, *args: Any, read_bind: Engine | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._read_bind = read_bind
+
+    def get_bind(self, mapper=None, *, clause=None, bind=None, **kw):  # type: ignore[override]
+        if (
+            bind is None
+            and self._read_bind is not None
+            and self.info.get("read_only")
+            and isinstance(clause, Select)
+            and not self._flushing
+        ):
+            return self._read_bind
+        return super().get_bind(mapper, clause=clause, bind=bind, **kw)
+
+
+class _WriteLock:
+    """Lock serializing the write sessions, re-entrant within a task.
+
+    A session opened while the same task holds another one, such as a helper
+    called by a method that opened a session, shares its connection instead of
+    waiting for it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = asyncio.Lock()
+        self._owner: asyncio.Task | None = None
+        self._depth = 0
+
+    async def acquire(self) -> None:
+        task = asyncio.current_task()
+        if task is not None and self._owner is task:
+            self._depth += 1
+            return
+        await self._lock.acquire()
+        self._owner = task
+        self._depth = 1
+
+    def release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self._owner = None
+            self._lock.release()
+
+
+class _SerializedSession(AsyncSession):
+    """Session that holds the write lock while open, unless it is read-only."""
+
+    def __init__(self, *args: Any, write_lock: _WriteLock | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._write_lock = write_lock
+        self._holds_write_lock = False
+
+    async def __aenter__(self) -> _SerializedSession:
+        if self._write_lock is not None and not self.info.get("read_only"):
+            await self._write_lock.acquire()
+            self._holds_write_lock = True
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        try:
+            await super().__aexit__(*exc_info)
+        finally:
+            if self._holds_write_lock:
+                self._holds_write_lock = False
+                self._write_lock.release()  # type: ignore[union-attr]
+
+
+def read_session(session_factory: async_sessionmaker) -> AsyncSession:
+    """Open a session whose queries may be served by the pooled read engine."""
+    return session_factory(info={"read_only": True})
+
+
+def _is_memory_url(database_url: str) -> bool:
+    return ":memory:" in database_url
+
+
+def _apply_pragmas(engine: AsyncEngine, config: StateManagementConfig) -> None:
+    """Apply the configured SQLite tuning profile to every new connection."""
+    pragmas = (
+        f"PRAGMA journal_mode={config.journal_mode.upper()}",
+        f"PRAGMA synchronous={config.synchronous.upper()}",
+        f"PRAGMA busy_timeout={config.busy_timeout_ms}",
+        # Negative cache_size is in KiB rather than pages
+        f"PRAGMA cache_size=-{config.cache_size_kb}",
+        f"PRAGMA mmap_size={config.mmap_size_mb * 1024 * 1024}",
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):  # pragma: no cover - hook
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
 
 def initialize_engine_and_session(
     config: StateManagementConfig,
 ) -> tuple[AsyncEngine, async_sessionmaker]:
     """Create the async engine and session factory for state DB.
 
-    Uses the same engine configuration as StateManager did previously.
+    In-memory databases use a single shared connection. File-backed databases
+    get the configured SQLite tuning profile (WAL, synchronous level, cache and
+    mmap sizes) and, with ``read_write_split``, a single-connection write
+    engine plus a pooled read engine sized by ``connection_pool`` that serves
+    sessions opened with ``read_session``.
+
+    Returns the write engine; ``dispose_engine`` also disposes its read engine.
     """
     database_url = _gen_url(config.database_path)
-    engine = create_async_engine(
+    if _is_memory_url(database_url):
+        engine = create_async_engine(
+            database_url,
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+            echo=False,
+        )
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        return engine, session_factory
+
+    pool_size = max(1, int(config.connection_pool.get("size", 5)))
+    pool_timeout = float(config.connection_pool.get("timeout", 30))
+
+    if not config.read_write_split:
+        engine = create_async_engine(
+            database_url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=0,
+            pool_timeout=pool_timeout,
+            connect_args={"check_same_thread": False},
+            echo=False,
+        )
+        _apply_pragmas(engine, config)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        return engine, session_factory
+
+    # SQLite allows a single writer at a time. Write sessions share one
+    # connection and take turns on it, which avoids busy-waiting on the
+    # database lock without starving sessions nested in another one.
+    write_engine = create_async_engine(
         database_url,
         poolclass=StaticPool,
         connect_args={"check_same_thread": False},
         echo=False,
     )
-    session_factory = async_sessionmaker(engine, expire_on_commit=False)
-    return engine, session_factory
+    read_engine = create_async_engine(
+        database_url,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=pool_size,
+        max_overflow=0,
+        pool_timeout=pool_timeout,
+        connect_args={"check_same_thread": False},
+        echo=False,
+    )
+    _apply_pragmas(write_engine, config)
+    _apply_pragmas(read_engine, config)
+    _read_engines[write_engine] = read_engine
+
+    session_factory = async_sessionmaker(
+        write_engine,
+        class_=_SerializedSession,
+        expire_on_commit=False,
+        sync_session_class=_ReadWriteSession,
+        read_bind=read_engine.sync_engine,
+        write_lock=_WriteLock(),
+    )
+    return write_engine, session_factory
 
 
 async def create_tables(engine: AsyncEngine) -> None:
@@ -33,5 +213,8 @@ async def create_tables(engine: AsyncEngine) -> None:
 
 
 async def dispose_engine(engine: AsyncEngine) -> None:
-    """Dispose the async engine and free resources."""
+    """Dispose the async engine, and its read engine if any, and free resources."""
+    read_engine = _read_engines.pop(engine, None)
+    if read_engine is not None:
+        await read_engine.dispose()
     await engine.dispose()
@@ -5,13 +5,17 @@ State management service for tracking document ingestion state.
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 
 from qdrant_loader.config.source_config import SourceConfig
 from qdrant_loader.config.state import IngestionStatus, StateManagementConfig
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.state import transitions as _transitions
-from qdrant_loader.core.state.models import DocumentStateRecord, IngestionHistory
+from qdrant_loader.core.state.models import (
+    ChunkStateRecord,
+    DocumentStateRecord,
+    IngestionHistory,
+)
 from qdrant_loader.core.state.session import create_tables as _create_tables
 from qdrant_loader.core.state.session import dispose_engine as _dispose_engine
 from qdrant_loader.core.state.session import (
@@ -188,6 +192,48 @@ class StateManager:
             )
             raise
 
+    async def get_sync_cursors(
+        self, project_id: str | None = None
+    ) -> dict[tuple[str, str], str]:
+        """Get the sync cursors of a project, keyed by ``(source_type, source)``."""
+        try:
+            return await _transitions.get_sync_cursors(
+                self._session_factory,  # type: ignore[arg-type]
+                project_id=project_id,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error getting sync cursors (project: {project_id}): {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def set_sync_cursor(
+        self,
+        source_type: str,
+        source: str,
+        cursor: str,
+        project_id: str | None = None,
+    ) -> None:
+        """Store the position reached by a complete ingestion of a source."""
+        self.logger.debug(
+            f"Setting sync cursor for {source_type}:{source} (project: {project_id})"
+        )
+        try:
+            await _transitions.set_sync_cursor(
+                self._session_factory,  # type: ignore[arg-type]
+                source_type=source_type,
+                source=source,
+                cursor=cursor,
+                project_id=project_id,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error setting sync cursor for {source_type}:{source}: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
     async def get_project_document_count(self, project_id: str) -> int:
         """Get the count of non-deleted documents for a project.
 
@@ -300,26 +346,61 @@ class StateManager:
 
         document_ids_to_delete: list[str] = []
 
+        groups: dict[tuple[str, str], list[str]] = {}
+        for doc in deleted_documents:
+            groups.setdefault((doc.source_type, doc.source), []).append(doc.id)
+
         # STEP 1: Commit state changes to DB first
         async with session_factory() as session:  # type: ignore
             tx = await session.begin()
             try:
                 now = datetime.now(UTC)
-                for doc in deleted_documents:
-                    query = select(DocumentStateRecord).filter(
-                        DocumentStateRecord.source_type == doc.source_type,
-                        DocumentStateRecord.source == doc.source,
-                        DocumentStateRecord.document_id == doc.id,
-                    )
-                    if project_id is not None:
-                        query = query.filter(
-                            DocumentStateRecord.project_id == project_id
+                found: set[tuple[str, str, str]] = set()
+                for (source_type, source), document_ids in groups.items():
+                    for start in range(
+                        0, len(document_ids), _transitions.IN_CLAUSE_BATCH
+                    ):
+                        ids = document_ids[start : start + _transitions.IN_CLAUSE_BATCH]
+                        conditions = [
+                            DocumentStateRecord.source_type == source_type,
+                            DocumentStateRecord.source == source,
+                            DocumentStateRecord.document_id.in_(ids),
+                        ]
+                        chunk_conditions = [
+                            ChunkStateRecord.source_type == source_type,
+                            ChunkStateRecord.source == source,
+                            ChunkStateRecord.document_id.in_(ids),
+                        ]
+                        if project_id is not None:
+                            conditions.append(
+                                DocumentStateRecord.project_id == project_id
+                            )
+                            chunk_conditions.append(
+                                ChunkStateRecord.project_id == project_id
+                            )
+                        result = await session.execute(
+                            select(DocumentStateRecord.document_id).filter(*conditions)
+                        )
+                        existing = set(result.scalars().all())
+                        if not existing:
+                            continue
+                        await session.execute(
+                            update(DocumentStateRecord)
+                            .where(*conditions)
+                            .values(is_deleted=True, updated_at=now)
+                        )
+                        await session.execute(
+                            delete(ChunkStateRecord).where(*chunk_conditions)
+                        )
+                        found.update(
+                            (source_type, source, document_id)
+                            for document_id in existing
                         )
-                    result = await session.execute(query)
-                    state = result.scalar_one_or_none()
-                    if state:
-                        state.is_deleted = True  # type: ignore
-                        state.updated_at = now  # type: ignore
+
+                for doc in deleted_documents:
+                    key = (doc.source_type, doc.source, doc.id)
+                    if key in found:
+                        found.discard(key)
                         document_ids_to_delete.append(doc.id)
 
                 # Commit state changes immediately
@@ -437,6 +518,115 @@ class StateManager:
             )
             raise
 
+    async def get_chunk_hashes(
+        self, documents: list[Document], project_id: str | None = None
+    ) -> dict[str, dict[str, str]]:
+        """Return ``{document_id: {chunk_id: content_hash}}`` for stored chunks."""
+        groups: dict[tuple[str, str], list[str]] = {}
+        for doc in documents:
+            groups.setdefault((doc.source_type, doc.source), []).append(doc.id)
+
+        hashes: dict[str, dict[str, str]] = {}
+        try:
+            for (source_type, source), document_ids in groups.items():
+                records = await _transitions.get_chunk_states(
+                    self._session_factory,  # type: ignore[arg-type]
+                    source_type=source_type,
+                    source=source,
+                    document_ids=document_ids,
+                    project_id=project_id,
+                )
+                for record in records:
+                    hashes.setdefault(record.document_id, {})[  # type: ignore[index]
+                        record.chunk_id  # type: ignore[index]
+                    ] = record.content_hash  # type: ignore[assignment]
+        except Exception as e:
+            self.logger.error(
+                f"Error getting chunk states: {str(e)}",
+                exc_info=True,
+            )
+            raise
+        return hashes
+
+    async def replace_chunk_states(
+        self,
+        documents: list[Document],
+        chunks_by_document: dict[str, dict[str, tuple[int, str]]],
+        project_id: str | None = None,
+    ) -> None:
+        """Store the current chunk set of each document, replacing the old one."""
+        if not self._initialized:
+            raise RuntimeError("StateManager not initialized. Call initialize() first.")
+
+        groups: dict[tuple[str, str], dict[str, dict[str, tuple[int, str]]]] = {}
+        for doc in documents:
+            if doc.id in chunks_by_document:
+                groups.setdefault((doc.source_type, doc.source), {})[doc.id] = (
+                    chunks_by_document[doc.id]
+                )
+        try:
+            for (source_type, source), chunks in groups.items():
+                await _transitions.replace_chunk_states(
+                    self._session_factory,  # type: ignore[arg-type]
+                    source_type=source_type,
+                    source=source,
+                    chunks_by_document=chunks,
+                    project_id=project_id,
+                )
+        except Exception as e:
+            self.logger.error(
+                f"Error replacing chunk states: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def get_file_stats(
+        self, project_id: str | None = None
+    ) -> dict[tuple[str, str], dict[str, tuple[int, int, str]]]:
+        """Get the file stats of a project, keyed by ``(source_type, source)``.
+
+        Each source maps a file path to ``(size, mtime_ns, url)``.
+        """
+        try:
+            return await _transitions.get_file_stats(
+                self._session_factory,  # type: ignore[arg-type]
+                project_id=project_id,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error getting file stats (project: {project_id}): {str(e)}",
+                exc_info=True,
+            )
+            raise
+
+    async def update_file_stats(
+        self,
+        source_type: str,
+        source: str,
+        changed: dict[str, tuple[int, int, str]],
+        removed: list[str],
+        project_id: str | None = None,
+    ) -> None:
+        """Store the stats of changed files of a source and drop removed ones."""
+        self.logger.debug(
+            f"Updating {len(changed)} file stats and removing {len(removed)} for {source_type}:{source} (project: {project_id})"
+        )
+        try:
+            await _transitions.update_file_stats(
+                self._session_factory,  # type: ignore[arg-type]
+                source_type=source_type,
+                source=source,
+                changed=changed,
+                removed=removed,
+                project_id=project_id,
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error updating file stats for {source_type}:{source}: {str(e)}",
+                exc_info=True,
+            )
+            raise
+
     async def update_document_state(
         self, document: Document, project_id: str | None = None
     ) -> DocumentStateRecord:
@@ -465,6 +655,37 @@ class StateManager:
             )
             raise
 
+    async def update_document_states(
+        self, documents: list[Document], project_id: str | None = None
+    ) -> int:
+        """Update the state of many documents in one transaction.
+
+        Returns the number of document states written.
+        """
+        if not self._initialized:
+            raise RuntimeError("StateManager not initialized. Call initialize() first.")
+
+        self.logger.debug(
+            f"Updating {len(documents)} document states (project: {project_id})"
+        )
+        try:
+            return await _transitions.update_document_states(
+                self._session_factory,  # type: ignore[arg-type]
+                documents=documents,
+                project_id=project_id,
+            )
+        except Exception as e:
+            self.logger.error(
+                "Failed to update document states",
+                extra={
+                    "project_id": project_id,
+                    "document_count": len(documents),
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                },
+            )
+            raise
+
     async def update_conversion_metrics(
         self,
         source_type: str,
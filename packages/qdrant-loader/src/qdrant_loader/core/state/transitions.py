@@ -4,13 +4,47 @@ from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from qdrant_loader.core.document import Document
-from qdrant_loader.core.state.models import DocumentStateRecord, IngestionHistory
+from qdrant_loader.core.state.models import (
+    ChunkStateRecord,
+    DocumentStateRecord,
+    FileStatRecord,
+    IngestionHistory,
+    SyncCursorRecord,
+)
+from qdrant_loader.core.state.session import read_session
 
 AsyncSessionFactory = Callable[[], Awaitable[Any]]
 
+# Keep IN (...) lists well below SQLite's bound-parameter limit
+IN_CLAUSE_BATCH = 500
+
+# Columns refreshed when an existing document state is written again
+_STATE_UPDATE_COLUMNS = (
+    "title",
+    "content_hash",
+    "is_deleted",
+    "updated_at",
+    "is_converted",
+    "conversion_method",
+    "original_file_type",
+    "original_filename",
+    "file_size",
+    "conversion_failed",
+    "conversion_error",
+    "conversion_time",
+    "is_attachment",
+    "parent_document_id",
+    "attachment_id",
+    "attachment_filename",
+    "attachment_mime_type",
+    "attachment_download_url",
+    "attachment_author",
+)
+
 
 async def update_last_ingestion(
     session_factory: AsyncSessionFactory,
@@ -66,7 +100,7 @@ async def get_last_ingestion(
     source: str,
     project_id: str | None,
 ) -> IngestionHistory | None:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         query = (
             select(IngestionHistory)
             .filter(IngestionHistory.source_type == source_type)
@@ -78,6 +112,63 @@ async def get_last_ingestion(
         return result.scalar_one_or_none()
 
 
+def _cursor_scope(project_id: str | None) -> Any:
+    """Condition selecting the sync cursors of a project."""
+    if project_id is None:
+        return SyncCursorRecord.project_id.is_(None)
+    return SyncCursorRecord.project_id == project_id
+
+
+async def get_sync_cursors(
+    session_factory: AsyncSessionFactory,
+    *,
+    project_id: str | None,
+) -> dict[tuple[str, str], str]:
+    """Fetch the sync cursors of a project, keyed by ``(source_type, source)``."""
+    async with read_session(session_factory) as session:  # type: ignore
+        result = await session.execute(
+            select(SyncCursorRecord).filter(_cursor_scope(project_id))
+        )
+        return {
+            (record.source_type, record.source): record.cursor
+            for record in result.scalars().all()
+        }
+
+
+async def set_sync_cursor(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    cursor: str,
+    project_id: str | None,
+) -> None:
+    async with session_factory() as session:  # type: ignore
+        now = datetime.now(UTC)
+        result = await session.execute(
+            select(SyncCursorRecord).filter(
+                _cursor_scope(project_id),
+                SyncCursorRecord.source_type == source_type,
+                SyncCursorRecord.source == source,
+            )
+        )
+        record = result.scalar_one_or_none()
+        if record:
+            record.cursor = cursor  # type: ignore
+            record.updated_at = now  # type: ignore
+        else:
+            session.add(
+                SyncCursorRecord(
+                    project_id=project_id,
+                    source_type=source_type,
+                    source=source,
+                    cursor=cursor,
+                    updated_at=now,
+                )
+            )
+        await session.commit()
+
+
 async def mark_document_deleted(
     session_factory: AsyncSessionFactory,
     *,
@@ -111,7 +202,7 @@ async def get_document_state_record(
     document_id: str,
     project_id: str | None,
 ) -> DocumentStateRecord | None:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         query = select(DocumentStateRecord).filter(
             DocumentStateRecord.source_type == source_type,
             DocumentStateRecord.source == source,
@@ -130,7 +221,7 @@ async def get_document_state_records(
     source: str,
     since: datetime | None,
 ) -> list[DocumentStateRecord]:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         # Select records for the given source_type and source; the previous
         # duplicate assignment filtered on the wrong field and was overridden
         # immediately — remove the erroneous assignment.
@@ -155,7 +246,7 @@ async def get_document_state_records_by_ids(
     """Fetch a set of DocumentStateRecord rows for a given source and list of document IDs in one query."""
     if not document_ids:
         return []
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         query = select(DocumentStateRecord).filter(
             DocumentStateRecord.source_type == source_type,
             DocumentStateRecord.source == source,
@@ -168,6 +259,167 @@ async def get_document_state_records_by_ids(
         return list(result.scalars().all())
 
 
+def _chunk_scope(source_type: str, source: str, project_id: str | None) -> list:
+    """Conditions selecting the chunk states of one source within a project."""
+    return [
+        ChunkStateRecord.source_type == source_type,
+        ChunkStateRecord.source == source,
+        (
+            ChunkStateRecord.project_id.is_(None)
+            if project_id is None
+            else ChunkStateRecord.project_id == project_id
+        ),
+    ]
+
+
+async def get_chunk_states(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    document_ids: list[str],
+    project_id: str | None = None,
+) -> list[ChunkStateRecord]:
+    """Fetch the stored chunk hashes of several documents in one query."""
+    if not document_ids:
+        return []
+    async with read_session(session_factory) as session:  # type: ignore
+        query = select(ChunkStateRecord).filter(
+            *_chunk_scope(source_type, source, project_id),
+            ChunkStateRecord.document_id.in_(document_ids),
+        )
+        result = await session.execute(query)
+        return list(result.scalars().all())
+
+
+async def replace_chunk_states(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    chunks_by_document: dict[str, dict[str, tuple[int, str]]],
+    project_id: str | None = None,
+) -> None:
+    """Replace the chunk hashes of documents with their current chunk set.
+
+    ``chunks_by_document`` maps a document ID to ``{chunk_id: (chunk_index,
+    content_hash)}``; an empty mapping clears the document's chunk states.
+    """
+    if not chunks_by_document:
+        return
+    now = datetime.now(UTC)
+    async with session_factory() as session:  # type: ignore
+        async with session.begin():
+            await session.execute(
+                delete(ChunkStateRecord).where(
+                    *_chunk_scope(source_type, source, project_id),
+                    ChunkStateRecord.document_id.in_(list(chunks_by_document)),
+                )
+            )
+            session.add_all(
+                ChunkStateRecord(
+                    project_id=project_id,
+                    source_type=source_type,
+                    source=source,
+                    document_id=document_id,
+                    chunk_id=chunk_id,
+                    chunk_index=chunk_index,
+                    content_hash=content_hash,
+                    updated_at=now,
+                )
+                for document_id, chunks in chunks_by_document.items()
+                for chunk_id, (chunk_index, content_hash) in chunks.items()
+            )
+
+
+def _file_stat_scope(source_type: str, source: str, project_id: str | None) -> list:
+    """Conditions selecting the file stats of one source within a project."""
+    return [
+        FileStatRecord.source_type == source_type,
+        FileStatRecord.source == source,
+        (
+            FileStatRecord.project_id.is_(None)
+            if project_id is None
+            else FileStatRecord.project_id == project_id
+        ),
+    ]
+
+
+async def get_file_stats(
+    session_factory: AsyncSessionFactory,
+    *,
+    project_id: str | None = None,
+) -> dict[tuple[str, str], dict[str, tuple[int, int, str]]]:
+    """Fetch the file stats of a project.
+
+    Returns ``{(source_type, source): {path: (size, mtime_ns, url)}}``.
+    """
+    stats: dict[tuple[str, str], dict[str, tuple[int, int, str]]] = {}
+    async with read_session(session_factory) as session:  # type: ignore
+        result = await session.execute(
+            select(
+                FileStatRecord.source_type,
+                FileStatRecord.source,
+                FileStatRecord.path,
+                FileStatRecord.size,
+                FileStatRecord.mtime_ns,
+                FileStatRecord.url,
+            ).filter(
+                FileStatRecord.project_id.is_(None)
+                if project_id is None
+                else FileStatRecord.project_id == project_id
+            )
+        )
+        for source_type, source, path, size, mtime_ns, url in result.all():
+            stats.setdefault((source_type, source), {})[path] = (size, mtime_ns, url)
+    return stats
+
+
+async def update_file_stats(
+    session_factory: AsyncSessionFactory,
+    *,
+    source_type: str,
+    source: str,
+    changed: dict[str, tuple[int, int, str]],
+    removed: list[str],
+    project_id: str | None = None,
+) -> None:
+    """Write the stats of changed files and drop those of removed files.
+
+    ``changed`` maps a path to ``(size, mtime_ns, url)``.
+    """
+    if not changed and not removed:
+        return
+    now = datetime.now(UTC)
+    paths = [*changed, *removed]
+    async with session_factory() as session:  # type: ignore
+        async with session.begin():
+            for start in range(0, len(paths), IN_CLAUSE_BATCH):
+                await session.execute(
+                    delete(FileStatRecord).where(
+                        *_file_stat_scope(source_type, source, project_id),
+                        FileStatRecord.path.in_(paths[start : start + IN_CLAUSE_BATCH]),
+                    )
+                )
+            if changed:
+                await session.execute(
+                    insert(FileStatRecord),
+                    [
+                        {
+                            "project_id": project_id,
+                            "source_type": source_type,
+                            "source": source,
+                            "path": path,
+                            "url": url,
+                            "size": size,
+                            "mtime_ns": mtime_ns,
+                            "updated_at": now,
+                        }
+                        for path, (size, mtime_ns, url) in changed.items()
+                    ],
+                )
+
+
 async def update_document_state(
     session_factory: AsyncSessionFactory,
     *,
@@ -280,6 +532,149 @@ async def update_document_state(
         return document_state_record
 
 
+def _parse_attachment_created_at(value: Any) -> datetime | None:
+    try:
+        if isinstance(value, str):
+            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if isinstance(value, datetime):
+            return value
+    except (ValueError, TypeError):
+        pass
+    return None
+
+
+def _document_state_values(
+    document: Document, project_id: str | None, now: datetime
+) -> dict[str, Any]:
+    """Column values of a document state row, as written by update_document_state."""
+    metadata = document.metadata
+    conversion_method = metadata.get("conversion_method")
+    return {
+        "project_id": project_id,
+        "document_id": document.id,
+        "source_type": document.source_type,
+        "source": document.source,
+        "url": document.url,
+        "title": document.title,
+        "content_hash": document.content_hash,
+        "is_deleted": False,
+        "created_at": now,
+        "updated_at": now,
+        "is_converted": conversion_method is not None,
+        "conversion_method": conversion_method,
+        "original_file_type": metadata.get("original_file_type"),
+        "original_filename": metadata.get("original_filename"),
+        "file_size": metadata.get("file_size"),
+        "conversion_failed": metadata.get("conversion_failed", False),
+        "conversion_error": metadata.get("conversion_error"),
+        "conversion_time": metadata.get("conversion_time"),
+        "is_attachment": metadata.get("is_attachment", False),
+        "parent_document_id": metadata.get("parent_document_id"),
+        "attachment_id": metadata.get("attachment_id"),
+        "attachment_filename": metadata.get("attachment_filename"),
+        "attachment_mime_type": metadata.get("attachment_mime_type"),
+        "attachment_download_url": metadata.get("attachment_download_url"),
+        "attachment_author": metadata.get("attachment_author"),
+        "attachment_created_at": _parse_attachment_created_at(
+            metadata.get("attachment_created_at")
+        ),
+    }
+
+
+async def update_document_states(
+    session_factory: AsyncSessionFactory,
+    *,
+    documents: list[Document],
+    project_id: str | None,
+) -> int:
+    """Upsert the state of many documents in a single transaction.
+
+    Rows are written with ``INSERT ... ON CONFLICT`` on ``uix_project_document``.
+    SQLite never reports a conflict for a NULL ``project_id``, so documents
+    without a project are matched with one SELECT per source and written with
+    bulk UPDATE/INSERT statements instead. Returns the number of rows written.
+    """
+    if not documents:
+        return 0
+
+    now = datetime.now(UTC)
+    rows_by_key: dict[tuple[str, str, str], dict[str, Any]] = {}
+    for document in documents:
+        rows_by_key[(document.source_type, document.source, document.id)] = (
+            _document_state_values(document, project_id, now)
+        )
+    rows = list(rows_by_key.values())
+
+    async with session_factory() as session:  # type: ignore
+        async with session.begin():
+            if project_id is not None:
+                stmt = sqlite_insert(DocumentStateRecord)
+                set_ = {
+                    column: stmt.excluded[column] for column in _STATE_UPDATE_COLUMNS
+                }
+                # Keep a known attachment date when the new metadata has none
+                set_["attachment_created_at"] = func.coalesce(
+                    stmt.excluded.attachment_created_at,
+                    DocumentStateRecord.attachment_created_at,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[
+                        "project_id",
+                        "source_type",
+                        "source",
+                        "document_id",
+                    ],
+                    set_=set_,
+                )
+                await session.execute(stmt, rows)
+                return len(rows)
+
+            groups: dict[tuple[str, str], list[str]] = {}
+            for source_type, source, document_id in rows_by_key:
+                groups.setdefault((source_type, source), []).append(document_id)
+
+            existing_ids: dict[tuple[str, str, str], int] = {}
+            for (source_type, source), document_ids in groups.items():
+                for start in range(0, len(document_ids), IN_CLAUSE_BATCH):
+                    result = await session.execute(
+                        select(
+                            DocumentStateRecord.id, DocumentStateRecord.document_id
+                        ).filter(
+                            DocumentStateRecord.source_type == source_type,
+                            DocumentStateRecord.source == source,
+                            DocumentStateRecord.document_id.in_(
+                                document_ids[start : start + IN_CLAUSE_BATCH]
+                            ),
+                        )
+                    )
+                    for row_id, document_id in result.all():
+                        existing_ids[(source_type, source, document_id)] = row_id
+
+            updates: list[dict[str, Any]] = []
+            inserts: list[dict[str, Any]] = []
+            for key, row in rows_by_key.items():
+                row_id = existing_ids.get(key)
+                if row_id is None:
+                    inserts.append(row)
+                    continue
+                values = {"id": row_id}
+                values.update((column, row[column]) for column in _STATE_UPDATE_COLUMNS)
+                if row["attachment_created_at"] is not None:
+                    values["attachment_created_at"] = row["attachment_created_at"]
+                updates.append(values)
+
+            if updates:
+                # Rows differ in their keys, so group them by shape for executemany
+                by_shape: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+                for values in updates:
+                    by_shape.setdefault(tuple(values), []).append(values)
+                for batch in by_shape.values():
+                    await session.execute(update(DocumentStateRecord), batch)
+            if inserts:
+                await session.execute(insert(DocumentStateRecord), inserts)
+    return len(rows)
+
+
 async def update_conversion_metrics(
     session_factory: AsyncSessionFactory,
     *,
@@ -334,7 +729,7 @@ async def get_conversion_metrics(
     source_type: str,
     source: str,
 ) -> dict[str, int | float]:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         result = await session.execute(
             select(IngestionHistory).filter_by(source_type=source_type, source=source)
         )
@@ -369,7 +764,7 @@ async def get_attachment_documents(
     *,
     parent_document_id: str,
 ) -> list[DocumentStateRecord]:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         result = await session.execute(
             select(DocumentStateRecord).filter(
                 DocumentStateRecord.parent_document_id == parent_document_id,
@@ -387,7 +782,7 @@ async def get_converted_documents(
     source: str,
     conversion_method: str | None,
 ) -> list[DocumentStateRecord]:
-    async with session_factory() as session:  # type: ignore
+    async with read_session(session_factory) as session:  # type: ignore
         query = select(DocumentStateRecord).filter(
             DocumentStateRecord.source_type == source_type,
             DocumentStateRecord.source == source,
@@ -0,0 +1,192 @@
+"""Process-wide registry for NLP models, tokenizers and chunking strategies.
+
+Loading a spaCy pipeline or building a chunking strategy is expensive, while
+using one is cheap. The registry makes sure each model is loaded once per
+process and shared by every component that asks for it.
+
+Models (spaCy pipelines, tiktoken encodings) are shared across threads.
+Strategy instances keep a little per-document working state, so they are
+shared per thread: a chunking thread reuses the same strategy for every
+document it processes, but never races another thread on it.
+"""
+
+import hashlib
+import threading
+import time
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import tiktoken
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.utils.logging import LoggingConfig
+
+if TYPE_CHECKING:
+    from qdrant_loader.config import Settings
+
+logger = LoggingConfig.get_logger(__name__)
+
+T = TypeVar("T")
+
+# Registry entry kinds
+SPACY = "spacy"
+TIKTOKEN = "tiktoken"
+STRATEGY = "strategy"
+
+
+def settings_fingerprint(settings: "Settings") -> Hashable:
+    """Build a hashable key describing the settings a strategy depends on.
+
+    Two settings objects with the same chunking, embedding tokenizer and
+    semantic analysis configuration produce the same key, so strategies built
+    from them can be shared. Objects that cannot be serialized (e.g. test
+    doubles) fall back to identity.
+    """
+    try:
+        global_config = settings.global_config
+        parts = [
+            global_config.chunking.model_dump_json(),
+            global_config.semantic_analysis.model_dump_json(),
+            str(global_config.embedding.tokenizer),
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+    except Exception:
+        return ("id", id(settings))
+
+
+class ModelRegistry:
+    """Thread-safe, load-once registry keyed by (kind, key)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Hashable], Any] = {}
+        self._key_locks: dict[tuple[str, Hashable], threading.Lock] = {}
+        self._load_counts: dict[str, int] = {}
+        self._load_seconds: dict[str, float] = {}
+        self._thread_local = threading.local()
+
+    def get_or_create(self, kind: str, key: Hashable, factory: Callable[[], T]) -> T:
+        """Return the entry for ``(kind, key)``, creating it once if missing.
+
+        Concurrent callers asking for the same entry wait for a single load
+        instead of loading it in parallel. Failed loads are not cached.
+        """
+        entry_key = (kind, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            return entry
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(entry_key, threading.Lock())
+
+        with key_lock:
+            entry = self._entries.get(entry_key)
+            if entry is not None:
+                return entry
+
+            started = time.perf_counter()
+            entry = factory()
+            elapsed = time.perf_counter() - started
+
+            with self._lock:
+                self._entries[entry_key] = entry
+                self._load_counts[kind] = self._load_counts.get(kind, 0) + 1
+                self._load_seconds[kind] = self._load_seconds.get(kind, 0.0) + elapsed
+                count = self._load_counts[kind]
+
+            prometheus_metrics.MODELS_LOADED.labels(kind=kind).set(count)
+            logger.debug(
+                "Model registry entry loaded",
+                kind=kind,
+                key=str(key),
+                load_seconds=round(elapsed, 3),
+            )
+            return entry
+
+    def get_spacy_pipeline(
+        self, model_name: str, loader: Callable[[], T], variant: str = "full"
+    ) -> T:
+        """Return a shared spaCy pipeline.
+
+        Args:
+            model_name: Name of the spaCy model
+            loader: Callable that loads the pipeline (including any download
+                fallback and pipe selection) when it is not cached yet
+            variant: Distinguishes differently configured pipelines of the
+                same model, e.g. one with the parser disabled
+        """
+        return self.get_or_create(SPACY, (model_name, variant), loader)
+
+    def get_tiktoken_encoding(
+        self,
+        encoding_name: str,
+        loader: Callable[[], tiktoken.Encoding] | None = None,
+    ) -> tiktoken.Encoding:
+        """Return a shared tiktoken encoding.
+
+        Args:
+            encoding_name: Name of the tiktoken encoding
+            loader: Optional callable used instead of ``tiktoken.get_encoding``
+        """
+        return self.get_or_create(
+            TIKTOKEN,
+            encoding_name,
+            loader or (lambda: tiktoken.get_encoding(encoding_name)),
+        )
+
+    def get_strategy(
+        self,
+        strategy_class: type[T],
+        settings: "Settings",
+        factory: Callable[[], T] | None = None,
+    ) -> T:
+        """Return this thread's strategy instance for the given class and settings."""
+        strategies = getattr(self._thread_local, "strategies", None)
+        if strategies is None:
+            strategies = self._thread_local.strategies = {}
+
+        key = (strategy_class, settings_fingerprint(settings))
+        strategy = strategies.get(key)
+        if strategy is None:
+            started = time.perf_counter()
+            strategy = factory() if factory is not None else strategy_class(settings)
+            elapsed = time.perf_counter() - started
+            strategies[key] = strategy
+
+            with self._lock:
+                self._load_counts[STRATEGY] = self._load_counts.get(STRATEGY, 0) + 1
+                self._load_seconds[STRATEGY] = (
+                    self._load_seconds.get(STRATEGY, 0.0) + elapsed
+                )
+                count = self._load_counts[STRATEGY]
+            prometheus_metrics.MODELS_LOADED.labels(kind=STRATEGY).set(count)
+        return strategy
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Return how many entries of each kind were loaded and how long it took."""
+        with self._lock:
+            return {
+                kind: {
+                    "loaded": count,
+                    "load_seconds": round(self._load_seconds.get(kind, 0.0), 3),
+                }
+                for kind, count in self._load_counts.items()
+            }
+
+    def clear(self) -> None:
+        """Drop all cached entries, including every thread's strategies."""
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+            self._load_counts.clear()
+            self._load_seconds.clear()
+        self._thread_local = threading.local()
+        for kind in (SPACY, TIKTOKEN, STRATEGY):
+            prometheus_metrics.MODELS_LOADED.labels(kind=kind).set(0)
+
+
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry."""
+    return _registry
@@ -10,6 +10,7 @@ import spacy
 from gensim import corpora
 from gensim.models import LdaModel
 from gensim.parsing.preprocessing import preprocess_string
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from spacy.cli.download import download as spacy_download
 from spacy.tokens import Doc
 
@@ -61,13 +62,10 @@ class SemanticAnalyzer:
         """
         self.logger = logging.getLogger(__name__)
 
-        # Initialize spaCy
-        try:
-            self.nlp = spacy.load(spacy_model)
-        except OSError:
-            self.logger.info(f"Downloading spaCy model {spacy_model}...")
-            spacy_download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
+        # Initialize spaCy (shared across the process)
+        self.nlp = get_model_registry().get_spacy_pipeline(
+            spacy_model, lambda: self._load_spacy_pipeline(spacy_model)
+        )
 
         # Initialize LDA parameters
         self.num_topics = num_topics
@@ -82,6 +80,15 @@ class SemanticAnalyzer:
         self._doc_cache: dict = {}
         self._doc_cache_lock = threading.Lock()
 
+    def _load_spacy_pipeline(self, spacy_model: str):
+        """Load the full spaCy pipeline, downloading the model if needed."""
+        try:
+            return spacy.load(spacy_model)
+        except OSError:
+            self.logger.info(f"Downloading spaCy model {spacy_model}...")
+            spacy_download(spacy_model)
+            return spacy.load(spacy_model)
+
     def _build_cache_key(
         self, text: str, doc_id: str | None, include_enhanced: bool
     ) -> tuple[str, bool, str] | None:
@@ -583,27 +590,8 @@ class SemanticAnalyzer:
             except Exception as e:
                 logger.warning(f"Error releasing dictionary: {e}")
 
-        # Release spaCy model resources
-        if hasattr(self, "nlp") and self.nlp is not None:
-            try:
-                # Clear spaCy caches and release memory
-                if hasattr(self.nlp, "vocab") and hasattr(self.nlp.vocab, "strings"):
-                    # Try different methods to clear spaCy caches
-                    if hasattr(self.nlp.vocab.strings, "_map") and hasattr(
-                        self.nlp.vocab.strings._map, "clear"
-                    ):
-                        self.nlp.vocab.strings._map.clear()
-                    elif hasattr(self.nlp.vocab.strings, "clear"):
-                        self.nlp.vocab.strings.clear()
-                    # Additional cleanup for different spaCy versions
-                    if hasattr(self.nlp.vocab, "_vectors") and hasattr(
-                        self.nlp.vocab._vectors, "clear"
-                    ):
-                        self.nlp.vocab._vectors.clear()
-                # Note: We don't set nlp to None as it might be needed for other operations
-                # but we clear its internal caches
-            except Exception as e:
-                logger.debug(f"spaCy cache clearing skipped (version-specific): {e}")
+        # The spaCy pipeline is shared through the model registry, so its
+        # vocab and vectors must not be cleared here.
 
         logger.debug("Semantic analyzer resources cleared")
 
@@ -618,7 +606,7 @@ class SemanticAnalyzer:
         # More aggressive cleanup for shutdown
         if hasattr(self, "nlp"):
             try:
-                # Release the spaCy model completely
+                # Drop our reference; the registry keeps the shared pipeline
                 del self.nlp
             except Exception as e:
                 logger.warning(f"Error releasing spaCy model: {e}")
@@ -4,6 +4,7 @@ import nltk
 import spacy
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from qdrant_loader.config import Settings
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from qdrant_loader.utils.logging import LoggingConfig
 from spacy.cli.download import download
 
@@ -36,28 +37,13 @@ class TextProcessor:
         except LookupError:
             nltk.download("stopwords")
 
-        # Load spaCy model with optimized settings
+        # Load spaCy model with optimized settings (shared across the process)
         spacy_model = settings.global_config.semantic_analysis.spacy_model
-        try:
-            self.nlp = spacy.load(spacy_model)
-            # Optimize spaCy pipeline for speed
-            # Select only essential components for faster processing
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
-        except OSError:
-            logger.info(f"Downloading spaCy model {spacy_model}...")
-            download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
-            if "parser" in self.nlp.pipe_names:
-                # Keep only essential components: tokenizer, tagger, ner (exclude parser)
-                essential_pipes = [
-                    pipe for pipe in self.nlp.pipe_names if pipe != "parser"
-                ]
-                self.nlp.select_pipes(enable=essential_pipes)
+        self.nlp = get_model_registry().get_spacy_pipeline(
+            spacy_model,
+            lambda: self._load_spacy_pipeline(spacy_model),
+            variant="no_parser",
+        )
 
         # Initialize LangChain text splitter with configuration from settings
         self.text_splitter = RecursiveCharacterTextSplitter(
@@ -75,6 +61,30 @@ class TextProcessor:
             ],  # Added sentence-ending punctuation
         )
 
+    @staticmethod
+    def _load_spacy_pipeline(spacy_model: str):
+        """Load a spaCy pipeline with the dependency parser disabled.
+
+        Args:
+            spacy_model: Name of the spaCy model to load
+
+        Returns:
+            The loaded spaCy Language object
+        """
+        try:
+            nlp = spacy.load(spacy_model)
+        except OSError:
+            logger.info(f"Downloading spaCy model {spacy_model}...")
+            download(spacy_model)
+            nlp = spacy.load(spacy_model)
+
+        # Optimize spaCy pipeline for speed
+        # Keep only essential components: tokenizer, tagger, ner (exclude parser)
+        if "parser" in nlp.pipe_names:
+            essential_pipes = [pipe for pipe in nlp.pipe_names if pipe != "parser"]
+            nlp.select_pipes(enable=essential_pipes)
+        return nlp
+
     def process_text(self, text: str) -> dict:
         """Process text using multiple NLP libraries with performance optimizations.
 
@@ -4,6 +4,7 @@ from typing import Any
 
 import spacy
 from gensim import corpora, models
+from qdrant_loader.core.text_processing.model_registry import get_model_registry
 from qdrant_loader.utils.logging import LoggingConfig
 from spacy.cli.download import download
 
@@ -31,13 +32,20 @@ class TopicModeler:
         self._cached_topics = {}  # Cache for topic inference results
         self._processed_texts = set()  # Track processed texts
 
-        # Initialize spaCy for text preprocessing
+        # Initialize spaCy for text preprocessing (shared across the process)
+        self.nlp = get_model_registry().get_spacy_pipeline(
+            spacy_model, lambda: self._load_spacy_pipeline(spacy_model)
+        )
+
+    @staticmethod
+    def _load_spacy_pipeline(spacy_model: str):
+        """Load the full spaCy pipeline, downloading the model if needed."""
         try:
-            self.nlp = spacy.load(spacy_model)
+            return spacy.load(spacy_model)
         except OSError:
             logger.info(f"Downloading spaCy model {spacy_model}...")
             download(spacy_model)
-            self.nlp = spacy.load(spacy_model)
+            return spacy.load(spacy_model)
 
     def _preprocess_text(self, text: str) -> list[str]:
         """Preprocess text for topic modeling.
@@ -9,6 +9,7 @@ from sqlalchemy import or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from qdrant_loader.core.state.models import Job
+from qdrant_loader.core.state.session import read_session
 
 
 class JobQueue(Protocol):
@@ -295,7 +296,7 @@ class SQLiteJobQueue:
                     break
                 offset += 1000
         """
-        async with self._session_factory() as session:
+        async with read_session(self._session_factory) as session:
             stmt = select(Job)
             if status:
                 stmt = stmt.where(Job.status == status)
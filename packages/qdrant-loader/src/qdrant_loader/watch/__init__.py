@@ -0,0 +1,15 @@
+"""Watch mode: ingest local file changes as they happen."""
+
+from .coalescer import ChangeCoalescer
+from .session import WatchSession, WatchTarget, resolve_watch_targets
+from .watchers import InotifyWatcher, PollingWatcher, create_watcher
+
+__all__ = [
+    "ChangeCoalescer",
+    "InotifyWatcher",
+    "PollingWatcher",
+    "WatchSession",
+    "WatchTarget",
+    "create_watcher",
+    "resolve_watch_targets",
+]
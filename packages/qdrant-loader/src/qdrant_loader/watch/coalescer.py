@@ -0,0 +1,61 @@
+"""Debouncing of filesystem change events."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable
+
+
+class ChangeCoalescer[K: Hashable]:
+    """Collect changed keys until they have been quiet for a while.
+
+    Events for the same key are merged into one. A key is due once no event
+    arrived for ``delay`` seconds, or ``max_delay`` seconds after its first
+    event so that a file written continuously is still picked up.
+    """
+
+    def __init__(
+        self,
+        delay: float = 1.0,
+        max_delay: float = 10.0,
+        monotonic: Callable[[], float] = time.monotonic,
+    ):
+        self.delay = delay
+        self.max_delay = max(max_delay, delay)
+        self._monotonic = monotonic
+        # key -> (time of the first event, time of the last event)
+        self._pending: dict[K, tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, key: K) -> None:
+        """Record an event for a key."""
+        now = self._monotonic()
+        first, _ = self._pending.get(key, (now, now))
+        self._pending[key] = (first, now)
+
+    def _due_at(self, first: float, last: float) -> float:
+        return min(last + self.delay, first + self.max_delay)
+
+    def pop_due(self) -> list[K]:
+        """Remove and return the keys that are due, in first-event order."""
+        now = self._monotonic()
+        due = [
+            key
+            for key, (first, last) in self._pending.items()
+            if self._due_at(first, last) <= now
+        ]
+        for key in due:
+            del self._pending[key]
+        return due
+
+    def next_due_in(self) -> float | None:
+        """Seconds until the next key is due, or None if nothing is pending."""
+        if not self._pending:
+            return None
+        now = self._monotonic()
+        next_due = min(
+            self._due_at(first, last) for first, last in self._pending.values()
+        )
+        return max(0.0, next_due - now)
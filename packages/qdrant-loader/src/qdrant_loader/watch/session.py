@@ -0,0 +1,355 @@
+"""Watch sessions: keep LocalFile sources in sync with their directories."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Any
+
+from qdrant_loader.connectors.base import FileStat
+from qdrant_loader.connectors.factory import get_connector_instance
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.shared.prefetch import map_in_order
+from qdrant_loader.core.document import Document
+from qdrant_loader.utils.logging import LoggingConfig
+from qdrant_loader.watch.coalescer import ChangeCoalescer
+from qdrant_loader.watch.watchers import create_watcher
+from qdrant_loader.webhooks.event_processor import delete_documents, upsert_documents
+
+logger = LoggingConfig.get_logger(__name__)
+
+SOURCE_TYPE = "localfile"
+# Documents upserted, or deleted, per document pipeline call
+WATCH_BATCH_SIZE = 64
+
+
+@dataclass
+class WatchTarget:
+    """A LocalFile source kept in sync by a watch session."""
+
+    project_id: str | None
+    source: str
+    connector: LocalFileConnector
+    # Stats of the files ingested from the source, keyed by relative path
+    file_stats: dict[str, FileStat] = field(default_factory=dict)
+
+
+def resolve_watch_targets(
+    pipeline: Any,
+    project_id: str | None = None,
+    source: str | None = None,
+) -> list[WatchTarget]:
+    """Create a connector for every LocalFile source to watch.
+
+    Args:
+        pipeline: Initialized ingestion pipeline
+        project_id: Only watch the sources of this project
+        source: Only watch the sources with this name
+
+    Raises:
+        ValueError: If the project does not exist
+    """
+    project_manager = pipeline.project_manager
+    project_ids = [project_id] if project_id else project_manager.list_project_ids()
+    file_conversion_config = pipeline.settings.global_config.file_conversion
+
+    targets: list[WatchTarget] = []
+    for pid in project_ids:
+        context = project_manager.get_project_context(pid)
+        if not context or not context.config:
+            if project_id:
+                raise ValueError(f"Project '{project_id}' not found")
+            continue
+        sources = context.config.sources.localfile or {}
+        for name, source_config in sources.items():
+            if source and name != source:
+                continue
+            connector = get_connector_instance(source_config)
+            if file_conversion_config and source_config.enable_file_conversion:
+                connector.set_file_conversion_config(file_conversion_config)
+            targets.append(WatchTarget(pid, name, connector))
+    return targets
+
+
+class WatchSession:
+    """Ingest the changes of LocalFile sources as they happen.
+
+    One ingestion pipeline stays initialized for the whole session. After an
+    initial incremental ingestion, filesystem events are debounced per path;
+    the files of each batch whose size or mtime changed are upserted, and the
+    removed ones deleted, through the same calls as single-event webhooks.
+    """
+
+    def __init__(
+        self,
+        pipeline: Any,
+        targets: list[WatchTarget],
+        debounce_seconds: float = 1.0,
+        max_delay_seconds: float = 10.0,
+        backend: str = "auto",
+        poll_interval: float = 2.0,
+    ):
+        self.pipeline = pipeline
+        self.targets = targets
+        self.backend = backend
+        self.poll_interval = poll_interval
+        # Keyed by (target index, absolute path)
+        self._coalescer: ChangeCoalescer[tuple[int, str]] = ChangeCoalescer(
+            debounce_seconds, max_delay_seconds
+        )
+
+    async def run(self, stop_event: asyncio.Event, initial_sync: bool = True) -> None:
+        """Watch the targets until ``stop_event`` is set.
+
+        Args:
+            stop_event: Ends the session once set
+            initial_sync: Run an incremental ingestion of each target first
+        """
+        await self.pipeline.initialize()
+        watchers = [
+            create_watcher(target.connector.base_path, self.backend, self.poll_interval)
+            for target in self.targets
+        ]
+        changes: asyncio.Queue[tuple[int, str]] = asyncio.Queue()
+        tasks = [
+            asyncio.create_task(self._forward(index, watcher.events(), changes))
+            for index, watcher in enumerate(watchers)
+        ]
+        try:
+            # Watchers are started first so nothing written during the initial
+            # ingestion is missed; replayed events are skipped by their stat
+            if initial_sync:
+                for target in self.targets:
+                    await self.pipeline.process_documents(
+                        project_id=target.project_id,
+                        source_type=SOURCE_TYPE,
+                        source=target.source,
+                    )
+            await self._load_file_stats()
+            logger.info(
+                "Watching local files",
+                sources=[target.source for target in self.targets],
+            )
+
+            while not stop_event.is_set():
+                timeout = self._coalescer.next_due_in()
+                try:
+                    key = await asyncio.wait_for(
+                        changes.get(), 1.0 if timeout is None else min(timeout, 1.0)
+                    )
+                    self._coalescer.add(key)
+                except TimeoutError:
+                    pass
+                if due := self._coalescer.pop_due():
+                    await self.process_changes(due)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            for watcher in watchers:
+                watcher.close()
+
+    async def _forward(
+        self,
+        index: int,
+        events: AsyncIterator[str],
+        changes: asyncio.Queue[tuple[int, str]],
+    ) -> None:
+        try:
+            async with aclosing(events):
+                async for path in events:
+                    changes.put_nowait((index, path))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(
+                "File watcher failed",
+                source=self.targets[index].source,
+                error=str(e),
+            )
+
+    async def _load_file_stats(self) -> None:
+        """Load the file stats recorded by the ingestion runs."""
+        stats_by_project: dict[str | None, dict] = {}
+        for target in self.targets:
+            if target.project_id not in stats_by_project:
+                stats_by_project[target.project_id] = (
+                    await self.pipeline.state_manager.get_file_stats(target.project_id)
+                )
+            rows = stats_by_project[target.project_id].get(
+                (SOURCE_TYPE, target.source), {}
+            )
+            target.file_stats = {path: FileStat(*row) for path, row in rows.items()}
+
+    async def process_changes(self, changes: list[tuple[int, str]]) -> None:
+        """Sync the changed paths of each target."""
+        paths_by_target: dict[int, set[str]] = {}
+        for index, path in changes:
+            paths_by_target.setdefault(index, set()).add(path)
+        for index, paths in paths_by_target.items():
+            target = self.targets[index]
+            try:
+                await self._sync_paths(target, paths)
+            except Exception as e:
+                # Stats are not updated, so the files are retried on their next
+                # change or by the next ingestion run
+                logger.error(
+                    "Failed to sync changed files",
+                    source=target.source,
+                    paths=len(paths),
+                    error=str(e),
+                )
+
+    async def _sync_paths(self, target: WatchTarget, paths: set[str]) -> None:
+        changed: dict[str, os.stat_result] = {}
+        removed: set[str] = set()
+        for path in paths:
+            listed, under = await asyncio.to_thread(self._scan_path, target, path)
+            if under is None:
+                continue
+            for rel_path, stat in listed.items():
+                previous = target.file_stats.get(rel_path)
+                if (
+                    previous is None
+                    or previous.size != stat.st_size
+                    or previous.mtime_ns != stat.st_mtime_ns
+                ):
+                    changed[rel_path] = stat
+            removed.update(
+                rel_path
+                for rel_path in self._known_under(target, under)
+                if rel_path not in listed
+            )
+
+        if changed:
+            await self._upsert(target, changed)
+        if removed:
+            await self._delete(target, removed)
+
+    def _scan_path(
+        self, target: WatchTarget, path: str
+    ) -> tuple[dict[str, os.stat_result], str | None]:
+        """List the files to process at or below a changed path.
+
+        Returns:
+            The stat of each file by relative path, and the relative path whose
+            known files are compared against the listing; None for paths
+            outside the base path or below a directory that cannot be listed
+        """
+        connector = target.connector
+        rel_path = connector._relative_path(path)
+        if rel_path == ".":
+            rel_path = ""
+        elif rel_path == ".." or rel_path.startswith("../"):
+            return {}, None
+
+        if os.path.isdir(path) and not os.path.islink(path):
+            unreadable_dirs: list[str] = []
+            listed = {
+                rel: stat
+                for _, rel, stat in connector._scan_files(unreadable_dirs, root=path)
+            }
+            if unreadable_dirs:
+                # Deleting the known files below them could drop live documents
+                return listed, None
+            return listed, rel_path
+
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return {}, rel_path
+        if not connector.file_processor.should_process_file(path):
+            return {}, rel_path
+        return {rel_path: stat}, rel_path
+
+    def _known_under(self, target: WatchTarget, rel_path: str) -> list[str]:
+        """Known files at or below a relative path."""
+        if rel_path in target.file_stats:
+            return [rel_path]
+        prefix = f"{rel_path}/" if rel_path else ""
+        return [path for path in target.file_stats if path.startswith(prefix)]
+
+    async def _upsert(
+        self, target: WatchTarget, changed: dict[str, os.stat_result]
+    ) -> None:
+        connector = target.connector
+
+        async def rel_paths() -> AsyncIterator[str]:
+            for rel_path in changed:
+                yield rel_path
+
+        async def fetch(rel_path: str) -> tuple[str, Document | None]:
+            return rel_path, await connector.fetch_by_id(rel_path)
+
+        batch: list[tuple[str, Document]] = []
+        async with aclosing(
+            map_in_order(
+                fetch, rel_paths(), concurrency=connector.config.max_concurrent_files
+            )
+        ) as fetched:
+            async for rel_path, document in fetched:
+                if document is None:
+                    continue
+                batch.append((rel_path, document))
+                if len(batch) >= WATCH_BATCH_SIZE:
+                    await self._upsert_batch(target, batch, changed)
+                    batch = []
+        if batch:
+            await self._upsert_batch(target, batch, changed)
+
+    async def _upsert_batch(
+        self,
+        target: WatchTarget,
+        batch: list[tuple[str, Document]],
+        stats: dict[str, os.stat_result],
+    ) -> None:
+        documents = [document for _, document in batch]
+        result = await upsert_documents(self.pipeline, documents, target.project_id)
+        succeeded = set(result.successfully_processed_documents)
+        updated = {
+            rel_path: FileStat(
+                stats[rel_path].st_size, stats[rel_path].st_mtime_ns, document.url
+            )
+            for rel_path, document in batch
+            if document.id in succeeded
+        }
+        await self.pipeline.state_manager.update_file_stats(
+            SOURCE_TYPE,
+            target.source,
+            changed={path: tuple(stat) for path, stat in updated.items()},
+            removed=[],
+            project_id=target.project_id,
+        )
+        target.file_stats.update(updated)
+        logger.info(
+            "Upserted changed files",
+            source=target.source,
+            documents=len(documents),
+            succeeded=len(updated),
+        )
+
+    async def _delete(self, target: WatchTarget, removed: set[str]) -> None:
+        for rel_paths in batched(sorted(removed), WATCH_BATCH_SIZE):
+            documents = [
+                target.connector._deleted_document(
+                    rel_path, target.file_stats[rel_path]
+                )
+                for rel_path in rel_paths
+            ]
+            await delete_documents(self.pipeline, documents, target.project_id)
+            await self.pipeline.state_manager.update_file_stats(
+                SOURCE_TYPE,
+                target.source,
+                changed={},
+                removed=list(rel_paths),
+                project_id=target.project_id,
+            )
+            for rel_path in rel_paths:
+                target.file_stats.pop(rel_path, None)
+            logger.info(
+                "Deleted removed files", source=target.source, documents=len(documents)
+            )
@@ -0,0 +1,287 @@
+"""Filesystem watchers: Linux inotify with a polling fallback.
+
+Both watchers report the absolute paths of changed files and directories
+below a root directory. A reported path may have been created, modified or
+removed; callers stat it to find out which.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import functools
+import os
+import struct
+import sys
+from collections.abc import AsyncIterator
+
+from qdrant_loader.utils.logging import LoggingConfig
+
+logger = LoggingConfig.get_logger(__name__)
+
+# Event masks from <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# Plain writes are reported once, on close, rather than for every write
+WATCH_MASK = (
+    IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+)
+
+# struct inotify_event header: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+WATCH_BACKENDS = ("auto", "inotify", "polling")
+
+
+@functools.cache
+def _libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_init1.restype = ctypes.c_int
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    libc.inotify_add_watch.restype = ctypes.c_int
+    libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    libc.inotify_rm_watch.restype = ctypes.c_int
+    return libc
+
+
+class InotifyWatcher:
+    """Report changes below a directory using Linux inotify.
+
+    Every directory of the tree gets a watch; directories created or moved in
+    later are watched as they appear. If the kernel event queue overflows,
+    the root itself is reported so that the caller rescans the whole tree.
+    """
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        self._fd: int | None = None
+        self._watches: dict[int, str] = {}
+
+    def start(self) -> None:
+        """Create the inotify instance and watch every directory of the tree.
+
+        Raises:
+            OSError: If inotify is unavailable or the watch limit is reached
+        """
+        if self._fd is not None:
+            return
+        try:
+            libc = _libc()
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError) as e:
+            raise OSError(errno.ENOSYS, f"inotify is not available: {e}") from e
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._fd = fd
+        try:
+            self._watch_tree(self.root)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the inotify instance, which drops all its watches."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches.clear()
+
+    def _watch_tree(self, directory: str) -> None:
+        """Watch a directory and every directory below it.
+
+        Symlinked directories are not followed, like in the LocalFile walk.
+        Directories that vanish or cannot be read are skipped.
+        """
+        assert self._fd is not None
+        libc = _libc()
+        directories = [directory]
+        while directories:
+            path = directories.pop()
+            wd = libc.inotify_add_watch(
+                self._fd, os.fsencode(path), WATCH_MASK | IN_ONLYDIR
+            )
+            if wd < 0:
+                err = ctypes.get_errno()
+                if err in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    continue
+                raise OSError(err, os.strerror(err), path)
+            self._watches[wd] = path
+            try:
+                with os.scandir(path) as it:
+                    directories.extend(
+                        entry.path
+                        for entry in it
+                        if entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+
+    def _unwatch_tree(self, directory: str) -> None:
+        """Drop the watches of a directory moved out of its place."""
+        assert self._fd is not None
+        prefix = directory + os.sep
+        for wd, path in list(self._watches.items()):
+            if path == directory or path.startswith(prefix):
+                _libc().inotify_rm_watch(self._fd, wd)
+                del self._watches[wd]
+
+    async def events(self) -> AsyncIterator[str]:
+        """Yield the paths of changed files and directories."""
+        self.start()
+        assert self._fd is not None
+        fd = self._fd
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        loop.add_reader(fd, self._read, queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            loop.remove_reader(fd)
+
+    def _read(self, queue: asyncio.Queue[str]) -> None:
+        """Parse the pending inotify events into changed paths."""
+        if self._fd is None:
+            return
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            start = offset + _EVENT_HEADER.size
+            name = data[start : start + length].rstrip(b"\0")
+            offset = start + length
+
+            if mask & IN_Q_OVERFLOW:
+                logger.warning("inotify event queue overflowed", root=self.root)
+                queue.put_nowait(self.root)
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    try:
+                        self._watch_tree(path)
+                    except OSError as e:
+                        logger.warning(
+                            "Failed to watch directory",
+                            directory=path,
+                            error=str(e),
+                        )
+                elif mask & IN_MOVED_FROM:
+                    self._unwatch_tree(path)
+            queue.put_nowait(path)
+
+
+class PollingWatcher:
+    """Report changes below a directory by comparing stat snapshots.
+
+    Used where inotify is not available, such as on other platforms, network
+    filesystems or when the inotify watch limit is exhausted.
+    """
+
+    def __init__(self, root: str, interval: float = 2.0):
+        self.root = os.path.abspath(root)
+        self.interval = interval
+
+    def start(self) -> None:
+        """Nothing to set up; the first snapshot is taken by ``events``."""
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+    async def events(self) -> AsyncIterator[str]:
+        """Yield the paths of files that changed between two snapshots."""
+        snapshot = await asyncio.to_thread(self._snapshot)
+        while True:
+            await asyncio.sleep(self.interval)
+            current = await asyncio.to_thread(self._snapshot)
+            for path, stat in current.items():
+                if snapshot.get(path) != stat:
+                    yield path
+            for path in snapshot.keys() - current.keys():
+                yield path
+            snapshot = current
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        """Size and mtime of every file below the root."""
+        snapshot: dict[str, tuple[int, int]] = {}
+        directories = [self.root]
+        while directories:
+            directory = directories.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                    elif entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+        return snapshot
+
+
+def create_watcher(
+    root: str, backend: str = "auto", poll_interval: float = 2.0
+) -> InotifyWatcher | PollingWatcher:
+    """Create a started watcher for a directory.
+
+    Args:
+        root: Directory to watch
+        backend: ``inotify``, ``polling``, or ``auto`` to use inotify where
+            available and fall back to polling
+        poll_interval: Seconds between two snapshots of the polling watcher
+
+    Raises:
+        ValueError: If the backend is unknown
+        OSError: If inotify was requested but cannot be used
+    """
+    if backend not in WATCH_BACKENDS:
+        raise ValueError(f"Unknown watch backend: {backend}")
+
+    if backend != "polling":
+        if sys.platform.startswith("linux"):
+            watcher = InotifyWatcher(root)
+            try:
+                watcher.start()
+                return watcher
+            except OSError as e:
+                if backend == "inotify":
+                    raise
+                logger.warning(
+                    "inotify unavailable, falling back to polling",
+                    root=root,
+                    error=str(e),
+                )
+        elif backend == "inotify":
+            raise OSError(errno.ENOSYS, "inotify is only available on Linux")
+
+    return PollingWatcher(root, poll_interval)
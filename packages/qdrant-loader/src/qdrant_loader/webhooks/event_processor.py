@@ -77,19 +77,7 @@ async def _process_single_upsert(
         )
         return
 
-    if project_id and pipeline.project_manager:
-        document.metadata = pipeline.project_manager.inject_project_metadata(
-            project_id, document.metadata
-        )
-
-    result = await pipeline.orchestrator.components.document_pipeline.process_documents(
-        [document]
-    )
-    await pipeline.orchestrator._update_document_states(
-        [document],
-        result.successfully_processed_documents,
-        project_id,
-    )
+    result = await upsert_documents(pipeline, [document], project_id)
     logger.info(
         "SINGLE_UPSERT completed",
         entity_id=event.entity_id,
@@ -111,17 +99,7 @@ async def _process_single_delete(
         )
         return
 
-    project_id = event.project_id
-    if project_id and pipeline.project_manager:
-        document.metadata = pipeline.project_manager.inject_project_metadata(
-            project_id, document.metadata
-        )
-
-    await pipeline.initialize()
-    await pipeline.orchestrator._process_deleted_documents(
-        [document],
-        project_id,
-    )
+    await delete_documents(pipeline, [document], event.project_id)
     logger.info(
         "SINGLE_DELETE completed",
         entity_id=event.entity_id,
@@ -130,6 +108,61 @@ async def _process_single_delete(
     )
 
 
+async def upsert_documents(
+    pipeline: Any,
+    documents: list[Document],
+    project_id: str | None,
+) -> Any:
+    """Chunk, embed and upsert documents outside a full ingestion run.
+
+    Shared by single-event webhooks and watch mode. Like an ingestion run,
+    only changed chunks are embedded, the points of disappeared chunks are
+    deleted, and the document and chunk states of the documents processed
+    successfully are updated.
+
+    Returns:
+        The result of the document pipeline
+    """
+    if project_id and pipeline.project_manager:
+        for document in documents:
+            document.metadata = pipeline.project_manager.inject_project_metadata(
+                project_id, document.metadata
+            )
+
+    orchestrator = pipeline.orchestrator
+    chunk_diff = await orchestrator._load_chunk_diff(documents, project_id)
+    result = await orchestrator.components.document_pipeline.process_documents(
+        documents, chunk_diff=chunk_diff
+    )
+    await orchestrator._update_document_states(
+        documents,
+        result.successfully_processed_documents,
+        project_id,
+    )
+    if chunk_diff is not None:
+        await orchestrator._apply_chunk_diff(chunk_diff, result, project_id)
+    return result
+
+
+async def delete_documents(
+    pipeline: Any,
+    documents: list[Document],
+    project_id: str | None,
+) -> None:
+    """Remove the points and mark the states of deleted documents.
+
+    Shared by single-event webhooks and watch mode.
+    """
+    if project_id and pipeline.project_manager:
+        for document in documents:
+            document.metadata = pipeline.project_manager.inject_project_metadata(
+                project_id, document.metadata
+            )
+
+    await pipeline.initialize()
+    await pipeline.orchestrator._process_deleted_documents(documents, project_id)
+
+
 def _document_from_delete_payload(event: ChangeEvent) -> Document | None:
     """Build a minimal Document for deletion from Jira webhook payload."""
     payload = event.payload if isinstance(event.payload, dict) else {}
@@ -73,6 +73,20 @@ def setup_test_environment():
         shutil.rmtree(data_dir)
 
 
+@pytest.fixture(autouse=True)
+def reset_model_registry():
+    """Give every test a fresh process-wide model registry.
+
+    Tests patch ``spacy.load``/``tiktoken.get_encoding`` with different doubles,
+    so models cached by one test must not leak into the next.
+    """
+    from qdrant_loader.core.text_processing.model_registry import get_model_registry
+
+    get_model_registry().clear()
+    yield
+    get_model_registry().clear()
+
+
 @pytest.fixture(scope="session")
 def test_settings():
     """Get test settings."""
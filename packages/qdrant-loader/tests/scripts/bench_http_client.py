@@ -0,0 +1,124 @@
+"""Benchmark the shared HTTP policy against a local stub server.
+
+Issues ``--requests`` GET calls, ``--concurrency`` at a time, through
+``request_with_policy`` once per transport:
+
+- ``threaded``: blocking ``requests.Session`` offloaded with ``asyncio.to_thread``
+- ``pooled``: the pooled ``httpx.AsyncClient`` used by the connectors
+
+The stub answers every call with a small JSON body after ``--latency-ms``.
+
+    python tests/scripts/bench_http_client.py --requests 2000 --concurrency 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+from qdrant_loader.connectors.shared.http import (
+    create_async_client,
+    request_with_policy,
+)
+
+LOG = logging.getLogger("qa.http.client_bench")
+
+BODY = json.dumps({"results": [{"id": str(n), "title": "x" * 40} for n in range(20)]})
+
+
+def start_stub_server(latency: float) -> ThreadingHTTPServer:
+    payload = BODY.encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self) -> None:  # noqa: N802 - http.server API
+            if latency:
+                time.sleep(latency)
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:
+            return None
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run_transport(name: str, url: str, args: argparse.Namespace) -> float:
+    session = requests.Session()
+    client = (
+        create_async_client(session, max_connections_per_host=args.concurrency)
+        if name == "pooled"
+        else None
+    )
+    limit = asyncio.Semaphore(args.concurrency)
+
+    async def call(n: int) -> None:
+        async with limit:
+            response = await request_with_policy(
+                session, "GET", f"{url}/rest/api/{n}", client=client, timeout=30
+            )
+            response.raise_for_status()
+            response.json()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(call(n) for n in range(args.requests)))
+    elapsed = time.perf_counter() - start
+    if client is not None:
+        await client.aclose()
+    session.close()
+
+    LOG.info(
+        "%-8s requests=%-6d elapsed=%.2fs requests/s=%.0f",
+        name,
+        args.requests,
+        elapsed,
+        args.requests / elapsed if elapsed else float("inf"),
+    )
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=1_000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("qdrant_loader").setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    server = start_stub_server(args.latency_ms / 1000)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        results = {
+            name: await run_transport(name, url, args)
+            for name in ("threaded", "pooled")
+        }
+    finally:
+        server.shutdown()
+
+    threaded, pooled = results["threaded"], results["pooled"]
+    LOG.info(
+        "SUMMARY threaded=%.2fs pooled=%.2fs speedup=%.1fx",
+        threaded,
+        pooled,
+        threaded / pooled if pooled else float("inf"),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,129 @@
+"""Benchmark the state-DB SQLite profile under concurrent queue load.
+
+Runs ``--producers`` tasks enqueueing ``--jobs`` jobs while ``--consumers``
+tasks claim them and mark them done, with a few extra tasks polling job
+listings, once per profile:
+
+- ``legacy``: rollback journal, synchronous=FULL, no read/write split
+- ``tuned``: the default profile (WAL, synchronous=NORMAL, read/write split)
+
+    python tests/scripts/bench_state_queue.py --jobs 5000 --consumers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from pathlib import Path
+
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.state.session import (
+    create_tables,
+    dispose_engine,
+    initialize_engine_and_session,
+)
+from qdrant_loader.core.worker.queue import SQLiteJobQueue
+
+LOG = logging.getLogger("qa.state.queue_bench")
+
+PROFILES = {
+    "legacy": {
+        "journal_mode": "delete",
+        "synchronous": "full",
+        "read_write_split": False,
+    },
+    "tuned": {},
+}
+
+
+async def run_profile(name: str, db_path: Path, args: argparse.Namespace) -> float:
+    if db_path.exists():
+        db_path.unlink()
+    config = StateManagementConfig(
+        database_path=str(db_path),
+        connection_pool={"size": args.pool_size, "timeout": 60},
+        **PROFILES[name],
+    )
+    engine, session_factory = initialize_engine_and_session(config)
+    await create_tables(engine)
+    queue = SQLiteJobQueue(session_factory)
+
+    per_producer = args.jobs // args.producers
+    total = per_producer * args.producers
+    done = 0
+    producers_finished = asyncio.Event()
+
+    async def produce(worker: int) -> None:
+        for n in range(per_producer):
+            await queue.enqueue("BENCH", {"worker": worker, "n": n})
+
+    async def consume() -> None:
+        nonlocal done
+        while done < total:
+            job = await queue.claim_next(lease_seconds=300)
+            if job is None:
+                if producers_finished.is_set() and done >= total:
+                    return
+                await asyncio.sleep(0.001)
+                continue
+            await queue.mark_done(job.id, job.attempts)
+            done += 1
+
+    async def observe() -> None:
+        while done < total:
+            await queue.list(status=SQLiteJobQueue.PENDING, limit=50)
+            await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    consumers = [asyncio.create_task(consume()) for _ in range(args.consumers)]
+    observers = [asyncio.create_task(observe()) for _ in range(args.observers)]
+    await asyncio.gather(*(produce(worker) for worker in range(args.producers)))
+    producers_finished.set()
+    await asyncio.gather(*consumers)
+    await asyncio.gather(*observers)
+    elapsed = time.perf_counter() - start
+    await dispose_engine(engine)
+
+    LOG.info(
+        "%-7s jobs=%-6d elapsed=%.2fs jobs/s=%.0f",
+        name,
+        total,
+        elapsed,
+        total / elapsed if elapsed else float("inf"),
+    )
+    return elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=2_000)
+    parser.add_argument("--producers", type=int, default=4)
+    parser.add_argument("--consumers", type=int, default=8)
+    parser.add_argument("--observers", type=int, default=2)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--workdir", default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("qdrant_loader").setLevel(logging.WARNING)
+
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="state-queue-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    results = {
+        name: await run_profile(name, workdir / f"{name}.db", args) for name in PROFILES
+    }
+    legacy, tuned = results["legacy"], results["tuned"]
+    LOG.info(
+        "SUMMARY legacy=%.2fs tuned=%.2fs speedup=%.1fx",
+        legacy,
+        tuned,
+        legacy / tuned if tuned else float("inf"),
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,152 @@
+"""Benchmark per-document vs bulk state-DB writes.
+
+Writes ``--documents`` document states in batches of ``--batch-size`` (the
+orchestrator's micro-batch size), once through ``update_document_states`` and
+once through per-document ``update_document_state`` calls, then re-writes
+them to exercise the update path and finally marks them deleted.
+
+The per-document path is slow on large corpora, so it runs on
+``--per-document-limit`` documents and is extrapolated to the full count.
+
+    python tests/scripts/bench_state_writes.py --documents 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.state.state_manager import StateManager
+
+LOG = logging.getLogger("qa.state.bench")
+
+
+def make_documents(count: int, revision: int = 0) -> list[Document]:
+    return [
+        Document(
+            id=f"doc-{i}",
+            title=f"Document {i} r{revision}",
+            content=f"content {i} revision {revision}",
+            content_type="md",
+            source_type="localfile",
+            source=f"source-{i % 10}",
+            url=f"file:///bench/doc-{i}.md",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+async def timed(
+    label: str,
+    documents: list[Document],
+    batch_size: int,
+    write: Callable[[list[Document]], Awaitable[object]],
+) -> float:
+    start = time.perf_counter()
+    for offset in range(0, len(documents), batch_size):
+        await write(documents[offset : offset + batch_size])
+    elapsed = time.perf_counter() - start
+    LOG.info(
+        "%-28s docs=%-7d elapsed=%.2fs docs/s=%.0f",
+        label,
+        len(documents),
+        elapsed,
+        len(documents) / elapsed if elapsed else float("inf"),
+    )
+    return elapsed
+
+
+async def open_manager(db_path: Path) -> StateManager:
+    if db_path.exists():
+        db_path.unlink()
+    manager = StateManager(StateManagementConfig(database_path=str(db_path)))
+    await manager.initialize()
+    return manager
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--per-document-limit", type=int, default=5_000)
+    parser.add_argument("--project-id", default="bench")
+    parser.add_argument("--workdir", default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("qdrant_loader").setLevel(logging.WARNING)
+
+    workdir = Path(args.workdir or tempfile.mkdtemp(prefix="state-bench-"))
+    workdir.mkdir(parents=True, exist_ok=True)
+    project_id = args.project_id or None
+    qdrant_manager = AsyncMock()
+
+    documents = make_documents(args.documents)
+    revised = make_documents(args.documents, revision=1)
+
+    bulk = await open_manager(workdir / "bulk.db")
+    bulk_insert = await timed(
+        "bulk insert",
+        documents,
+        args.batch_size,
+        lambda batch: bulk.update_document_states(batch, project_id),
+    )
+    bulk_update = await timed(
+        "bulk update",
+        revised,
+        args.batch_size,
+        lambda batch: bulk.update_document_states(batch, project_id),
+    )
+    bulk_delete = await timed(
+        "bulk mark deleted",
+        revised,
+        args.batch_size,
+        lambda batch: bulk.mark_documents_deleted_atomic(
+            batch, qdrant_manager, project_id
+        ),
+    )
+    await bulk.dispose()
+
+    sample = min(args.per_document_limit, args.documents)
+    scale = args.documents / sample if sample else 0.0
+
+    async def per_document(batch: list[Document]) -> None:
+        for doc in batch:
+            await single.update_document_state(doc, project_id)
+
+    single = await open_manager(workdir / "single.db")
+    single_insert = await timed(
+        "per-document insert", documents[:sample], args.batch_size, per_document
+    )
+    single_update = await timed(
+        "per-document update", revised[:sample], args.batch_size, per_document
+    )
+    await single.dispose()
+
+    LOG.info("SUMMARY documents=%s batch_size=%s", args.documents, args.batch_size)
+    LOG.info(
+        "SUMMARY insert bulk=%.2fs per-document~%.2fs speedup~%.1fx",
+        bulk_insert,
+        single_insert * scale,
+        single_insert * scale / bulk_insert if bulk_insert else float("inf"),
+    )
+    LOG.info(
+        "SUMMARY update bulk=%.2fs per-document~%.2fs speedup~%.1fx",
+        bulk_update,
+        single_update * scale,
+        single_update * scale / bulk_update if bulk_update else float("inf"),
+    )
+    LOG.info("SUMMARY mark-deleted bulk=%.2fs", bulk_delete)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,6 +1,9 @@
 """Tests for QdrantConfig class."""
 
+import pytest
+from pydantic import ValidationError
 from qdrant_loader.config.qdrant import QdrantConfig
+from qdrant_loader_core.config import PayloadLayout
 
 
 class TestQdrantConfig:
@@ -56,6 +59,12 @@ class TestQdrantConfig:
             "url": "http://localhost:6333",
             "api_key": "test-key",
             "collection_name": "my_collection",
+            "prefer_grpc": False,
+            "grpc_port": 6334,
+            "collection_profile": "default",
+            "collection_profiles": {},
+            "reindex_retention": 2,
+            "payload": PayloadLayout().model_dump(),
         }
         assert result == expected
 
@@ -71,6 +80,12 @@ class TestQdrantConfig:
             "url": "http://localhost:6333",
             "api_key": None,
             "collection_name": "my_collection",
+            "prefer_grpc": False,
+            "grpc_port": 6334,
+            "collection_profile": "default",
+            "collection_profiles": {},
+            "reindex_retention": 2,
+            "payload": PayloadLayout().model_dump(),
         }
         assert result == expected
 
@@ -80,6 +95,10 @@ class TestQdrantConfig:
         assert config.url == "http://localhost:6333"
         assert config.collection_name == "documents"
         assert config.api_key is None
+        assert config.prefer_grpc is False
+        assert config.grpc_port == 6334
+        assert config.reindex_retention == 2
+        assert config.payload == PayloadLayout()
 
     def test_override_url(self):
         """Test that URL can be overridden."""
@@ -95,3 +114,41 @@ class TestQdrantConfig:
 
     # Note: Empty string validation is not implemented in the base QdrantConfig class
     # This would require custom field validators if needed in the future
+
+    def test_collection_profile_defaults_to_plain_vectors(self):
+        """New collections keep float32 in-RAM vectors unless a profile is set."""
+        config = QdrantConfig()
+        assert config.collection_profile == "default"
+        assert config.profile.quantization == "none"
+        assert config.profile.vectors_on_disk is False
+
+    def test_builtin_collection_profile(self):
+        """Built-in profiles can be selected by name."""
+        config = QdrantConfig(collection_profile="memory_saver")
+        assert config.profile.quantization == "binary"
+        assert config.profile.vectors_on_disk is True
+        assert config.profile.search.oversampling == 3.0
+
+    def test_custom_collection_profile(self):
+        """Custom profiles are validated and can be selected."""
+        config = QdrantConfig(
+            collection_profile="pq",
+            collection_profiles={
+                "pq": {
+                    "quantization": "product",
+                    "product_compression": "x32",
+                    "vectors_on_disk": True,
+                    "search": {"oversampling": 4.0},
+                }
+            },
+        )
+        assert config.profile.quantization == "product"
+        assert config.profile.product_compression == "x32"
+        assert config.to_dict()["collection_profiles"]["pq"]["quantization"] == (
+            "product"
+        )
+
+    def test_unknown_collection_profile_is_rejected(self):
+        """Selecting a profile that does not exist fails validation."""
+        with pytest.raises(ValidationError, match="Unknown collection profile"):
+            QdrantConfig(collection_profile="fastest")
@@ -1,8 +1,11 @@
 """Unit tests for the Confluence connector."""
 
+import asyncio
 import os
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 import requests
 from pydantic import HttpUrl
@@ -12,6 +15,7 @@ from qdrant_loader.connectors.confluence.config import (
     ConfluenceSpaceConfig,
 )
 from qdrant_loader.connectors.confluence.connector import ConfluenceConnector
+from qdrant_loader.connectors.confluence.pagination import build_cloud_search_params
 from qdrant_loader.core.document import Document
 
 
@@ -198,22 +202,35 @@ class TestConfluenceConnector:
     @pytest.mark.asyncio
     async def test_make_request_success(self, connector):
         """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"test": "data"}
-        mock_response.raise_for_status.return_value = None
+        requests_seen = []
 
-        with patch("requests.Session.request", return_value=mock_response):
-            result = await connector._make_request("GET", "content/search")
-            assert result == {"test": "data"}
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests_seen.append(request)
+            return httpx.Response(200, json={"test": "data"})
+
+        connector._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        result = await connector._make_request("GET", "content/search")
+        assert result == {"test": "data"}
+        assert requests_seen[0].url.path.endswith("/rest/api/content/search")
+        assert requests_seen[0].headers["Authorization"].startswith("Basic ")
 
     @pytest.mark.asyncio
     async def test_make_request_failure(self, connector):
         """Test failed API request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("API Error", request=request)
+
+        connector._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
         with patch(
-            "requests.Session.request",
-            side_effect=requests.exceptions.RequestException("API Error"),
+            "qdrant_loader.connectors.shared.http.client.asyncio.sleep",
+            new=AsyncMock(),
         ):
-            with pytest.raises(requests.exceptions.RequestException, match="API Error"):
+            with pytest.raises(requests.exceptions.ConnectionError, match="API Error"):
                 await connector._make_request("GET", "content/search")
 
     @pytest.mark.asyncio
@@ -230,7 +247,7 @@ class TestConfluenceConnector:
 
         with (
             patch(
-                "qdrant_loader.connectors.shared.http.policy.make_request_with_retries_async",
+                "qdrant_loader.connectors.shared.http.policy.httpx_request_with_retries",
                 new=AsyncMock(return_value=fake_response),
             ) as _mock_retry,
             patch(
@@ -326,6 +343,80 @@ class TestConfluenceConnector:
             assert documents[0].content == "Test content"
             assert documents[0].source_type == SourceType.CONFLUENCE
 
+    @pytest.mark.asyncio
+    async def test_stream_documents_prefetches_pages_and_attachments(self, connector):
+        """Data Center pages are fetched ahead and attachments concurrently."""
+        connector.config.deployment_type = ConfluenceDeploymentType.DATACENTER
+        connector.config.max_concurrent_attachments = 2
+        connector.config.include_labels = []
+        connector.config.exclude_labels = []
+        since = datetime(2024, 5, 1, 12, 30)
+
+        def page(start: int) -> dict:
+            return {
+                "results": [
+                    {
+                        "id": str(start + n),
+                        "title": f"Page {start + n}",
+                        "type": "page",
+                        "space": {"key": "TEST"},
+                        "body": {"storage": {"value": "Test content"}},
+                        "version": {"number": 1, "when": "2024-01-01T00:00:00Z"},
+                        "history": {"createdDate": "2024-01-01T00:00:00Z"},
+                        "metadata": {"labels": {"results": []}},
+                        "children": {"comment": {"results": []}},
+                    }
+                    for n in range(3)
+                ],
+                "totalSize": 75,
+            }
+
+        active = 0
+        peak = 0
+
+        async def fake_attachments(content, document):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return []
+
+        with (
+            patch.object(
+                connector,
+                "_get_space_content_datacenter",
+                AsyncMock(side_effect=lambda start, _since: page(start)),
+            ) as mock_fetch,
+            patch.object(
+                connector,
+                "_process_attachments_for_document",
+                side_effect=fake_attachments,
+            ),
+        ):
+            documents = [
+                document async for document in connector.stream_documents(since)
+            ]
+
+        assert [doc.metadata["id"] for doc in documents] == [
+            str(start + n) for start in (0, 25, 50) for n in range(3)
+        ]
+        assert [call.args for call in mock_fetch.call_args_list] == [
+            (0, since),
+            (25, since),
+            (50, since),
+        ]
+        assert peak == 2
+
+    def test_search_params_filter_by_modification_time(self):
+        """The since filter is added to the CQL query."""
+        params = build_cloud_search_params(
+            "TEST", ["page"], None, datetime(2024, 5, 1, 12, 30)
+        )
+        assert params["cql"] == (
+            'space = "TEST" and type in ("page") and lastmodified >= "2024-05-01 12:30"'
+        )
+
     @pytest.mark.asyncio
     async def test_change_tracking_version_comparison(self, connector):
         """Test version comparison for change tracking."""
@@ -188,3 +188,78 @@ class TestGitConnector:
                 }
                 assert "test.md" in processed_files
                 assert "test.txt" in processed_files
+
+    @pytest.mark.asyncio
+    async def test_incremental_listing_from_sync_cursor(
+        self, mock_config, mock_git_ops, tmp_path
+    ):
+        """Test that a previous cursor limits the run to the changed files."""
+        config = mock_config.model_copy(update={"mirror_dir": str(tmp_path)})
+        with (
+            patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.FileProcessor.should_process_file",
+                return_value=True,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.GitMetadataExtractor"
+            ) as mock_extractor_class,
+        ):
+            mock_extractor_class.return_value.extract_all_metadata.return_value = {}
+            connector = GitConnector(config)
+            mock_git_ops.head_commit.return_value = "new"
+            mock_git_ops.has_commit.return_value = True
+
+            async with connector:
+                repo_dir = connector.temp_dir
+                assert repo_dir == connector.mirror.path
+                assert connector.mirror.locked
+                mock_git_ops.diff_name_status.return_value = [
+                    ("M", os.path.join(repo_dir, "docs", "changed.md")),
+                    ("D", os.path.join(repo_dir, "docs", "removed.md")),
+                ]
+                fingerprint = connector._filter_fingerprint()
+                connector.set_sync_cursor(f"old:{fingerprint}")
+
+                documents = await connector.get_documents()
+
+            assert not connector.mirror.locked
+            mock_git_ops.diff_name_status.assert_called_once_with("old", "new")
+            mock_git_ops.list_files.assert_not_called()
+            assert [(doc.title, doc.is_deleted) for doc in documents] == [
+                ("changed.md", False),
+                ("removed.md", True),
+            ]
+            assert documents[1].url.endswith("/blob/main/docs/removed.md")
+            assert connector.sync_cursor == f"new:{fingerprint}"
+
+    @pytest.mark.asyncio
+    async def test_filter_change_lists_all_files(self, mock_config, mock_git_ops):
+        """Test that a cursor recorded with other file filters is ignored."""
+        with (
+            patch(
+                "qdrant_loader.connectors.git.connector.GitOperations",
+                return_value=mock_git_ops,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.FileProcessor.should_process_file",
+                return_value=True,
+            ),
+            patch(
+                "qdrant_loader.connectors.git.connector.GitMetadataExtractor"
+            ) as mock_extractor_class,
+        ):
+            mock_extractor_class.return_value.extract_all_metadata.return_value = {}
+            connector = GitConnector(mock_config)
+            mock_git_ops.head_commit.return_value = "new"
+            connector.set_sync_cursor("old:other-filters")
+
+            async with connector:
+                documents = await connector.get_documents()
+
+            mock_git_ops.diff_name_status.assert_not_called()
+            assert len(documents) == 2
+            assert not any(doc.is_deleted for doc in documents)
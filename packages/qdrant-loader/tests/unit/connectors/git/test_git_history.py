@@ -0,0 +1,84 @@
+"""
+Unit tests for the Git history index.
+"""
+
+import os
+from unittest.mock import MagicMock
+
+import git
+import pytest
+from qdrant_loader.connectors.git.config import GitRepoConfig
+from qdrant_loader.connectors.git.history import GitHistoryIndex
+from qdrant_loader.connectors.git.metadata_extractor import GitMetadataExtractor
+from qdrant_loader.connectors.git.operations import GitOperations
+
+
+def _commit(repo: git.Repo, files: dict[str, str | None], message: str) -> None:
+    for rel_path, content in files.items():
+        path = os.path.join(repo.working_dir, rel_path)
+        if content is None:
+            repo.index.remove([rel_path], working_tree=True)
+            continue
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(content)
+        repo.index.add([rel_path])
+    actor = git.Actor("Test Author", "author@example.com")
+    repo.index.commit(message, author=actor, committer=actor)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create a repository with a small history."""
+    repo = git.Repo.init(tmp_path)
+    _commit(repo, {"README.md": "v1", "docs/guide one.md": "guide"}, "Initial")
+    _commit(repo, {"README.md": "v2", "old.md": "old"}, "Update readme")
+    _commit(repo, {"old.md": None}, "Remove old file")
+    return repo
+
+
+def test_index_maps_paths_to_first_and_last_commit(repo):
+    index = GitHistoryIndex.build(repo, chunk_size=16)
+
+    assert index.head == repo.head.commit.hexsha
+    assert index.first_commit("README.md").message == "Initial"
+    assert index.last_commit("README.md").message == "Update readme"
+    assert index.last_commit("docs/guide one.md").message == "Initial"
+    assert index.last_commit("old.md").message == "Remove old file"
+    assert index.last_commit("missing.md") is None
+    assert index.latest_commit.sha == repo.head.commit.hexsha
+    assert index.latest_commit.author == "Test Author"
+
+
+def test_operations_and_extractor_read_dates_from_index(repo):
+    operations = GitOperations()
+    operations.repo = repo
+    index = operations.build_history_index()
+    assert operations.build_history_index() is index
+
+    head = repo.head.commit
+    initial = head.parents[0].parents[0]
+    readme = os.path.join(repo.working_dir, "README.md")
+    repo.iter_commits = MagicMock(side_effect=AssertionError("per-file walk"))
+
+    assert operations.get_first_commit_date(readme) == initial.committed_datetime
+    assert operations.get_last_commit_date(readme) == (
+        head.parents[0].committed_datetime
+    )
+
+    extractor = GitMetadataExtractor(
+        GitRepoConfig(
+            base_url="https://github.com/test/repo.git",
+            file_types=["*.md"],
+            token="token",
+            source="test",
+            source_type="git",
+            temp_dir=repo.working_dir,
+        )
+    )
+    extractor.history = index
+    assert extractor._extract_git_metadata("docs/guide one.md") == {
+        "last_commit_date": initial.committed_datetime.isoformat(),
+        "last_commit_author": "Test Author",
+        "last_commit_message": "Initial",
+    }
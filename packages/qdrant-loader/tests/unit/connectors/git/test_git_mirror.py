@@ -0,0 +1,34 @@
+"""Tests for persistent Git mirrors."""
+
+import pytest
+from qdrant_loader.connectors.git.mirror import GitMirror
+
+
+def test_mirror_path_depends_on_url_and_branch(tmp_path):
+    main = GitMirror(str(tmp_path), "https://example.com/repo.git", "main")
+
+    assert main.path.startswith(str(tmp_path))
+    assert (
+        main.path
+        == GitMirror(str(tmp_path), "https://example.com/repo.git", "main").path
+    )
+    assert (
+        main.path
+        != GitMirror(str(tmp_path), "https://example.com/repo.git", "dev").path
+    )
+
+
+@pytest.mark.asyncio
+async def test_lock_is_exclusive(tmp_path):
+    first = GitMirror(str(tmp_path), "https://example.com/repo.git", "main")
+    second = GitMirror(str(tmp_path), "https://example.com/repo.git", "main")
+
+    await first.acquire()
+    assert first.locked
+    assert not second._try_lock()
+
+    first.release()
+    await second.acquire(poll_interval=0.01)
+    assert second.locked
+    second.release()
+    assert not second.locked
@@ -1,8 +1,10 @@
 """Unit tests for Jira connector."""
 
+import asyncio
 import os
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
 import pytest
 from pydantic import HttpUrl
 from qdrant_loader.config.types import SourceType
@@ -361,31 +363,27 @@ class TestJiraConnector:
         # Mock the actual HTTP request to avoid network calls but keep rate limiting logic
         call_times = []
 
-        def mock_session_request(*args, **kwargs):
+        def handler(request: httpx.Request) -> httpx.Response:
             import time
 
             call_times.append(time.time())
-            # Create a mock response
-            mock_response = MagicMock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.return_value = {"issues": []}
-            return mock_response
+            return httpx.Response(200, json={"issues": []})
 
-        with patch.object(
-            connector.session, "request", side_effect=mock_session_request
-        ):
-            async with connector:
-                # Make multiple requests quickly
-                for _ in range(3):
-                    await connector._make_request(
-                        "GET", "search/jql", params={"jql": 'project = "TEST"'}
-                    )
-
-                # Check that rate limiting was applied
-                if len(call_times) >= 2:
-                    time_diff = call_times[1] - call_times[0]
-                    min_interval = 60.0 / connector.config.requests_per_minute
-                    assert time_diff >= min_interval * 0.9  # Allow some tolerance
+        connector._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        async with connector:
+            # Make multiple requests quickly
+            for _ in range(3):
+                await connector._make_request(
+                    "GET", "search/jql", params={"jql": 'project = "TEST"'}
+                )
+
+            # Check that rate limiting was applied
+            if len(call_times) >= 2:
+                time_diff = call_times[1] - call_times[0]
+                min_interval = 60.0 / connector.config.requests_per_minute
+                assert time_diff >= min_interval * 0.9  # Allow some tolerance
 
     @pytest.mark.asyncio
     async def test_data_center_rate_limiting(self, jira_data_center_config):
@@ -395,31 +393,27 @@ class TestJiraConnector:
         # Mock the actual HTTP request to avoid network calls but keep rate limiting logic
         call_times = []
 
-        def mock_session_request(*args, **kwargs):
+        def handler(request: httpx.Request) -> httpx.Response:
             import time
 
             call_times.append(time.time())
-            # Create a mock response
-            mock_response = MagicMock()
-            mock_response.raise_for_status.return_value = None
-            mock_response.json.return_value = {"issues": [], "total": 0}
-            return mock_response
+            return httpx.Response(200, json={"issues": [], "total": 0})
 
-        with patch.object(
-            connector.session, "request", side_effect=mock_session_request
-        ):
-            async with connector:
-                # Make multiple requests quickly
-                for _ in range(3):
-                    await connector._make_request(
-                        "GET", "search", params={"jql": 'project = "TEST"'}
-                    )
-
-                # Check that rate limiting was applied
-                if len(call_times) >= 2:
-                    time_diff = call_times[1] - call_times[0]
-                    min_interval = 60.0 / connector.config.requests_per_minute
-                    assert time_diff >= min_interval * 0.9  # Allow some tolerance
+        connector._http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        async with connector:
+            # Make multiple requests quickly
+            for _ in range(3):
+                await connector._make_request(
+                    "GET", "search", params={"jql": 'project = "TEST"'}
+                )
+
+            # Check that rate limiting was applied
+            if len(call_times) >= 2:
+                time_diff = call_times[1] - call_times[0]
+                min_interval = 60.0 / connector.config.requests_per_minute
+                assert time_diff >= min_interval * 0.9  # Allow some tolerance
 
     @pytest.mark.asyncio
     async def test_get_cloud_documents(self, jira_cloud_config, mock_cloud_issue_data):
@@ -515,6 +509,51 @@ class TestJiraConnector:
                 assert len(issues) == 1
                 assert call_count == 2  # Should have made 2 API calls
 
+    @pytest.mark.asyncio
+    async def test_stream_documents_processes_attachments_concurrently(
+        self, jira_data_center_config, mock_data_center_issue_data
+    ):
+        """Attachments of several issues are processed at once, in order."""
+        jira_data_center_config.download_attachments = True
+        jira_data_center_config.max_concurrent_attachments = 2
+        connector = JiraDataCenterConnector(jira_data_center_config)
+        issues = [
+            {**mock_data_center_issue_data, "id": str(n), "key": f"TEST-{n}"}
+            for n in range(4)
+        ]
+
+        in_flight = 0
+        peak = 0
+
+        async def fetch_and_process(attachments, parent):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            # Earlier issues have slower attachments
+            await asyncio.sleep(0.01 * (4 - int(attachments[0].parent_document_id)))
+            in_flight -= 1
+            return [
+                MagicMock(
+                    spec=Document, metadata={"key": f"att-{parent.metadata['key']}"}
+                )
+            ]
+
+        connector.attachment_reader = MagicMock()
+        connector.attachment_reader.fetch_and_process = fetch_and_process
+
+        with patch.object(
+            connector,
+            "_make_request",
+            return_value={"issues": issues, "total": 4},
+        ):
+            keys = [
+                document.metadata["key"]
+                async for document in connector.stream_documents()
+            ]
+
+        assert keys == [key for n in range(4) for key in (f"TEST-{n}", f"att-TEST-{n}")]
+        assert peak == 2
+
     @pytest.mark.asyncio
     async def test_pagination(
         self, jira_data_center_config, mock_data_center_issue_data
@@ -1328,6 +1367,7 @@ class TestFetchById:
         connector.attachment_reader.fetch_and_process.side_effect = RuntimeError(
             "attachment boom"
         )
+        connector.attachment_reader.aclose = AsyncMock()
 
         with (
             patch.object(connector, "_validate_connection", return_value=None),
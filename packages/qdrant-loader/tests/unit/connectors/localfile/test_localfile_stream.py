@@ -0,0 +1,128 @@
+"""Tests for the incremental LocalFile stream."""
+
+import os
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from pydantic import AnyUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.base import FileStat
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.localfile.config import LocalFileConfig
+
+
+class TestLocalFileStream:
+    """Test stat-based skipping and deletion markers of the LocalFile stream."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a directory tree with test files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "a.md").write_text("# A")
+            (Path(temp_dir) / "sub").mkdir()
+            (Path(temp_dir) / "sub" / "b.txt").write_text("b")
+            yield temp_dir
+
+    @pytest.fixture
+    def config(self, temp_dir):
+        """Create LocalFile configuration."""
+        return LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.txt", "*.md"],
+            max_concurrent_files=2,
+        )
+
+    async def _stream(self, connector):
+        return [document async for document in connector.stream_documents()]
+
+    @pytest.mark.asyncio
+    async def test_reports_stats_of_every_file(self, config, temp_dir):
+        """A full stream yields every file and reports its size and mtime."""
+        connector = LocalFileConnector(config)
+        documents = await self._stream(connector)
+
+        assert sorted(d.title for d in documents) == ["a.md", "b.txt"]
+        assert connector.file_stats is not None
+        assert set(connector.file_stats) == {"a.md", "sub/b.txt"}
+        stat = os.stat(Path(temp_dir) / "sub" / "b.txt")
+        b_stat = connector.file_stats["sub/b.txt"]
+        assert (b_stat.size, b_stat.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+        assert b_stat.url == next(d.url for d in documents if d.title == "b.txt")
+
+    @pytest.mark.asyncio
+    async def test_skips_unchanged_files_without_reading(self, config, temp_dir):
+        """Files whose stat matches the previous run are not read again."""
+        first = LocalFileConnector(config)
+        await self._stream(first)
+
+        (Path(temp_dir) / "a.md").write_text("# A changed")
+        second = LocalFileConnector(config)
+        second.set_file_stats(first.file_stats)
+        with patch.object(
+            second, "_load_document", wraps=second._load_document
+        ) as load:
+            documents = await self._stream(second)
+
+        assert [d.title for d in documents] == ["a.md"]
+        load.assert_called_once()
+        assert second.file_stats is not None
+        assert second.file_stats["sub/b.txt"] == first.file_stats["sub/b.txt"]
+
+    @pytest.mark.asyncio
+    async def test_yields_deletion_markers_for_removed_files(self, config, temp_dir):
+        """Known files that are gone are yielded as deleted documents."""
+        first = LocalFileConnector(config)
+        documents = await self._stream(first)
+        removed_url = next(d.url for d in documents if d.title == "b.txt")
+
+        os.remove(Path(temp_dir) / "sub" / "b.txt")
+        second = LocalFileConnector(config)
+        second.set_file_stats(first.file_stats)
+        documents = await self._stream(second)
+
+        assert len(documents) == 1
+        assert documents[0].is_deleted
+        assert documents[0].url == removed_url
+        assert second.file_stats is not None
+        assert set(second.file_stats) == {"a.md"}
+
+    @pytest.mark.asyncio
+    async def test_unlisted_directory_does_not_delete_its_files(self, config, temp_dir):
+        """Files below a directory that cannot be listed are not deleted."""
+        first = LocalFileConnector(config)
+        await self._stream(first)
+
+        second = LocalFileConnector(config)
+        second.set_file_stats(
+            {
+                **(first.file_stats or {}),
+                "locked/c.md": FileStat(1, 1, "file:///locked/c.md"),
+            }
+        )
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if os.path.basename(path) == "sub":
+                raise PermissionError("denied")
+            return real_scandir(path)
+
+        with patch("qdrant_loader.connectors.localfile.connector.os.scandir", scandir):
+            documents = await self._stream(second)
+
+        # Only c.md, which was not listed, is reported as deleted
+        assert [d.url for d in documents if d.is_deleted] == ["file:///locked/c.md"]
+
+    @pytest.mark.asyncio
+    async def test_fetch_by_id_loads_a_single_file(self, config):
+        """A file is fetched by its relative path; filtered files are not."""
+        connector = LocalFileConnector(config)
+
+        document = await connector.fetch_by_id("sub/b.txt")
+        assert document is not None
+        assert document.title == "b.txt"
+        assert document.content == "b"
+        assert await connector.fetch_by_id("sub/missing.py") is None
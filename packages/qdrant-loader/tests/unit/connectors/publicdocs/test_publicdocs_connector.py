@@ -315,11 +315,20 @@ class TestPublicDocsConnector:
         session.__aenter__.return_value = session
         session.__aexit__.return_value = None
 
+        index_response = AsyncMock()
+        index_response.status = 200
+        index_response.text = AsyncMock(
+            return_value='<html><a href="error-page">E</a><a href="valid-page">V</a>'
+        )
+        index_response.raise_for_status = MagicMock()
+
         async def mock_get(url: str, **kwargs) -> AsyncMock:
             if url == error_url:
                 return error_response
             elif url == valid_url:
                 return valid_response
+            elif url == base_url:
+                return index_response
             raise ValueError(f"Unexpected URL: {url}")
 
         session.get = AsyncMock(side_effect=mock_get)
@@ -337,22 +346,17 @@ class TestPublicDocsConnector:
                 assert content is not None
                 assert title == "Page 1"
 
-                # Now test get_documents with a mix of valid and error URLs
-                # It should handle errors and return only valid documents
-                async def mock_get_all_pages() -> list[str]:
-                    return [valid_url, error_url]
-
-                with patch.object(
-                    connector, "_get_all_pages", side_effect=mock_get_all_pages
-                ):
-                    # get_documents should not raise an exception but should log the error
-                    documents = await connector.get_documents()
+                # Now crawl an index linking to a valid and an error page
+                # The error is logged and only valid documents are returned
+                documents = [
+                    document async for document in connector.stream_documents()
+                ]
 
-                    # We should get only the valid document
-                    assert len(documents) == 1
-                    assert documents[0].url == valid_url
-                    assert documents[0].title == "Page 1"
-                    assert "Page 1 content" in documents[0].content
+                # The index has no content; we should get only the valid document
+                assert len(documents) == 1
+                assert documents[0].url == valid_url
+                assert documents[0].title == "Page 1"
+                assert "Page 1 content" in documents[0].content
 
         # Test network error in _process_page
         connector = PublicDocsConnector(publicdocs_config)
@@ -443,3 +447,51 @@ class TestPublicDocsConnector:
                 assert documents[0].title == "Test Page"
                 assert documents[1].title == "Page 1"
                 assert all(doc.metadata.get("version") == "1.0.0" for doc in documents)
+
+    @pytest.mark.asyncio
+    async def test_stream_documents_fetches_each_page_once(
+        self, publicdocs_config: PublicDocsSourceConfig
+    ) -> None:
+        """Pages are fetched once and reused for links, content and attachments."""
+        config = publicdocs_config.model_copy(update={"download_attachments": True})
+        connector = PublicDocsConnector(config)
+        base_url = str(config.base_url)
+        pages = {
+            base_url: HTML_CONTENT.replace(
+                "</article>", '<a href="/docs/guide.pdf">Guide</a></article>'
+            ),
+            f"{base_url}docs/page1": LINKED_PAGE_CONTENT,
+        }
+
+        async def mock_get(url: str, **kwargs) -> AsyncMock:
+            response = AsyncMock()
+            response.status = 200
+            response.text = AsyncMock(return_value=pages[url])
+            response.raise_for_status = MagicMock()
+            return response
+
+        session = AsyncMock()
+        session.get = AsyncMock(side_effect=mock_get)
+        session.close = AsyncMock()
+
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                downloader = MagicMock()
+                downloader.download_and_process_attachments = AsyncMock(
+                    return_value=[MagicMock(url=f"{base_url}docs/guide.pdf")]
+                )
+                downloader.aclose = AsyncMock()
+                connector.attachment_downloader = downloader
+                documents = [doc async for doc in connector.stream_documents()]
+
+        assert [doc.url for doc in documents] == [
+            base_url,
+            f"{base_url}docs/guide.pdf",
+            f"{base_url}docs/page1",
+        ]
+        fetched = [call.args[0] for call in session.get.call_args_list]
+        # The excluded blog page is a leaf, so it is not even downloaded
+        assert sorted(fetched) == [base_url, f"{base_url}docs/page1"]
+        attachments = downloader.download_and_process_attachments.call_args.args[0]
+        assert [a.download_url for a in attachments] == [f"{base_url}docs/guide.pdf"]
+        downloader.aclose.assert_awaited_once()
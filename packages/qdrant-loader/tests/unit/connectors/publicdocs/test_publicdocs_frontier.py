@@ -0,0 +1,75 @@
+"""Unit tests for the PublicDocs crawl frontier."""
+
+import asyncio
+import itertools
+
+import pytest
+from qdrant_loader.connectors.publicdocs.frontier import (
+    CrawlFrontier,
+    HostLimiter,
+    normalize_url,
+)
+
+
+def test_normalize_url_deduplicates_equivalent_urls():
+    assert normalize_url("HTTPS://Docs.Example.com:443/a?b=1#top") == (
+        "https://docs.example.com/a?b=1"
+    )
+    assert normalize_url("http://docs.example.com") == "http://docs.example.com/"
+    assert normalize_url("http://docs.example.com:8080/a") == (
+        "http://docs.example.com:8080/a"
+    )
+
+
+@pytest.mark.asyncio
+async def test_crawl_follows_links_to_max_depth_concurrently():
+    site = {
+        "https://d.io/": ["https://d.io/a", "https://d.io/b#x", "https://d.io/a"],
+        "https://d.io/a": ["https://d.io/c", "https://D.io/"],
+        "https://d.io/b": ["https://d.io/d"],
+        "https://d.io/c": ["https://d.io/e"],
+    }
+    in_flight = 0
+    peak = 0
+
+    async def visit(url: str, depth: int) -> tuple[str, list[str]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"{depth}:{url}", site.get(url, [])
+
+    frontier = CrawlFrontier(max_depth=2, concurrency=2)
+    frontier.add("https://d.io/")
+    visited = [result async for result in frontier.crawl(visit)]
+
+    assert sorted(visited) == [
+        "0:https://d.io/",
+        "1:https://d.io/a",
+        "1:https://d.io/b",
+        "2:https://d.io/c",
+        "2:https://d.io/d",
+    ]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_host_limiter_spaces_requests_to_a_host():
+    limiter = HostLimiter(per_host=4, delay=0.02)
+    loop = asyncio.get_running_loop()
+    starts: dict[str, list[float]] = {"a": [], "b": []}
+
+    async def request(url: str, host: str) -> None:
+        async with limiter.slot(url):
+            starts[host].append(loop.time())
+
+    await asyncio.gather(
+        *(request("https://a.io/x", "a") for _ in range(3)),
+        request("https://b.io/x", "b"),
+    )
+
+    gaps = [later - earlier for earlier, later in itertools.pairwise(starts["a"])]
+    assert all(gap >= 0.015 for gap in gaps)
+    # Other hosts are not held back
+    assert starts["b"][0] - starts["a"][0] < 0.015
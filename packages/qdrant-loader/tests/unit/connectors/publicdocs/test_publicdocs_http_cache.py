@@ -0,0 +1,102 @@
+"""Unit tests for the PublicDocs HTTP validator cache and conditional crawls."""
+
+import os
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pydantic import HttpUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.publicdocs.config import PublicDocsSourceConfig
+from qdrant_loader.connectors.publicdocs.connector import PublicDocsConnector
+from qdrant_loader.connectors.publicdocs.http_cache import (
+    CachedPage,
+    HttpValidatorCache,
+)
+
+BASE_URL = "https://test.docs.com/"
+
+PAGES = {
+    BASE_URL: '<html><article><h1>Home</h1><p>Welcome</p><a href="/guide">G</a></article></html>',
+    f"{BASE_URL}guide": "<html><article><h1>Guide</h1><p>Steps</p></article></html>",
+}
+
+
+def test_cached_page_conditional_headers():
+    page = CachedPage.from_headers(
+        {"ETag": '"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+    )
+
+    assert page.request_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+    }
+    assert CachedPage.from_headers({}) is None
+
+
+def test_cache_generations_round_trip_and_prune(tmp_path):
+    cache = HttpValidatorCache(str(tmp_path), BASE_URL)
+    assert cache.load(None) == 0
+    cache.record(BASE_URL, CachedPage(etag='"v1"', links=[f"{BASE_URL}guide"]))
+    first = cache.save()
+
+    cache = HttpValidatorCache(str(tmp_path), BASE_URL)
+    assert cache.load(first) == 1
+    assert cache.get(BASE_URL).links == [f"{BASE_URL}guide"]
+    second = cache.save()
+
+    # The previous generation is kept until the pipeline stores the new one
+    assert sorted(os.listdir(cache.path)) == sorted([f"{first}.json", f"{second}.json"])
+
+    cache = HttpValidatorCache(str(tmp_path), BASE_URL)
+    cache.load(second)
+    cache.save()
+    assert f"{first}.json" not in os.listdir(cache.path)
+
+
+@pytest.mark.asyncio
+async def test_recrawl_skips_pages_not_modified(tmp_path):
+    config = PublicDocsSourceConfig(
+        source_type=SourceType.PUBLICDOCS,
+        source="test_docs",
+        base_url=HttpUrl(BASE_URL),
+        version="1.0",
+        http_cache_dir=str(tmp_path),
+    )
+    requests: list[tuple[str, dict]] = []
+
+    async def mock_get(url: str, **kwargs) -> AsyncMock:
+        headers = kwargs.get("headers", {})
+        requests.append((url, headers))
+        response = AsyncMock()
+        response.raise_for_status = MagicMock()
+        response.headers = {"ETag": f'"{url}"'}
+        response.status = 304 if headers.get("If-None-Match") == f'"{url}"' else 200
+        response.text = AsyncMock(return_value=PAGES[url])
+        return response
+
+    session = AsyncMock()
+    session.get = AsyncMock(side_effect=mock_get)
+    session.close = AsyncMock()
+
+    async def crawl(cursor: str | None) -> tuple[list[str], str | None]:
+        connector = PublicDocsConnector(config)
+        connector.set_sync_cursor(cursor)
+        with patch("aiohttp.ClientSession", return_value=session):
+            async with connector:
+                urls = [doc.url async for doc in connector.stream_documents()]
+        return urls, connector.sync_cursor
+
+    urls, cursor = await crawl(None)
+    assert sorted(urls) == [BASE_URL, f"{BASE_URL}guide"]
+    assert cursor is not None
+
+    requests.clear()
+    urls, next_cursor = await crawl(cursor)
+
+    # Both pages were revalidated (the guide through the cached links)
+    assert urls == []
+    assert [headers["If-None-Match"] for _, headers in requests] == [
+        f'"{BASE_URL}"',
+        f'"{BASE_URL}guide"',
+    ]
+    assert next_cursor not in (None, cursor)
@@ -1,11 +1,18 @@
 from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import requests
+from qdrant_loader.connectors.shared.http.async_client import (
+    create_async_client,
+    to_requests_response,
+)
 from qdrant_loader.connectors.shared.http.policy import (
     aiohttp_request_with_policy,
     request_with_policy,
 )
 from qdrant_loader.connectors.shared.http.rate_limit import RateLimiter
+from requests.auth import HTTPBasicAuth
 
 
 @pytest.mark.asyncio
@@ -90,3 +97,56 @@ async def test_aiohttp_request_with_policy_invokes_retries_and_rate_limiter():
         assert isinstance(resp, DummyAiohttpResponse)
         mock_retry_call.assert_awaited()
         mock_acquire.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_request_with_policy_uses_pooled_client_and_retries():
+    statuses = [503, 200]
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(statuses.pop(0), json={"ok": True})
+
+    session = requests.Session()
+    session.auth = HTTPBasicAuth("user", "secret")
+    session.headers["X-Test"] = "1"
+    client = create_async_client(session, transport=httpx.MockTransport(handler))
+
+    with patch(
+        "qdrant_loader.connectors.shared.http.client.asyncio.sleep", new=AsyncMock()
+    ):
+        resp = await request_with_policy(
+            session, "GET", "https://example.com/api", client=client, timeout=(1, 5)
+        )
+
+    assert isinstance(resp, requests.Response)
+    assert resp.status_code == 200
+    assert resp.json() == {"ok": True}
+    assert len(seen) == 2
+    assert seen[0].headers["X-Test"] == "1"
+    assert seen[0].headers["Authorization"].startswith("Basic ")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_request_with_policy_maps_client_errors_to_requests():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("slow", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    with patch(
+        "qdrant_loader.connectors.shared.http.client.asyncio.sleep", new=AsyncMock()
+    ):
+        with pytest.raises(requests.exceptions.Timeout):
+            await request_with_policy(
+                requests.Session(), "GET", "https://example.com", client=client
+            )
+
+    response = httpx.Response(
+        404, request=httpx.Request("GET", "https://example.com/missing")
+    )
+    with pytest.raises(requests.exceptions.HTTPError):
+        to_requests_response(response).raise_for_status()
+    await client.aclose()
@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+from qdrant_loader.connectors.shared.prefetch import (
+    ByteBudget,
+    fetch_in_order,
+    map_in_order,
+    read_ahead,
+)
+
+
+@pytest.mark.asyncio
+async def test_read_ahead_fetches_next_items_while_consumer_works():
+    fetched: list[int] = []
+
+    async def pages():
+        for n in range(4):
+            fetched.append(n)
+            yield n
+
+    consumed = []
+    async for page in read_ahead(pages(), depth=2):
+        await asyncio.sleep(0.01)
+        # The producer runs ahead of the consumer, within the depth
+        assert len(fetched) - len(consumed) <= 4
+        consumed.append(page)
+
+    assert consumed == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_read_ahead_raises_source_error_after_earlier_items():
+    async def pages():
+        yield 1
+        raise RuntimeError("page failed")
+
+    received = []
+    with pytest.raises(RuntimeError, match="page failed"):
+        async for page in read_ahead(pages(), depth=3):
+            received.append(page)
+
+    assert received == [1]
+
+
+@pytest.mark.asyncio
+async def test_fetch_in_order_bounds_requests_and_keeps_order():
+    in_flight = 0
+    peak = 0
+
+    async def fetch(offset: int) -> int:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Later offsets answer first
+        await asyncio.sleep(0.01 * (10 - offset // 25))
+        in_flight -= 1
+        return offset
+
+    pages = [page async for page in fetch_in_order(fetch, range(0, 250, 25), 3)]
+
+    assert pages == list(range(0, 250, 25))
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_map_in_order_overlaps_slow_items_and_keeps_order():
+    async def items():
+        for n in range(5):
+            yield n
+
+    started: list[int] = []
+
+    async def process(n: int) -> int:
+        started.append(n)
+        await asyncio.sleep(0.05 if n == 0 else 0.001)
+        return n * 10
+
+    results = [r async for r in map_in_order(process, items(), concurrency=3)]
+
+    assert results == [0, 10, 20, 30, 40]
+    # Items after the slow first one started before it finished
+    assert started[:3] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_blocks_until_bytes_are_released():
+    budget = ByteBudget(100)
+    await budget.acquire(60)
+
+    waiter = asyncio.create_task(budget.acquire(50))
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    await budget.release(60)
+    await waiter
+    assert budget.reserved == 50
+
+    # Oversized reservations go through once nothing else is reserved
+    await budget.release(50)
+    await budget.acquire(500)
+    assert budget.reserved == 500
@@ -0,0 +1,71 @@
+"""Tests for the process-pool chunking backend."""
+
+import asyncio
+import concurrent.futures
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from qdrant_loader.core.chunking.chunking_service import ChunkingService
+from qdrant_loader.core.chunking.process_pool import (
+    ChunkingProcessPool,
+    chunk_packed_document,
+    pack_document,
+    unpack_document,
+)
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.pipeline.workers.chunking_worker import ChunkingWorker
+
+
+def _document(content: str = "Test content", **metadata) -> Document:
+    return Document(
+        url="https://example.com/doc.md",
+        content=content,
+        content_type="md",
+        title="Test Document",
+        source_type="test",
+        source="test_source",
+        metadata=metadata,
+    )
+
+
+def test_pack_roundtrip_drops_parent_document():
+    parent = _document("parent")
+    chunk = _document("chunk", chunk_index=0, parent_document=parent)
+
+    packed = pack_document(chunk)
+    restored = unpack_document(packed)
+
+    assert "parent_document" not in restored.metadata
+    assert restored.metadata == {"chunk_index": 0}
+    assert restored.id == chunk.id
+    assert restored.content_hash == chunk.content_hash
+    assert restored.created_at == chunk.created_at
+    # The original chunk keeps its back-reference
+    assert chunk.metadata["parent_document"] is parent
+
+
+@pytest.mark.asyncio
+async def test_worker_ships_packed_documents_to_process_pool():
+    document = _document("# Title\n\nBody", source_url="https://example.com")
+    chunk = _document("Body", chunk_index=0)
+    executor = Mock(spec=ChunkingProcessPool)
+    executor.wait_until_ready = AsyncMock()
+
+    def submit(fn, *args):
+        future = concurrent.futures.Future()
+        future.set_result([pack_document(chunk)])
+        return future
+
+    executor.submit.side_effect = submit
+    chunking_service = Mock(spec=ChunkingService)
+    worker = ChunkingWorker(chunking_service, executor, shutdown_event=asyncio.Event())
+
+    chunks = await worker.process(document)
+
+    executor.wait_until_ready.assert_awaited_once()
+    executor.submit.assert_called_once_with(
+        chunk_packed_document, pack_document(document)
+    )
+    chunking_service.chunk_document.assert_not_called()
+    assert [c.content for c in chunks] == ["Body"]
+    assert chunks[0].metadata["parent_document"] is document
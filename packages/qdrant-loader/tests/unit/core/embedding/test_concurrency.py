@@ -0,0 +1,87 @@
+"""Tests for the adaptive embedding concurrency window."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from qdrant_loader.core.embedding.concurrency import (
+    AdaptiveConcurrencyLimiter,
+    is_throttling_error,
+)
+from qdrant_loader_core.llm.errors import RateLimitedError, ServerError
+
+
+def test_is_throttling_error():
+    assert is_throttling_error(RateLimitedError("429"))
+    assert is_throttling_error(ServerError("503"))
+
+    error = Exception("boom")
+    error.response = SimpleNamespace(status_code=429)
+    assert is_throttling_error(error)
+
+    error = Exception("bad request")
+    error.status_code = 400
+    assert not is_throttling_error(error)
+    assert not is_throttling_error(ValueError("nope"))
+
+
+def test_window_grows_when_healthy():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=1)
+
+    for _ in range(10):
+        limiter.record_success(0.1)
+
+    assert limiter.limit == 4
+
+
+def test_window_halves_on_throttle():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=8)
+
+    limiter.record_throttle()
+    assert limiter.limit == 4
+    limiter.record_throttle()
+    limiter.record_throttle()
+    limiter.record_throttle()
+    assert limiter.limit == 1
+
+
+def test_window_shrinks_when_latency_degrades():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=6)
+
+    limiter.record_success(0.1)
+    for _ in range(5):
+        limiter.record_success(1.0)
+
+    assert limiter.limit < 6
+
+
+@pytest.mark.asyncio
+async def test_slot_bounds_in_flight_requests():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=2, initial_limit=2)
+    active = 0
+    peak = 0
+
+    async def request():
+        nonlocal active, peak
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(request() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_slot_records_throttle_and_reraises():
+    limiter = AdaptiveConcurrencyLimiter(max_limit=4, initial_limit=4)
+
+    with pytest.raises(RateLimitedError):
+        async with limiter.slot():
+            raise RateLimitedError("slow down")
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,81 @@
+"""Tests for the persistent embedding cache."""
+
+import pytest
+from qdrant_loader.core.embedding.embedding_cache import (
+    CACHE_FILENAME,
+    EmbeddingCache,
+    normalize_text,
+    resolve_cache_path,
+)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.db", ("openai", "model", 3))
+    yield cache
+    cache.close()
+
+
+def test_normalize_text_ignores_cosmetic_differences():
+    assert normalize_text("  a  \r\nb\t\r\n") == normalize_text("a\nb")
+    assert normalize_text("cafe\u0301") == normalize_text("caf\u00e9")
+    assert normalize_text("a b") != normalize_text("a  b")
+
+
+def test_keys_depend_on_namespace(tmp_path, cache):
+    other = EmbeddingCache(tmp_path / "cache.db", ("openai", "model", 4))
+    try:
+        assert cache.key_for("text") == cache.key_for(" text\n")
+        assert cache.key_for("text") != other.key_for("text")
+        assert cache.key_for("text") != cache.key_for("other text")
+    finally:
+        other.close()
+
+
+def test_round_trip_and_persistence(tmp_path, cache):
+    key = cache.key_for("hello")
+    cache.put_many([(key, [0.5, 0.25, 1.0])])
+
+    assert cache.get_many([key, "missing"]) == {key: [0.5, 0.25, 1.0]}
+
+    reopened = EmbeddingCache(tmp_path / "cache.db", ("openai", "model", 3))
+    try:
+        assert len(reopened) == 1
+        assert reopened.get_many([key]) == {key: [0.5, 0.25, 1.0]}
+    finally:
+        reopened.close()
+
+
+def test_empty_vectors_are_not_stored(cache):
+    cache.put_many([("k", [])])
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = EmbeddingCache(tmp_path / "cache.db", ("p", "m", 1), max_entries=10)
+    try:
+        cache.put_many([(f"k{i}", [float(i)]) for i in range(10)])
+        # Touch k0 so it becomes the most recently used entry
+        cache._conn.execute(
+            "UPDATE embedding_cache SET last_used_at = last_used_at - 100 "
+            "WHERE key != 'k0'"
+        )
+        cache.put_many([("k10", [10.0])])
+
+        assert len(cache) == 9
+        remaining = cache.get_many([f"k{i}" for i in range(11)])
+        assert "k0" in remaining
+        assert "k10" in remaining
+    finally:
+        cache.close()
+
+
+def test_resolve_cache_path(tmp_path):
+    state_db = tmp_path / "data" / "state.db"
+    assert resolve_cache_path(str(state_db), None) == state_db.parent / CACHE_FILENAME
+    assert resolve_cache_path(str(state_db), str(tmp_path / "c.db")) == (
+        tmp_path / "c.db"
+    )
+    assert resolve_cache_path(":memory:", None) is None
+    assert resolve_cache_path("sqlite:///:memory:", None) is None
+    assert resolve_cache_path(None, None) is None
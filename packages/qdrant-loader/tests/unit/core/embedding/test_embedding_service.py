@@ -18,6 +18,7 @@ def mock_settings():
 
     # Create mock for embedding config
     embedding_config = MagicMock()
+    embedding_config.cache_enabled = False
     embedding_config.endpoint = "https://api.openai.com/v1"
     embedding_config.model = "text-embedding-3-small"
     embedding_config.tokenizer = "cl100k_base"
@@ -82,6 +83,7 @@ def test_init_tokenizer_none():
     # settings with tokenizer none
     global_config = MagicMock()
     embedding_config = MagicMock()
+    embedding_config.cache_enabled = False
     embedding_config.tokenizer = "none"
     global_config.embedding = embedding_config
     settings = MagicMock(spec=Settings)
@@ -108,6 +110,7 @@ def test_init_tokenizer():
         # Create proper mock settings structure
         global_config = MagicMock()
         embedding_config = MagicMock()
+        embedding_config.cache_enabled = False
         embedding_config.tokenizer = "cl100k_base"
         global_config.embedding = embedding_config
 
@@ -138,6 +141,7 @@ def test_init_tokenizer_fallback():
         # Create proper mock settings structure
         global_config = MagicMock()
         embedding_config = MagicMock()
+        embedding_config.cache_enabled = False
         embedding_config.tokenizer = "invalid_tokenizer"
         global_config.embedding = embedding_config
 
@@ -165,6 +169,33 @@ async def test_get_embedding_provider(mock_settings):
         assert len(embedding) == 1536
 
 
+@pytest.mark.asyncio
+async def test_provider_rate_limiter_replaces_fixed_interval(mock_settings):
+    """A provider limiter with an RPM budget drops the fixed spacing and exports metrics."""
+    from qdrant_loader.core.monitoring import prometheus_metrics
+    from qdrant_loader_core.llm.ratelimit import AsyncRateLimiter
+
+    provider = _fake_provider()
+    provider.rate_limiter = AsyncRateLimiter(rpm=600, name="fake:model")
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: provider),
+    ):
+        service = EmbeddingService(mock_settings)
+
+    assert service.rate_limiter is provider.rate_limiter
+    assert service.min_request_interval == 0.0
+
+    async with provider.rate_limiter.acquire():
+        await service.get_embedding("test text")
+
+    fill = prometheus_metrics.LLM_RATE_LIMIT_FILL.labels(
+        limiter="fake:model", bucket="rpm"
+    )._value.get()
+    assert fill == pytest.approx(599 / 600, abs=1e-3)
+
+
 @pytest.mark.asyncio
 async def test_get_embeddings_batch_provider_shapes(mock_settings):
     """Test batch embedding generation via provider returns correct shapes."""
@@ -237,6 +268,7 @@ async def test_rate_limiting():
     # Create proper mock settings structure
     global_config = MagicMock()
     embedding_config = MagicMock()
+    embedding_config.cache_enabled = False
     embedding_config.endpoint = "http://localhost:8000"
     global_config.embedding = embedding_config
 
@@ -279,6 +311,7 @@ def test_count_tokens_fallback():
     # Tokenizer none was already tested above
     global_config = MagicMock()
     embedding_config = MagicMock()
+    embedding_config.cache_enabled = False
     embedding_config.tokenizer = "none"
     global_config.embedding = embedding_config
     settings = MagicMock(spec=Settings)
@@ -352,3 +385,79 @@ async def test_provider_error_propagates(mock_settings):
         service = EmbeddingService(mock_settings)
         with pytest.raises(RuntimeError, match="provider failure"):
             await service.get_embedding("test text")
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_dispatches_sub_batches_concurrently(mock_settings):
+    """Token-bounded sub-batches overlap in flight and keep their order."""
+    mock_settings.global_config.embedding.max_tokens_per_request = 2
+    in_flight = 0
+    peak = 0
+
+    class _SlowEmb:
+        async def embed(self, inputs):  # type: ignore[no-untyped-def]
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return [[float(len(text))] for text in inputs]
+
+    class _Prov:
+        def embeddings(self):
+            return _SlowEmb()
+
+    with (
+        patch("tiktoken.get_encoding") as mock_get_encoding,
+        patch(
+            "qdrant_loader.core.embedding.embedding_service.import_module",
+            return_value=SimpleNamespace(create_provider=lambda _: _Prov()),
+        ),
+    ):
+        mock_get_encoding.return_value.encode.side_effect = lambda text: [1, 2]
+        service = EmbeddingService(mock_settings, max_concurrent_requests=4)
+        service.min_request_interval = 0
+        texts = ["a", "bb", "ccc", "dddd"]
+        result = await service.get_embeddings(texts)
+
+    assert result == [[1.0], [2.0], [3.0], [4.0]]
+    assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_get_embeddings_served_from_persistent_cache(mock_settings, tmp_path):
+    """Unchanged chunk text is embedded once and then served from the cache."""
+    mock_settings.global_config.embedding.cache_enabled = True
+    mock_settings.global_config.embedding.cache_path = str(tmp_path / "cache.db")
+    mock_settings.global_config.embedding.cache_max_entries = 1000
+
+    calls: list[list[str]] = []
+
+    class _Emb:
+        async def embed(self, inputs):  # type: ignore[no-untyped-def]
+            calls.append(list(inputs))
+            return [[float(len(text)), 0.5] for text in inputs]
+
+    class _Prov:
+        def embeddings(self):
+            return _Emb()
+
+    with patch(
+        "qdrant_loader.core.embedding.embedding_service.import_module",
+        return_value=SimpleNamespace(create_provider=lambda _: _Prov()),
+    ):
+        service = EmbeddingService(mock_settings)
+    service.min_request_interval = 0
+
+    try:
+        first = await service.get_embeddings(["alpha", "beta", "alpha"])
+        assert calls == [["alpha", "beta"]]
+        assert first == [[5.0, 0.5], [4.0, 0.5], [5.0, 0.5]]
+
+        second = await service.get_embeddings(["beta", "gamma"])
+        assert calls[-1] == ["gamma"]
+        assert second == [[4.0, 0.5], [5.0, 0.5]]
+
+        assert service.cache_stats() == {"hits": 1, "misses": 4}
+    finally:
+        service.close()
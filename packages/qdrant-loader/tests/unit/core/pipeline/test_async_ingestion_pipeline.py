@@ -532,6 +532,12 @@ class TestAsyncIngestionPipeline:
                 settings=mock_settings, qdrant_manager=mock_qdrant_manager
             )
 
+            embedding_service = Mock()
+            pipeline.components = Mock()
+            pipeline.components.document_pipeline.embedding_worker.embedding_service = (
+                embedding_service
+            )
+
             # Call cleanup
             await pipeline.cleanup()
 
@@ -540,6 +546,8 @@ class TestAsyncIngestionPipeline:
             # Note: stop_metrics_server may be called during initialization and cleanup
             assert mock_prometheus.stop_metrics_server.call_count >= 1
             mock_resource_manager.cleanup.assert_called_once()
+            mock_qdrant_manager.aclose.assert_awaited_once()
+            embedding_service.close.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_cleanup_error_handling(self, mock_settings, mock_qdrant_manager):
@@ -0,0 +1,218 @@
+"""Tests for chunk-level diffing."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.pipeline.chunk_diff import ChunkDiff, chunk_content_hash
+from qdrant_loader.core.pipeline.document_pipeline import DocumentPipeline
+from qdrant_loader.core.pipeline.workers.upsert_worker import (
+    PipelineResult,
+    UpsertWorker,
+)
+from qdrant_loader_core.config import PayloadLayout
+
+
+def _document(
+    doc_id: str, content: str = "content", metadata: dict | None = None
+) -> Document:
+    return Document(
+        id=doc_id,
+        title=f"Title {doc_id}",
+        content=content,
+        content_type="md",
+        source_type="test",
+        source="test_source",
+        url=f"http://example.com/{doc_id}",
+        metadata=dict(metadata or {}),
+    )
+
+
+def _chunks(document: Document, contents: list[str]) -> list[Document]:
+    chunks = []
+    for index, content in enumerate(contents):
+        chunk = _document(Document.generate_chunk_id(document.id, index), content)
+        chunk.title = document.title
+        chunk.metadata.update(
+            {
+                **document.metadata,
+                "chunk_index": index,
+                "parent_document": document,
+                "parent_document_id": document.id,
+            }
+        )
+        chunks.append(chunk)
+    return chunks
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+@pytest.mark.asyncio
+async def test_filter_chunks_skips_unchanged_and_finds_stale_points():
+    """Only changed chunks are yielded and disappeared IDs are reported."""
+    document = _document("doc-1")
+    old_chunks = _chunks(document, ["a", "b", "c"])
+    new_chunks = _chunks(document, ["a", "B"])
+    previous = {
+        document.id: {chunk.id: chunk_content_hash(chunk) for chunk in old_chunks}
+    }
+
+    diff = ChunkDiff(previous)
+    emitted = await _collect(diff.filter_chunks(_aiter(new_chunks)))
+
+    assert [chunk.content for chunk in emitted] == ["B"]
+    assert diff.skipped_count == 1
+    assert diff.unchanged_documents() == set()
+    assert diff.stale_point_ids({document.id}) == [old_chunks[2].id]
+
+    states = diff.chunk_states({document.id}, upserted_chunk_ids=set())
+    assert set(states[document.id]) == {new_chunks[0].id}
+
+
+@pytest.mark.asyncio
+async def test_filter_chunks_without_skipping_emits_everything():
+    """Forced runs still record the chunk set but embed every chunk."""
+    document = _document("doc-1")
+    chunks = _chunks(document, ["a", "b"])
+    previous = {document.id: {chunk.id: chunk_content_hash(chunk) for chunk in chunks}}
+
+    diff = ChunkDiff(previous, skip_unchanged=False)
+    emitted = await _collect(diff.filter_chunks(_aiter(chunks)))
+
+    assert emitted == chunks
+    assert diff.skipped_count == 0
+    assert set(diff.current[document.id]) == {chunk.id for chunk in chunks}
+
+
+@pytest.mark.asyncio
+async def test_process_batch_marks_fully_unchanged_documents_successful():
+    """Documents whose chunks were all skipped still count as processed."""
+    unchanged_doc = _document("doc-unchanged")
+    changed_doc = _document("doc-changed")
+    unchanged_chunks = _chunks(unchanged_doc, ["same"])
+    changed_chunks = _chunks(changed_doc, ["edited"])
+    previous = {
+        unchanged_doc.id: {
+            unchanged_chunks[0].id: chunk_content_hash(unchanged_chunks[0])
+        },
+        changed_doc.id: {changed_chunks[0].id: "outdated"},
+    }
+
+    chunking_worker = MagicMock()
+    chunking_worker.process_documents.return_value = _aiter(
+        unchanged_chunks + changed_chunks
+    )
+    embedding_worker = MagicMock()
+
+    async def embed(chunks):
+        async for chunk in chunks:
+            yield chunk, [0.1]
+
+    embedding_worker.process_chunks.side_effect = embed
+    upsert_worker = MagicMock()
+    upserted: list[str] = []
+
+    async def upsert(embedded):
+        result = PipelineResult()
+        async for chunk, _ in embedded:
+            upserted.append(chunk.id)
+            result.success_count += 1
+            result.upserted_chunk_ids.add(chunk.id)
+            result.successfully_processed_documents.add(
+                chunk.metadata["parent_document"].id
+            )
+        return result
+
+    upsert_worker.process_embedded_chunks.side_effect = upsert
+    upsert_worker.update_payloads = AsyncMock(return_value=(set(), []))
+
+    pipeline = DocumentPipeline(chunking_worker, embedding_worker, upsert_worker)
+    result = await pipeline.process_batch(
+        [unchanged_doc, changed_doc], chunk_diff=ChunkDiff(previous)
+    )
+
+    assert upserted == [changed_chunks[0].id]
+    assert result.skipped_count == 1
+    assert result.successfully_processed_documents == {
+        unchanged_doc.id,
+        changed_doc.id,
+    }
+    assert result.upserted_chunk_ids == {changed_chunks[0].id}
+    upsert_worker.update_payloads.assert_awaited_once_with(unchanged_chunks)
+
+
+@pytest.mark.asyncio
+async def test_metadata_only_update_rewrites_the_payload_without_embedding():
+    """Skipped chunks get the new metadata of their document in their payload."""
+    old_document = _document("doc-1", metadata={"status": "Open"})
+    document = _document("doc-1", metadata={"status": "Done"})
+    assert document.content_hash != old_document.content_hash
+    chunks = _chunks(document, ["a", "b"])
+    previous = {
+        document.id: {
+            chunk.id: chunk_content_hash(chunk)
+            for chunk in _chunks(old_document, ["a", "b"])
+        }
+    }
+
+    chunking_worker = MagicMock()
+    chunking_worker.process_documents.return_value = _aiter(chunks)
+    embedding_worker = MagicMock()
+    embedded: list[str] = []
+
+    async def embed(chunks):
+        async for chunk in chunks:
+            embedded.append(chunk.id)
+            yield chunk, [0.1]
+
+    embedding_worker.process_chunks.side_effect = embed
+    qdrant_manager = MagicMock()
+    qdrant_manager.payload_layout = PayloadLayout()
+    qdrant_manager.upsert_points = AsyncMock()
+    qdrant_manager.upsert_analysis = AsyncMock()
+    qdrant_manager.overwrite_payloads = AsyncMock()
+    upsert_worker = UpsertWorker(qdrant_manager, batch_size=10)
+
+    pipeline = DocumentPipeline(chunking_worker, embedding_worker, upsert_worker)
+    result = await pipeline.process_batch([document], chunk_diff=ChunkDiff(previous))
+
+    assert embedded == []
+    qdrant_manager.upsert_points.assert_not_awaited()
+    (payloads,), _ = qdrant_manager.overwrite_payloads.await_args
+    assert [point_id for point_id, _ in payloads] == [chunk.id for chunk in chunks]
+    assert all(
+        payload["metadata"]["status"] == "Done" and payload["document_id"] == "doc-1"
+        for _, payload in payloads
+    )
+    assert result.successfully_processed_documents == {document.id}
+
+
+@pytest.mark.asyncio
+async def test_failed_payload_update_keeps_the_document_for_the_next_run():
+    """A document whose skipped chunks could not be rewritten is not stored."""
+    document = _document("doc-1", metadata={"status": "Done"})
+    chunks = _chunks(document, ["a"])
+    previous = {document.id: {chunks[0].id: chunk_content_hash(chunks[0])}}
+
+    chunking_worker = MagicMock()
+    chunking_worker.process_documents.return_value = _aiter(chunks)
+    embedding_worker = MagicMock()
+    embedding_worker.process_chunks.side_effect = lambda chunks: chunks
+    qdrant_manager = MagicMock()
+    qdrant_manager.payload_layout = PayloadLayout()
+    qdrant_manager.overwrite_payloads = AsyncMock(side_effect=RuntimeError("down"))
+    upsert_worker = UpsertWorker(qdrant_manager, batch_size=10)
+
+    pipeline = DocumentPipeline(chunking_worker, embedding_worker, upsert_worker)
+    result = await pipeline.process_batch([document], chunk_diff=ChunkDiff(previous))
+
+    assert result.successfully_processed_documents == set()
+    assert result.failed_document_ids == {document.id}
+    assert any("Payload update failed" in error for error in result.errors)
@@ -1,11 +1,14 @@
 """Tests for PipelineOrchestrator module."""
 
+import asyncio
 from typing import cast
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 
 import pytest
 from qdrant_loader.config import Settings, SourcesConfig
+from qdrant_loader.connectors.base import FileStat
 from qdrant_loader.core.document import Document
+from qdrant_loader.core.pipeline.config import PipelineConfig
 from qdrant_loader.core.pipeline.document_pipeline import DocumentPipeline
 from qdrant_loader.core.pipeline.orchestrator import (
     PipelineComponents,
@@ -13,6 +16,8 @@ from qdrant_loader.core.pipeline.orchestrator import (
 )
 from qdrant_loader.core.pipeline.source_filter import SourceFilter
 from qdrant_loader.core.pipeline.source_processor import SourceProcessor
+from qdrant_loader.core.pipeline.source_scheduler import SourceRun
+from qdrant_loader.core.pipeline.workers.upsert_worker import PipelineResult
 from qdrant_loader.core.qdrant_manager import QdrantManager
 from qdrant_loader.core.state.state_manager import StateManager
 
@@ -143,7 +148,9 @@ class TestPipelineOrchestrator:
         self.source_filter.filter_sources.assert_called_once_with(
             self.mock_sources_config, None, None
         )
-        self.document_pipeline.process_batch.assert_called_once_with(mock_documents)
+        self.document_pipeline.process_batch.assert_called_once_with(
+            mock_documents, chunk_diff=ANY
+        )
         self.orchestrator._update_document_states.assert_called_once_with(
             mock_documents, {"doc1", "doc2"}, None
         )
@@ -241,7 +248,9 @@ class TestPipelineOrchestrator:
         self.source_filter.filter_sources.assert_called_once_with(
             self.mock_sources_config, "git", "my-repo"
         )
-        self.document_pipeline.process_batch.assert_called_once_with(mock_documents)
+        self.document_pipeline.process_batch.assert_called_once_with(
+            mock_documents, chunk_diff=ANY
+        )
         self.orchestrator._update_document_states.assert_called_once_with(
             mock_documents, {"doc1"}, None
         )
@@ -636,14 +645,14 @@ class TestPipelineOrchestrator:
 
         # Verify
         self.state_manager.initialize.assert_called_once()
-        # Should update states for doc1 and doc3 only
-        assert self.state_manager.update_document_state.call_count == 2
-        updated_docs = [
-            call.args[0]
-            for call in self.state_manager.update_document_state.call_args_list
-        ]
-        updated_doc_ids = {doc.id for doc in updated_docs}
-        assert updated_doc_ids == {"doc1", "doc3"}
+        # Should update states for doc1 and doc3 only, in one bulk write
+        self.state_manager.update_document_states.assert_called_once()
+        updated_docs, project_id = (
+            self.state_manager.update_document_states.call_args.args
+        )
+        assert {doc.id for doc in updated_docs} == {"doc1", "doc3"}
+        assert project_id is None
+        self.state_manager.update_document_state.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_update_document_states_state_manager_initialized(self):
@@ -659,8 +668,8 @@ class TestPipelineOrchestrator:
 
         # Verify
         self.state_manager.initialize.assert_not_called()
-        self.state_manager.update_document_state.assert_called_once_with(
-            mock_documents[0], None
+        self.state_manager.update_document_states.assert_called_once_with(
+            mock_documents, None
         )
 
     @pytest.mark.asyncio
@@ -675,7 +684,10 @@ class TestPipelineOrchestrator:
         # Setup state manager
         self.state_manager._initialized = True
 
-        # Configure one update to fail
+        # The bulk write fails, then one per-document retry fails
+        self.state_manager.update_document_states.side_effect = Exception(
+            "Bulk update failed"
+        )
         self.state_manager.update_document_state.side_effect = [
             None,  # Success for doc1
             Exception("Update failed for doc2"),  # Failure for doc2
@@ -700,6 +712,7 @@ class TestPipelineOrchestrator:
         await self.orchestrator._update_document_states(mock_documents, successfully_processed_doc_ids, None)  # type: ignore
 
         # Verify no updates were attempted (but initialization was called)
+        self.state_manager.update_document_states.assert_not_called()
         self.state_manager.update_document_state.assert_not_called()
         self.state_manager.initialize.assert_called_once()
 
@@ -722,6 +735,7 @@ class TestPipelineOrchestrator:
                 error_count=1,
                 successfully_processed_documents={"doc1"},
                 failed_document_ids={"doc1-failed"},
+                failed_sources={("git", "repo1")},
                 errors=["p1-error"],
             ),
             "p2": Mock(
@@ -729,6 +743,7 @@ class TestPipelineOrchestrator:
                 error_count=2,
                 successfully_processed_documents={"doc2"},
                 failed_document_ids={"doc2-failed"},
+                failed_sources=set(),
                 errors=["p2-error"],
             ),
         }
@@ -758,6 +773,192 @@ class TestPipelineOrchestrator:
             "doc2-failed",
         }
         assert orchestrator.last_pipeline_result.errors == ["p1-error", "p2-error"]
+        assert orchestrator.last_pipeline_result.failed_sources == {("git", "repo1")}
+
+    @pytest.mark.asyncio
+    async def test_process_all_projects_runs_projects_concurrently(self):
+        """Projects run concurrently up to the limit and keep their own results."""
+        project_ids = ["p1", "p2", "p3", "p4"]
+        project_manager = Mock()
+        project_manager.list_project_ids.return_value = project_ids
+        orchestrator = PipelineOrchestrator(
+            self.settings,
+            self.components,
+            project_manager=project_manager,
+            pipeline_config=PipelineConfig(max_concurrent_projects=2),
+        )
+        self.source_filter.filter_sources.side_effect = lambda config, *_: config
+
+        active = 0
+        peak = 0
+
+        async def fake_ingest_sources(filtered_config, project_id, force, since):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # Later projects finish first
+            await asyncio.sleep(
+                0.01 * (len(project_ids) - project_ids.index(project_id))
+            )
+            active -= 1
+            result = PipelineResult()
+            result.success_count = project_ids.index(project_id) + 1
+            result.successfully_processed_documents = {f"{project_id}-doc"}
+            return [Mock(spec=Document, id=f"{project_id}-doc")], result
+
+        orchestrator._ingest_sources = fake_ingest_sources
+        documents = await orchestrator._process_all_projects()
+
+        assert peak == 2
+        assert [doc.id for doc in documents] == [f"{p}-doc" for p in project_ids]
+        assert orchestrator.last_pipeline_result.success_count == 1 + 2 + 3 + 4
+        assert orchestrator.last_pipeline_result.successfully_processed_documents == {
+            f"{p}-doc" for p in project_ids
+        }
+
+    @pytest.mark.asyncio
+    async def test_ingest_sources_routes_deletions_and_stores_sync_cursor(self):
+        """Deleted documents skip the pipeline and complete sources save cursors."""
+        changed = Document(
+            title="a.md",
+            content="a",
+            content_type="md",
+            source_type="git",
+            source="repo",
+            url="https://example.com/repo/blob/main/a.md",
+            metadata={},
+        )
+        removed = Document(
+            title="b.md",
+            content="",
+            content_type="md",
+            source_type="git",
+            source="repo",
+            url="https://example.com/repo/blob/main/b.md",
+            metadata={},
+            is_deleted=True,
+        )
+        self.state_manager.get_sync_cursors.return_value = {("git", "repo"): "old"}
+
+        async def fake_stream_batches(
+            filtered_config,
+            batch_size=256,
+            since=None,
+            project_id=None,
+            seen_uris=None,
+            source_runs=None,
+            sync_cursors=None,
+            file_stats=None,
+        ):
+            assert sync_cursors == {("git", "repo"): "old"}
+            source_runs.append(
+                SourceRun(source_type="Git", source="repo", sync_cursor="new")
+            )
+            yield [changed, removed]
+
+        self.orchestrator._stream_batches_from_sources = fake_stream_batches
+        self.orchestrator._process_deleted_documents = AsyncMock()
+        self.orchestrator._update_document_states = AsyncMock()
+        mock_result = Mock()
+        mock_result.success_count = 1
+        mock_result.failure_count = 0
+        mock_result.errors = []
+        mock_result.successfully_processed_documents = {changed.id}
+        mock_result.failed_document_ids = set()
+        self.document_pipeline.process_batch.return_value = mock_result
+
+        mock_change_detector = AsyncMock()
+        mock_change_detector.classify_batch.side_effect = lambda batch, *_: batch
+        with patch(
+            "qdrant_loader.core.pipeline.orchestrator.StateChangeDetector"
+        ) as detector_class:
+            detector_class.return_value.__aenter__ = AsyncMock(
+                return_value=mock_change_detector
+            )
+            documents, _ = await self.orchestrator._ingest_sources(
+                self.mock_sources_config, "p1", False, None
+            )
+
+        assert documents == [changed]
+        self.orchestrator._process_deleted_documents.assert_awaited_once_with(
+            [removed], "p1"
+        )
+        self.document_pipeline.process_batch.assert_called_once_with(
+            [changed], chunk_diff=ANY
+        )
+        self.state_manager.set_sync_cursor.assert_awaited_once_with(
+            "git", "repo", "new", "p1"
+        )
+
+    @pytest.mark.asyncio
+    async def test_ingest_sources_reports_failed_source(self):
+        """A source that failed to stream fails the result, cursor unsaved."""
+
+        async def fake_stream_batches(
+            filtered_config,
+            batch_size=256,
+            since=None,
+            project_id=None,
+            seen_uris=None,
+            source_runs=None,
+            sync_cursors=None,
+            file_stats=None,
+        ):
+            source_runs.append(
+                SourceRun(
+                    source_type="Git",
+                    source="repo",
+                    sync_cursor="new",
+                    error="connection refused",
+                )
+            )
+            return
+            yield
+
+        self.orchestrator._stream_batches_from_sources = fake_stream_batches
+
+        documents, result = await self.orchestrator._ingest_sources(
+            self.mock_sources_config, "p1", True, None
+        )
+
+        assert documents == []
+        assert result.failed_sources == {("git", "repo")}
+        assert result.errors == ["Git source repo: connection refused"]
+        assert result.has_failures
+        self.state_manager.set_sync_cursor.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_store_file_stats_writes_changes_and_keeps_failed_files(self):
+        """Only changed stats are written; failed files keep their old stats."""
+        kept = FileStat(10, 1, "file:///docs/kept.md")
+        old_failed = FileStat(20, 1, "file:///docs/failed.md")
+        previous = {
+            ("localfile", "docs"): {
+                "kept.md": kept,
+                "failed.md": old_failed,
+                "gone.md": FileStat(30, 1, "file:///docs/gone.md"),
+            }
+        }
+        run = SourceRun(
+            source_type="LocalFile",
+            source="docs",
+            file_stats={
+                "kept.md": kept,
+                "failed.md": FileStat(21, 2, "file:///docs/failed.md"),
+                "new.md": FileStat(40, 3, "file:///docs/new.md"),
+            },
+        )
+        failed_id = Document.generate_id("localfile", "docs", "file:///docs/failed.md")
+
+        await self.orchestrator._store_file_stats([run], previous, {failed_id}, "p1")
+
+        self.state_manager.update_file_stats.assert_awaited_once_with(
+            "localfile",
+            "docs",
+            {"new.md": (40, 3, "file:///docs/new.md")},
+            ["gone.md"],
+            "p1",
+        )
 
     @pytest.mark.asyncio
     async def test_process_all_projects_handles_missing_project_results(self):
@@ -778,6 +979,7 @@ class TestPipelineOrchestrator:
             error_count=0,
             successfully_processed_documents={"doc1"},
             failed_document_ids=set(),
+            failed_sources=set(),
             errors=[],
         )
 
@@ -828,6 +1030,7 @@ class TestPipelineOrchestrator:
                 error_count=0,
                 successfully_processed_documents={"doc2"},
                 failed_document_ids=set(),
+                failed_sources=set(),
                 errors=[],
             )
             return [Mock(spec=Document, id="doc2")]
@@ -866,6 +1069,7 @@ class TestPipelineOrchestrator:
             error_count=0,
             successfully_processed_documents={"doc1"},
             failed_document_ids=set(),
+            failed_sources=set(),
             errors=[],
         )
 
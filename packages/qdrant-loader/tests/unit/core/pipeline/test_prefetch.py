@@ -0,0 +1,98 @@
+"""Tests for the batch prefetch stage."""
+
+import asyncio
+
+import pytest
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.monitoring import prometheus_metrics
+from qdrant_loader.core.pipeline.prefetch import prefetch_batches
+
+
+def _batch(index: int, content_size: int = 10) -> list[Document]:
+    return [
+        Document(
+            title=f"Doc {index}",
+            content="x" * content_size,
+            content_type="md",
+            source_type="test",
+            source="test_source",
+            url=f"http://example.com/{index}",
+            metadata={},
+        )
+    ]
+
+
+class _Source:
+    """Batch stream that records how far it has been pulled."""
+
+    def __init__(self, batches: list[list[Document]], fail_at: int | None = None):
+        self.batches = batches
+        self.fail_at = fail_at
+        self.pulled = 0
+        self.closed = False
+
+    async def stream(self):
+        try:
+            for index, batch in enumerate(self.batches):
+                if index == self.fail_at:
+                    raise RuntimeError("source failed")
+                self.pulled += 1
+                yield batch
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_fetches_ahead_up_to_depth_while_consumer_works():
+    source = _Source([_batch(i) for i in range(6)])
+    stream = prefetch_batches(source.stream(), depth=2)
+
+    first = await stream.__anext__()
+    await asyncio.sleep(0.01)
+
+    # The consumer holds batch 0, batches 1 and 2 are buffered and the
+    # producer waits for room with batch 3
+    assert first == source.batches[0]
+    assert source.pulled == 4
+    assert prometheus_metrics.CHUNK_QUEUE_SIZE._value.get() == 2
+
+    rest = [batch async for batch in stream]
+    assert rest == source.batches[1:]
+    assert prometheus_metrics.CHUNK_QUEUE_SIZE._value.get() == 0
+
+
+@pytest.mark.asyncio
+async def test_byte_ceiling_limits_buffer_but_admits_one_batch():
+    source = _Source([_batch(i, content_size=100) for i in range(4)])
+    stream = prefetch_batches(source.stream(), depth=10, max_bytes=150)
+
+    await stream.__anext__()
+    await asyncio.sleep(0.01)
+
+    # Batch 1 is buffered; batch 2 would exceed the ceiling and waits
+    assert source.pulled == 3
+    assert len([batch async for batch in stream]) == 3
+
+
+@pytest.mark.asyncio
+async def test_source_errors_surface_after_buffered_batches():
+    source = _Source([_batch(i) for i in range(3)], fail_at=2)
+    received = []
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        async for batch in prefetch_batches(source.stream(), depth=4):
+            received.append(batch)
+
+    assert received == source.batches[:2]
+
+
+@pytest.mark.asyncio
+async def test_stopping_early_closes_the_source():
+    source = _Source([_batch(i) for i in range(10)])
+    stream = prefetch_batches(source.stream(), depth=2)
+
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert source.closed
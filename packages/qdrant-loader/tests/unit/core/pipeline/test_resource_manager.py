@@ -485,6 +485,18 @@ class TestResourceManager:
 
             mock_async_cleanup.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_cleanup_shuts_down_conversion_pools(self):
+        """Both cleanup paths stop the attachment conversion workers."""
+        with patch(
+            "qdrant_loader.core.pipeline.resource_manager.shutdown_conversion_pools"
+        ) as mock_shutdown:
+            await self.resource_manager.cleanup()
+            mock_shutdown.assert_called_once()
+
+            self.resource_manager._cleanup()
+            assert mock_shutdown.call_count == 2
+
     def test_add_task(self):
         """Test adding task for tracking."""
         mock_task = Mock(spec=asyncio.Task)
@@ -0,0 +1,140 @@
+"""Tests for the concurrent source scheduler."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from qdrant_loader.connectors.base import ConnectorConfigurationError
+from qdrant_loader.core.document import Document
+from qdrant_loader.core.pipeline.source_scheduler import SourceRun, SourceScheduler
+
+
+def _document(source: str, index: int) -> Document:
+    return Document(
+        title=f"{source} {index}",
+        content="x" * 10,
+        content_type="md",
+        source_type="test",
+        source=source,
+        url=f"http://example.com/{source}/{index}",
+        metadata={},
+    )
+
+
+class _Processor:
+    """Source processor stub that tracks how many sources stream at once."""
+
+    def __init__(
+        self,
+        documents_per_source: int = 3,
+        fail_source: str | None = None,
+        error_source: str | None = None,
+    ):
+        self.documents_per_source = documents_per_source
+        self.fail_source = fail_source
+        self.error_source = error_source
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.peak_total = 0
+
+    async def stream_source_documents(
+        self, source_configs, connector_factory, source_type, since=None, on_error=None
+    ):
+        (name,) = source_configs
+        if name == self.error_source:
+            on_error(name, RuntimeError("source down"))
+            return
+        self.active[source_type] = self.active.get(source_type, 0) + 1
+        self.peak[source_type] = max(
+            self.peak.get(source_type, 0), self.active[source_type]
+        )
+        self.peak_total = max(self.peak_total, sum(self.active.values()))
+        try:
+            for index in range(self.documents_per_source):
+                if name == self.fail_source:
+                    raise ConnectorConfigurationError("bad credentials")
+                await asyncio.sleep(0.001)
+                yield _document(name, index)
+        finally:
+            self.active[source_type] -= 1
+
+
+def _sources(**counts: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        **{
+            attribute: {f"{attribute}-{i}": object() for i in range(count)}
+            for attribute, count in counts.items()
+        }
+    )
+
+
+@pytest.mark.asyncio
+async def test_streams_sources_concurrently_within_limits():
+    processor = _Processor()
+    scheduler = SourceScheduler(
+        processor, max_concurrent_sources=3, max_concurrent_per_type=2
+    )
+    runs: list[SourceRun] = []
+
+    documents = [
+        document
+        async for document in scheduler.stream_documents(
+            _sources(confluence=3, jira=2), None, project_id="p1", runs=runs
+        )
+    ]
+
+    assert len(documents) == 15
+    assert processor.peak_total == 3
+    assert processor.peak == {"Confluence": 2, "Jira": 2}
+    assert {(run.source_type, run.source) for run in runs} == {
+        ("Confluence", "confluence-0"),
+        ("Confluence", "confluence-1"),
+        ("Confluence", "confluence-2"),
+        ("Jira", "jira-0"),
+        ("Jira", "jira-1"),
+    }
+    assert all(run.document_count == 3 and run.project_id == "p1" for run in runs)
+    assert all(run.finished_at is not None and run.duration > 0 for run in runs)
+
+
+@pytest.mark.asyncio
+async def test_limit_of_one_keeps_source_order():
+    scheduler = SourceScheduler(_Processor(), max_concurrent_sources=1)
+
+    sources = [
+        document.source
+        async for document in scheduler.stream_documents(
+            _sources(git=1, confluence=1, localfile=1), None
+        )
+    ]
+
+    assert sources == ["confluence-0"] * 3 + ["git-0"] * 3 + ["localfile-0"] * 3
+
+
+@pytest.mark.asyncio
+async def test_failed_source_is_recorded_on_its_run():
+    scheduler = SourceScheduler(_Processor(error_source="git-1"))
+    runs: list[SourceRun] = []
+
+    documents = [
+        document
+        async for document in scheduler.stream_documents(
+            _sources(git=2), None, runs=runs
+        )
+    ]
+
+    assert len(documents) == 3
+    errors = {run.source: run.error for run in runs}
+    assert errors == {"git-0": None, "git-1": "source down"}
+
+
+@pytest.mark.asyncio
+async def test_configuration_error_stops_all_sources():
+    processor = _Processor(documents_per_source=50, fail_source="jira-0")
+    scheduler = SourceScheduler(processor, max_concurrent_sources=4)
+
+    with pytest.raises(ConnectorConfigurationError):
+        async for _ in scheduler.stream_documents(_sources(git=2, jira=1), None):
+            pass
+
+    assert sum(processor.active.values()) == 0
@@ -418,3 +418,49 @@ class TestEmbeddingWorker:
 
         # Verify embedding service was not called
         self.mock_embedding_service.get_embeddings.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_chunks_runs_batches_concurrently_in_order(self):
+        """Batches overlap in flight but results keep chunk order."""
+        chunks = []
+        for i in range(6):
+            mock_chunk = Mock()
+            mock_chunk.content = f"Test content {i}"
+            mock_chunk.id = f"chunk{i}"
+            chunks.append(mock_chunk)
+
+        async def chunk_iterator():
+            for chunk in chunks:
+                yield chunk
+
+        in_flight = 0
+        max_in_flight = 0
+
+        async def get_embeddings_side_effect(contents):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            # Earlier batches finish last to exercise reordering
+            index = int(contents[0].rsplit(" ", 1)[1])
+            await asyncio.sleep(0.03 - index * 0.005)
+            in_flight -= 1
+            return [[float(content.rsplit(" ", 1)[1])] for content in contents]
+
+        self.mock_embedding_service.get_embeddings = AsyncMock(
+            side_effect=get_embeddings_side_effect
+        )
+        self.mock_embedding_service.batch_size = 1
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.embedding_worker.prometheus_metrics"
+        ):
+            results = [
+                result
+                async for result in self.embedding_worker.process_chunks(
+                    chunk_iterator()
+                )
+            ]
+
+        assert [chunk.id for chunk, _ in results] == [c.id for c in chunks]
+        assert [emb for _, emb in results] == [[float(i)] for i in range(6)]
+        assert 1 < max_in_flight <= 4
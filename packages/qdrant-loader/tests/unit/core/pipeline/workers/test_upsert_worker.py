@@ -9,6 +9,7 @@ from qdrant_loader.core.pipeline.workers.upsert_worker import (
     PipelineResult,
     UpsertWorker,
 )
+from qdrant_loader_core.config import PayloadLayout
 
 
 class TestPipelineResult:
@@ -32,6 +33,9 @@ class TestUpsertWorker:
         """Set up test fixtures."""
         self.mock_qdrant_manager = Mock()
         self.mock_qdrant_manager.upsert_points = AsyncMock()
+        self.mock_qdrant_manager.wait_for_updates = AsyncMock()
+        self.mock_qdrant_manager.upsert_analysis = AsyncMock()
+        self.mock_qdrant_manager.payload_layout = PayloadLayout()
         self.mock_qdrant_manager.build_point_vector = Mock(
             side_effect=lambda embedding, _text: embedding
         )
@@ -246,6 +250,43 @@ class TestUpsertWorker:
         point = points[0]
         assert point.payload["document_id"] == "chunk1"
 
+    @pytest.mark.asyncio
+    async def test_process_lays_out_payload_v2(self):
+        """Filterable fields are promoted and analysis fields go to the side store."""
+        self.mock_qdrant_manager.payload_layout = PayloadLayout(
+            analysis_fields="side_store"
+        )
+        mock_chunk = Mock()
+        mock_chunk.id = "chunk1"
+        mock_chunk.content = "Test content"
+        mock_chunk.source = "test_source"
+        mock_chunk.source_type = "test"
+        mock_chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        mock_chunk.metadata = {
+            "parent_document": Mock(id="doc1"),
+            "parent_document_id": "doc1",
+            "project_id": "proj",
+            "chunk_index": 0,
+            "entities": [{"text": "Qdrant"}],
+        }
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            await self.upsert_worker.process([(mock_chunk, [0.1, 0.2, 0.3])])
+
+        point = self.mock_qdrant_manager.upsert_points.call_args[0][0][0]
+        assert point.payload["project_id"] == "proj"
+        assert point.payload["parent_document_id"] == "doc1"
+        assert point.payload["metadata"] == {"chunk_index": 0}
+        assert point.payload["payload_version"] == 2
+        analysis = self.mock_qdrant_manager.upsert_analysis.call_args[0][0][0]
+        assert analysis.id == "chunk1"
+        assert analysis.payload == {
+            "document_id": "doc1",
+            "entities": [{"text": "Qdrant"}],
+        }
+
     @pytest.mark.asyncio
     async def test_process_upsert_exception(self):
         """Test processing with upsert exception."""
@@ -730,3 +771,121 @@ class TestUpsertWorker:
         assert len(result.errors) == 1
         assert "duplicate chunk IDs" in result.errors[0]
         mock_logger.warning.assert_called()
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_bounds_concurrent_batches(self):
+        """Batches are upserted concurrently, up to max_workers at a time."""
+        chunks = []
+        for i in range(6):
+            chunk = Mock()
+            chunk.id = f"chunk{i}"
+            chunk.content = f"Test content {i}"
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": Mock(id=f"doc{i}")}
+            chunks.append(chunk)
+
+        in_flight = 0
+        max_in_flight = 0
+        release = asyncio.Event()
+
+        async def slow_upsert(points, wait=True):
+            nonlocal in_flight, max_in_flight
+            assert wait is False
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await release.wait()
+            in_flight -= 1
+
+        self.mock_qdrant_manager.upsert_points.side_effect = slow_upsert
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+            release.set()
+
+        worker = UpsertWorker(
+            qdrant_manager=self.mock_qdrant_manager,
+            batch_size=1,
+            max_workers=2,
+            shutdown_event=self.mock_shutdown_event,
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            processing = asyncio.create_task(
+                worker.process_embedded_chunks(embedded_chunks_iterator())
+            )
+            await asyncio.sleep(0.01)
+            # The third batch waits for a free slot, so the iterator is not drained
+            assert max_in_flight == 2
+            assert not release.is_set()
+            release.set()
+            result = await processing
+
+        assert result.success_count == 6
+        assert result.successfully_processed_documents == {f"doc{i}" for i in range(6)}
+        assert self.mock_qdrant_manager.upsert_points.call_count == 6
+        self.mock_qdrant_manager.wait_for_updates.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_bounds_batch_bytes(self):
+        """A batch is sent early once its approximate size reaches the limit."""
+        chunks = []
+        for i in range(3):
+            chunk = Mock()
+            chunk.id = f"chunk{i}"
+            chunk.content = "x" * 100
+            chunk.contextual_content = None
+            chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+            chunk.metadata = {"parent_document": Mock(id=f"doc{i}")}
+            chunks.append(chunk)
+
+        async def embedded_chunks_iterator():
+            for chunk in chunks:
+                yield (chunk, [0.1, 0.2, 0.3])
+
+        worker = UpsertWorker(
+            qdrant_manager=self.mock_qdrant_manager,
+            batch_size=10,
+            shutdown_event=self.mock_shutdown_event,
+            max_batch_bytes=300,
+        )
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            result = await worker.process_embedded_chunks(embedded_chunks_iterator())
+
+        assert result.success_count == 3
+        batch_sizes = [
+            len(call.args[0])
+            for call in self.mock_qdrant_manager.upsert_points.call_args_list
+        ]
+        assert batch_sizes == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_process_embedded_chunks_barrier_failure_is_reported(self):
+        """A failed barrier is reported without failing acknowledged documents."""
+        chunk = Mock()
+        chunk.id = "chunk1"
+        chunk.content = "Test content"
+        chunk.created_at = datetime(2023, 1, 1, 12, 0, 0)
+        chunk.metadata = {"parent_document": Mock(id="doc1")}
+
+        async def embedded_chunks_iterator():
+            yield (chunk, [0.1, 0.2, 0.3])
+
+        self.mock_qdrant_manager.wait_for_updates.side_effect = Exception("timeout")
+
+        with patch(
+            "qdrant_loader.core.pipeline.workers.upsert_worker.prometheus_metrics"
+        ):
+            result = await self.upsert_worker.process_embedded_chunks(
+                embedded_chunks_iterator()
+            )
+
+        assert result.success_count == 1
+        assert result.successfully_processed_documents == {"doc1"}
+        assert len(result.errors) == 1
+        assert "timeout" in result.errors[0]
@@ -0,0 +1,125 @@
+"""Tests for the state database engine and session setup."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.state.models import Project
+from qdrant_loader.core.state.session import (
+    _read_engines,
+    create_tables,
+    dispose_engine,
+    initialize_engine_and_session,
+    read_session,
+)
+from qdrant_loader.core.worker.queue import SQLiteJobQueue
+from sqlalchemy import select, text
+
+
+@pytest.mark.asyncio
+async def test_file_database_applies_tuning_profile(tmp_path: Path):
+    config = StateManagementConfig(
+        database_path=str(tmp_path / "state.db"),
+        synchronous="normal",
+        busy_timeout_ms=1234,
+        cache_size_kb=2048,
+    )
+    engine, _ = initialize_engine_and_session(config)
+    read_engine = _read_engines[engine]
+    try:
+        for target in (engine, read_engine):
+            async with target.connect() as conn:
+                assert (await conn.scalar(text("PRAGMA journal_mode"))) == "wal"
+                assert (await conn.scalar(text("PRAGMA synchronous"))) == 1
+                assert (await conn.scalar(text("PRAGMA busy_timeout"))) == 1234
+                assert (await conn.scalar(text("PRAGMA cache_size"))) == -2048
+    finally:
+        await dispose_engine(engine)
+    assert engine not in _read_engines
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_use_reader_and_others_use_writer(tmp_path: Path):
+    config = StateManagementConfig(database_path=str(tmp_path / "state.db"))
+    engine, session_factory = initialize_engine_and_session(config)
+    read_engine = _read_engines[engine]
+    await create_tables(engine)
+    query = select(Project)
+    try:
+        async with session_factory() as session:
+            assert session.sync_session.get_bind(clause=query) is engine.sync_engine
+
+            now = datetime.now(UTC)
+            session.add(
+                Project(
+                    id="p1",
+                    display_name="P1",
+                    collection_name="c",
+                    created_at=now,
+                    updated_at=now,
+                )
+            )
+            await session.commit()
+
+        async with read_session(session_factory) as session:
+            sync_session = session.sync_session
+            assert sync_session.get_bind(clause=query) is read_engine.sync_engine
+            assert sync_session.get_bind() is engine.sync_engine
+            assert (await session.get(Project, "p1")) is not None
+    finally:
+        await dispose_engine(engine)
+
+
+@pytest.mark.asyncio
+async def test_nested_write_sessions_do_not_wait_for_the_pool(tmp_path: Path):
+    config = StateManagementConfig(
+        database_path=str(tmp_path / "state.db"),
+        connection_pool={"size": 1, "timeout": 1},
+    )
+    engine, session_factory = initialize_engine_and_session(config)
+    await create_tables(engine)
+    try:
+        async with session_factory() as outer:
+            await outer.execute(select(Project))
+            async with session_factory() as inner:
+                await asyncio.wait_for(inner.execute(select(Project)), timeout=5)
+    finally:
+        await dispose_engine(engine)
+
+
+@pytest.mark.asyncio
+async def test_memory_database_keeps_single_engine():
+    config = StateManagementConfig(database_path=":memory:")
+    engine, _ = initialize_engine_and_session(config)
+    try:
+        assert engine not in _read_engines
+    finally:
+        await dispose_engine(engine)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queue_claims_are_unique(tmp_path: Path):
+    config = StateManagementConfig(database_path=str(tmp_path / "queue.db"))
+    engine, session_factory = initialize_engine_and_session(config)
+    await create_tables(engine)
+    queue = SQLiteJobQueue(session_factory)
+    try:
+        await asyncio.gather(*(queue.enqueue("TEST", {"n": n}) for n in range(20)))
+
+        async def drain() -> list[int]:
+            claimed = []
+            while (job := await queue.claim_next()) is not None:
+                await queue.mark_done(job.id, job.attempts)
+                claimed.append(job.id)
+            return claimed
+
+        results = await asyncio.gather(*(drain() for _ in range(4)))
+        claimed_ids = [job_id for result in results for job_id in result]
+        assert sorted(claimed_ids) == sorted(set(claimed_ids))
+        assert len(claimed_ids) == 20
+    finally:
+        await dispose_engine(engine)
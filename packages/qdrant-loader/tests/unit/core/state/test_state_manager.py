@@ -5,7 +5,7 @@ import os
 import sqlite3
 import tempfile
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import pytest_asyncio
@@ -78,9 +78,9 @@ async def test_initialization_error():
         os.chmod(db_path, 0o444)
 
         # Try to initialize a manager with the read-only database
-        config = MagicMock(spec=StateManagementConfig)
-        config.database_path = db_path
-        config.connection_pool = {"size": 5, "timeout": 30}
+        config = StateManagementConfig(
+            database_path=db_path, connection_pool={"size": 5, "timeout": 30}
+        )
         manager = StateManager(config)
 
         with pytest.raises(
@@ -176,6 +176,59 @@ async def test_mark_document_deleted(state_manager, sample_document):
     assert record.is_deleted is True
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("project_id", [None, "project-a"])
+async def test_update_document_states_bulk_upsert(state_manager, project_id):
+    """Bulk writes insert new rows and update existing ones in place."""
+    documents = [
+        Document(
+            id=f"bulk-{i}",
+            title=f"Doc {i}",
+            content=f"content {i}",
+            content_type="md",
+            source_type="test",
+            source="bulk-source",
+            url=f"http://test.com/bulk-{i}",
+            metadata={},
+        )
+        for i in range(3)
+    ]
+    assert await state_manager.update_document_states(documents, project_id) == 3
+
+    documents[0].title = "Renamed"
+    await state_manager.update_document_states(documents[:1], project_id)
+
+    records = await state_manager.get_document_state_records_by_ids(
+        "test", "bulk-source", [doc.id for doc in documents], project_id
+    )
+    assert len(records) == 3
+    titles = {record.document_id: record.title for record in records}
+    assert titles["bulk-0"] == "Renamed"
+    assert titles["bulk-1"] == "Doc 1"
+    assert all(record.project_id == project_id for record in records)
+
+
+@pytest.mark.asyncio
+async def test_replace_chunk_states(state_manager, sample_document):
+    """Chunk states are replaced per document and cleared on deletion."""
+    await state_manager.update_document_state(sample_document)
+    await state_manager.replace_chunk_states(
+        [sample_document],
+        {sample_document.id: {"c0": (0, "h0"), "c1": (1, "h1")}},
+    )
+    await state_manager.replace_chunk_states(
+        [sample_document], {sample_document.id: {"c0": (0, "h0-new")}}
+    )
+
+    hashes = await state_manager.get_chunk_hashes([sample_document])
+    assert hashes == {sample_document.id: {"c0": "h0-new"}}
+
+    qdrant_manager = MagicMock()
+    qdrant_manager.delete_points_by_document_id = AsyncMock()
+    await state_manager.mark_documents_deleted_atomic([sample_document], qdrant_manager)
+    assert await state_manager.get_chunk_hashes([sample_document]) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_document_state_records(state_manager, sample_document):
     """Test retrieving document state records."""
@@ -242,6 +295,41 @@ async def test_get_document_state_records_since(state_manager, sample_document):
     assert records[0].document_id == new_record.document_id
 
 
+@pytest.mark.asyncio
+async def test_sync_cursor_round_trip(state_manager):
+    """Test storing and replacing source sync cursors."""
+    assert await state_manager.get_sync_cursors() == {}
+
+    await state_manager.set_sync_cursor("git", "repo", "abc:1")
+    await state_manager.set_sync_cursor("git", "repo", "def:1")
+    await state_manager.set_sync_cursor("git", "other", "123:1")
+
+    assert await state_manager.get_sync_cursors() == {
+        ("git", "repo"): "def:1",
+        ("git", "other"): "123:1",
+    }
+
+
+@pytest.mark.asyncio
+async def test_file_stats_round_trip(state_manager):
+    """Test writing changed file stats and dropping removed ones."""
+    assert await state_manager.get_file_stats() == {}
+
+    await state_manager.update_file_stats(
+        "localfile",
+        "docs",
+        {"a.md": (1, 10, "file:///docs/a.md"), "b.md": (2, 20, "file:///docs/b.md")},
+        [],
+    )
+    await state_manager.update_file_stats(
+        "localfile", "docs", {"a.md": (3, 30, "file:///docs/a.md")}, ["b.md"]
+    )
+
+    assert await state_manager.get_file_stats() == {
+        ("localfile", "docs"): {"a.md": (3, 30, "file:///docs/a.md")}
+    }
+
+
 @pytest.mark.asyncio
 async def test_context_manager(mock_config):
     """Test state manager as context manager."""
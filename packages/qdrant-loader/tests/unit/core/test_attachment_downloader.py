@@ -2,15 +2,20 @@
 Unit tests for the attachment downloader service.
 """
 
+import os
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+import requests
 from qdrant_loader.core.attachment_downloader import (
     AttachmentDownloader,
     AttachmentMetadata,
 )
+from qdrant_loader.core.attachment_pipeline import ConvertedAttachment
 from qdrant_loader.core.document import Document
 from qdrant_loader.core.file_conversion.conversion_config import FileConversionConfig
 
@@ -31,6 +36,19 @@ def file_conversion_config():
     )
 
 
+def _downloader_with_responses(handler, **kwargs):
+    """Create a downloader whose HTTP client is served by ``handler``."""
+    return AttachmentDownloader(
+        session=requests.Session(),
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _converted(content: str) -> ConvertedAttachment:
+    return ConvertedAttachment(content, "md", "markitdown", False, True)
+
+
 @pytest.fixture
 def attachment_downloader(mock_session, file_conversion_config):
     """Create attachment downloader instance."""
@@ -174,10 +192,9 @@ class TestShouldDownloadAttachment:
 class TestAttachmentDownload:
     """Test attachment download functionality."""
 
-    @pytest.mark.asyncio
-    async def test_download_attachment_success(self, attachment_downloader):
-        """Test successful attachment download."""
-        metadata = AttachmentMetadata(
+    @pytest.fixture
+    def metadata(self):
+        return AttachmentMetadata(
             id="att_123",
             filename="document.pdf",
             size=1024000,
@@ -186,99 +203,97 @@ class TestAttachmentDownload:
             parent_document_id="doc_456",
         )
 
-        # Mock successful response
-        mock_response = MagicMock()
-        mock_response.headers = {
-            "content-length": "1024000",
-            "content-type": "application/pdf",
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_response.iter_content.return_value = [
-            b"PDF content chunk 1",
-            b"PDF content chunk 2",
-        ]
-        attachment_downloader.session.get.return_value = mock_response
+    @pytest.mark.asyncio
+    async def test_download_attachment_success(self, metadata):
+        """Test successful attachment download."""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/pdf"},
+                content=b"PDF content chunk 1" * 1000,
+            )
 
-        # Mock temporary file creation and file operations
-        with (
-            patch("tempfile.NamedTemporaryFile") as mock_temp_file_class,
-            patch("os.path.getsize") as mock_getsize,
-        ):
+        downloader = _downloader_with_responses(handler)
+        temp_file_path = await downloader.download_attachment(metadata)
 
-            mock_temp_file = MagicMock()
-            mock_temp_file.name = "/tmp/test_attachment.pdf"
-            mock_temp_file.write = MagicMock()
-            mock_temp_file.close = MagicMock()
-            mock_temp_file_class.return_value = mock_temp_file
+        try:
+            assert temp_file_path is not None
+            assert temp_file_path.endswith(".pdf")
+            assert Path(temp_file_path).read_bytes() == b"PDF content chunk 1" * 1000
+            assert requested == ["https://example.com/document.pdf"]
+            assert downloader.stats()["download"]["completed"] == 1
+            assert downloader.stats()["download"]["bytes"] == 19000
+        finally:
+            downloader.cleanup_temp_file(temp_file_path or "")
+            await downloader.aclose()
 
-            # Mock file size to be non-zero
-            mock_getsize.return_value = 1024000
+    @pytest.mark.asyncio
+    async def test_download_attachment_http_error(self, metadata):
+        """Test attachment download with HTTP error."""
+        downloader = _downloader_with_responses(lambda request: httpx.Response(404))
 
-            temp_file_path = await attachment_downloader.download_attachment(metadata)
+        temp_file_path = await downloader.download_attachment(metadata)
 
-            assert temp_file_path == "/tmp/test_attachment.pdf"
-            attachment_downloader.session.get.assert_called_once()
-            # Verify that content was written to the file
-            assert mock_temp_file.write.call_count >= 1
+        assert temp_file_path is None
+        assert downloader.stats()["download"]["failed"] == 1
 
     @pytest.mark.asyncio
-    async def test_download_attachment_http_error(self, attachment_downloader):
-        """Test attachment download with HTTP error."""
-        metadata = AttachmentMetadata(
-            id="att_123",
-            filename="document.pdf",
-            size=1024000,
-            mime_type="application/pdf",
-            download_url="https://example.com/document.pdf",
-            parent_document_id="doc_456",
+    async def test_download_attachment_size_mismatch(self, metadata):
+        """Test attachment download much larger than announced."""
+        downloader = _downloader_with_responses(
+            lambda request: httpx.Response(
+                200,
+                headers={"content-type": "application/pdf"},
+                content=b"x" * 2048000,
+            )
         )
 
-        # Mock HTTP error
-        attachment_downloader.session.get.side_effect = Exception("HTTP 404 Not Found")
-
-        temp_file_path = await attachment_downloader.download_attachment(metadata)
+        temp_file_path = await downloader.download_attachment(metadata)
 
         assert temp_file_path is None
 
     @pytest.mark.asyncio
-    async def test_download_attachment_size_mismatch(self, attachment_downloader):
-        """Test attachment download with size mismatch."""
+    async def test_download_stops_at_size_limit(self):
+        """A response without content length is abandoned past the size limit."""
         metadata = AttachmentMetadata(
             id="att_123",
-            filename="document.pdf",
-            size=1024000,
-            mime_type="application/pdf",
-            download_url="https://example.com/document.pdf",
+            filename="unknown.bin",
+            size=0,
+            mime_type="application/octet-stream",
+            download_url="https://example.com/unknown.bin",
             parent_document_id="doc_456",
         )
 
-        # Mock response with different content length
-        mock_response = MagicMock()
-        mock_response.headers = {"content-length": "2048000"}  # Different from metadata
-        attachment_downloader.session.get.return_value = mock_response
+        async def body():
+            for _ in range(10):
+                yield b"x" * 1024
 
-        temp_file_path = await attachment_downloader.download_attachment(metadata)
+        downloader = _downloader_with_responses(
+            lambda request: httpx.Response(200, content=body()),
+            max_attachment_size=4096,
+        )
+        with patch.object(
+            downloader, "cleanup_temp_file", wraps=downloader.cleanup_temp_file
+        ) as cleanup:
+            temp_file_path = await downloader.download_attachment(metadata)
 
         assert temp_file_path is None
+        removed = cleanup.call_args.args[0]
+        assert not os.path.exists(removed)
 
     @pytest.mark.asyncio
-    async def test_download_attachment_html_response(self, attachment_downloader):
+    async def test_download_attachment_html_response(self, metadata):
         """Test attachment download that returns HTML (auth error)."""
-        metadata = AttachmentMetadata(
-            id="att_123",
-            filename="document.pdf",
-            size=1024000,
-            mime_type="application/pdf",
-            download_url="https://example.com/document.pdf",
-            parent_document_id="doc_456",
+        downloader = _downloader_with_responses(
+            lambda request: httpx.Response(
+                200, headers={"content-type": "text/html"}, content=b"<html></html>"
+            )
         )
 
-        # Mock HTML response (indicates auth error)
-        mock_response = MagicMock()
-        mock_response.headers = {"content-type": "text/html"}
-        attachment_downloader.session.get.return_value = mock_response
-
-        temp_file_path = await attachment_downloader.download_attachment(metadata)
+        temp_file_path = await downloader.download_attachment(metadata)
 
         assert temp_file_path is None
 
@@ -500,36 +515,18 @@ class TestDownloadAndProcessAttachments:
             ),
         ]
 
-        # Mock successful downloads and processing
+        # Mock successful downloads and conversions
         with (
             patch.object(attachment_downloader, "download_attachment") as mock_download,
-            patch.object(attachment_downloader, "process_attachment") as mock_process,
+            patch.object(attachment_downloader, "_convert") as mock_convert,
             patch.object(attachment_downloader, "cleanup_temp_file") as mock_cleanup,
         ):
 
             # Mock download returns temp file paths
             mock_download.side_effect = ["/tmp/temp1.pdf", "/tmp/temp2.xlsx"]
-
-            # Mock process returns documents
-            mock_process.side_effect = [
-                Document(
-                    title="document.pdf",
-                    content="PDF content",
-                    content_type="md",
-                    source_type="confluence",
-                    source="test_space",
-                    url="https://example.com/document.pdf",
-                    metadata={},
-                ),
-                Document(
-                    title="spreadsheet.xlsx",
-                    content="Excel content",
-                    content_type="md",
-                    source_type="confluence",
-                    source="test_space",
-                    url="https://example.com/spreadsheet.xlsx",
-                    metadata={},
-                ),
+            mock_convert.side_effect = [
+                _converted("PDF content"),
+                _converted("Excel content"),
             ]
 
             documents = await attachment_downloader.download_and_process_attachments(
@@ -537,8 +534,10 @@ class TestDownloadAndProcessAttachments:
             )
 
             assert len(documents) == 2
-            assert documents[0].title == "document.pdf"
-            assert documents[1].title == "spreadsheet.xlsx"
+            assert documents[0].title == "Attachment: document.pdf"
+            assert documents[0].content == "PDF content"
+            assert documents[1].title == "Attachment: spreadsheet.xlsx"
+            assert documents[1].content == "Excel content"
 
             # Verify cleanup was called for each temp file
             assert mock_cleanup.call_count == 2
@@ -580,22 +579,13 @@ class TestDownloadAndProcessAttachments:
         # Mock one successful download, one failure
         with (
             patch.object(attachment_downloader, "download_attachment") as mock_download,
-            patch.object(attachment_downloader, "process_attachment") as mock_process,
+            patch.object(attachment_downloader, "_convert") as mock_convert,
             patch.object(attachment_downloader, "cleanup_temp_file") as mock_cleanup,
         ):
 
             # First download succeeds, second fails
             mock_download.side_effect = ["/tmp/temp1.pdf", None]
-
-            mock_process.return_value = Document(
-                title="good_document.pdf",
-                content="PDF content",
-                content_type="md",
-                source_type="jira",
-                source="test_project",
-                url="https://example.com/good_document.pdf",
-                metadata={},
-            )
+            mock_convert.return_value = _converted("PDF content")
 
             documents = await attachment_downloader.download_and_process_attachments(
                 attachments, parent_document
@@ -603,11 +593,108 @@ class TestDownloadAndProcessAttachments:
 
             # Should only get one document (the successful one)
             assert len(documents) == 1
-            assert documents[0].title == "good_document.pdf"
+            assert documents[0].title == "Attachment: good_document.pdf"
 
             # Cleanup should only be called once (for the successful download)
             mock_cleanup.assert_called_once_with("/tmp/temp1.pdf")
 
+    @pytest.mark.asyncio
+    async def test_attachment_shared_by_documents_is_converted_once(
+        self, attachment_downloader
+    ):
+        """Documents linking the same attachment reuse its converted text."""
+        parents = [
+            Document(
+                title=f"Page {n}",
+                content="Parent content",
+                content_type="html",
+                source_type="publicdocs",
+                source="docs",
+                url=f"https://example.com/page{n}",
+                metadata={},
+            )
+            for n in range(2)
+        ]
+
+        def attachment(n: int) -> AttachmentMetadata:
+            return AttachmentMetadata(
+                id=f"{parents[n].id}_0",
+                filename="guide.pdf",
+                size=0,
+                mime_type="application/pdf",
+                download_url="https://example.com/guide.pdf",
+                parent_document_id=parents[n].id,
+            )
+
+        with (
+            patch.object(attachment_downloader, "download_attachment") as mock_download,
+            patch.object(attachment_downloader, "_convert") as mock_convert,
+            patch.object(attachment_downloader, "cleanup_temp_file"),
+        ):
+            mock_download.return_value = "/tmp/guide.pdf"
+            mock_convert.return_value = _converted("Guide")
+
+            first, second = [
+                await attachment_downloader.download_and_process_attachments(
+                    [attachment(n), attachment(n)], parents[n]
+                )
+                for n in range(2)
+            ]
+
+        mock_download.assert_awaited_once()
+        mock_convert.assert_awaited_once()
+        assert [d.content for d in first + second] == ["Guide"] * 4
+        assert first[0].id != second[0].id
+        assert attachment_downloader.stats()["deduplicated"] == 3
+
+    @pytest.mark.asyncio
+    async def test_timed_out_thread_keeps_its_slot_and_file(
+        self, attachment_downloader
+    ):
+        """A conversion thread past its timeout holds its slot and file until done."""
+        attachment_downloader.conversion_backend = "thread"
+        attachment_downloader.file_converter.config.conversion_timeout = 1
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_file.write(b"%PDF-1.4")
+        metadata = AttachmentMetadata(
+            id="att_001",
+            filename="slow.pdf",
+            size=8,
+            mime_type="application/pdf",
+            download_url="https://example.com/slow.pdf",
+            parent_document_id="doc_456",
+        )
+        release = threading.Event()
+
+        def convert_attachment(attachment, temp_file_path):
+            release.wait(10)
+            return _converted("late")
+
+        with (
+            patch.object(
+                attachment_downloader,
+                "download_attachment",
+                return_value=temp_file.name,
+            ),
+            patch.object(attachment_downloader, "_needs_conversion", return_value=True),
+            patch.object(
+                attachment_downloader,
+                "convert_attachment",
+                side_effect=convert_attachment,
+            ),
+        ):
+            converted = await attachment_downloader._converted_content(metadata)
+
+            assert converted.conversion_failed
+            assert os.path.exists(temp_file.name)
+            assert attachment_downloader.convert_stage.active == 1
+
+            release.set()
+            await attachment_downloader.aclose()
+
+        assert not os.path.exists(temp_file.name)
+        assert attachment_downloader.convert_stage.active == 0
+
     @pytest.mark.asyncio
     async def test_download_and_process_empty_attachments(self, attachment_downloader):
         """Test processing empty attachment list."""
@@ -0,0 +1,79 @@
+"""Tests for the payload migration module."""
+
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from qdrant_client.http import models
+from qdrant_loader.core.payload_migration import migrate_collection_payloads
+from qdrant_loader_core.config import PayloadLayout, migrate_payload
+
+
+def _manager(layout, records):
+    client = Mock()
+    client.scroll = AsyncMock(return_value=(records, None))
+    client.batch_update_points = AsyncMock()
+    client.get_collection = AsyncMock(
+        return_value=Mock(
+            payload_schema={
+                "created_at": Mock(data_type=models.PayloadSchemaType.KEYWORD)
+            }
+        )
+    )
+    client.delete_payload_index = AsyncMock()
+    client.create_payload_index = AsyncMock()
+
+    manager = Mock()
+    manager.collection_name = "documents"
+    manager.payload_layout = layout
+    manager.uses_analysis_store = layout.analysis_fields == "side_store"
+    manager.payload_indexes.return_value = [
+        ("document_id", {"type": "keyword"}),
+        ("created_at", {"type": "datetime"}),
+    ]
+    manager.upsert_analysis = AsyncMock()
+    manager._get_async_client.return_value = client
+    return manager, client
+
+
+@pytest.mark.asyncio
+async def test_migration_rewrites_legacy_payloads_only():
+    """Legacy payloads are rewritten; migrated ones are left alone."""
+    layout = PayloadLayout(analysis_fields="side_store")
+    legacy = {
+        "content": "text",
+        "document_id": "doc1",
+        "metadata": {"project_id": "proj", "entities": [{"text": "Qdrant"}]},
+    }
+    migrated, _ = migrate_payload(legacy, layout)
+    records = [Mock(id="p1", payload=legacy), Mock(id="p2", payload=migrated)]
+    manager, client = _manager(layout, records)
+
+    count = await migrate_collection_payloads(manager, batch_size=10)
+
+    assert count == 1
+    operations = client.batch_update_points.call_args.kwargs["update_operations"]
+    assert len(operations) == 1
+    assert operations[0].overwrite_payload.points == ["p1"]
+    assert operations[0].overwrite_payload.payload == migrated
+    manager._create_analysis_collection.assert_called_once()
+    analysis = manager.upsert_analysis.call_args[0][0]
+    assert [point.payload for point in analysis] == [
+        {"document_id": "doc1", "entities": [{"text": "Qdrant"}]}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_migration_replaces_keyword_date_indexes():
+    """Date indexes created as keywords are recreated as datetimes."""
+    manager, client = _manager(PayloadLayout(), [])
+
+    assert await migrate_collection_payloads(manager) == 0
+
+    client.batch_update_points.assert_not_called()
+    client.delete_payload_index.assert_awaited_once_with(
+        collection_name="documents", field_name="created_at", wait=True
+    )
+    created = [
+        call.kwargs["field_name"] for call in client.create_payload_index.call_args_list
+    ]
+    assert created == ["document_id", "created_at"]
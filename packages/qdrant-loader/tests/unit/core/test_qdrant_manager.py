@@ -7,7 +7,12 @@ import pytest
 from qdrant_client.http import models
 from qdrant_client.http.models import Distance, VectorParams
 from qdrant_loader.config import Settings
-from qdrant_loader.core.qdrant_manager import QdrantConnectionError, QdrantManager
+from qdrant_loader.config.qdrant import QdrantConfig
+from qdrant_loader.core.qdrant_manager import (
+    ANALYSIS_COLLECTION_TTL_SECONDS,
+    QdrantConnectionError,
+    QdrantManager,
+)
 
 
 def _collection_info(
@@ -80,6 +85,7 @@ class TestQdrantManager:
         """Mock QdrantClient for testing."""
         client = Mock()
         client.get_collections.return_value = Mock(collections=[])
+        client.get_aliases.return_value = Mock(aliases=[])
         client.create_collection = Mock()
         client.create_payload_index = Mock()
         client.upsert = Mock()
@@ -88,6 +94,15 @@ class TestQdrantManager:
         client.delete = Mock()
         return client
 
+    @pytest.fixture
+    def mock_async_qdrant_client(self):
+        """Mock AsyncQdrantClient for testing."""
+        client = Mock()
+        client.upsert = AsyncMock()
+        client.delete = AsyncMock()
+        client.close = AsyncMock()
+        return client
+
     @pytest.fixture
     def mock_global_config(self):
         """Mock global config for testing."""
@@ -339,13 +354,17 @@ class TestQdrantManager:
                 ("source_type", {"type": "keyword"}),
                 ("source", {"type": "keyword"}),
                 ("title", {"type": "keyword"}),
-                ("created_at", {"type": "keyword"}),
-                ("updated_at", {"type": "keyword"}),
+                ("created_at", {"type": "datetime"}),
+                ("updated_at", {"type": "datetime"}),
                 # Secondary performance indexes
                 ("is_attachment", {"type": "bool"}),
                 ("parent_document_id", {"type": "keyword"}),
                 ("original_file_type", {"type": "keyword"}),
                 ("is_converted", {"type": "bool"}),
+                # Fields promoted to the top level by payload layout v2
+                ("file_type", {"type": "keyword"}),
+                ("file_name", {"type": "keyword"}),
+                ("file_path", {"type": "keyword"}),
             ]
 
             # Verify create_payload_index was called the correct number of times
@@ -366,6 +385,38 @@ class TestQdrantManager:
                     actual_call_kwargs == expected_call
                 ), f"Call {i+1} mismatch: expected {expected_call}, got {actual_call_kwargs}"
 
+    def test_create_collection_with_profile(
+        self, mock_settings, mock_qdrant_client, mock_global_config
+    ):
+        """The configured collection profile sets quantization and storage options."""
+        mock_global_config.qdrant = QdrantConfig(collection_profile="memory_saver")
+        mock_qdrant_client.get_collections.return_value = Mock(collections=[])
+
+        with (
+            patch(
+                "qdrant_loader.core.qdrant_manager.get_global_config",
+                return_value=mock_global_config,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            manager.create_collection()
+
+        kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+        assert kwargs["vectors_config"]["dense"] == VectorParams(
+            size=1536, distance=Distance.COSINE, on_disk=True
+        )
+        assert kwargs["sparse_vectors_config"]["sparse"].index.on_disk is True
+        assert kwargs["quantization_config"] == models.BinaryQuantization(
+            binary=models.BinaryQuantizationConfig(always_ram=True)
+        )
+        assert kwargs["hnsw_config"].on_disk is True
+        assert kwargs["optimizers_config"].memmap_threshold == 20000
+        assert kwargs["on_disk_payload"] is True
+
     def test_create_collection_exists(
         self, mock_settings, mock_qdrant_client, mock_global_config
     ):
@@ -536,7 +587,9 @@ class TestQdrantManager:
             assert mock_qdrant_client.get_collection.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_upsert_points_success(self, mock_settings, mock_qdrant_client):
+    async def test_upsert_points_success(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
         """Test successful point upsert."""
         # Create a proper mock point that satisfies type checking
         mock_point = models.PointStruct(
@@ -550,19 +603,250 @@ class TestQdrantManager:
                 "qdrant_loader.core.qdrant_manager.QdrantClient",
                 return_value=mock_qdrant_client,
             ),
-            patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread,
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
         ):
             manager = QdrantManager(mock_settings)
             await manager.upsert_points(points)
 
-            mock_to_thread.assert_called_once_with(
-                mock_qdrant_client.upsert,
+            mock_async_qdrant_client.upsert.assert_awaited_once_with(
                 collection_name="test_collection",
                 points=points,
+                wait=True,
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_client_reused_and_closed(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """The async client is created once per event loop and closed by aclose."""
+        with (
+            patch(
+                "qdrant_loader.core.qdrant_manager.get_global_config"
+            ) as mock_get_config,
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ) as mock_async_client_class,
+        ):
+            mock_get_config.return_value.qdrant.prefer_grpc = True
+            mock_get_config.return_value.qdrant.grpc_port = 6334
+            manager = QdrantManager(mock_settings)
+            await manager.upsert_points([], wait=False)
+            await manager.delete_points(["p1"])
+            await manager.aclose()
+
+            mock_async_client_class.assert_called_once_with(
+                url="http://localhost:6333",
+                api_key=None,
+                timeout=60,
+                prefer_grpc=True,
+                grpc_port=6334,
             )
+            mock_async_qdrant_client.close.assert_awaited_once()
+            assert manager.async_client is None
 
     @pytest.mark.asyncio
-    async def test_upsert_points_error(self, mock_settings, mock_qdrant_client):
+    async def test_wait_for_updates(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """The barrier is a waited delete that matches no point."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.wait_for_updates()
+
+            call_kwargs = mock_async_qdrant_client.delete.call_args.kwargs
+            assert call_kwargs["wait"] is True
+            condition = call_kwargs["points_selector"].must[0]
+            assert condition.match.any == []
+
+    @pytest.mark.asyncio
+    async def test_wait_for_updates_covers_side_collection(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """Collections written to during the run get the barrier too."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.upsert_analysis([], wait=False)
+            await manager.wait_for_updates()
+
+            waited = [
+                call.kwargs["collection_name"]
+                for call in mock_async_qdrant_client.delete.call_args_list
+            ]
+            assert waited == ["test_collection", "test_collection__analysis"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_analysis_follows_a_switched_alias(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """A reindex switching the alias moves later writes to its side collection."""
+        mock_qdrant_client.get_aliases.return_value = Mock(
+            aliases=[
+                Mock(
+                    alias_name="test_collection", collection_name="test_collection__v1"
+                )
+            ]
+        )
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+            patch("qdrant_loader.core.qdrant_manager.time.monotonic") as monotonic,
+        ):
+            monotonic.return_value = 1000.0
+            manager = QdrantManager(mock_settings)
+            await manager.upsert_analysis([])
+
+            mock_qdrant_client.get_aliases.return_value = Mock(
+                aliases=[
+                    Mock(
+                        alias_name="test_collection",
+                        collection_name="test_collection__v2",
+                    )
+                ]
+            )
+            await manager.upsert_analysis([])
+            monotonic.return_value += ANALYSIS_COLLECTION_TTL_SECONDS
+            await manager.upsert_analysis([])
+
+            written = [
+                call.kwargs["collection_name"]
+                for call in mock_async_qdrant_client.upsert.call_args_list
+            ]
+            assert written == [
+                "test_collection__v1__analysis",
+                "test_collection__v1__analysis",
+                "test_collection__v2__analysis",
+            ]
+
+    @staticmethod
+    def _collection_info(status, m=16, indexing_threshold=20000):
+        return SimpleNamespace(
+            status=status,
+            points_count=1000,
+            indexed_vectors_count=(
+                1000 if status == models.CollectionStatus.GREEN else 0
+            ),
+            optimizer_status="ok",
+            config=SimpleNamespace(
+                hnsw_config=SimpleNamespace(m=m),
+                optimizer_config=SimpleNamespace(indexing_threshold=indexing_threshold),
+            ),
+        )
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_restores_profile_and_waits_for_green(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """Indexing is disabled while loading, then the profile's HNSW is built."""
+        mock_async_qdrant_client.get_collection = AsyncMock(
+            side_effect=[
+                self._collection_info(models.CollectionStatus.GREEN, m=24),
+                self._collection_info(models.CollectionStatus.YELLOW),
+                self._collection_info(models.CollectionStatus.GREEN),
+            ]
+        )
+        mock_async_qdrant_client.update_collection = AsyncMock()
+
+        with (
+            patch(
+                "qdrant_loader.core.qdrant_manager.get_global_config"
+            ) as mock_get_config,
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+        ):
+            mock_get_config.return_value.qdrant = QdrantConfig(
+                collection_profile="max_recall"
+            )
+            manager = QdrantManager(mock_settings)
+            async with manager.bulk_load(poll_interval=0):
+                disabled = mock_async_qdrant_client.update_collection.call_args.kwargs
+                assert disabled["hnsw_config"].m == 0
+                assert disabled["optimizers_config"].indexing_threshold == 0
+
+            restored = mock_async_qdrant_client.update_collection.call_args.kwargs
+            assert restored["hnsw_config"].m == 32
+            assert restored["optimizers_config"].indexing_threshold == 20000
+            assert mock_async_qdrant_client.get_collection.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_load_rolls_back_on_failure(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """A failed load puts back the settings the collection had."""
+        mock_async_qdrant_client.get_collection = AsyncMock(
+            return_value=self._collection_info(
+                models.CollectionStatus.GREEN, m=24, indexing_threshold=10000
+            )
+        )
+        mock_async_qdrant_client.update_collection = AsyncMock()
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            with pytest.raises(RuntimeError, match="ingestion failed"):
+                async with manager.bulk_load(poll_interval=0):
+                    raise RuntimeError("ingestion failed")
+
+            assert mock_async_qdrant_client.update_collection.await_count == 2
+            rollback = mock_async_qdrant_client.update_collection.call_args.kwargs
+            assert rollback["hnsw_config"].m == 24
+            assert rollback["optimizers_config"].indexing_threshold == 10000
+            # Only the original settings were read; no wait for green
+            assert mock_async_qdrant_client.get_collection.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_upsert_points_error(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
         """Test upsert points error handling."""
         # Create a proper mock point that satisfies type checking
         mock_point = models.PointStruct(
@@ -576,8 +860,12 @@ class TestQdrantManager:
                 "qdrant_loader.core.qdrant_manager.QdrantClient",
                 return_value=mock_qdrant_client,
             ),
-            patch("asyncio.to_thread", side_effect=Exception("Upsert failed")),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
         ):
+            mock_async_qdrant_client.upsert.side_effect = Exception("Upsert failed")
             manager = QdrantManager(mock_settings)
 
             with pytest.raises(Exception, match="Upsert failed"):
@@ -677,9 +965,146 @@ class TestQdrantManager:
             with pytest.raises(Exception, match="Delete failed"):
                 manager.delete_collection()
 
+    @staticmethod
+    def _named(name):
+        collection = Mock()
+        collection.name = name
+        return collection
+
+    def test_swap_alias_switches_existing_alias_atomically(
+        self, mock_settings, mock_qdrant_client
+    ):
+        """Deleting the old alias and creating the new one is a single request."""
+        mock_qdrant_client.get_aliases.return_value = Mock(
+            aliases=[
+                models.AliasDescription(
+                    alias_name="test_collection", collection_name="test_collection__v1"
+                )
+            ]
+        )
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            previous = manager.swap_alias("test_collection__v2")
+
+        assert previous == "test_collection__v1"
+        mock_qdrant_client.update_collection_aliases.assert_called_once_with(
+            change_aliases_operations=[
+                models.DeleteAliasOperation(
+                    delete_alias=models.DeleteAlias(alias_name="test_collection")
+                ),
+                models.CreateAliasOperation(
+                    create_alias=models.CreateAlias(
+                        collection_name="test_collection__v2",
+                        alias_name="test_collection",
+                    )
+                ),
+            ]
+        )
+        mock_qdrant_client.delete_collection.assert_not_called()
+
+    def test_swap_alias_replaces_plain_collection(
+        self, mock_settings, mock_qdrant_client
+    ):
+        """A collection named like the alias is deleted before the alias exists."""
+        mock_qdrant_client.get_collections.return_value = Mock(
+            collections=[
+                self._named("test_collection"),
+                self._named("test_collection__v1"),
+            ]
+        )
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            assert manager.swap_alias("test_collection__v1") is None
+
+        mock_qdrant_client.delete_collection.assert_called_once_with(
+            collection_name="test_collection"
+        )
+        operations = mock_qdrant_client.update_collection_aliases.call_args.kwargs[
+            "change_aliases_operations"
+        ]
+        assert [type(op) for op in operations] == [models.CreateAliasOperation]
+
+    def test_delete_old_versions_keeps_retention_and_live(
+        self, mock_settings, mock_qdrant_client
+    ):
+        """Versions beyond the retention count are deleted, never the live one."""
+        mock_qdrant_client.get_collections.return_value = Mock(
+            collections=[
+                self._named(name)
+                for name in (
+                    "test_collection__v10",
+                    "test_collection__v2",
+                    "test_collection__v9",
+                    "test_collection__v3",
+                    "test_collection_other",
+                )
+            ]
+        )
+        mock_qdrant_client.get_aliases.return_value = Mock(
+            aliases=[
+                models.AliasDescription(
+                    alias_name="test_collection", collection_name="test_collection__v3"
+                )
+            ]
+        )
+
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            assert [v for v, _ in manager.list_collection_versions()] == [2, 3, 9, 10]
+            deleted = manager.delete_old_versions(retention=2)
+
+        assert deleted == ["test_collection__v2"]
+        mock_qdrant_client.delete_collection.assert_called_once_with(
+            collection_name="test_collection__v2"
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_points_by_id(
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
+    ):
+        """Test point deletion by point ID."""
+        with (
+            patch("qdrant_loader.core.qdrant_manager.get_global_config"),
+            patch(
+                "qdrant_loader.core.qdrant_manager.QdrantClient",
+                return_value=mock_qdrant_client,
+            ),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
+        ):
+            manager = QdrantManager(mock_settings)
+            await manager.delete_points(["p1", "p2"])
+
+            call_args = mock_async_qdrant_client.delete.call_args
+            points_selector = call_args[1]["points_selector"]
+            assert isinstance(points_selector, models.PointIdsList)
+            assert points_selector.points == ["p1", "p2"]
+
     @pytest.mark.asyncio
     async def test_delete_points_by_document_id_success(
-        self, mock_settings, mock_qdrant_client
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
     ):
         """Test successful point deletion by document ID."""
         document_ids = ["doc1", "doc2", "doc3"]
@@ -690,15 +1115,17 @@ class TestQdrantManager:
                 "qdrant_loader.core.qdrant_manager.QdrantClient",
                 return_value=mock_qdrant_client,
             ),
-            patch("asyncio.to_thread", new_callable=AsyncMock) as mock_to_thread,
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
         ):
             manager = QdrantManager(mock_settings)
             await manager.delete_points_by_document_id(document_ids)
 
             # Verify the call was made with correct parameters
-            mock_to_thread.assert_called_once()
-            call_args = mock_to_thread.call_args
-            assert call_args[0][0] == mock_qdrant_client.delete
+            mock_async_qdrant_client.delete.assert_awaited_once()
+            call_args = mock_async_qdrant_client.delete.call_args
             assert call_args[1]["collection_name"] == "test_collection"
 
             # Verify the filter structure
@@ -707,7 +1134,7 @@ class TestQdrantManager:
 
     @pytest.mark.asyncio
     async def test_delete_points_by_document_id_error(
-        self, mock_settings, mock_qdrant_client
+        self, mock_settings, mock_qdrant_client, mock_async_qdrant_client
     ):
         """Test delete points error handling."""
         document_ids = ["doc1", "doc2"]
@@ -718,8 +1145,12 @@ class TestQdrantManager:
                 "qdrant_loader.core.qdrant_manager.QdrantClient",
                 return_value=mock_qdrant_client,
             ),
-            patch("asyncio.to_thread", side_effect=Exception("Delete failed")),
+            patch(
+                "qdrant_loader.core.qdrant_manager.AsyncQdrantClient",
+                return_value=mock_async_qdrant_client,
+            ),
         ):
+            mock_async_qdrant_client.delete.side_effect = Exception("Delete failed")
             manager = QdrantManager(mock_settings)
 
             with pytest.raises(Exception, match="Delete failed"):
@@ -0,0 +1,185 @@
+"""Tests for the reindex module."""
+
+import sqlite3
+from contextlib import asynccontextmanager, closing
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from qdrant_loader.config.state import StateManagementConfig
+from qdrant_loader.core.pipeline.workers.upsert_worker import PipelineResult
+from qdrant_loader.core.reindex import reindex_collection
+
+
+def _settings(tmp_path):
+    """Settings whose state database holds one row, ``live``."""
+    database = tmp_path / "state.db"
+    _write_state(database, "live")
+    settings = Mock()
+    settings.global_config.qdrant.reindex_retention = 2
+    settings.global_config.state_management = StateManagementConfig(
+        database_path=str(database)
+    )
+    return settings
+
+
+def _write_state(database, value):
+    with closing(sqlite3.connect(database)) as conn:
+        conn.execute("CREATE TABLE IF NOT EXISTS state (value TEXT)")
+        conn.execute("DELETE FROM state")
+        conn.execute("INSERT INTO state VALUES (?)", (value,))
+        conn.commit()
+
+
+def _read_state(database):
+    with closing(sqlite3.connect(database)) as conn:
+        return [row[0] for row in conn.execute("SELECT value FROM state")]
+
+
+def _pipeline_class(pipeline):
+    """Pipeline class double; ingesting writes ``shadow`` to its state."""
+
+    def create(settings, qdrant_manager, state_manager=None, **_):
+        async def process_documents(**_):
+            qdrant_manager.events.append("ingested")
+            _write_state(state_manager.config.database_path, "shadow")
+
+        pipeline.process_documents.side_effect = process_documents
+        return pipeline
+
+    return create
+
+
+def _managers():
+    alias = Mock()
+    alias.collection_name = "documents"
+    alias.list_collection_versions.return_value = [(1, "documents__v1")]
+    alias.version_name.side_effect = lambda version: f"documents__v{version}"
+    alias.get_alias_target.return_value = "documents__v1"
+    alias.delete_old_versions.return_value = []
+
+    shadow = Mock()
+    shadow.collection_name = "documents__v2"
+    shadow.events = []
+
+    @asynccontextmanager
+    async def bulk_load():
+        shadow.events.append("bulk_load")
+        yield
+        shadow.events.append("indexed")
+
+    shadow.bulk_load = bulk_load
+    return alias, shadow
+
+
+@pytest.mark.asyncio
+async def test_reindex_builds_next_version_and_switches_alias(tmp_path):
+    """The new version is loaded in bulk, then served through the alias."""
+    alias, shadow = _managers()
+    settings = _settings(tmp_path)
+    pipeline = Mock()
+    pipeline.process_documents = AsyncMock()
+    pipeline.orchestrator.last_pipeline_result = PipelineResult()
+    pipeline.cleanup = AsyncMock()
+
+    with (
+        patch(
+            "qdrant_loader.core.reindex.QdrantManager", side_effect=[alias, shadow]
+        ) as mock_manager_class,
+        patch(
+            "qdrant_loader.core.async_ingestion_pipeline.AsyncIngestionPipeline",
+            side_effect=_pipeline_class(pipeline),
+        ),
+    ):
+        collection = await reindex_collection(settings)
+
+    assert collection == "documents__v2"
+    mock_manager_class.assert_called_with(settings, collection_name="documents__v2")
+    shadow.create_collection.assert_called_once()
+    pipeline.process_documents.assert_awaited_once_with(force=True)
+    assert shadow.events == ["bulk_load", "ingested", "indexed"]
+    pipeline.cleanup.assert_awaited_once()
+    alias.swap_alias.assert_called_once_with("documents__v2")
+    alias.delete_old_versions.assert_called_once_with(2)
+    # The state built for the new version replaced the live one
+    assert _read_state(tmp_path / "state.db") == ["shadow"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["state.db"]
+
+
+@pytest.mark.asyncio
+async def test_failed_reindex_drops_new_version_and_keeps_alias(tmp_path):
+    """A failed reindex deletes its version and does not touch the alias."""
+    alias, shadow = _managers()
+    pipeline = Mock()
+    pipeline.process_documents = AsyncMock(side_effect=RuntimeError("source down"))
+    pipeline.cleanup = AsyncMock()
+
+    with (
+        patch("qdrant_loader.core.reindex.QdrantManager", side_effect=[alias, shadow]),
+        patch(
+            "qdrant_loader.core.async_ingestion_pipeline.AsyncIngestionPipeline",
+            return_value=pipeline,
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="source down"):
+            await reindex_collection(_settings(tmp_path), retention=3)
+
+    assert shadow.events == ["bulk_load"]
+    pipeline.cleanup.assert_awaited_once()
+    shadow.delete_collection.assert_called_once()
+    alias.swap_alias.assert_not_called()
+    alias.delete_old_versions.assert_not_called()
+    assert _read_state(tmp_path / "state.db") == ["live"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["state.db"]
+
+
+@pytest.mark.asyncio
+async def test_reindex_with_failed_source_drops_new_version(tmp_path):
+    """Sources the pipeline skipped after a failure abort the swap."""
+    alias, shadow = _managers()
+    result = PipelineResult()
+    result.failed_sources.add(("git", "repo"))
+    pipeline = Mock()
+    pipeline.process_documents = AsyncMock()
+    pipeline.orchestrator.last_pipeline_result = result
+    pipeline.cleanup = AsyncMock()
+
+    with (
+        patch("qdrant_loader.core.reindex.QdrantManager", side_effect=[alias, shadow]),
+        patch(
+            "qdrant_loader.core.async_ingestion_pipeline.AsyncIngestionPipeline",
+            side_effect=_pipeline_class(pipeline),
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="1 sources"):
+            await reindex_collection(_settings(tmp_path), retention=3)
+
+    shadow.delete_collection.assert_called_once()
+    alias.swap_alias.assert_not_called()
+    assert _read_state(tmp_path / "state.db") == ["live"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["state.db"]
+
+
+@pytest.mark.asyncio
+async def test_failed_alias_swap_drops_new_version_and_its_state(tmp_path):
+    """The live state is kept when the alias cannot be switched."""
+    alias, shadow = _managers()
+    alias.swap_alias.side_effect = RuntimeError("alias conflict")
+    pipeline = Mock()
+    pipeline.process_documents = AsyncMock()
+    pipeline.orchestrator.last_pipeline_result = PipelineResult()
+    pipeline.cleanup = AsyncMock()
+
+    with (
+        patch("qdrant_loader.core.reindex.QdrantManager", side_effect=[alias, shadow]),
+        patch(
+            "qdrant_loader.core.async_ingestion_pipeline.AsyncIngestionPipeline",
+            side_effect=_pipeline_class(pipeline),
+        ),
+    ):
+        with pytest.raises(RuntimeError, match="alias conflict"):
+            await reindex_collection(_settings(tmp_path), retention=3)
+
+    shadow.delete_collection.assert_called_once()
+    alias.delete_old_versions.assert_not_called()
+    assert _read_state(tmp_path / "state.db") == ["live"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["state.db"]
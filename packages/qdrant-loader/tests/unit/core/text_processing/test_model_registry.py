@@ -0,0 +1,136 @@
+"""Tests for the process-wide model registry."""
+
+import threading
+from unittest.mock import Mock, patch
+
+from qdrant_loader.core.text_processing.model_registry import (
+    SPACY,
+    STRATEGY,
+    ModelRegistry,
+    settings_fingerprint,
+)
+
+
+class _Strategy:
+    def __init__(self, settings):
+        self.settings = settings
+
+
+def test_get_or_create_loads_once():
+    registry = ModelRegistry()
+    loader = Mock(return_value="nlp")
+
+    first = registry.get_spacy_pipeline("en_core_web_sm", loader)
+    second = registry.get_spacy_pipeline("en_core_web_sm", loader)
+
+    assert first == second == "nlp"
+    loader.assert_called_once()
+    assert registry.stats()[SPACY]["loaded"] == 1
+
+
+def test_spacy_variants_are_cached_separately():
+    registry = ModelRegistry()
+
+    full = registry.get_spacy_pipeline("en_core_web_sm", lambda: object())
+    no_parser = registry.get_spacy_pipeline(
+        "en_core_web_sm", lambda: object(), variant="no_parser"
+    )
+
+    assert full is not no_parser
+    assert registry.stats()[SPACY]["loaded"] == 2
+
+
+def test_failed_load_is_not_cached():
+    registry = ModelRegistry()
+    loader = Mock(side_effect=[OSError("missing"), "nlp"])
+
+    try:
+        registry.get_spacy_pipeline("en_core_web_sm", loader)
+    except OSError:
+        pass
+
+    assert registry.get_spacy_pipeline("en_core_web_sm", loader) == "nlp"
+    assert loader.call_count == 2
+
+
+def test_concurrent_callers_share_single_load():
+    registry = ModelRegistry()
+    calls = []
+    barrier = threading.Barrier(8)
+
+    def loader():
+        calls.append(1)
+        return object()
+
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(registry.get_spacy_pipeline("en_core_web_sm", loader))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_tiktoken_encoding_is_shared():
+    registry = ModelRegistry()
+    with patch(
+        "qdrant_loader.core.text_processing.model_registry.tiktoken.get_encoding"
+    ) as mock_get_encoding:
+        mock_get_encoding.return_value = Mock()
+        first = registry.get_tiktoken_encoding("cl100k_base")
+        second = registry.get_tiktoken_encoding("cl100k_base")
+
+    assert first is second
+    mock_get_encoding.assert_called_once_with("cl100k_base")
+
+
+def test_strategy_reused_within_thread_and_isolated_across_threads():
+    registry = ModelRegistry()
+    settings = Mock()
+
+    first = registry.get_strategy(_Strategy, settings)
+    second = registry.get_strategy(_Strategy, settings)
+    assert first is second
+
+    other_thread_result = []
+    thread = threading.Thread(
+        target=lambda: other_thread_result.append(
+            registry.get_strategy(_Strategy, settings)
+        )
+    )
+    thread.start()
+    thread.join()
+
+    assert other_thread_result[0] is not first
+    assert registry.stats()[STRATEGY]["loaded"] == 2
+
+
+def test_clear_drops_entries():
+    registry = ModelRegistry()
+    loader = Mock(return_value="nlp")
+    registry.get_spacy_pipeline("en_core_web_sm", loader)
+    registry.get_strategy(_Strategy, Mock())
+
+    registry.clear()
+    registry.get_spacy_pipeline("en_core_web_sm", loader)
+
+    assert loader.call_count == 2
+    assert STRATEGY not in registry.stats()
+
+
+def test_settings_fingerprint_matches_equal_configs(test_settings):
+    assert settings_fingerprint(test_settings) == settings_fingerprint(
+        test_settings.model_copy(deep=True)
+    )
+
+
+def test_settings_fingerprint_falls_back_to_identity():
+    settings = Mock()
+    assert settings_fingerprint(settings) == ("id", id(settings))
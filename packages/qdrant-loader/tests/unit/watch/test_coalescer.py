@@ -0,0 +1,54 @@
+"""Tests for the change coalescer."""
+
+import pytest
+from qdrant_loader.watch.coalescer import ChangeCoalescer
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestChangeCoalescer:
+    """Test debouncing of change events."""
+
+    def test_merges_events_until_quiet(self):
+        """Repeated events for a key are released once, after the delay."""
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(delay=1.0, max_delay=10.0, monotonic=clock)
+
+        coalescer.add("a")
+        clock.now = 0.5
+        coalescer.add("a")
+        clock.now = 1.2
+        assert coalescer.pop_due() == []
+        assert coalescer.next_due_in() == pytest.approx(0.3)
+
+        clock.now = 1.5
+        assert coalescer.pop_due() == ["a"]
+        assert len(coalescer) == 0
+        assert coalescer.next_due_in() is None
+
+    def test_releases_busy_keys_after_max_delay(self):
+        """A key changing continuously is still released after max_delay."""
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(delay=1.0, max_delay=3.0, monotonic=clock)
+
+        for step in range(7):
+            clock.now = step * 0.5
+            coalescer.add("busy")
+        assert coalescer.pop_due() == ["busy"]
+
+    def test_releases_keys_in_first_event_order(self):
+        """Due keys are returned in the order they first changed."""
+        clock = FakeClock()
+        coalescer = ChangeCoalescer(delay=1.0, monotonic=clock)
+
+        coalescer.add("b")
+        coalescer.add("a")
+        coalescer.add("b")
+        clock.now = 2.0
+        assert coalescer.pop_due() == ["b", "a"]
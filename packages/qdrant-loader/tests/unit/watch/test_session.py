@@ -0,0 +1,190 @@
+"""Tests for the watch session."""
+
+import os
+import tempfile
+from pathlib import Path
+from types import MethodType, SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from pydantic import AnyUrl
+from qdrant_loader.config.types import SourceType
+from qdrant_loader.connectors.localfile import LocalFileConnector
+from qdrant_loader.connectors.localfile.config import LocalFileConfig
+from qdrant_loader.core.pipeline.chunk_diff import chunk_content_hash
+from qdrant_loader.core.pipeline.orchestrator import PipelineOrchestrator
+from qdrant_loader.watch.session import WatchSession, WatchTarget
+
+
+def _pipeline():
+    """Pipeline double recording upserts and deletions."""
+
+    async def process_documents(documents, chunk_diff=None):
+        return SimpleNamespace(
+            successfully_processed_documents={d.id for d in documents}
+        )
+
+    pipeline = MagicMock()
+    pipeline.project_manager = None
+    pipeline.initialize = AsyncMock()
+    pipeline.orchestrator._load_chunk_diff = AsyncMock(return_value=None)
+    pipeline.orchestrator.components.document_pipeline.process_documents = AsyncMock(
+        side_effect=process_documents
+    )
+    pipeline.orchestrator._update_document_states = AsyncMock()
+    pipeline.orchestrator._process_deleted_documents = AsyncMock()
+    pipeline.state_manager.update_file_stats = AsyncMock()
+    return pipeline
+
+
+class TestWatchSession:
+    """Test syncing of changed paths."""
+
+    @pytest.fixture
+    def temp_dir(self):
+        """Create a directory tree with test files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            (Path(temp_dir) / "a.md").write_text("# A")
+            (Path(temp_dir) / "sub").mkdir()
+            (Path(temp_dir) / "sub" / "b.txt").write_text("b")
+            (Path(temp_dir) / "sub" / "c.txt").write_text("c")
+            yield temp_dir
+
+    @pytest_asyncio.fixture
+    async def target(self, temp_dir):
+        """Watch target whose stats match the files on disk."""
+        config = LocalFileConfig(
+            base_url=AnyUrl(f"file://{temp_dir}"),
+            source="test-localfile",
+            source_type=SourceType.LOCALFILE,
+            file_types=["*.txt", "*.md"],
+        )
+        connector = LocalFileConnector(config)
+        async for _ in connector.stream_documents():
+            pass
+        return WatchTarget(
+            "project", "test-localfile", connector, dict(connector.file_stats or {})
+        )
+
+    @pytest.mark.asyncio
+    async def test_upserts_changed_and_deletes_removed_files(self, target, temp_dir):
+        """Changed files are upserted, removed ones deleted, and stats updated."""
+        pipeline = _pipeline()
+        session = WatchSession(pipeline, [target])
+        changed = os.path.join(temp_dir, "a.md")
+        Path(changed).write_text("# A changed")
+        removed = os.path.join(temp_dir, "sub", "b.txt")
+        os.remove(removed)
+
+        await session.process_changes([(0, changed), (0, removed), (0, changed)])
+
+        process = pipeline.orchestrator.components.document_pipeline.process_documents
+        process.assert_awaited_once()
+        (upserted,) = process.await_args.args
+        assert process.await_args.kwargs == {"chunk_diff": None}
+        assert [d.title for d in upserted] == ["a.md"]
+        deleted, project_id = (
+            pipeline.orchestrator._process_deleted_documents.await_args.args
+        )
+        assert [d.title for d in deleted] == ["b.txt"]
+        assert deleted[0].is_deleted
+        assert project_id == "project"
+
+        stat = os.stat(changed)
+        assert target.file_stats["a.md"][:2] == (stat.st_size, stat.st_mtime_ns)
+        assert set(target.file_stats) == {"a.md", "sub/c.txt"}
+        assert pipeline.state_manager.update_file_stats.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_skips_paths_whose_stat_is_unchanged(self, target, temp_dir):
+        """Events for files that did not change do not reach the pipeline."""
+        pipeline = _pipeline()
+        session = WatchSession(pipeline, [target])
+
+        await session.process_changes([(0, os.path.join(temp_dir, "sub"))])
+
+        process = pipeline.orchestrator.components.document_pipeline.process_documents
+        process.assert_not_awaited()
+        pipeline.orchestrator._process_deleted_documents.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_removed_directory_deletes_its_files(self, target, temp_dir):
+        """Removing a directory deletes every known file below it."""
+        pipeline = _pipeline()
+        session = WatchSession(pipeline, [target])
+        for name in ("b.txt", "c.txt"):
+            os.remove(os.path.join(temp_dir, "sub", name))
+        os.rmdir(os.path.join(temp_dir, "sub"))
+
+        await session.process_changes([(0, os.path.join(temp_dir, "sub"))])
+
+        deleted, _ = pipeline.orchestrator._process_deleted_documents.await_args.args
+        assert sorted(d.title for d in deleted) == ["b.txt", "c.txt"]
+        assert set(target.file_stats) == {"a.md"}
+
+    @pytest.mark.asyncio
+    async def test_shrunk_file_deletes_its_stale_chunks(self, target, temp_dir):
+        """Chunks a changed file lost are deleted and its chunk states replaced."""
+        pipeline = _pipeline()
+        orchestrator = pipeline.orchestrator
+        orchestrator._load_chunk_diff = MethodType(
+            PipelineOrchestrator._load_chunk_diff, orchestrator
+        )
+        orchestrator._apply_chunk_diff = MethodType(
+            PipelineOrchestrator._apply_chunk_diff, orchestrator
+        )
+        state_manager = orchestrator.components.state_manager
+        state_manager.replace_chunk_states = AsyncMock()
+        orchestrator.components.qdrant_manager.delete_points = AsyncMock()
+
+        async def process_documents(documents, chunk_diff=None):
+            # One chunk per line of each document
+            async def chunks():
+                for document in documents:
+                    for index, line in enumerate(document.content.splitlines()):
+                        yield SimpleNamespace(
+                            id=f"{document.id}-{index}",
+                            content=line,
+                            metadata={
+                                "parent_document": document,
+                                "chunk_index": index,
+                            },
+                        )
+
+            upserted = {chunk.id async for chunk in chunk_diff.filter_chunks(chunks())}
+            return SimpleNamespace(
+                successfully_processed_documents={d.id for d in documents},
+                failed_document_ids=set(),
+                upserted_chunk_ids=upserted,
+            )
+
+        orchestrator.components.document_pipeline.process_documents = AsyncMock(
+            side_effect=process_documents
+        )
+        session = WatchSession(pipeline, [target])
+        changed = os.path.join(temp_dir, "a.md")
+        Path(changed).write_text("# A\nsecond line")
+        document = await target.connector.fetch_by_id("a.md")
+        kept = SimpleNamespace(content="# A")
+        state_manager.get_chunk_hashes = AsyncMock(
+            return_value={
+                document.id: {
+                    f"{document.id}-0": chunk_content_hash(kept),
+                    f"{document.id}-1": "old-hash",
+                    f"{document.id}-2": "old-hash",
+                }
+            }
+        )
+
+        await session.process_changes([(0, changed)])
+
+        orchestrator.components.qdrant_manager.delete_points.assert_awaited_once_with(
+            [f"{document.id}-2"]
+        )
+        documents, states, project_id = (
+            state_manager.replace_chunk_states.await_args.args
+        )
+        assert [d.id for d in documents] == [document.id]
+        assert set(states[document.id]) == {f"{document.id}-0", f"{document.id}-1"}
+        assert project_id == "project"